@@ -33,6 +33,7 @@ from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.gateway import start_existing_gateway_container
 from hummingbot.core.management.console import start_management_console
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -91,6 +92,10 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
 
+    if config_file_name is not None:
+        # The strategy is started from its config file, the trading pairs are not fetched for the autocompletion
+        TradingPairFetcher.get_instance(client_config_map, fetch_trading_pairs=False)
+
     hb = HummingbotApplication.main_application(client_config_map=client_config_map)
     # Todo: validate strategy and config_file_name before assinging
 
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+import logging
+from typing import Dict, List
+
+import path_util  # noqa: F401
+
+from hummingbot import init_logging
+from hummingbot.client.config.config_helpers import load_client_config_map_from_file, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.data_type.market_data_hub import MarketDataHub
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Tracks the exchange order books once and shares them with the local bots "
+                                     "configured to use the market data hub.")
+        self.add_argument("--socket-path", "-s",
+                          type=str,
+                          required=False,
+                          help="The Unix socket the bots connect to, by default the one in the data directory.")
+        self.add_argument("--markets", "-m",
+                          type=str,
+                          nargs="*",
+                          default=[],
+                          help="Order books to track from the start, as exchange:TRADING-PAIR,TRADING-PAIR "
+                               "(e.g. binance:BTC-USDT,ETH-USDT). The hub also tracks the ones the bots subscribe to.")
+
+
+def parse_markets(markets: List[str]) -> Dict[str, List[str]]:
+    parsed_markets: Dict[str, List[str]] = {}
+    for market in markets:
+        exchange, trading_pairs = market.split(":", 1)
+        parsed_markets.setdefault(exchange, []).extend(trading_pairs.split(","))
+    return parsed_markets
+
+
+async def run_hub(args: argparse.Namespace):
+    client_config_map = load_client_config_map_from_file()
+    init_logging("hummingbot_logs.yml", client_config_map, strategy_file_path="market_data_hub")
+    await read_system_configs_from_yml()
+    # The connectors of the hub read their settings from the main application
+    HummingbotApplication.main_application(client_config_map=client_config_map)
+
+    hub = MarketDataHub(client_config_map,
+                        socket_path=args.socket_path or client_config_map.market_data_hub.market_data_hub_socket_path,
+                        markets=parse_markets(args.markets))
+    await hub.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await hub.stop()
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    try:
+        asyncio.get_event_loop().run_until_complete(run_hub(args))
+    except KeyboardInterrupt:
+        logging.getLogger().info("Market data hub stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,16 @@ export interface PollResponse {
   txReceipt: CustomTransactionReceipt | null;
 }
 
+export interface PollBatchRequest extends NetworkSelectionRequest {
+  txHashes: string[];
+}
+
+export interface PollBatchResponse {
+  network: string;
+  timestamp: number;
+  transactions: PollResponse[]; // the transactions failing to poll are left out, to be polled one by one
+}
+
 export interface StatusRequest {
   chain?: string; //the target chain (e.g. ethereum, avalanche, or harmony)
   network?: string; // the target network of the chain (e.g. mainnet)
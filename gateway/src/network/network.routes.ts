@@ -11,11 +11,14 @@ import {
   mkRequestValidator,
   RequestValidator,
   validateTxHash,
+  validateTxHashes,
 } from '../services/validators';
 import { getStatus, getTokens } from './network.controllers';
 import {
   BalanceRequest,
   BalanceResponse,
+  PollBatchRequest,
+  PollBatchResponse,
   PollRequest,
   PollResponse,
   StatusRequest,
@@ -37,6 +40,10 @@ export const validatePollRequest: RequestValidator = mkRequestValidator([
   validateTxHash,
 ]);
 
+export const validatePollBatchRequest: RequestValidator = mkRequestValidator([
+  validateTxHashes,
+]);
+
 export const validateTokensRequest: RequestValidator = mkRequestValidator([
   validateEthereumChain,
   validateEthereumNetwork,
@@ -131,6 +138,54 @@ export namespace NetworkRoutes {
     )
   );
 
+  router.post(
+    '/poll-batch',
+    asyncHandler(
+      async (
+        req: Request<{}, {}, PollBatchRequest>,
+        res: Response<PollBatchResponse, {}>
+      ) => {
+        validatePollBatchRequest(req.body);
+        const { txHashes, ...networkSelection } = req.body;
+        let pollTransaction: (txHash: string) => Promise<PollResponse>;
+        let network: string;
+        if (req.body.chain == 'solana') {
+          const chain = await getChain<Solanaish>(
+            req.body.chain,
+            req.body.network
+          );
+          network = chain.network;
+          pollTransaction = async (txHash: string) => {
+            const pollRequest = { ...networkSelection, txHash };
+            validateSolanaPollRequest(pollRequest);
+            return await solanaControllers.poll(chain, pollRequest);
+          };
+        } else {
+          const chain = await getChain<Ethereumish>(
+            req.body.chain,
+            req.body.network
+          );
+          network = chain.chain;
+          pollTransaction = (txHash: string) =>
+            ethereumControllers.poll(chain, { ...networkSelection, txHash });
+        }
+
+        // A transaction failing to poll (e.g. out of gas) is left out of the response, the client polls it
+        // through /poll to get its error
+        const results = await Promise.allSettled(txHashes.map(pollTransaction));
+        const transactions: PollResponse[] = [];
+        for (const result of results) {
+          if (result.status === 'fulfilled') transactions.push(result.value);
+        }
+        res.status(200).json({
+          network,
+          timestamp: Date.now(),
+          transactions,
+        });
+      }
+    )
+  );
+
   router.get(
     '/tokens',
     asyncHandler(
@@ -7,6 +7,9 @@ export const invalidTokenError: string = 'The token param should be a string.';
 
 export const invalidTxHashError: string = 'The txHash param must be a string.';
 
+export const invalidTxHashesError: string =
+  'The txHashes param should be an array of strings.';
+
 export const invalidTokenSymbolsError: string =
   'The tokenSymbols param should be an array of strings.';
 
@@ -180,3 +183,10 @@ export const validateTxHash: Validator = mkValidator(
   invalidTxHashError,
   (val) => typeof val === 'string'
 );
+
+export const validateTxHashes: Validator = mkValidator(
+  'txHashes',
+  invalidTxHashesError,
+  (val) =>
+    Array.isArray(val) && val.every((txHash) => typeof txHash === 'string')
+);
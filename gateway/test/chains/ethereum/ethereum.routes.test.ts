@@ -572,6 +572,72 @@ describe('POST /network/poll', () => {
   });
 });
 
+describe('POST /network/poll-batch', () => {
+  const successfulTxHash =
+    '0x6d068067a5e5a0f08c6395b31938893d1cdad81f54a54456221ecd8c1941294d'; // noqa: mock
+  const outOfGasTxHash =
+    '0x2faeb1aa55f96c1db55f643a8cf19b0f76bf091d0b7d1b068d2e829414576362'; // noqa: mock
+  const unknownTxHash =
+    '0x3c7bd0a2cbd0f5d1dfe8b2cf9e8dd3b4df9b29e6fcbd8e2f8cd0e0f6c4bbf8a1'; // noqa: mock
+
+  const patchTransactions = () => {
+    patch(eth, 'getCurrentBlockNumber', () => 1);
+    patch(eth, 'getTransaction', (txHash: string) => {
+      if (txHash === successfulTxHash) return transactionSuccesful;
+      if (txHash === outOfGasTxHash) return transactionOutOfGas;
+      return null;
+    });
+    patch(eth, 'getTransactionReceipt', (txHash: string) => {
+      if (txHash === successfulTxHash) return transactionSuccesfulReceipt;
+      if (txHash === outOfGasTxHash) return transactionOutOfGasReceipt;
+      return null;
+    });
+  };
+
+  it('should return the status of each transaction', async () => {
+    patchTransactions();
+    const res = await request(gatewayApp)
+      .post('/network/poll-batch')
+      .send({
+        chain: 'ethereum',
+        network: 'kovan',
+        txHashes: [successfulTxHash, unknownTxHash],
+      });
+    expect(res.statusCode).toEqual(200);
+    expect(res.body.network).toEqual('kovan');
+    expect(
+      res.body.transactions.map((tx: any) => [tx.txHash, tx.txStatus])
+    ).toEqual([
+      [successfulTxHash, 1],
+      [unknownTxHash, -1],
+    ]);
+  });
+
+  it('should leave out the transactions failing to poll', async () => {
+    patchTransactions();
+    const res = await request(gatewayApp)
+      .post('/network/poll-batch')
+      .send({
+        chain: 'ethereum',
+        network: 'kovan',
+        txHashes: [outOfGasTxHash, successfulTxHash],
+      });
+    expect(res.statusCode).toEqual(200);
+    expect(res.body.transactions.map((tx: any) => tx.txHash)).toEqual([
+      successfulTxHash,
+    ]);
+  });
+
+  it('should return 404 when txHashes is not an array of strings', async () => {
+    const res = await request(gatewayApp).post('/network/poll-batch').send({
+      chain: 'ethereum',
+      network: 'kovan',
+      txHashes: successfulTxHash,
+    });
+    expect(res.statusCode).toEqual(404);
+  });
+});
+
 describe('overwrite existing transaction', () => {
   it('overwritten transaction is dropped', async () => {
     patchGetWallet();
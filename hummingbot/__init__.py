@@ -138,6 +138,7 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.queue_log_handler import QueueOverflowPolicy, install_queue_logging, uninstall_queue_logging
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
@@ -161,7 +162,14 @@ def init_logging(conf_filename: str,
             for logger in config_dict["loggers"]:
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        queue_config: Dict = config_dict.pop("queue", None) or {}
+        # The records still queued are written to the handlers being replaced
+        uninstall_queue_logging()
         logging.config.dictConfig(config_dict)
+        if queue_config.get("enabled", False):
+            install_queue_logging(max_size=int(queue_config.get("max_size", 10000)),
+                                  overflow_policy=QueueOverflowPolicy(queue_config.get("overflow_policy", "drop_oldest")),
+                                  sample_rate=int(queue_config.get("sample_rate", 10)))
 
 
 def get_strategy_list() -> List[str]:
@@ -70,6 +70,7 @@ client_configs_to_display = ["autofill_import",
                              "gateway_cert_passphrase",
                              "gateway_api_host",
                              "gateway_api_port",
+                             "gateway_quote_cache_ttl",
                              "rate_oracle_source",
                              "extra_tokens",
                              "global_token",
@@ -80,7 +81,8 @@ client_configs_to_display = ["autofill_import",
                              "create_command_timeout",
                              "other_commands_timeout",
                              "tables_format",
-                             "tick_size"]
+                             "tick_size",
+                             "tick_overrun_policy"]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
                              "output_pane",
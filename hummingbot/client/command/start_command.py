@@ -15,6 +15,7 @@ from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.connector.connector_status import get_connector_status, warning_messages
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.clock_mode import TickOverrunPolicy
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import OracleRateUnavailable
@@ -209,7 +210,9 @@ class StartCommand(GatewayChainApiManager):
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            self.clock = Clock(ClockMode.REALTIME,
+                               tick_size=tick_size,
+                               overrun_policy=TickOverrunPolicy(self.client_config_map.tick_overrun_policy.value))
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -219,6 +222,9 @@ class StartCommand(GatewayChainApiManager):
                         await market.cancel_all(5.0)
             if self.strategy:
                 self.clock.add_iterator(self.strategy)
+                max_age = self.client_config_map.trade_history_max_age
+                self.strategy.fill_store.set_retention(self.client_config_map.trade_history_max_fills,
+                                                       max_age * 3600 if max_age > 0 else None)
             try:
                 self._pmm_script_iterator = self.client_config_map.pmm_script_mode.get_iterator(
                     self.strategy_name, list(self.markets.values()), self.strategy
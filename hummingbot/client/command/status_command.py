@@ -1,7 +1,7 @@
 import asyncio
 import time
 from collections import OrderedDict, deque
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import pandas as pd
 
@@ -13,9 +13,12 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
+from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.clock_mode import ClockMode
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.tick_profiler import TickProfiler
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.user.user_balances import UserBalances
 
@@ -24,6 +27,8 @@ if TYPE_CHECKING:
 
 
 class StatusCommand:
+    TICK_PROFILE_EXPORT_INTERVAL = 60.0
+
     def _expire_old_application_warnings(self,  # type: HummingbotApplication
                                          ):
         now: float = time.time()
@@ -74,11 +79,22 @@ class StatusCommand:
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
-        status = paper_trade + "\n" + st_status
+        status = paper_trade + "\n" + st_status + self.format_clock_status()
         if self._pmm_script_iterator is not None and live is False:
             self._pmm_script_iterator.request_status()
         return status
 
+    def format_clock_status(self,  # type: HummingbotApplication
+                            ) -> str:
+        if self.clock is None or self.clock.clock_mode is not ClockMode.REALTIME:
+            return ""
+        stats = self.clock.overrun_stats
+        if stats.overruns == 0 and stats.deferred_ticks == 0:
+            return ""
+        return (f"\n\n  Clock ({self.clock.overrun_policy.value} on overrun): {stats.overruns} of {stats.ticks} ticks "
+                f"overran, {stats.missed_ticks} ticks missed, {stats.deferred_ticks} strategy ticks deferred, "
+                f"max lag {stats.max_lag:.3f}s, max tick duration {stats.max_tick_duration:.3f}s")
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -120,9 +136,46 @@ class StatusCommand:
         return validation_errors
 
     def status(self,  # type: HummingbotApplication
-               live: bool = False):
+               live: bool = False,
+               profile: Optional[str] = None):
+        if profile is not None:
+            self.tick_profile_status(stop=profile == "stop")
+            return
         safe_ensure_future(self.status_check_all(live=live), loop=self.ev_loop)
 
+    def tick_profile_status(self,  # type: HummingbotApplication
+                            stop: bool = False):
+        profiler = TickProfiler.get_instance()
+        if stop:
+            if profiler.enabled:
+                profiler.stop()
+                self.notify("Tick profiler stopped.")
+            else:
+                self.notify("Tick profiler is not running.")
+        elif not profiler.enabled:
+            profiler.start(export_path=self.client_config_map.log_file_path / "tick_profile.json",
+                           export_interval=self.TICK_PROFILE_EXPORT_INTERVAL)
+            self.notify(f"Tick profiler started, the timings are written to {profiler.export_path} every "
+                        f"{self.TICK_PROFILE_EXPORT_INTERVAL:.0f} seconds.\n"
+                        f"Run `status --profile` again to see them, and `status --profile stop` to stop profiling.")
+        else:
+            self.notify(self.format_tick_profile(profiler))
+
+    def format_tick_profile(self,  # type: HummingbotApplication
+                            profiler: TickProfiler) -> str:
+        rows = profiler.snapshot()
+        if len(rows) == 0:
+            return "\n  No ticks profiled yet."
+        df = pd.DataFrame(
+            data=[[row["component"], row["stage"], row["count"], row["mean_us"], row["p50_us"], row["p99_us"],
+                   row["max_us"], row["total_ms"]] for row in rows],
+            columns=["Component", "Stage", "Count", "Mean (us)", "p50 (us)", "p99 (us)", "Max (us)", "Total (ms)"])
+        df = df.round(1)
+        lines = ["", "  Tick profile (percentiles are log2 bucket upper bounds):"]
+        lines.extend(["    " + line for line in format_df_for_printout(
+            df, table_format=self.client_config_map.tables_format).split("\n")])
+        return "\n".join(lines)
+
     async def status_check_all(self,  # type: HummingbotApplication
                                notify_success=True,
                                live=False) -> bool:
@@ -131,13 +184,28 @@ class StatusCommand:
             if live:
                 await self.stop_live_update()
                 self.app.live_updates = True
-                while self.app.live_updates and self.strategy:
-                    script_status = '\n Status from PMM script would not appear here. ' \
-                                    'Simply run the status command without "--live" to see PMM script status.'
-                    await self.cls_display_delay(
-                        await self.strategy_status(live=True) + script_status + "\n\n Press escape key to stop update.", 0.1
-                    )
-                self.app.live_updates = False
+                script_status = '\n Status from PMM script would not appear here. ' \
+                                'Simply run the status command without "--live" to see PMM script status.'
+                displayed_status = None
+                try:
+                    while self.app.live_updates and self.strategy:
+                        status = (await self.strategy_status(live=True) + script_status
+                                  + "\n\n Press escape key to stop update.")
+                        # The output is only redrawn when the status or the output width (the lines are wrapped at it)
+                        # changed. The logs are not written to the output during live updates, the undo restores them.
+                        render_info = self.app.output_field.window.render_info
+                        output_width = None if render_info is None else render_info.window_width
+                        if (status, output_width) != displayed_status:
+                            if displayed_status is not None:
+                                self.app.output_field.buffer.undo()
+                            self.app.output_field.buffer.save_to_undo_stack()
+                            self.app.log(status, save_log=False)
+                            displayed_status = (status, output_width)
+                        await asyncio.sleep(0.1)
+                finally:
+                    if displayed_status is not None:
+                        self.app.output_field.buffer.undo()
+                    self.app.live_updates = False
                 self.notify("Stopped live status display update.")
             else:
                 self.notify(await self.strategy_status())
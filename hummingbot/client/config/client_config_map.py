@@ -49,6 +49,11 @@ def using_exchange(exchange: str) -> Callable:
     return using_exchange_pointer(exchange)
 
 
+class MQTTPublishDropPolicyEnum(str, ClientConfigEnum):
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+
+
 class MQTTBridgeConfigMap(BaseClientModel):
     mqtt_host: str = Field(
         default="localhost",
@@ -133,10 +138,142 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_publish_qos: int = Field(
+        default=0,
+        description="The MQTT QoS level of the published events, logs and notifications (0, 1 or 2)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the QoS level of the published messages (0, 1 or 2)"
+            ),
+        ),
+    )
+    mqtt_publish_queue_size: int = Field(
+        default=10000,
+        description="The number of messages waiting to be published beyond which messages are dropped",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of messages waiting to be published"
+            ),
+        ),
+    )
+    mqtt_publish_drop_policy: MQTTPublishDropPolicyEnum = Field(
+        default=MQTTPublishDropPolicyEnum.drop_oldest,
+        description="Which messages are dropped when the publish queue is full",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Which messages to drop when the publish queue is full? "
+                f"({'/'.join(list(MQTTPublishDropPolicyEnum))})"
+            ),
+        ),
+    )
+    mqtt_publish_batch_size: int = Field(
+        default=1,
+        description="The maximum number of messages of a topic published as one batch message,"
+                    " 1 publishes every message on its own",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of messages of a topic published together (1 to disable batching)"
+            ),
+        ),
+    )
+    mqtt_snapshots: bool = Field(
+        default=False,
+        description="Publish the top of book of the markets, the balances, the active orders and the strategy state"
+                    " to their own topics",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the market data, balances, orders and strategy snapshots"
+            ),
+        ),
+    )
+    mqtt_market_data_interval: float = Field(
+        default=1.0,
+        description="The interval in seconds of the top of book snapshots, 0 to disable them",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds of the top of book snapshots (0 to disable them)"
+            ),
+        ),
+    )
+    mqtt_balances_interval: float = Field(
+        default=10.0,
+        description="The interval in seconds of the balances snapshots, 0 to disable them",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds of the balances snapshots (0 to disable them)"
+            ),
+        ),
+    )
+    mqtt_orders_interval: float = Field(
+        default=1.0,
+        description="The interval in seconds of the active orders snapshots, 0 to disable them",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds of the active orders snapshots (0 to disable them)"
+            ),
+        ),
+    )
+    mqtt_strategy_interval: float = Field(
+        default=5.0,
+        description="The interval in seconds of the strategy state snapshots, 0 to disable them",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds of the strategy state snapshots (0 to disable them)"
+            ),
+        ),
+    )
+    mqtt_snapshots_delta_only: bool = Field(
+        default=True,
+        description="Publish only the entries of the snapshots that changed, the full snapshots are published every"
+                    " mqtt_snapshots_full_interval seconds",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Publish only the changes of the snapshots? (Yes/No)"
+            ),
+        ),
+    )
+    mqtt_snapshots_full_interval: float = Field(
+        default=60.0,
+        description="The interval in seconds of the full snapshots when publishing the changes only",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds of the full snapshots"
+            ),
+        ),
+    )
 
     class Config:
         title = "mqtt_bridge"
 
+    @validator("mqtt_market_data_interval",
+               "mqtt_balances_interval",
+               "mqtt_orders_interval",
+               "mqtt_strategy_interval",
+               "mqtt_snapshots_full_interval",
+               pre=True)
+    def validate_snapshots_interval(cls, v: Union[str, float]):
+        if float(v) < 0:
+            raise ValueError("The interval can't be negative.")
+        return v
+
+    @validator("mqtt_publish_qos", pre=True)
+    def validate_mqtt_publish_qos(cls, v: Union[str, int]):
+        if int(v) not in (0, 1, 2):
+            raise ValueError("The QoS level must be 0, 1 or 2.")
+        return v
+
+    @validator("mqtt_publish_queue_size", "mqtt_publish_batch_size", pre=True)
+    def validate_positive_int(cls, v: Union[str, int]):
+        if int(v) < 1:
+            raise ValueError("The value must be greater than 0.")
+        return v
+
+    @validator("mqtt_publish_drop_policy", pre=True)
+    def validate_mqtt_publish_drop_policy(cls, v: Union[str, MQTTPublishDropPolicyEnum]):
+        if isinstance(v, str) and v not in MQTTPublishDropPolicyEnum.__members__:
+            raise ValueError(f"The value must be one of {', '.join(list(MQTTPublishDropPolicyEnum))}.")
+        return v
+
 
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
@@ -283,12 +420,30 @@ class PaperTradeConfigMap(BaseClientModel):
         ),
     )
 
+    paper_trade_queue_position_fills: bool = Field(
+        default=False,
+        description="Fill the paper trade limit orders from their estimated place in the order book queue of their"
+                    " price and the size of the trades, instead of in full when a trade crosses them",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to simulate the queue position of the paper trade limit orders? (Yes/No)",
+        ),
+    )
+
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
         if isinstance(v, str):
             v = json.loads(v)
         return v
 
+    @validator("paper_trade_queue_position_fills", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
 
 class KillSwitchMode(BaseClientModel, ABC):
     @abstractmethod
@@ -343,6 +498,12 @@ class AutofillImportEnum(str, ClientConfigEnum):
     disabled = "disabled"
 
 
+class TickOverrunPolicyEnum(str, ClientConfigEnum):
+    skip = "skip"
+    coalesce = "coalesce"
+    connectors_first = "connectors_first"
+
+
 class TelegramMode(BaseClientModel, ABC):
     @abstractmethod
     def get_notifiers(self, hb: "HummingbotApplication") -> List[TelegramNotifier]:
@@ -543,11 +704,49 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_quote_cache_ttl: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="The number of seconds a Gateway price quote is reused for identical price requests",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How many seconds should a Gateway price quote be reused for identical requests?",
+        ),
+    )
 
     class Config:
         title = "gateway"
 
 
+class MarketDataHubConfigMap(BaseClientModel):
+    market_data_hub_enabled: bool = Field(
+        default=False,
+        description="Track the order books through the local market data hub (bin/market_data_hub.py) instead of"
+                    " connecting to the exchanges, the hub shares one exchange connection between the local bots",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to get the order books from the local market data hub? (Yes/No)",
+        ),
+    )
+    market_data_hub_socket_path: str = Field(
+        default="",
+        description="The Unix socket of the market data hub, empty for the default one in the data directory",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the path of the market data hub socket (empty for the default one)",
+        ),
+    )
+
+    class Config:
+        title = "market_data_hub"
+
+    @validator("market_data_hub_enabled", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+
 class CertsConfigMap(BaseClientModel):
     path: str = Field(
         default="",
@@ -974,7 +1173,16 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    fetch_pairs_from_all_exchanges: bool = Field(
+        default=False,
+        description="Fetch the trading pairs of every exchange at start for the autocompletion, instead of fetching"
+                    "\nthe trading pairs of an exchange when they are first needed.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to fetch the trading pairs of all the exchanges at start? (Yes/No)",
+        ),
+    )
     paper_trade: PaperTradeConfigMap = Field(default=PaperTradeConfigMap())
+    market_data_hub: MarketDataHubConfigMap = Field(default=MarketDataHubConfigMap())
     color: ColorConfigMap = Field(default=ColorConfigMap())
     tick_size: float = Field(
         default=1.0,
@@ -988,6 +1196,35 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    tick_overrun_policy: TickOverrunPolicyEnum = Field(
+        default=TickOverrunPolicyEnum.skip,
+        description="What the clock does when a tick takes longer than the tick size:"
+                    "\nskip waits for the next tick, coalesce runs the late tick right away,"
+                    "\nconnectors_first ticks the connectors before the strategy and runs a late tick"
+                    "\nright away for the connectors only, the strategy waits for the next tick.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"What to do when a tick takes longer than the tick size? ({'/'.join(list(TickOverrunPolicyEnum))})"
+            ),
+        ),
+    )
+    trade_history_max_fills: int = Field(
+        default=100000,
+        ge=0,
+        description="The number of fills the strategy keeps in memory for its trades and fill summaries,"
+                    "\nthe oldest fills are dropped once there are more.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How many fills should the strategy keep in memory?",
+        ),
+    )
+    trade_history_max_age: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="The age (in hours) of the fills the strategy keeps in memory, 0 keeps them regardless of age.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How old (in hours) can the fills the strategy keeps in memory be? (0 for no limit)",
+        ),
+    )
 
     class Config:
         title = "client_config_map"
@@ -1010,6 +1247,12 @@ class ClientConfigMap(BaseClientModel):
             raise ValueError(f"The value must be one of {', '.join(list(AutofillImportEnum))}.")
         return v
 
+    @validator("tick_overrun_policy", pre=True)
+    def validate_tick_overrun_policy(cls, v: Union[str, TickOverrunPolicyEnum]):
+        if isinstance(v, str) and v not in TickOverrunPolicyEnum.__members__:
+            raise ValueError(f"The value must be one of {', '.join(list(TickOverrunPolicyEnum))}.")
+        return v
+
     @validator("telegram_mode", pre=True)
     def validate_telegram_mode(cls, v: Union[(str, Dict) + tuple(TELEGRAM_MODES.values())]):
         if isinstance(v, tuple(TELEGRAM_MODES.values()) + (Dict,)):
@@ -1022,7 +1265,7 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", pre=True)
+    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
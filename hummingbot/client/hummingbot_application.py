@@ -75,7 +75,7 @@ class HummingbotApplication(*commands):
         self.ssl_config_map: SSLConfigMap = (  # type-hint enables IDE auto-complete
             load_ssl_config_map_from_file()
         )
-        # This is to start fetching trading pairs for auto-complete
+        # This is to load the cached trading pairs for auto-complete (and fetch them all if configured so)
         TradingPairFetcher.get_instance(self.client_config_map)
         self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
         self.markets: Dict[str, ExchangeBase] = {}
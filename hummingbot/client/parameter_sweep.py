@@ -0,0 +1,298 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import time
+from contextlib import contextmanager
+from dataclasses import fields
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_strategy_starter_file, parse_cvar_value
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.connector.exchange.paper_trade.backtest_exchange import BacktestExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.market_data_replay import MarketDataEvents
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+from hummingbot.logger import HummingbotLogger
+
+StrategyConfigMap = Union[ClientConfigAdapter, Dict[str, ConfigVar]]
+
+METRICS_COLUMNS = [field.name for field in fields(PerformanceMetrics)]
+
+
+class BacktestRateSource(RateSourceBase):
+    """
+    Prices the back tested trading pairs at their mid price in the replayed order books, so the performance metrics
+    of a back test do not depend on live prices.
+    """
+
+    def __init__(self, markets: Dict[str, BacktestExchange]):
+        super().__init__()
+        self._markets = markets
+
+    @property
+    def name(self) -> str:
+        return "backtest"
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        prices = {}
+        for market in self._markets.values():
+            for trading_pair in market.order_books:
+                prices[trading_pair] = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+        return prices
+
+
+class BacktestApplication:
+    """
+    Stands in for HummingbotApplication when a strategy start function (hummingbot/strategy/*/start.py) builds the
+    strategy of a back test: the markets it initializes are BacktestExchanges replaying the recorded market data.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    _initialize_market_assets = staticmethod(HummingbotApplication._initialize_market_assets)
+
+    def __init__(self,
+                 client_config_map: ClientConfigAdapter,
+                 strategy_name: str,
+                 strategy_config_map: StrategyConfigMap,
+                 market_data: Dict[str, MarketDataEvents],
+                 initial_balances: Dict[str, Decimal]):
+        self.client_config_map = client_config_map
+        self.strategy_name = strategy_name
+        self.strategy_file_name = f"{strategy_name}_backtest.yml"
+        self.strategy_config_map = strategy_config_map
+        self.market_data = market_data
+        self.initial_balances = initial_balances
+        self.markets: Dict[str, BacktestExchange] = {}
+        self.market_trading_pairs_map: Dict[str, List[str]] = {}
+        self.market_trading_pair_tuples = []
+        self.strategy = None
+        self.notifications: List[str] = []
+
+    def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        for market_name, trading_pairs in market_names:
+            # The pydantic strategy configs give the exchange as a ClientConfigEnum
+            market_name = str(market_name)
+            missing_pairs = [trading_pair for trading_pair in trading_pairs if trading_pair not in self.market_data]
+            if len(missing_pairs) > 0:
+                raise ValueError(f"No recorded market data for {', '.join(missing_pairs)}.")
+            market = BacktestExchange(self.client_config_map,
+                                      market_name,
+                                      {trading_pair: self.market_data[trading_pair] for trading_pair in trading_pairs})
+            for asset, balance in self.initial_balances.items():
+                market.set_balance(asset, balance)
+            self.markets[market_name] = market
+            self.market_trading_pairs_map[market_name] = list(trading_pairs)
+
+    def notify(self, msg: str):
+        self.notifications.append(msg)
+
+    @contextmanager
+    def as_main_application(self):
+        """
+        The strategies notify (and some start functions read) HummingbotApplication.main_application(), the back test
+        application stands in for it while the strategy is built and run.
+        """
+        main_application = HummingbotApplication._main_app
+        HummingbotApplication._main_app = self
+        try:
+            yield self
+        finally:
+            HummingbotApplication._main_app = main_application
+
+    def start_strategy(self):
+        get_strategy_starter_file(self.strategy_name)(self)
+        # The start functions notify the error when they fail to create the strategy
+        if self.strategy is None or len(self.notifications) > 0:
+            raise ValueError(f"The {self.strategy_name} strategy could not be created: "
+                             f"{' '.join(self.notifications)}")
+
+    def run(self,
+            tick_size: float = 1.0,
+            start_time: Optional[float] = None,
+            end_time: Optional[float] = None) -> PerformanceMetrics:
+        """
+        Runs the strategy over the recorded market data (or the part of it between start_time and end_time) and
+        returns the performance of its first market, valued at the replayed mid price.
+        """
+        replays = [market.market_data_replay for market in self.markets.values()]
+        start_time = start_time if start_time is not None else min(replay.start_timestamp for replay in replays)
+        end_time = end_time if end_time is not None else max(replay.end_timestamp for replay in replays)
+        clock = Clock(ClockMode.BACKTEST, tick_size, start_time, end_time)
+        for market in self.markets.values():
+            clock.add_iterator(market)
+        clock.add_iterator(self.strategy)
+        clock.backtest_til(end_time)
+
+        market_info = self.market_trading_pair_tuples[0]
+        trades = [trade for trade in self.strategy.trades if trade.trading_pair == market_info.trading_pair]
+        if len(trades) == 0:
+            return PerformanceMetrics()
+        rate_oracle = RateOracle.get_instance()
+        source = rate_oracle.source
+        rate_oracle.source = BacktestRateSource(self.markets)
+        try:
+            return asyncio.get_event_loop().run_until_complete(
+                PerformanceMetrics.create(market_info.trading_pair, trades, market_info.market.get_all_balances())
+            )
+        finally:
+            rate_oracle.source = source
+
+
+class ParameterSweep:
+    """
+    Back tests a strategy over every combination of a grid of parameter values, on a pool of worker processes.
+
+    The strategy is built by its start function from a copy of its config map (legacy or pydantic, as loaded by the
+    client) where the swept parameters are overridden, each run gets its own BacktestExchanges. The workers are
+    forked, they share the market data read-only: load it with load_market_data, the columns are views of the
+    memory mapped recorder files and stay in the page cache once for all the workers. The combinations are split
+    in shards handed out to the workers as they finish, the runs are independent so the sweep scales with the cores.
+
+    Parameter names are config keys, with their config values (e.g. bid_spread in percent), nested pydantic configs
+    use dotted names (e.g. order_levels_mode.order_levels).
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 strategy_name: str,
+                 strategy_config_map: StrategyConfigMap,
+                 parameter_grid: Dict[str, Sequence[Any]],
+                 market_data: Dict[str, MarketDataEvents],
+                 initial_balances: Dict[str, Decimal],
+                 tick_size: float = 1.0,
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None,
+                 client_config_map: Optional[ClientConfigAdapter] = None):
+        self._strategy_name = strategy_name
+        self._strategy_config_map = strategy_config_map
+        self._parameter_grid = {key: list(values) for key, values in parameter_grid.items()}
+        self._market_data = market_data
+        self._initial_balances = initial_balances
+        self._tick_size = tick_size
+        self._start_time = start_time
+        self._end_time = end_time
+        self._client_config_map = client_config_map or ClientConfigAdapter(ClientConfigMap())
+        self._legacy_values: Dict[str, Any] = {}
+        if not isinstance(strategy_config_map, ClientConfigAdapter):
+            self._legacy_values = {key: config_var.value for key, config_var in strategy_config_map.items()}
+
+    @property
+    def combinations(self) -> List[Dict[str, Any]]:
+        keys = list(self._parameter_grid.keys())
+        return [dict(zip(keys, values)) for values in itertools.product(*self._parameter_grid.values())]
+
+    def shards(self, processes: int) -> List[List[Tuple[int, Dict[str, Any]]]]:
+        """
+        Splits the numbered combinations in shards of consecutive runs, a few shards per process so the workers
+        finishing early take over the remaining shards.
+        """
+        runs = list(enumerate(self.combinations))
+        shard_size = max(1, -(-len(runs) // (processes * 4)))
+        return [runs[i:i + shard_size] for i in range(0, len(runs), shard_size)]
+
+    def run(self, processes: Optional[int] = None) -> pd.DataFrame:
+        """
+        Runs every combination and returns the results table: a row per run with the parameters, the
+        PerformanceMetrics fields (as floats), the error of the failed runs and the run duration in seconds.
+        """
+        processes = processes or multiprocessing.cpu_count()
+        shards = self.shards(processes)
+        rows = []
+        # The workers inherit the sweep (and its memory mapped market data) from the fork instead of unpickling it
+        context = multiprocessing.get_context("fork")
+        with context.Pool(min(processes, len(shards)) or 1, initializer=_init_worker, initargs=(self,)) as pool:
+            for shard_rows in pool.imap_unordered(_run_shard, shards):
+                rows.extend(shard_rows)
+        columns = ["run_id"] + list(self._parameter_grid.keys()) + METRICS_COLUMNS + ["error", "duration"]
+        return pd.DataFrame(rows, columns=columns).sort_values("run_id").set_index("run_id")
+
+    def run_single(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Back tests one combination in the current process. The legacy config maps are module level objects, a
+        worker process changes its own copy of them, their values are restored after the run.
+        """
+        row: Dict[str, Any] = dict(parameters)
+        started = time.perf_counter()
+        try:
+            config_map = self._config_map_with(parameters)
+            application = BacktestApplication(self._client_config_map,
+                                              self._strategy_name,
+                                              config_map,
+                                              self._market_data,
+                                              self._initial_balances)
+            with application.as_main_application():
+                application.start_strategy()
+                metrics = application.run(self._tick_size, self._start_time, self._end_time)
+            row.update({column: float(getattr(metrics, column)) for column in METRICS_COLUMNS})
+            row["error"] = None
+        except Exception as e:
+            self.logger().error(f"Back test of {parameters} failed.", exc_info=True)
+            row["error"] = str(e)
+        finally:
+            self._restore_legacy_values()
+        row["duration"] = time.perf_counter() - started
+        return row
+
+    def _config_map_with(self, parameters: Dict[str, Any]) -> StrategyConfigMap:
+        if isinstance(self._strategy_config_map, ClientConfigAdapter):
+            config_map = ClientConfigAdapter(self._strategy_config_map.hb_config.copy(deep=True))
+            for key, value in parameters.items():
+                *parents, attribute = key.split(".")
+                target = config_map
+                for parent in parents:
+                    target = getattr(target, parent)
+                setattr(target, attribute, value)
+            return config_map
+
+        config_map = self._strategy_config_map
+        for key, value in parameters.items():
+            if key not in config_map:
+                raise ValueError(f"{key} is not a {self._strategy_name} config.")
+            config_var = config_map[key]
+            config_var.value = parse_cvar_value(config_var, value)
+            error = asyncio.get_event_loop().run_until_complete(config_var.validate(str(config_var.value)))
+            if error is not None:
+                raise ValueError(f"Invalid value {value} for {key}: {error}")
+        return config_map
+
+    def _restore_legacy_values(self):
+        for key, value in self._legacy_values.items():
+            self._strategy_config_map[key].value = value
+
+
+_worker_sweep: Optional[ParameterSweep] = None
+
+
+def _init_worker(sweep: ParameterSweep):
+    global _worker_sweep
+    _worker_sweep = sweep
+    # The forked worker must not share the event loop of its parent, nor use the prices of its rate oracle
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    asyncio.get_event_loop().run_until_complete(RateOracle.get_instance().stop_network())
+
+
+def _run_shard(shard: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    return [{"run_id": run_id, **_worker_sweep.run_single(parameters)} for run_id, parameters in shard]
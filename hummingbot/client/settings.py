@@ -1,19 +1,23 @@
+import hashlib
 import importlib
 import json
+import os
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
-from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot import data_path, get_strategy_list, root_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
     from hummingbot.connector.connector_base import ConnectorBase
 
 # Global variables
@@ -59,6 +63,10 @@ PAPER_TRADE_EXCHANGES = [  # todo: fix after global config map refactor
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES = ["test_support", "utilities"]
 
+CONNECTOR_MANIFEST_PATH = Path(data_path()) / "connector_manifest.json"
+# Bump when the manifest entries change, the manifests of the previous format are then rebuilt
+CONNECTOR_MANIFEST_FORMAT = 1
+
 
 class ConnectorType(Enum):
     """
@@ -244,7 +252,8 @@ class ConnectorSetting(NamedTuple):
 
     def non_trading_connector_instance_with_default_configuration(
             self,
-            trading_pairs: Optional[List[str]] = None) -> 'ConnectorBase':
+            trading_pairs: Optional[List[str]] = None,
+            client_config_map: Optional["ClientConfigAdapter"] = None) -> 'ConnectorBase':
         from hummingbot.client.config.config_helpers import ClientConfigAdapter
         from hummingbot.client.hummingbot_application import HummingbotApplication
 
@@ -265,81 +274,58 @@ class ConnectorSetting(NamedTuple):
         kwargs = self.conn_init_parameters(kwargs)
         kwargs = self.add_domain_parameter(kwargs)
         kwargs.update(trading_pairs=trading_pairs, trading_required=False)
-        kwargs["client_config_map"] = HummingbotApplication.main_application().client_config_map
+        kwargs["client_config_map"] = client_config_map or HummingbotApplication.main_application().client_config_map
         connector = connector_class(**kwargs)
 
         return connector
 
 
+class ConnectorConfigKeysReference(NamedTuple):
+    """
+    Where the config keys of a connector are defined: an attribute of its utils module, or for the other domains of
+    the connector the domain item of that attribute.
+    """
+    module_path: str
+    attribute: str
+    domain: Optional[str] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = getattr(importlib.import_module(self.module_path), self.attribute, None)
+        if self.domain is not None:
+            config_keys = config_keys[self.domain]
+        return config_keys
+
+
+class ManifestConnectorSetting(ConnectorSetting):
+    """
+    A connector setting read from the connector manifest, its config_keys field holds a ConnectorConfigKeysReference.
+    The utils module of the connector is only imported when its config keys are first used.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = super().config_keys
+        if isinstance(config_keys, ConnectorConfigKeysReference):
+            config_keys = config_keys.load()
+        return config_keys
+
+
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
     @classmethod
     def create_connector_settings(cls):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
-        """
-        cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        Creates a dictionary of exchange names to ConnectorSetting.
 
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        The settings of the connectors are read from the connector manifest, which is rebuilt by importing the utils
+        module of every connector when the connectors changed (see _connectors_fingerprint). The connector modules
+        are then imported when they are used.
+        """
+        cls.all_connector_settings = cls._load_connector_manifest()
+        if len(cls.all_connector_settings) == 0:
+            cls.all_connector_settings = cls._scan_connector_settings()
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -364,23 +350,190 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @classmethod
+    def _connector_dirs(cls) -> List[Tuple[DirEntry, DirEntry]]:
+        """
+        Lists the (type directory, connector directory) of the connectors in hummingbot/connector.
+        """
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        connector_dirs: List[Tuple[DirEntry, DirEntry]] = []
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES
+        ]
+        for type_dir in type_dirs:
+            if type_dir.name == 'gateway':
+                continue
+            for connector_dir in scandir(type_dir.path):
+                if not connector_dir.is_dir() or not exists(join(connector_dir.path, "__init__.py")):
+                    continue
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                connector_dirs.append((type_dir, cast(DirEntry, connector_dir)))
+        return connector_dirs
+
+    @classmethod
+    def _connectors_fingerprint(cls) -> str:
+        """
+        Identifies the state of the connector modules the manifest was built from: the package version and the
+        modification time of every connector utils module.
+        """
+        version_path = root_path() / "hummingbot" / "VERSION"
+        state: List[Any] = [CONNECTOR_MANIFEST_FORMAT, version_path.read_text().strip() if version_path.exists() else ""]
+        for type_dir, connector_dir in cls._connector_dirs():
+            util_module_file = join(connector_dir.path, f"{connector_dir.name}_utils.py")
+            util_module_mtime = os.stat(util_module_file).st_mtime_ns if exists(util_module_file) else None
+            state.append([type_dir.name, connector_dir.name, util_module_mtime])
+        return hashlib.md5(json.dumps(sorted(state, key=str)).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _load_connector_manifest(cls) -> Dict[str, ConnectorSetting]:
+        try:
+            with open(CONNECTOR_MANIFEST_PATH) as fd:
+                manifest: Dict[str, Any] = json.load(fd)
+            if manifest.get("fingerprint") != cls._connectors_fingerprint():
+                return {}
+            return {entry["name"]: cls._connector_setting_from_manifest_entry(entry)
+                    for entry in manifest["connectors"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    @classmethod
+    def _save_connector_manifest(cls,
+                                 connector_settings: Dict[str, ConnectorSetting],
+                                 config_keys_references: Dict[str, Optional[ConnectorConfigKeysReference]]):
+        manifest = {
+            "fingerprint": cls._connectors_fingerprint(),
+            "connectors": [
+                cls._connector_setting_to_manifest_entry(connector_setting, config_keys_references[name])
+                for name, connector_setting in connector_settings.items()
+            ],
+        }
+        temp_path = f"{CONNECTOR_MANIFEST_PATH}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(CONNECTOR_MANIFEST_PATH.parent, exist_ok=True)
+            with open(temp_path, "w") as fd:
+                json.dump(manifest, fd)
+            # Bots started at the same time may rebuild the manifest concurrently, each replaces it atomically
+            os.replace(temp_path, CONNECTOR_MANIFEST_PATH)
+        except OSError:
+            # The manifest is only a cache, the connectors are scanned again at the next start
+            pass
+
+    @staticmethod
+    def _connector_setting_to_manifest_entry(
+            connector_setting: ConnectorSetting,
+            config_keys_reference: Optional[ConnectorConfigKeysReference]) -> Dict[str, Any]:
+        trade_fee_schema = connector_setting.trade_fee_schema
+        entry = connector_setting._asdict()
+        entry.update(
+            type=connector_setting.type.name,
+            trade_fee_schema={
+                "percent_fee_token": trade_fee_schema.percent_fee_token,
+                "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+                "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+                "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+                "maker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.maker_fixed_fees],
+                "taker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.taker_fixed_fees],
+            },
+            config_keys=config_keys_reference._asdict() if config_keys_reference is not None else None,
+        )
+        return entry
+
+    @staticmethod
+    def _connector_setting_from_manifest_entry(entry: Dict[str, Any]) -> ConnectorSetting:
+        trade_fee_schema = entry["trade_fee_schema"]
+        config_keys = entry["config_keys"]
+        return ManifestConnectorSetting(**{
+            **entry,
+            "type": ConnectorType[entry["type"]],
+            "trade_fee_schema": TradeFeeSchema(
+                percent_fee_token=trade_fee_schema["percent_fee_token"],
+                maker_percent_fee_decimal=Decimal(trade_fee_schema["maker_percent_fee_decimal"]),
+                taker_percent_fee_decimal=Decimal(trade_fee_schema["taker_percent_fee_decimal"]),
+                buy_percent_fee_deducted_from_returns=trade_fee_schema["buy_percent_fee_deducted_from_returns"],
+                maker_fixed_fees=[TokenAmount.from_json(fee) for fee in trade_fee_schema["maker_fixed_fees"]],
+                taker_fixed_fees=[TokenAmount.from_json(fee) for fee in trade_fee_schema["taker_fixed_fees"]],
+            ),
+            "config_keys": ConnectorConfigKeysReference(**config_keys) if config_keys is not None else None,
+        })
+
+    @classmethod
+    def _scan_connector_settings(cls) -> Dict[str, ConnectorSetting]:
+        """
+        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting,
+        and saves them to the connector manifest.
+        """
+        connector_settings: Dict[str, ConnectorSetting] = {}
+        config_keys_references: Dict[str, Optional[ConnectorConfigKeysReference]] = {}
+
+        for type_dir, connector_dir in cls._connector_dirs():
+            if connector_dir.name in connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+            try:
+                util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
+                                        f"{connector_dir.name}.{connector_dir.name}_utils"
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_dir.name, trade_fee_settings
+            )
+            connector_settings[connector_dir.name] = ConnectorSetting(
+                name=connector_dir.name,
+                type=ConnectorType[type_dir.name.capitalize()],
+                centralised=getattr(util_module, "CENTRALIZED", True),
+                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                trade_fee_schema=trade_fee_schema,
+                config_keys=getattr(util_module, "KEYS", None),
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            )
+            config_keys_references[connector_dir.name] = (
+                ConnectorConfigKeysReference(util_module_path, "KEYS") if hasattr(util_module, "KEYS") else None
+            )
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                parent = connector_settings[connector_dir.name]
+                connector_settings[domain] = ConnectorSetting(
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
+                    trade_fee_schema=trade_fee_schema,
+                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                )
+                config_keys_references[domain] = ConnectorConfigKeysReference(
+                    util_module_path, "OTHER_DOMAINS_KEYS", domain
+                )
+
+        cls._save_connector_manifest(connector_settings, config_keys_references)
+        return connector_settings
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the config keys of the manifest settings unloaded
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -109,7 +109,7 @@ class HummingbotCompleter(Completer):
             if exchange in self.prompt_text:
                 market = exchange
                 break
-        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if trading_pair_fetcher.ready and market else []
+        trading_pairs = trading_pair_fetcher.get_trading_pairs(market) if trading_pair_fetcher.ready and market else []
         return WordCompleter(trading_pairs, ignore_case=True, sentence=True)
 
     @property
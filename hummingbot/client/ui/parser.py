@@ -79,6 +79,8 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
 
     status_parser = subparsers.add_parser("status", help="Get the market status of the current bot")
     status_parser.add_argument("--live", default=False, action="store_true", dest="live", help="Show status updates")
+    status_parser.add_argument("--profile", nargs="?", const="show", default=None, choices=("show", "stop"),
+                               dest="profile", help="Start the tick profiler and show its timings, or stop it")
     status_parser.set_defaults(func=hummingbot.status)
 
     history_parser = subparsers.add_parser("history", help="See the past performance of the current bot")
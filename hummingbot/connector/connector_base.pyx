@@ -140,17 +140,27 @@ cdef class ConnectorBase(NetworkIterator):
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
+        if type(self).event_logs is ConnectorBase.event_logs:
+            # The fill log keeps the traded amounts summed by trading pair and trade type, the fills are not read back
+            traded_amounts = self._event_logger.fill_log.traded_amounts(starting_timestamp)
+        else:
+            # The connector keeps its own event logs
+            traded_amounts = {}
+            for event in self.event_logs:
+                if isinstance(event, OrderFilledEvent) and event.timestamp > starting_timestamp:
+                    amount, quote_amount = traded_amounts.get((event.trading_pair, event.trade_type),
+                                                              (s_decimal_0, s_decimal_0))
+                    traded_amounts[(event.trading_pair, event.trade_type)] = (
+                        amount + event.amount, quote_amount + event.price * event.amount)
         balances = {}
-        for event in order_filled_events:
-            base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
-            if event.trade_type is TradeType.BUY:
-                quote_value = Decimal("-1") * event.price * event.amount
-                base_value = event.amount
+        for (trading_pair, trade_type), (amount, quote_amount) in traded_amounts.items():
+            base, quote = trading_pair.split("-")[0], trading_pair.split("-")[1]
+            if trade_type is TradeType.BUY:
+                quote_value = Decimal("-1") * quote_amount
+                base_value = amount
             else:
-                quote_value = event.price * event.amount
-                base_value = Decimal("-1") * event.amount
+                quote_value = quote_amount
+                base_value = Decimal("-1") * amount
             if base not in balances:
                 balances[base] = s_decimal_0
             if quote not in balances:
@@ -279,6 +289,33 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    @property
+    def supports_order_amend(self) -> bool:
+        """
+        Whether the connector can change the price and amount of an open limit order in a single request (see
+        amend_order). Connectors that support it override this property.
+        """
+        return False
+
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        """
+        Whether get_order_price always returns the quote price (from the same price request), in which case callers
+        needing both prices only request the quote price.
+        """
+        return False
+
+    def amend_order(self, trading_pair: str, client_order_id: str, price: Decimal, amount: Decimal) -> str:
+        """
+        Changes the price and amount of an open limit order.
+        :param trading_pair: The market (e.g. BTC-USDT) of the order.
+        :param client_order_id: The internal order id of the order to amend
+        :param price: The new price
+        :param amount: The new amount in base token value
+        :return: The client order id of the amended order, the same id unless the exchange replaces the order
+        """
+        raise NotImplementedError
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
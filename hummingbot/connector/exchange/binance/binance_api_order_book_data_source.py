@@ -6,9 +6,10 @@ from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
 from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_subscriptions import WSSubscriptionManager
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -20,6 +21,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
     ONE_HOUR = 60 * 60
+    MAX_STREAMS_PER_CONNECTION = CONSTANTS.WS_MAX_STREAMS_PER_CONNECTION
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -68,29 +70,23 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Subscribes to the trade events and diff orders events through the provided websocket connection.
         :param ws: the websocket assistant used to connect to the exchange
         """
+        await self._subscribe_channels_for_trading_pairs(ws, self._trading_pairs)
+
+    async def _subscribe_channels_for_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
+        """
+        Subscribes to the trade events and diff orders events of the trading pairs through the provided websocket
+        connection.
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pairs: the trading pairs to subscribe to
+        """
         try:
-            trade_params = []
-            depth_params = []
-            for trading_pair in self._trading_pairs:
+            channels = []
+            for trading_pair in trading_pairs:
                 symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-                trade_params.append(f"{symbol.lower()}@trade")
-                depth_params.append(f"{symbol.lower()}@depth@100ms")
-            payload = {
-                "method": "SUBSCRIBE",
-                "params": trade_params,
-                "id": 1
-            }
-            subscribe_trade_request: WSJSONRequest = WSJSONRequest(payload=payload)
-
-            payload = {
-                "method": "SUBSCRIBE",
-                "params": depth_params,
-                "id": 2
-            }
-            subscribe_orderbook_request: WSJSONRequest = WSJSONRequest(payload=payload)
-
-            await ws.send(subscribe_trade_request)
-            await ws.send(subscribe_orderbook_request)
+                channels.append(f"{symbol.lower()}@trade")
+                channels.append(f"{symbol.lower()}@depth@100ms")
+            # All the streams of the connection are subscribed to in a single frame
+            await ws.subscribe_channels(channels)
 
             self.logger().info("Subscribed to public order book and trade channels...")
         except asyncio.CancelledError:
@@ -103,7 +99,8 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             raise
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
-        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        ws: WSAssistant = await self._api_factory.get_ws_assistant(
+            subscription_manager=WSSubscriptionManager(web_utils.BinanceWSSubscriptionFormat()))
         await ws.connect(ws_url=CONSTANTS.WSS_URL.format(self._domain),
                          ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
         return ws
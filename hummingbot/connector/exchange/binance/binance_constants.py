@@ -28,6 +28,8 @@ ORDER_PATH_URL = "/order"
 BINANCE_USER_STREAM_PATH_URL = "/userDataStream"
 
 WS_HEARTBEAT_TIME_INTERVAL = 30
+# A single websocket connection can listen to a maximum of 1024 streams
+WS_MAX_STREAMS_PER_CONNECTION = 1024
 
 # Binance params
 
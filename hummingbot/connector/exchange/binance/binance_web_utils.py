@@ -1,4 +1,4 @@
-from typing import Callable, Optional
+from typing import Any, Callable, List, Optional
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
@@ -7,6 +7,7 @@ from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_subscriptions import WSSubscriptionAck, WSSubscriptionFormatBase
 
 
 def public_rest_url(path_url: str, domain: str = CONSTANTS.DEFAULT_DOMAIN) -> str:
@@ -29,6 +30,30 @@ def private_rest_url(path_url: str, domain: str = CONSTANTS.DEFAULT_DOMAIN) -> s
     return CONSTANTS.REST_URL.format(domain) + CONSTANTS.PRIVATE_API_VERSION + path_url
 
 
+class BinanceWSSubscriptionFormat(WSSubscriptionFormatBase):
+    """
+    The subscriptions to the Binance streams: a SUBSCRIBE frame takes all the streams of a connection, and is
+    acknowledged by a result message with its id, or rejected by an error message with its id
+    """
+    max_channels_per_frame = CONSTANTS.WS_MAX_STREAMS_PER_CONNECTION
+
+    def subscription_payload(self, channels: List[str], request_id: int) -> Any:
+        return {
+            "method": "SUBSCRIBE",
+            "params": channels,
+            "id": request_id
+        }
+
+    def acknowledgement(self, data: Any) -> Optional[WSSubscriptionAck]:
+        if not isinstance(data, dict) or "id" not in data:
+            return None
+        if "result" in data:
+            return WSSubscriptionAck(request_id=data["id"], success=True)
+        if "code" in data or "error" in data:
+            return WSSubscriptionAck(request_id=data["id"], success=False)
+        return None
+
+
 def build_api_factory(
         throttler: Optional[AsyncThrottler] = None,
         time_synchronizer: Optional[TimeSynchronizer] = None,
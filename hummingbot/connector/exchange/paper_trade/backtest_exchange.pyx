@@ -0,0 +1,65 @@
+from typing import Dict, TYPE_CHECKING
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange cimport PaperTradeExchange
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock cimport Clock
+from hummingbot.core.data_type.market_data_replay import (
+    BacktestOrderBookTracker,
+    MarketDataEvents,
+    MarketDataReplay,
+)
+from hummingbot.core.network_iterator import NetworkStatus
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+
+cdef class BacktestExchange(PaperTradeExchange):
+    """
+    A paper trade exchange whose order books replay recorded market data, to run strategies with a back testing
+    clock (ClockMode.BACKTEST). Each tick first replays the market data recorded up to the tick timestamp, the
+    recorded trades fill the resting paper orders through the PaperTradeExchange matching, then the paper trade tick
+    processes the market orders and the crossed limit orders as usual.
+    The fees are those of the exchange_name connector.
+    """
+
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 exchange_name: str,
+                 market_data: Dict[str, MarketDataEvents],
+                 queue_position_fills: bool = False):
+        order_book_tracker = BacktestOrderBookTracker(market_data)
+        PaperTradeExchange.__init__(
+            self,
+            client_config_map,
+            order_book_tracker,
+            ExchangeBase,
+            exchange_name=exchange_name,
+            queue_position_fills=queue_position_fills,
+        )
+        # The paper trade exchange has set the order book create function to create composite order books
+        order_book_tracker.create_order_books()
+        self.init_paper_trade_market()
+        self._paper_trade_market_initialized = True
+
+    @property
+    def display_name(self) -> str:
+        return f"{self._exchange_name}_Backtest"
+
+    @property
+    def market_data_replay(self) -> MarketDataReplay:
+        return self._order_book_tracker.replay
+
+    cdef c_start(self, Clock clock, double timestamp):
+        PaperTradeExchange.c_start(self, clock, timestamp)
+        # The order books are ready from the start, with the data recorded up to the start time
+        self._order_book_tracker.advance(timestamp)
+        self._network_status = NetworkStatus.CONNECTED
+
+    async def _check_network_loop(self):
+        # Nothing to connect to
+        self._network_status = NetworkStatus.CONNECTED
+
+    cdef c_tick(self, double timestamp):
+        self._order_book_tracker.advance(timestamp)
+        PaperTradeExchange.c_tick(self, timestamp)
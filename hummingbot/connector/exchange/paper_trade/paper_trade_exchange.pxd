@@ -40,6 +40,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
         str _exchange_name
+        bint _queue_position_fills
+        dict _queue_positions
+        dict _pending_trades
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
@@ -76,6 +79,16 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef c_fill_limit_order(self,
+                            bint is_buy,
+                            LimitOrders *limit_orders_map_ptr,
+                            LimitOrdersIterator *map_it_ptr,
+                            SingleTradingPairLimitOrdersIterator orders_it,
+                            object fill_amount)
+    cdef c_add_queue_position(self, str order_id, str trading_pair, bint is_buy, object price, object amount)
+    cdef c_match_pending_trades(self)
+    cdef c_match_trades_to_queue_positions(self, str trading_pair, bint is_buy, list trades)
+    cdef c_update_queue_positions(self)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
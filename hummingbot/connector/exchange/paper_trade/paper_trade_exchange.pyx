@@ -110,6 +110,37 @@ cdef class QueuedOrder:
                 f"{self.amount})")
 
 
+cdef class QueuePosition:
+    """
+    The estimated place of a resting paper limit order in the queue of its price level: the amount resting ahead of
+    it in the market order book, which the trades at its price consume before filling it. Also accumulates the
+    partial fills of the order.
+    """
+    cdef:
+        public str trading_pair
+        public bint is_buy
+        public double price
+        public double queue_ahead
+        public double remaining
+        public object filled_amount
+        public object base_amount
+        public object quote_amount
+
+    def __init__(self, trading_pair: str, is_buy: bool, price: float, queue_ahead: float, amount: Decimal):
+        self.trading_pair = trading_pair
+        self.is_buy = is_buy
+        self.price = price
+        self.queue_ahead = queue_ahead
+        self.remaining = float(amount)
+        self.filled_amount = s_decimal_0
+        self.base_amount = s_decimal_0
+        self.quote_amount = s_decimal_0
+
+    def __repr__(self) -> str:
+        return (f"QueuePosition('{self.trading_pair}', {self.is_buy}, {self.price}, {self.queue_ahead}, "
+                f"{self.remaining}, {self.filled_amount})")
+
+
 cdef class OrderBookTradeListener(EventListener):
     cdef:
         ExchangeBase _market
@@ -157,7 +188,12 @@ cdef class PaperTradeExchange(ExchangeBase):
         order_book_tracker: OrderBookTracker,
         target_market: Callable,
         exchange_name: str,
+        queue_position_fills: bool = False,
     ):
+        """
+        :param queue_position_fills: fill the limit orders from their estimated queue position and the size of the
+        trades at their price (partially if the trades are smaller), instead of in full as soon as a trade crosses them
+        """
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._set_order_book_tracker(order_book_tracker)
         self._budget_checker = BudgetChecker(exchange=self)
@@ -173,6 +209,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        self._queue_position_fills = queue_position_fills
+        self._queue_positions = {}
+        self._pending_trades = {}
 
         # Trade volume metrics should never be gather for paper trade connector
         self._trade_volume_metric_collector = DummyMetricsCollector()
@@ -242,6 +281,14 @@ cdef class PaperTradeExchange(ExchangeBase):
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
 
+    @property
+    def queue_position_fills(self) -> bool:
+        return self._queue_position_fills
+
+    @property
+    def queue_positions(self) -> Dict[str, QueuePosition]:
+        return self._queue_positions
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         cdef:
@@ -278,10 +325,13 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            quantity = limit_order.quantity
+            if limit_order.filled_quantity is not None:
+                quantity -= limit_order.filled_quantity
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += quantity
         return _on_hold_balances
 
     @property
@@ -318,6 +368,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
+        if self._queue_position_fills:
+            self.c_match_pending_trades()
         self.c_process_crossed_limit_orders()
 
     cdef str c_buy(self,
@@ -368,6 +420,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 int(self._current_timestamp * 1e6),
                 0
             ))
+            if self._queue_position_fills:
+                self.c_add_queue_position(order_id, trading_pair_str, True, quantized_price, quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -426,6 +480,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 int(self._current_timestamp * 1e6),
                 0
             ))
+            if self._queue_position_fills:
+                self.c_add_queue_position(order_id, trading_pair_str, False, quantized_price, quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -625,6 +681,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            if self._queue_position_fills:
+                self._queue_positions.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -821,8 +879,17 @@ cdef class PaperTradeExchange(ExchangeBase):
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
                                SingleTradingPairLimitOrdersIterator orders_it):
+        cdef:
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
         try:
-            if is_buy:
+            if self._queue_position_fills:
+                # Fills what the trades at the order price have not filled yet
+                cpp_limit_order_ptr = address(deref(orders_it))
+                remaining_amount = <object> cpp_limit_order_ptr.getQuantity()
+                if <object> cpp_limit_order_ptr.getFilledQuantity() is not None:
+                    remaining_amount -= <object> cpp_limit_order_ptr.getFilledQuantity()
+                self.c_fill_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it, remaining_amount)
+            elif is_buy:
                 self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
             else:
                 self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
@@ -887,6 +954,286 @@ cdef class PaperTradeExchange(ExchangeBase):
             if map_it != limit_orders_ptr.end():
                 inc(map_it)
 
+    cdef c_fill_limit_order(self,
+                            bint is_buy,
+                            LimitOrders *limit_orders_map_ptr,
+                            LimitOrdersIterator *map_it_ptr,
+                            SingleTradingPairLimitOrdersIterator orders_it,
+                            object fill_amount):
+        """
+        Fills a limit order by fill_amount, partially if it is less than the amount left to fill. The order completed
+        event of a partially filled order reports the amounts of all its fills.
+        """
+        cdef:
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
+            str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
+            str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
+            str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
+            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object price = <object> cpp_limit_order_ptr.getPrice()
+            object filled_amount = <object> cpp_limit_order_ptr.getFilledQuantity()
+            object quote_balance = self.c_get_balance(quote_asset)
+            object base_balance = self.c_get_balance(base_asset)
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            QueuePosition queue_position = self._queue_positions.get(order_id)
+            CPPLimitOrder cpp_limit_order
+
+        order_candidate = OrderCandidate(
+            trading_pair=trading_pair_str,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY if is_buy else TradeType.SELL,
+            amount=fill_amount,
+            price=price,
+            from_total_balances=True
+        )
+        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+        # Quote currency paid (base currency sold for a sell order), including fees.
+        spent_amount = adjusted_order_candidate.order_collateral.amount
+        # Base currency acquired (quote currency for a sell order), including fees.
+        acquired_amount = adjusted_order_candidate.potential_returns.amount
+        spent_asset = quote_asset if is_buy else base_asset
+        spent_balance = quote_balance if is_buy else base_balance
+
+        if spent_amount > spent_balance:
+            self.logger().warning(f"Not enough {spent_asset} balance to fill limit {'buy' if is_buy else 'sell'} order "
+                                  f"on {trading_pair_str}. {spent_amount:.8g} {spent_asset} needed vs. "
+                                  f"{spent_balance:.8g} {spent_asset} available.")
+            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+            self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
+                                 OrderCancelledEvent(self._current_timestamp, order_id))
+            return
+
+        if is_buy:
+            self.c_set_balance(quote_asset, quote_balance - spent_amount)
+            self.c_set_balance(base_asset, base_balance + acquired_amount)
+        else:
+            self.c_set_balance(quote_asset, quote_balance + acquired_amount)
+            self.c_set_balance(base_asset, base_balance - spent_amount)
+
+        fees = build_trade_fee(
+            exchange=self.name,
+            is_maker=True,
+            base_currency="",
+            quote_currency="",
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY if is_buy else TradeType.SELL,
+            amount=Decimal("0"),
+            price=Decimal("0"),
+        )
+        self.c_trigger_event(
+            self.ORDER_FILLED_EVENT_TAG,
+            OrderFilledEvent(
+                self._current_timestamp,
+                order_id,
+                trading_pair_str,
+                TradeType.BUY if is_buy else TradeType.SELL,
+                OrderType.LIMIT,
+                price,
+                fill_amount,
+                fees,
+                exchange_trade_id=str(int(self._time() * 1e6))
+            ))
+
+        if queue_position is None:
+            queue_position = QueuePosition(trading_pair_str, is_buy, float(price), 0, amount)
+        base_amount = acquired_amount if is_buy else spent_amount
+        quote_amount = spent_amount if is_buy else acquired_amount
+        queue_position.base_amount += base_amount
+        queue_position.quote_amount += quote_amount
+        filled_amount = (filled_amount or s_decimal_0) + fill_amount
+
+        if filled_amount >= amount:
+            if is_buy:
+                self.c_trigger_event(
+                    self.BUY_ORDER_COMPLETED_EVENT_TAG,
+                    BuyOrderCompletedEvent(self._current_timestamp,
+                                           order_id,
+                                           base_asset,
+                                           quote_asset,
+                                           queue_position.base_amount,
+                                           queue_position.quote_amount,
+                                           OrderType.LIMIT))
+            else:
+                self.c_trigger_event(
+                    self.SELL_ORDER_COMPLETED_EVENT_TAG,
+                    SellOrderCompletedEvent(self._current_timestamp,
+                                            order_id,
+                                            base_asset,
+                                            quote_asset,
+                                            queue_position.base_amount,
+                                            queue_position.quote_amount,
+                                            OrderType.LIMIT))
+            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+            return
+
+        # The orders are immutable in their set: replaces the order with a copy recording the filled amount. Not
+        # through c_delete_limit_order, the collection (and the map iterator) must stay valid.
+        cpp_limit_order = CPPLimitOrder(
+            cpp_limit_order_ptr.getClientOrderID(),
+            cpp_limit_order_ptr.getTradingPair(),
+            cpp_limit_order_ptr.getIsBuy(),
+            cpp_limit_order_ptr.getBaseCurrency(),
+            cpp_limit_order_ptr.getQuoteCurrency(),
+            cpp_limit_order_ptr.getPrice(),
+            cpp_limit_order_ptr.getQuantity(),
+            <PyObject *> filled_amount,
+            cpp_limit_order_ptr.getCreationTimestamp(),
+            cpp_limit_order_ptr.getStatus()
+        )
+        orders_collection_ptr.erase(orders_it)
+        orders_collection_ptr.insert(cpp_limit_order)
+        queue_position.filled_amount = filled_amount
+        queue_position.remaining = float(amount - filled_amount)
+        self._queue_positions[order_id] = queue_position
+
+    cdef c_add_queue_position(self, str order_id, str trading_pair, bint is_buy, object price, object amount):
+        """
+        The new order joins the back of the queue of its price level: the whole level amount is ahead of it.
+        """
+        cdef:
+            double level_price = float(price)
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+        self._queue_positions[order_id] = QueuePosition(trading_pair,
+                                                        is_buy,
+                                                        level_price,
+                                                        order_book.c_get_level_amount(is_buy, level_price),
+                                                        amount)
+
+    cdef c_match_pending_trades(self):
+        """
+        Matches the trades received since the last tick to the limit orders, in one pass per trading pair and side.
+        """
+        cdef:
+            dict pending_trades = self._pending_trades
+            list trades
+            list bid_trades
+            list ask_trades
+        self._pending_trades = {}
+        for trading_pair, trades in pending_trades.items():
+            bid_trades = [(price, amount) for is_maker_buy, price, amount in trades if is_maker_buy]
+            ask_trades = [(price, amount) for is_maker_buy, price, amount in trades if not is_maker_buy]
+            if len(bid_trades) > 0:
+                self.c_match_trades_to_queue_positions(trading_pair, True, bid_trades)
+            if len(ask_trades) > 0:
+                self.c_match_trades_to_queue_positions(trading_pair, False, ask_trades)
+        self.c_update_queue_positions()
+
+    cdef c_match_trades_to_queue_positions(self, str trading_pair, bint is_buy, list trades):
+        """
+        Fills the limit orders of one side of a trading pair from the trades taking that side, in their time order.
+        A trade fills the orders priced better than the trade price from its amount, then at the trade price it
+        consumes the market order book amount queued ahead of an order before filling it. The fills of an order are
+        summed in double precision and applied once.
+
+        :param is_buy: are the limit orders on the bid side (i.e. the trades are taker sells)?
+        :param trades: (price, amount) of the trades
+        """
+        cdef:
+            string cpp_trading_pair = trading_pair.encode("utf8")
+            LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
+                                                 if is_buy
+                                                 else address(self._ask_limit_orders))
+            LimitOrdersIterator map_it = limit_orders_map_ptr.find(cpp_trading_pair)
+            SingleTradingPairLimitOrders *orders_collection_ptr = NULL
+            SingleTradingPairLimitOrdersIterator orders_it
+            vector[SingleTradingPairLimitOrdersIterator] order_its
+            vector[double] prices
+            vector[double] queue_ahead
+            vector[double] remaining
+            vector[double] fills
+            list priority
+            list order_ids = []
+            QueuePosition queue_position
+            double trade_price
+            double trade_amount
+            double consumed_ahead
+            double price_improvement
+            double fill
+            int i
+            int index
+
+        if map_it == limit_orders_map_ptr.end():
+            return
+        orders_collection_ptr = address(deref(map_it).second)
+        orders_it = orders_collection_ptr.begin()
+        while orders_it != orders_collection_ptr.end():
+            order_id = deref(orders_it).getClientOrderID().decode("utf8")
+            queue_position = self._queue_positions.get(order_id)
+            if queue_position is not None and queue_position.remaining > 0:
+                order_its.push_back(orders_it)
+                order_ids.append(order_id)
+                prices.push_back(queue_position.price)
+                queue_ahead.push_back(queue_position.queue_ahead)
+                remaining.push_back(queue_position.remaining)
+                fills.push_back(0)
+            inc(orders_it)
+        if order_its.size() == 0:
+            return
+
+        # Best price first, then the least amount queued ahead
+        priority_keys = [(-prices[i] if is_buy else prices[i], queue_ahead[i])
+                         for i in range(<int> order_its.size())]
+        priority = sorted(range(order_its.size()), key=priority_keys.__getitem__)
+
+        for trade_price, trade_amount in trades:
+            consumed_ahead = 0
+            for index in priority:
+                if trade_amount <= 0:
+                    break
+                if remaining[index] <= 0:
+                    continue
+                price_improvement = prices[index] - trade_price if is_buy else trade_price - prices[index]
+                if price_improvement < 0:
+                    break
+                if price_improvement == 0 and queue_ahead[index] > consumed_ahead:
+                    fill = min(trade_amount, queue_ahead[index] - consumed_ahead)
+                    consumed_ahead += fill
+                    trade_amount -= fill
+                fill = min(trade_amount, remaining[index])
+                fills[index] += fill
+                remaining[index] -= fill
+                trade_amount -= fill
+            if consumed_ahead > 0:
+                for i in range(<int> order_its.size()):
+                    if prices[i] == trade_price:
+                        queue_ahead[i] = max(0.0, queue_ahead[i] - consumed_ahead)
+
+        for i in range(<int> order_its.size()):
+            queue_position = self._queue_positions[order_ids[i]]
+            queue_position.queue_ahead = queue_ahead[i]
+            if fills[i] <= 0:
+                continue
+            amount_left = (<object> deref(order_its[i]).getQuantity()) - queue_position.filled_amount
+            if remaining[i] <= 1e-12 * queue_position.remaining:
+                fill_amount = amount_left
+            else:
+                fill_amount = min(amount_left, self.c_quantize_order_amount(trading_pair, Decimal(repr(fills[i]))))
+            if fill_amount <= 0:
+                continue
+            try:
+                self.c_fill_limit_order(is_buy, limit_orders_map_ptr, address(map_it), order_its[i], fill_amount)
+            except Exception:
+                self.logger().error("Error processing limit order.", exc_info=True)
+
+    cdef c_update_queue_positions(self):
+        """
+        The amount queued ahead of an order never exceeds the amount of its price level: cancellations and trades
+        missed by the trade stream move the order forward.
+        """
+        cdef:
+            QueuePosition queue_position
+            OrderBook order_book
+            double level_amount
+        for queue_position in self._queue_positions.values():
+            if queue_position.queue_ahead <= 0:
+                continue
+            order_book = self.c_get_order_book(queue_position.trading_pair)
+            level_amount = order_book.c_get_level_amount(queue_position.is_buy, queue_position.price)
+            if level_amount < queue_position.queue_ahead:
+                queue_position.queue_ahead = level_amount
+
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
@@ -909,6 +1256,12 @@ cdef class PaperTradeExchange(ExchangeBase):
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        if self._queue_position_fills:
+            # Matched with the other trades of the tick in c_match_pending_trades
+            self._pending_trades.setdefault(order_book_trade_event.trading_pair, []).append(
+                (is_maker_buy, float(trade_price), float(trade_quantity)))
+            return
+
         if map_it == limit_orders_map_ptr.end():
             return
 
@@ -19,8 +19,9 @@ from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_data_hub import MarketDataHubOrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker, OrderBookTrackerDataSourceType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
@@ -73,7 +74,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
         self._set_order_book_tracker(OrderBookTracker(
-            data_source=self._orderbook_ds,
+            data_source=self._create_order_book_tracker_data_source(),
             trading_pairs=self.trading_pairs,
             domain=self.domain))
 
@@ -1024,6 +1025,24 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_book_data_source(self) -> OrderBookTrackerDataSource:
         raise NotImplementedError
 
+    @property
+    def order_book_tracker_data_source_type(self) -> OrderBookTrackerDataSourceType:
+        if self._client_config.market_data_hub.market_data_hub_enabled:
+            return OrderBookTrackerDataSourceType.LOCAL_HUB
+        return OrderBookTrackerDataSourceType.EXCHANGE_API
+
+    def _create_order_book_tracker_data_source(self) -> OrderBookTrackerDataSource:
+        """
+        The order book tracker subscribes to the local market data hub instead of the exchange when the client is
+        configured to use it
+        """
+        if self.order_book_tracker_data_source_type is OrderBookTrackerDataSourceType.LOCAL_HUB:
+            return MarketDataHubOrderBookTrackerDataSource(
+                trading_pairs=self.trading_pairs,
+                exchange_name=self.name,
+                socket_path=self._client_config.market_data_hub.market_data_hub_socket_path or None)
+        return self._orderbook_ds
+
     @abstractmethod
     def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
         raise NotImplementedError
@@ -719,14 +719,9 @@ class GatewayEVMAMMLP(ConnectorBase):
         tx_hash_list: List[str] = await safe_gather(*[
             tracked_approval.get_exchange_order_id() for tracked_approval in tracked_approvals
         ])
-        transaction_states: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
+        transaction_states: List[Union[Dict[str, Any], Exception]] = (
+            await self._get_gateway_instance().get_transaction_statuses(self.chain, self.network, tx_hash_list)
+        )
         for tracked_approval, transaction_status in zip(tracked_approvals, transaction_states):
             token_symbol: str = self.get_token_symbol_from_approval_order_id(tracked_approval.client_order_id)
             if isinstance(transaction_status, Exception):
@@ -776,14 +771,13 @@ class GatewayEVMAMMLP(ConnectorBase):
             "Polling for order status updates of %d canceled orders.",
             len(canceled_tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
+        update_results: List[Union[Dict[str, Any], Exception]] = (
+            await self._get_gateway_instance().get_transaction_statuses(
                 self.chain,
                 self.network,
-                tx_hash
+                [t.cancel_tx_hash for t in canceled_tracked_orders]
             )
-            for tx_hash in [t.cancel_tx_hash for t in canceled_tracked_orders]
-        ], return_exceptions=True)
+        )
         for tracked_order, update_result in zip(canceled_tracked_orders, update_results):
             if isinstance(update_result, Exception):
                 raise update_result
@@ -840,15 +834,14 @@ class GatewayEVMAMMLP(ConnectorBase):
             "Polling for order status updates of %d orders.",
             len(tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
+        update_results: List[Union[Dict[str, Any], Exception]] = (
+            await self._get_gateway_instance().get_transaction_statuses(
                 self.chain,
                 self.network,
-                tx_hash,
+                tx_hash_list,
                 connector=self.connector_name
             )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
+        )
         for tracked_order, update_result in zip(pending_nft_orders, update_results):
             if isinstance(update_result, Exception):
                 raise update_result
@@ -73,16 +73,15 @@ class GatewayNearAMM(GatewayEVMAMM):
             "Polling for order status updates of %d orders.",
             len(tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                chain=self.chain,
-                network=self.network,
-                transaction_hash=tx_hash,
+        update_results: List[Union[Dict[str, Any], Exception]] = (
+            await self._get_gateway_instance().get_transaction_statuses(
+                self.chain,
+                self.network,
+                tx_hash_list,
                 address=self.address,
                 fail_silently=True
             )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
+        )
         for tracked_order, tx_details in zip(tracked_orders, update_results):
             if "txHash" not in tx_details:
                 continue
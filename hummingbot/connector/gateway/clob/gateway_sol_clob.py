@@ -229,6 +229,10 @@ class GatewaySOLCLOB(ConnectorBase):
             for in_flight_order in self.orders
         ]
 
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return True
+
     @property
     def network_transaction_fee(self) -> TokenAmount:
         """
@@ -709,14 +713,9 @@ class GatewaySOLCLOB(ConnectorBase):
         tx_hash_list: List[str] = await safe_gather(*[
             tracked_approval.get_exchange_order_id() for tracked_approval in tracked_approvals
         ])
-        transaction_states: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
+        transaction_states: List[Union[Dict[str, Any], Exception]] = (
+            await self._get_gateway_instance().get_transaction_statuses(self.chain, self.network, tx_hash_list)
+        )
         for tracked_approval, transaction_status in zip(tracked_approvals, transaction_states):
             token_symbol: str = self.get_token_symbol_from_approval_order_id(tracked_approval.client_order_id)
             if isinstance(transaction_status, Exception):
@@ -773,14 +772,13 @@ class GatewaySOLCLOB(ConnectorBase):
             "Polling for order status updates of %d canceled orders.",
             len(canceled_tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
+        update_results: List[Union[Dict[str, Any], Exception]] = (
+            await self._get_gateway_instance().get_transaction_statuses(
                 self.chain,
                 self.network,
-                tx_hash
+                [t.cancel_tx_hash for t in canceled_tracked_orders]
             )
-            for tx_hash in [t.cancel_tx_hash for t in canceled_tracked_orders]
-        ], return_exceptions=True)
+        )
         for tracked_order, update_result in zip(canceled_tracked_orders, update_results):
             if isinstance(update_result, Exception):
                 raise update_result
@@ -837,14 +835,9 @@ class GatewaySOLCLOB(ConnectorBase):
             "Polling for order status updates of %d orders.",
             len(tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
+        update_results: List[Union[Dict[str, Any], Exception]] = (
+            await self._get_gateway_instance().get_transaction_statuses(self.chain, self.network, tx_hash_list)
+        )
         for tracked_order, tx_details in zip(tracked_orders, update_results):
             if isinstance(tx_details, Exception):
                 self.logger().error(f"An error occurred fetching transaction status of {tracked_order.client_order_id}")
@@ -163,6 +163,10 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     def _create_order_book_data_source(self) -> PerpetualAPIOrderBookDataSource:
         raise NotImplementedError
 
+    def _create_order_book_tracker_data_source(self) -> PerpetualAPIOrderBookDataSource:
+        # The funding info is streamed by the order book data source, the market data hub does not forward it
+        return self._orderbook_ds
+
     @abstractmethod
     async def _place_order(
         self,
@@ -10,3 +10,12 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _profiler
+        object _overrun_policy
+        object _overrun_stats
+        bint _missed_last_tick
+        bint _deferred_last_tick
+
+    cdef bint c_tick_children(self, list iterators) except *
+    cdef bint c_tick_connectors_first(self) except *
+    cdef c_tick_child(self, object child_iterator)
@@ -3,16 +3,56 @@
 import asyncio
 import logging
 import time
-from typing import List
+from time import perf_counter_ns
+from typing import Any, Dict, List
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
-from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_mode import ClockMode, TickOverrunPolicy
+from hummingbot.core.utils.tick_profiler import TickProfiler
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
 
+class TickOverrunStats:
+    """
+    Real time clock tick accounting. The lag of a tick is the time between its scheduled timestamp and the moment its
+    iterators start, a tick overruns when its iterators are still running at the next tick timestamp.
+    """
+
+    def __init__(self):
+        self.ticks: int = 0
+        self.overruns: int = 0
+        self.missed_ticks: int = 0
+        self.deferred_ticks: int = 0
+        self.last_lag: float = 0.0
+        self.max_lag: float = 0.0
+        self.max_tick_duration: float = 0.0
+
+    def record_tick(self, lag: float, duration: float, missed_ticks: int):
+        self.ticks += 1
+        self.last_lag = lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if duration > self.max_tick_duration:
+            self.max_tick_duration = duration
+        if missed_ticks > 0:
+            self.overruns += 1
+            self.missed_ticks += missed_ticks
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "missed_ticks": self.missed_ticks,
+            "deferred_ticks": self.deferred_ticks,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "max_tick_duration": self.max_tick_duration,
+        }
+
+
 cdef class Clock:
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -21,12 +61,14 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 overrun_policy: TickOverrunPolicy = TickOverrunPolicy.SKIP):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param overrun_policy: (real time mode only) what to do when the iterators take longer than a tick
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +78,11 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._profiler = TickProfiler.get_instance()
+        self._overrun_policy = overrun_policy
+        self._overrun_stats = TickOverrunStats()
+        self._missed_last_tick = False
+        self._deferred_last_tick = False
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +104,14 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def overrun_policy(self) -> TickOverrunPolicy:
+        return self._overrun_policy
+
+    @property
+    def overrun_stats(self) -> TickOverrunStats:
+        return self._overrun_stats
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -90,6 +145,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            int missed_ticks
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -107,21 +164,33 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                if self._missed_last_tick and self._overrun_policy is not TickOverrunPolicy.SKIP:
+                    # Run the late tick right away, on the last tick boundary, after letting the other coroutines
+                    # run: back to back late ticks would starve them
+                    next_tick_time = (now // self._tick_size) * self._tick_size
+                    await asyncio.sleep(0)
+                else:
+                    # Sleep until the next tick
+                    next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                    await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                tick_start = time.time()
 
                 # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                if self._overrun_policy is TickOverrunPolicy.CONNECTORS_FIRST:
+                    if not self.c_tick_connectors_first():
                         return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                elif not self.c_tick_children(self._current_context):
+                    return
+
+                now = time.time()
+                missed_ticks = <int>((now - self._current_tick) // self._tick_size)
+                self._missed_last_tick = missed_ticks > 0
+                self._overrun_stats.record_tick(tick_start - self._current_tick, now - tick_start, missed_ticks)
+                if self._profiler.enabled:
+                    self._profiler.record("Clock", "tick_lag", <long long>((tick_start - self._current_tick) * 1e9))
+                    self._profiler.set_counters("Clock", self._overrun_stats.to_dict())
+                    self._profiler.export_if_due(now)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
@@ -142,7 +211,7 @@ cdef class Clock:
                 for ci in self._child_iterators:
                     child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_child(child_iterator)
                     except StopIteration:
                         raise
                     except Exception:
@@ -154,5 +223,53 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef bint c_tick_children(self, list iterators) except *:
+        """
+        Ticks the iterators in order, returns False if one of them stopped the clock
+        """
+        for ci in iterators:
+            try:
+                self.c_tick_child(ci)
+            except StopIteration:
+                self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                return False
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+        return True
+
+    cdef bint c_tick_connectors_first(self) except *:
+        """
+        Ticks the connectors, then the other iterators. When the previous tick ran over its budget (the tick size), the
+        other iterators are deferred so the late tick only updates the connectors. They are never deferred two ticks in
+        a row.
+        """
+        from hummingbot.core.network_iterator import NetworkIterator
+
+        cdef:
+            list connectors = [ci for ci in self._current_context if isinstance(ci, NetworkIterator)]
+            list others = [ci for ci in self._current_context if not isinstance(ci, NetworkIterator)]
+
+        if not self.c_tick_children(connectors):
+            return False
+        if self._missed_last_tick and not self._deferred_last_tick and len(others) > 0:
+            self._deferred_last_tick = True
+            self._overrun_stats.deferred_ticks += 1
+            return True
+        self._deferred_last_tick = False
+        return self.c_tick_children(others)
+
+    cdef c_tick_child(self, object child_iterator):
+        cdef:
+            TimeIterator typed_iterator = child_iterator
+            long long start_ns
+        if self._profiler.enabled:
+            start_ns = perf_counter_ns()
+            try:
+                typed_iterator.c_tick(self._current_tick)
+            finally:
+                self._profiler.record(child_iterator.__class__.__name__, "tick", perf_counter_ns() - start_ns)
+        else:
+            typed_iterator.c_tick(self._current_tick)
+
     def backtest(self):
         self.backtest_til(self._end_time)
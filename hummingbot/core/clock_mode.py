@@ -6,3 +6,16 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+
+
+class TickOverrunPolicy(Enum):
+    """
+    What the real time clock does when the iterators take longer than a tick:
+    SKIP waits for the next tick boundary, the missed ticks are dropped.
+    COALESCE runs the late tick right away, the missed ticks are merged into it.
+    CONNECTORS_FIRST ticks the connectors (network iterators) before the other iterators (strategies, scripts). A late
+    tick runs right away like COALESCE, but only for the connectors: the other iterators are deferred to the next tick.
+    """
+    SKIP = "skip"
+    COALESCE = "coalesce"
+    CONNECTORS_FIRST = "connectors_first"
@@ -0,0 +1,96 @@
+#include "CrossBookMatcher.h"
+#include <algorithm>
+
+CrossBookMatch matchCrossBook(const std::set<OrderBookEntry> &bidBook,
+                              const std::set<OrderBookEntry> &askBook,
+                              double bidPriceRate,
+                              double askPriceRate,
+                              double minProfitability) {
+    CrossBookMatch match;
+    match.bidLevels = match.askLevels = 0;
+    std::set<OrderBookEntry>::const_reverse_iterator bidIterator = bidBook.rbegin();
+    std::set<OrderBookEntry>::const_iterator askIterator = askBook.begin();
+    double bidLeftover = 0;
+    double askLeftover = 0;
+
+    while (true) {
+        // Advance the side(s) whose current level is filled, the best bid and the best ask come first
+        if (bidLeftover <= 0) {
+            if (bidIterator == bidBook.rend()) {
+                break;
+            }
+            if (match.bidLevels > 0) {
+                ++bidIterator;
+                if (bidIterator == bidBook.rend()) {
+                    break;
+                }
+            }
+            bidLeftover = bidIterator->getAmount();
+            match.bidLevels++;
+        }
+        if (askLeftover <= 0) {
+            if (askIterator == askBook.end()) {
+                break;
+            }
+            if (match.askLevels > 0) {
+                ++askIterator;
+                if (askIterator == askBook.end()) {
+                    break;
+                }
+            }
+            askLeftover = askIterator->getAmount();
+            match.askLevels++;
+        }
+
+        double bidPriceAdjusted = bidIterator->getPrice() * bidPriceRate;
+        double askPriceAdjusted = askIterator->getPrice() * askPriceRate;
+        if (bidPriceAdjusted < askPriceAdjusted) {
+            break;
+        }
+        // Negative profitabilities are allowed for debugging, they still bound the walk
+        if (minProfitability < 0 && bidPriceAdjusted / askPriceAdjusted < 1 + minProfitability) {
+            break;
+        }
+
+        double stepAmount = std::min(bidLeftover, askLeftover);
+        // Some exchanges publish levels with a zero amount, they are skipped
+        if (stepAmount <= 0) {
+            continue;
+        }
+        match.steps.push_back(CrossBookStep{bidIterator->getPrice(), askIterator->getPrice(), stepAmount});
+        bidLeftover -= stepAmount;
+        askLeftover -= stepAmount;
+    }
+    return match;
+}
+
+size_t findBestProfitableSteps(const std::vector<CrossBookStep> &steps,
+                               double bidPriceRate,
+                               double askPriceRate,
+                               double bidFeePercent,
+                               double askFeePercent,
+                               double minProfitability,
+                               double maxAmount,
+                               double &bestAmount,
+                               double &bestProfitability) {
+    size_t bestSteps = 0;
+    double totalAmount = 0;
+    double totalBidValue = 0;
+    double totalAskValue = 0;
+    bestAmount = bestProfitability = 0;
+
+    for (size_t i = 0; i < steps.size() && totalAmount < maxAmount; i++) {
+        double stepAmount = std::min(steps[i].amount, maxAmount - totalAmount);
+        totalAmount += stepAmount;
+        totalBidValue += steps[i].bidPrice * bidPriceRate * stepAmount;
+        totalAskValue += steps[i].askPrice * askPriceRate * stepAmount;
+        double profitability = (totalBidValue * (1 - bidFeePercent)) / (totalAskValue * (1 + askFeePercent));
+        // The deepest step above the minimum profitability is the best amount, as in ArbitrageStrategy
+        if (profitability > 1 + minProfitability) {
+            bestSteps = i + 1;
+            bestAmount = totalAmount;
+            bestProfitability = profitability;
+        }
+    }
+    return bestSteps;
+}
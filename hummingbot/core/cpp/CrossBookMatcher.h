@@ -0,0 +1,38 @@
+#ifndef _CROSS_BOOK_MATCHER_H
+#define _CROSS_BOOK_MATCHER_H
+
+#include <stddef.h>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+struct CrossBookStep {
+    double bidPrice;
+    double askPrice;
+    double amount;
+};
+
+struct CrossBookMatch {
+    std::vector<CrossBookStep> steps;
+    // The number of levels walked on each side, including the level the walk stopped at
+    size_t bidLevels;
+    size_t askLevels;
+};
+
+CrossBookMatch matchCrossBook(const std::set<OrderBookEntry> &bidBook,
+                              const std::set<OrderBookEntry> &askBook,
+                              double bidPriceRate,
+                              double askPriceRate,
+                              double minProfitability);
+
+size_t findBestProfitableSteps(const std::vector<CrossBookStep> &steps,
+                               double bidPriceRate,
+                               double askPriceRate,
+                               double bidFeePercent,
+                               double askFeePercent,
+                               double minProfitability,
+                               double maxAmount,
+                               double &bestAmount,
+                               double &bestProfitability);
+
+#endif
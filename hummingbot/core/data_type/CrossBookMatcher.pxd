@@ -0,0 +1,32 @@
+# distutils: language=c++
+
+from libcpp.set cimport set
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/CrossBookMatcher.h":
+    ctypedef struct CrossBookStep:
+        double bidPrice
+        double askPrice
+        double amount
+
+    ctypedef struct CrossBookMatch:
+        vector[CrossBookStep] steps
+        size_t bidLevels
+        size_t askLevels
+
+    CrossBookMatch matchCrossBook(const set[OrderBookEntry] &bid_book,
+                                  const set[OrderBookEntry] &ask_book,
+                                  double bid_price_rate,
+                                  double ask_price_rate,
+                                  double min_profitability)
+
+    size_t findBestProfitableSteps(const vector[CrossBookStep] &steps,
+                                   double bid_price_rate,
+                                   double ask_price_rate,
+                                   double bid_fee_percent,
+                                   double ask_fee_percent,
+                                   double min_profitability,
+                                   double max_amount,
+                                   double &best_amount,
+                                   double &best_profitability)
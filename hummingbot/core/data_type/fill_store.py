@@ -0,0 +1,293 @@
+from decimal import Decimal
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade import Trade
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
+from hummingbot.core.event.events import OrderFilledEvent
+
+COLUMN_DTYPES = {
+    "timestamp": np.float64,
+    "price": np.float64,
+    "amount": np.float64,
+    # The amount of the first flat fee, NaN when the fee has none
+    "fee_amount": np.float64,
+    "market": np.int32,
+    "fee": np.int32,
+    "trade_type": np.int8,
+    "order_type": np.int8,
+}
+INITIAL_CAPACITY = 1024
+
+
+class FillSummary(NamedTuple):
+    fills: int
+    volume: float
+    quote_volume: float
+
+    @property
+    def average_price(self) -> float:
+        return self.quote_volume / self.volume if self.volume > 0 else float("nan")
+
+
+class FillStore:
+    """
+    Keeps the order fills of a strategy in NumPy columns instead of OrderFilledEvent and Trade objects.
+
+    The columns are a ring buffer growing up to max_fills rows, then the oldest fills are dropped. When max_age is
+    set the fills older than max_age seconds before the latest fill are dropped too, so the memory used stays flat
+    over long runs. The markets and the fee types are interned: a fill row takes 42 bytes. The summaries (volume,
+    average price by market and side) are computed on the columns, the Trade objects are only created by trades().
+    """
+
+    def __init__(self, max_fills: int = 100000, max_age: Optional[float] = None):
+        """
+        :param max_fills: The number of fills kept
+        :param max_age: The age (in seconds, relative to the latest fill) of the fills kept, None keeps them all
+        """
+        self._max_fills = max_fills
+        self._max_age = max_age
+        self._capacity = 0
+        self._start = 0
+        self._size = 0
+        # The sequence number of the oldest fill kept, the fills are numbered as they are added
+        self._first_seq = 0
+        self._columns: Dict[str, np.ndarray] = {name: np.empty(0, dtype=dtype)
+                                                for name, dtype in COLUMN_DTYPES.items()}
+        self._market_keys: List[Tuple[str, str]] = []
+        self._market_indexes: Dict[Tuple[str, str], int] = {}
+        self._fee_keys: List[Tuple[Hashable, ...]] = []
+        self._fee_indexes: Dict[Tuple[Hashable, ...], int] = {}
+        # The amounts of the flat fees after the first one, by fill sequence number
+        self._extra_fee_amounts: Dict[int, List[Decimal]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def max_fills(self) -> int:
+        return self._max_fills
+
+    @property
+    def max_age(self) -> Optional[float]:
+        return self._max_age
+
+    def set_retention(self, max_fills: int, max_age: Optional[float] = None):
+        """
+        Changes how many fills are kept, the fills out of the new retention are dropped.
+        """
+        self._max_fills = max_fills
+        self._max_age = max_age
+        while self._size > max_fills:
+            self._drop_oldest()
+        if self._capacity > max_fills:
+            self._resize(max(max_fills, 1))
+        self._expire()
+
+    def add_order_filled_event(self, market: str, event: OrderFilledEvent):
+        """
+        :param market: The display name of the market that filled the order
+        :param event: The order filled event
+        """
+        self.add_fill(market, event.trading_pair, event.trade_type, event.order_type, event.price, event.amount,
+                      event.timestamp, event.trade_fee)
+
+    def add_fill(self,
+                 market: str,
+                 trading_pair: str,
+                 trade_type: TradeType,
+                 order_type: OrderType,
+                 price: Decimal,
+                 amount: Decimal,
+                 timestamp: float,
+                 trade_fee: Any):
+        if self._max_fills <= 0:
+            return
+        if self._size == self._capacity:
+            if self._capacity < self._max_fills:
+                self._resize(min(max(self._capacity * 2, INITIAL_CAPACITY), self._max_fills))
+            else:
+                self._drop_oldest()
+        seq = self._first_seq + self._size
+        position = (self._start + self._size) % self._capacity
+        fee_index, fee_amounts = self._intern_fee(trade_fee)
+        columns = self._columns
+        columns["timestamp"][position] = timestamp
+        columns["price"][position] = price
+        columns["amount"][position] = amount
+        columns["fee_amount"][position] = fee_amounts[0] if len(fee_amounts) > 0 else np.nan
+        columns["market"][position] = self._intern_market(market, trading_pair)
+        columns["fee"][position] = fee_index
+        columns["trade_type"][position] = trade_type.value
+        columns["order_type"][position] = order_type.value
+        if len(fee_amounts) > 1:
+            self._extra_fee_amounts[seq] = fee_amounts[1:]
+        self._size += 1
+        self._expire()
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        :return: The values of a column, from the oldest fill to the latest
+        """
+        values = self._columns[name]
+        end = self._start + self._size
+        if end <= self._capacity:
+            return values[self._start:end]
+        return np.concatenate((values[self._start:], values[:end - self._capacity]))
+
+    def summary(self,
+                market: Optional[str] = None,
+                trading_pair: Optional[str] = None,
+                start_timestamp: Optional[float] = None) -> Dict[Tuple[str, str, TradeType], FillSummary]:
+        """
+        :return: The number of fills, the base and quote volumes by market, trading pair and side
+        """
+        mask = self._mask(market, trading_pair, None, start_timestamp)
+        amounts = self.column("amount")[mask]
+        quote_amounts = amounts * self.column("price")[mask]
+        # One group per market and side
+        groups = self.column("market")[mask].astype(np.int64) * 4 + self.column("trade_type")[mask]
+        group_count = len(self._market_keys) * 4
+        fills = np.bincount(groups, minlength=group_count)
+        volumes = np.bincount(groups, weights=amounts, minlength=group_count)
+        quote_volumes = np.bincount(groups, weights=quote_amounts, minlength=group_count)
+        summaries = {}
+        for group in np.flatnonzero(fills):
+            market_name, market_trading_pair = self._market_keys[group // 4]
+            summaries[(market_name, market_trading_pair, TradeType(group % 4))] = FillSummary(
+                int(fills[group]), float(volumes[group]), float(quote_volumes[group]))
+        return summaries
+
+    def volume(self,
+               market: Optional[str] = None,
+               trading_pair: Optional[str] = None,
+               trade_type: Optional[TradeType] = None) -> float:
+        """
+        :return: The base amount filled
+        """
+        return float(self.column("amount")[self._mask(market, trading_pair, trade_type)].sum())
+
+    def quote_volume(self,
+                     market: Optional[str] = None,
+                     trading_pair: Optional[str] = None,
+                     trade_type: Optional[TradeType] = None) -> float:
+        """
+        :return: The quote amount filled
+        """
+        mask = self._mask(market, trading_pair, trade_type)
+        return float((self.column("amount")[mask] * self.column("price")[mask]).sum())
+
+    def average_price(self,
+                      market: Optional[str] = None,
+                      trading_pair: Optional[str] = None,
+                      trade_type: Optional[TradeType] = None) -> float:
+        """
+        :return: The volume weighted average price of the fills, NaN when there is none
+        """
+        volume = self.volume(market, trading_pair, trade_type)
+        return self.quote_volume(market, trading_pair, trade_type) / volume if volume > 0 else float("nan")
+
+    def trades(self, market: Optional[str] = None, trading_pair: Optional[str] = None) -> List[Trade]:
+        """
+        :return: The fills as Trade objects, sorted by timestamp
+        """
+        mask = self._mask(market, trading_pair)
+        rows = np.flatnonzero(mask)
+        timestamps = self.column("timestamp")
+        rows = rows[np.argsort(timestamps[rows], kind="stable")]
+        prices, amounts, fee_amounts = self.column("price"), self.column("amount"), self.column("fee_amount")
+        markets, fees = self.column("market"), self.column("fee")
+        trade_types, order_types = self.column("trade_type"), self.column("order_type")
+        trades = []
+        for row in rows.tolist():
+            market_name, market_trading_pair = self._market_keys[markets[row]]
+            trades.append(Trade(
+                market_trading_pair,
+                TradeType(int(trade_types[row])),
+                Decimal(str(prices[row])),
+                Decimal(str(amounts[row])),
+                OrderType(int(order_types[row])),
+                market_name,
+                float(timestamps[row]),
+                self._fee(int(fees[row]), float(fee_amounts[row]), self._first_seq + row)))
+        return trades
+
+    def _mask(self,
+              market: Optional[str] = None,
+              trading_pair: Optional[str] = None,
+              trade_type: Optional[TradeType] = None,
+              start_timestamp: Optional[float] = None) -> np.ndarray:
+        mask = np.ones(self._size, dtype=bool)
+        if market is not None or trading_pair is not None:
+            market_indexes = [index for index, (market_name, market_trading_pair) in enumerate(self._market_keys)
+                              if market in (None, market_name) and trading_pair in (None, market_trading_pair)]
+            mask &= np.isin(self.column("market"), market_indexes)
+        if trade_type is not None:
+            mask &= self.column("trade_type") == trade_type.value
+        if start_timestamp is not None:
+            mask &= self.column("timestamp") >= start_timestamp
+        return mask
+
+    def _resize(self, capacity: int):
+        columns = {}
+        for name, dtype in COLUMN_DTYPES.items():
+            values = np.empty(capacity, dtype=dtype)
+            values[:self._size] = self.column(name)
+            columns[name] = values
+        self._columns = columns
+        self._capacity = capacity
+        self._start = 0
+
+    def _drop_oldest(self):
+        self._extra_fee_amounts.pop(self._first_seq, None)
+        self._start = (self._start + 1) % self._capacity
+        self._size -= 1
+        self._first_seq += 1
+
+    def _expire(self):
+        if self._max_age is None or self._size == 0:
+            return
+        timestamps = self._columns["timestamp"]
+        latest_timestamp = timestamps[(self._start + self._size - 1) % self._capacity]
+        while self._size > 0 and timestamps[self._start] < latest_timestamp - self._max_age:
+            self._drop_oldest()
+
+    def _intern_market(self, market: str, trading_pair: str) -> int:
+        key = (market, trading_pair)
+        index = self._market_indexes.get(key)
+        if index is None:
+            index = len(self._market_keys)
+            self._market_keys.append(key)
+            self._market_indexes[key] = index
+        return index
+
+    def _intern_fee(self, trade_fee: Any) -> Tuple[int, List[Decimal]]:
+        # The fee key holds what the fills share (the fee type, percent and tokens), the flat fee amounts are kept
+        # in the fee_amount column
+        if isinstance(trade_fee, TradeFeeBase):
+            key = (type(trade_fee), trade_fee.percent, trade_fee.percent_token,
+                   tuple(flat_fee.token for flat_fee in trade_fee.flat_fees))
+            amounts = [flat_fee.amount for flat_fee in trade_fee.flat_fees]
+        else:
+            key = (None, trade_fee)
+            amounts = []
+        index = self._fee_indexes.get(key)
+        if index is None:
+            index = len(self._fee_keys)
+            self._fee_keys.append(key)
+            self._fee_indexes[key] = index
+        return index, amounts
+
+    def _fee(self, fee_index: int, fee_amount: float, seq: int) -> Any:
+        key = self._fee_keys[fee_index]
+        if key[0] is None:
+            return key[1]
+        fee_class, percent, percent_token, flat_fee_tokens = key
+        amounts = []
+        if len(flat_fee_tokens) > 0:
+            amounts = [Decimal(str(fee_amount))] + self._extra_fee_amounts.get(seq, [])
+        return fee_class(percent=percent,
+                         percent_token=percent_token,
+                         flat_fees=[TokenAmount(token, amount) for token, amount in zip(flat_fee_tokens, amounts)])
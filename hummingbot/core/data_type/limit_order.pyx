@@ -9,6 +9,7 @@ from cpython cimport PyObject
 from libcpp.string cimport string
 
 from hummingbot.core.event.events import LimitOrderStatus
+from hummingbot.core.utils.status_report import StatusTable
 
 cdef class LimitOrder:
     """
@@ -16,16 +17,15 @@ cdef class LimitOrder:
     between connectors and strategies. It is also used in HummingSim for back testing as well.
     """
     @classmethod
-    def to_pandas(cls, limit_orders: List[LimitOrder], mid_price: float = 0.0, hanging_ids: List[str] = None,
-                  end_time_order_age: int = 0) \
-            -> pd.DataFrame:
+    def to_status_table(cls, limit_orders: List[LimitOrder], mid_price: float = 0.0, hanging_ids: List[str] = None,
+                        end_time_order_age: int = 0) -> StatusTable:
         """
-        Creates a dataframe for displaying current active orders
+        Creates a status table for displaying current active orders
         :param limit_orders: A list of current active LimitOrder from a single market
         :param mid_price: The mid price (between best bid and best ask) of the market
         :param hanging_ids: A list of hanging order ids if applicable
         :param end_time_order_age: The end time for order age calculation, if unspecified the current time is used.
-        :return: A pandas data frame object
+        :return: The orders table
         """
         cdef:
             list buys = [o for o in limit_orders if o.is_buy]
@@ -50,10 +50,25 @@ cdef class LimitOrder:
             age_txt = "n/a"
             age_seconds = order.age_til(now_timestamp)
             if age_seconds >= 0:
-                age_txt = pd.Timestamp(age_seconds, unit='s', tz='UTC').strftime('%H:%M:%S')
+                age_txt = time.strftime("%H:%M:%S", time.gmtime(age_seconds))
             hang_txt = "n/a" if hanging_ids is None else ("yes" if order.client_order_id in hanging_ids else "no")
             data.append([order_id_txt, type_txt, price, spread_txt, quantity, age_txt, hang_txt])
-        return pd.DataFrame(data=data, columns=columns)
+        return StatusTable(columns, data)
+
+    @classmethod
+    def to_pandas(cls, limit_orders: List[LimitOrder], mid_price: float = 0.0, hanging_ids: List[str] = None,
+                  end_time_order_age: int = 0) \
+            -> pd.DataFrame:
+        """
+        Creates a dataframe for displaying current active orders
+        :param limit_orders: A list of current active LimitOrder from a single market
+        :param mid_price: The mid price (between best bid and best ask) of the market
+        :param hanging_ids: A list of hanging order ids if applicable
+        :param end_time_order_age: The end time for order age calculation, if unspecified the current time is used.
+        :return: A pandas data frame object
+        """
+        table = cls.to_status_table(limit_orders, mid_price, hanging_ids, end_time_order_age)
+        return pd.DataFrame(data=table.rows, columns=table.columns)
 
     def __init__(self,
                  client_order_id: str,
@@ -0,0 +1,468 @@
+import asyncio
+import json
+import logging
+import os
+import struct
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+# Frames, all little endian: a FRAME_HEADER (body length, frame type) followed by the body.
+# The hub sends market data frames, their body is a MARKET_DATA_HEADER, the trading pair (utf8) and the bid rows then
+# the ask rows as float64 (price, amount) pairs. A trade is one row, a bid row for a taker buy.
+# The bots send control frames, their body is JSON: the subscription and the snapshot requests.
+FRAME_HEADER = struct.Struct("<IB")
+# timestamp, update id (trade id of a trade), last trade price, bid rows, ask rows, trading pair length
+MARKET_DATA_HEADER = struct.Struct("<dqdIIH")
+SNAPSHOT_FRAME = 1
+DIFF_FRAME = 2
+TRADE_FRAME = 3
+ERROR_FRAME = 4
+SUBSCRIBE_FRAME = 5
+SNAPSHOT_REQUEST_FRAME = 6
+
+SOCKET_FILE_NAME = "market_data_hub.sock"
+
+
+def default_socket_path() -> str:
+    return os.path.join(data_path(), SOCKET_FILE_NAME)
+
+
+def _rows_array(rows: Sequence[Sequence[Any]]) -> np.ndarray:
+    if len(rows) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    # The exchange messages may carry the prices and amounts as strings, and more fields after them
+    return np.array([row[:2] for row in rows], dtype=np.float64)
+
+
+def encode_frame(frame_type: int, body: bytes) -> bytes:
+    return FRAME_HEADER.pack(len(body), frame_type) + body
+
+
+def encode_control(frame_type: int, content: Dict[str, Any]) -> bytes:
+    return encode_frame(frame_type, json.dumps(content).encode("utf8"))
+
+
+def encode_market_data(frame_type: int,
+                       trading_pair: str,
+                       timestamp: float,
+                       update_id: int,
+                       bids: Sequence[Sequence[Any]],
+                       asks: Sequence[Sequence[Any]],
+                       last_trade_price: float = float("nan")) -> bytes:
+    pair = trading_pair.encode("utf8")
+    bid_rows = _rows_array(bids)
+    ask_rows = _rows_array(asks)
+    body = b"".join((
+        MARKET_DATA_HEADER.pack(timestamp, update_id, last_trade_price, len(bid_rows), len(ask_rows), len(pair)),
+        pair,
+        bid_rows.tobytes(),
+        ask_rows.tobytes(),
+    ))
+    return encode_frame(frame_type, body)
+
+
+def decode_market_data(frame_type: int, body: bytes) -> OrderBookMessage:
+    """
+    :return: the order book message of a market data frame, as the exchange data sources parse them. The snapshot
+    messages also carry the last trade price of the hub order book.
+    """
+    timestamp, update_id, last_trade_price, bid_rows, ask_rows, pair_length = MARKET_DATA_HEADER.unpack_from(body)
+    offset = MARKET_DATA_HEADER.size
+    trading_pair = body[offset:offset + pair_length].decode("utf8")
+    offset += pair_length
+    rows = np.frombuffer(body, dtype=np.float64, count=2 * (bid_rows + ask_rows), offset=offset).reshape(-1, 2)
+    bids = rows[:bid_rows].tolist()
+    asks = rows[bid_rows:].tolist()
+
+    if frame_type == TRADE_FRAME:
+        price, amount = (bids or asks)[0]
+        trade_type = TradeType.BUY if bid_rows > 0 else TradeType.SELL
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": trading_pair,
+            "trade_type": float(trade_type.value),
+            "trade_id": update_id,
+            "update_id": update_id,
+            "price": price,
+            "amount": amount,
+        }, timestamp=timestamp)
+
+    content = {"trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks}
+    if frame_type == SNAPSHOT_FRAME:
+        content["last_trade_price"] = last_trade_price
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, content, timestamp=timestamp)
+    return OrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=timestamp)
+
+
+class MarketDataHubPublisher:
+    """
+    Forwards the messages an order book tracker of the hub applies to the bots subscribed to their trading pairs.
+    It is set as the market data recorder of the tracker (OrderBookTracker.set_market_data_recorder), each message is
+    encoded once for all the subscribers, from the bids and asks the tracker applies.
+    """
+
+    def __init__(self, hub: "MarketDataHub", exchange: str):
+        self._hub = hub
+        self._exchange = exchange
+        self._trade_ids: Dict[str, int] = defaultdict(int)
+
+    def record_diff(self, trading_pair: str, message: OrderBookMessage):
+        self._hub.publish(self._exchange, trading_pair, encode_market_data(
+            DIFF_FRAME, trading_pair, message.timestamp or time.time(), message.update_id,
+            message.bids, message.asks))
+
+    def record_snapshot(self, trading_pair: str, message: OrderBookMessage, past_diffs: List[OrderBookMessage]):
+        # The bots replay their own past diffs, they received the same ones
+        self._hub.publish(self._exchange, trading_pair, encode_market_data(
+            SNAPSHOT_FRAME, trading_pair, message.timestamp or time.time(), message.update_id,
+            message.bids, message.asks))
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook):
+        # The bots request the snapshots of the order books they start tracking
+        pass
+
+    def record_trade(self, trading_pair: str, trade_event: OrderBookTradeEvent):
+        self._trade_ids[trading_pair] += 1
+        row = [(trade_event.price, trade_event.amount)]
+        is_buy = trade_event.type is TradeType.BUY
+        self._hub.publish(self._exchange, trading_pair, encode_market_data(
+            TRADE_FRAME, trading_pair, trade_event.timestamp, self._trade_ids[trading_pair],
+            row if is_buy else [], [] if is_buy else row))
+
+
+class MarketDataHubSubscriber:
+    """
+    A bot connected to the hub
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, max_buffer_size: int):
+        self._writer = writer
+        self._max_buffer_size = max_buffer_size
+        self.topics: Set[Tuple[str, str]] = set()
+
+    @property
+    def closed(self) -> bool:
+        return self._writer.is_closing()
+
+    def send(self, frame: bytes) -> bool:
+        """
+        :return: False if the subscriber is disconnected, or too slow to keep up and was disconnected
+        """
+        if self._writer.is_closing():
+            return False
+        if self._writer.transport.get_write_buffer_size() > self._max_buffer_size:
+            self._writer.close()
+            return False
+        self._writer.write(frame)
+        return True
+
+    def close(self):
+        self._writer.close()
+
+
+class MarketDataHub:
+    """
+    Tracks the order books of the trading pairs the local bots subscribe to, once for all of them, and forwards their
+    snapshots, diffs and trades to the bots over a Unix socket. The bots track the order books with a
+    MarketDataHubOrderBookTrackerDataSource (OrderBookTrackerDataSourceType.LOCAL_HUB) instead of their exchange
+    data source, so the exchange connections and the message parsing are not repeated in each bot process.
+
+    A subscription for trading pairs the hub does not track yet starts an order book tracker for them, with the
+    exchange data source of the connector.
+    """
+
+    MAX_SUBSCRIBER_BUFFER_SIZE = 16 * 1024 * 1024
+    SNAPSHOT_POLL_INTERVAL = 0.5
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 client_config_map: Optional["ClientConfigAdapter"] = None,
+                 socket_path: Optional[str] = None,
+                 markets: Optional[Dict[str, List[str]]] = None,
+                 tracker_factory: Optional[Callable[[str, List[str]], OrderBookTracker]] = None):
+        """
+        :param client_config_map: the client configuration of the connectors the order books are tracked with
+        :param socket_path: the path of the hub Unix socket, by default in the data directory
+        :param markets: the trading pairs to track from the start, by exchange
+        :param tracker_factory: creates the order book tracker of trading pairs of an exchange, by default the tracker
+        of a non trading instance of the exchange connector
+        """
+        self._client_config_map = client_config_map
+        self._socket_path: str = socket_path or default_socket_path()
+        self._markets: Dict[str, List[str]] = markets or {}
+        self._tracker_factory = tracker_factory or self._create_connector_tracker
+        self._trackers: Dict[str, List[OrderBookTracker]] = defaultdict(list)
+        self._tracked_pairs: Dict[str, Dict[str, OrderBookTracker]] = defaultdict(dict)
+        self._publishers: Dict[str, MarketDataHubPublisher] = {}
+        self._subscribers: Dict[Tuple[str, str], Set[MarketDataHubSubscriber]] = defaultdict(set)
+        self._connectors: List[Any] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def socket_path(self) -> str:
+        return self._socket_path
+
+    @property
+    def trackers(self) -> Dict[str, List[OrderBookTracker]]:
+        return self._trackers
+
+    @property
+    def subscribers_count(self) -> int:
+        return len({subscriber for subscribers in self._subscribers.values() for subscriber in subscribers})
+
+    async def start(self):
+        if os.path.exists(self._socket_path):
+            # The socket file of a hub that did not stop cleanly
+            os.unlink(self._socket_path)
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=self._socket_path)
+        for exchange, trading_pairs in self._markets.items():
+            self.track(exchange, trading_pairs)
+        self.logger().info(f"Market data hub listening on {self._socket_path}.")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for subscribers in self._subscribers.values():
+            for subscriber in subscribers:
+                subscriber.close()
+        self._subscribers.clear()
+        for trackers in self._trackers.values():
+            for tracker in trackers:
+                tracker.stop()
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+
+    def track(self, exchange: str, trading_pairs: List[str]):
+        """
+        Starts tracking the order books of the trading pairs not tracked yet
+        """
+        missing_pairs = [trading_pair for trading_pair in trading_pairs
+                         if trading_pair not in self._tracked_pairs[exchange]]
+        if len(missing_pairs) == 0:
+            return
+        tracker = self._tracker_factory(exchange, missing_pairs)
+        if exchange not in self._publishers:
+            self._publishers[exchange] = MarketDataHubPublisher(self, exchange)
+        tracker.set_market_data_recorder(self._publishers[exchange])
+        tracker.start()
+        self._trackers[exchange].append(tracker)
+        for trading_pair in missing_pairs:
+            self._tracked_pairs[exchange][trading_pair] = tracker
+        self.logger().info(f"Tracking the {exchange} order books of {', '.join(missing_pairs)}.")
+
+    def publish(self, exchange: str, trading_pair: str, frame: bytes):
+        subscribers = self._subscribers.get((exchange, trading_pair))
+        if not subscribers:
+            return
+        for subscriber in list(subscribers):
+            if not subscriber.send(frame):
+                self.logger().warning(f"Disconnected a bot that did not keep up with the {exchange} "
+                                      f"{trading_pair} market data.")
+                self._remove_subscriber(subscriber)
+
+    def order_book(self, exchange: str, trading_pair: str) -> Optional[OrderBook]:
+        tracker = self._tracked_pairs[exchange].get(trading_pair)
+        return tracker.order_books.get(trading_pair) if tracker is not None else None
+
+    def snapshot_frame(self, trading_pair: str, order_book: OrderBook) -> bytes:
+        """
+        The current state of a hub order book: it includes every diff sent before it
+        """
+        return encode_market_data(SNAPSHOT_FRAME,
+                                  trading_pair,
+                                  time.time(),
+                                  max(order_book.snapshot_uid, order_book.last_diff_uid),
+                                  [(row.price, row.amount) for row in order_book.bid_entries()],
+                                  [(row.price, row.amount) for row in order_book.ask_entries()],
+                                  order_book.last_trade_price)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        subscriber = MarketDataHubSubscriber(writer, self.MAX_SUBSCRIBER_BUFFER_SIZE)
+        try:
+            while True:
+                length, frame_type = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+                content = json.loads(await reader.readexactly(length))
+                if frame_type == SUBSCRIBE_FRAME:
+                    self._subscribe(subscriber, content["exchange"], content["trading_pairs"])
+                elif frame_type == SNAPSHOT_REQUEST_FRAME:
+                    safe_ensure_future(self._send_snapshot(subscriber, content["exchange"], content["trading_pair"]))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error("Unexpected error handling a market data hub connection.", exc_info=True)
+        finally:
+            self._remove_subscriber(subscriber)
+            writer.close()
+
+    def _subscribe(self, subscriber: MarketDataHubSubscriber, exchange: str, trading_pairs: List[str]):
+        try:
+            self.track(exchange, trading_pairs)
+        except Exception as e:
+            self.logger().error(f"Could not track the {exchange} order books of {trading_pairs}.", exc_info=True)
+            subscriber.send(encode_control(ERROR_FRAME, {"error": f"Could not track the {exchange} order books: {e}"}))
+            return
+        for trading_pair in trading_pairs:
+            subscriber.topics.add((exchange, trading_pair))
+            self._subscribers[(exchange, trading_pair)].add(subscriber)
+
+    async def _send_snapshot(self, subscriber: MarketDataHubSubscriber, exchange: str, trading_pair: str):
+        while (exchange, trading_pair) in subscriber.topics and not subscriber.closed:
+            order_book = self.order_book(exchange, trading_pair)
+            if order_book is not None:
+                subscriber.send(self.snapshot_frame(trading_pair, order_book))
+                return
+            await asyncio.sleep(self.SNAPSHOT_POLL_INTERVAL)
+
+    def _remove_subscriber(self, subscriber: MarketDataHubSubscriber):
+        for topic in subscriber.topics:
+            self._subscribers[topic].discard(subscriber)
+        subscriber.topics.clear()
+
+    def _create_connector_tracker(self, exchange: str, trading_pairs: List[str]) -> OrderBookTracker:
+        from hummingbot.client.config.config_helpers import ClientConfigAdapter
+        from hummingbot.client.settings import AllConnectorSettings
+
+        # The hub connectors track the order books from the exchange
+        client_config_map = ClientConfigAdapter(self._client_config_map.hb_config.copy(deep=True))
+        client_config_map.market_data_hub.market_data_hub_enabled = False
+        connector_settings = AllConnectorSettings.get_connector_settings()[exchange]
+        connector = connector_settings.non_trading_connector_instance_with_default_configuration(
+            trading_pairs=trading_pairs, client_config_map=client_config_map)
+        self._connectors.append(connector)
+        return connector.order_book_tracker
+
+
+class MarketDataHubOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    The data source of the order book trackers of type OrderBookTrackerDataSourceType.LOCAL_HUB: it subscribes to the
+    order books of an exchange on the local market data hub (see MarketDataHub) instead of the exchange. The hub
+    messages are already parsed, they go to the tracker as they are. The order books are initialized (and restored
+    after a hub reconnection) from snapshots of the hub order books.
+    """
+
+    RECONNECT_DELAY = 5.0
+
+    def __init__(self, trading_pairs: List[str], exchange_name: str, socket_path: Optional[str] = None):
+        super().__init__(trading_pairs)
+        self._exchange_name = exchange_name
+        self._socket_path: str = socket_path or default_socket_path()
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connected: asyncio.Event = asyncio.Event()
+        self._connections_count: int = 0
+        self._snapshot_requests: Dict[str, asyncio.Future] = {}
+        self._last_traded_prices: Dict[str, float] = {}
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        """
+        The last trade prices received from the hub, NaN (as in a new order book) for the trading pairs without trades
+        """
+        return {trading_pair: self._last_traded_prices.get(trading_pair, float("nan")) for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = await super().get_new_order_book(trading_pair)
+        if trading_pair in self._last_traded_prices:
+            order_book.last_trade_price = self._last_traded_prices[trading_pair]
+        return order_book
+
+    async def listen_for_subscriptions(self):
+        while True:
+            try:
+                reader, self._writer = await asyncio.open_unix_connection(self._socket_path)
+                self._send(SUBSCRIBE_FRAME, {"exchange": self._exchange_name, "trading_pairs": self._trading_pairs})
+                if self._connections_count > 0:
+                    # The order books missed the diffs sent while disconnected, they are restored from fresh snapshots
+                    for trading_pair in self._trading_pairs:
+                        self._request_snapshot(trading_pair)
+                self._connections_count += 1
+                self._connected.set()
+                await self._process_hub_messages(reader)
+            except asyncio.CancelledError:
+                raise
+            except (ConnectionError, OSError, asyncio.IncompleteReadError) as connection_exception:
+                self.logger().warning(f"The market data hub connection was closed ({connection_exception}).")
+            except Exception:
+                self.logger().exception("Unexpected error occurred when listening to the market data hub.")
+            finally:
+                self._connected.clear()
+                if self._writer is not None:
+                    self._writer.close()
+                    self._writer = None
+            await self._sleep(self.RECONNECT_DELAY)
+
+    async def _process_hub_messages(self, reader: asyncio.StreamReader):
+        while True:
+            length, frame_type = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+            body = await reader.readexactly(length)
+            if frame_type == ERROR_FRAME:
+                self.logger().error(f"Market data hub error: {json.loads(body)['error']}")
+                continue
+            message = decode_market_data(frame_type, body)
+            if message.type is OrderBookMessageType.TRADE:
+                self._last_traded_prices[message.trading_pair] = message.content["price"]
+                self._message_queue[self._trade_messages_queue_key].put_nowait(message)
+            elif message.type is OrderBookMessageType.DIFF:
+                self._message_queue[self._diff_messages_queue_key].put_nowait(message)
+            else:
+                last_trade_price = message.content["last_trade_price"]
+                if not np.isnan(last_trade_price):
+                    self._last_traded_prices[message.trading_pair] = last_trade_price
+                snapshot_request = self._snapshot_requests.pop(message.trading_pair, None)
+                if snapshot_request is not None and not snapshot_request.done():
+                    snapshot_request.set_result(message)
+                else:
+                    self._message_queue[self._snapshot_messages_queue_key].put_nowait(message)
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        await self._connected.wait()
+        snapshot_request = self._snapshot_requests.get(trading_pair)
+        if snapshot_request is None:
+            snapshot_request = asyncio.get_event_loop().create_future()
+            self._snapshot_requests[trading_pair] = snapshot_request
+            self._request_snapshot(trading_pair)
+        return await asyncio.shield(snapshot_request)
+
+    def _request_snapshot(self, trading_pair: str):
+        self._send(SNAPSHOT_REQUEST_FRAME, {"exchange": self._exchange_name, "trading_pair": trading_pair})
+
+    def _send(self, frame_type: int, content: Dict[str, Any]):
+        self._writer.write(encode_control(frame_type, content))
+
+    # The hub messages are parsed when they are read
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
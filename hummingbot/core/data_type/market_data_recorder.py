@@ -0,0 +1,382 @@
+import bisect
+import json
+import logging
+import struct
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_replay import (
+    DIFF_MESSAGE,
+    SNAPSHOT_MESSAGE,
+    TRADE_MESSAGE,
+    MarketDataEvents,
+    MarketDataEventType,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.logger import HummingbotLogger
+
+# File layout, all little endian:
+# - the file header: FILE_MAGIC and the format version (int64)
+# - chunks of the rows of one trading pair: a CHUNK_HEADER (magic, rows, first and last timestamps, trading pair)
+#   followed by the MarketDataEvents.COLUMNS, each a fixed width column of `rows` float64 or int64 values
+# All the sizes are multiples of 8 bytes, so every column can be memory mapped in place.
+FILE_MAGIC = b"HBMDREC\x00"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<8sq")
+CHUNK_MAGIC = b"HBCK"
+CHUNK_HEADER = struct.Struct("<4s4xqdd32s")
+COLUMN_DTYPES = {
+    "timestamp": np.float64,
+    "update_id": np.int64,
+    "event_type": np.int64,
+    "price": np.float64,
+    "amount": np.float64,
+}
+FILE_SUFFIX = ".hbmd"
+INDEX_SUFFIX = ".index.json"
+# The kinds of the queued records of market data that is already in columns and of order book states, the
+# messages kinds are above 0
+EVENTS_RECORD = 0
+SNAPSHOT_ORDER_BOOK_RECORD = -1
+
+
+class MarketDataChunk(NamedTuple):
+    trading_pair: str
+    offset: int
+    rows: int
+    first_timestamp: float
+    last_timestamp: float
+
+
+def index_path(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+class MarketDataFile:
+    """
+    A memory mapped market data file written by MarketDataRecorder. The chunks are located with the index file
+    written next to it when the file is closed, or by scanning the chunk headers when there is none (e.g. the
+    recorder was killed).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._path: Path = Path(path)
+        self._data: np.ndarray = np.memmap(self._path, dtype=np.uint8, mode="r")
+        magic, version = FILE_HEADER.unpack_from(self._data, 0)
+        if magic != FILE_MAGIC:
+            raise ValueError(f"{self._path} is not a market data file.")
+        if version != FILE_VERSION:
+            raise ValueError(f"Unsupported market data file version {version} in {self._path}.")
+        self._chunks: List[MarketDataChunk] = self._read_index() or self._scan_chunks()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def chunks(self) -> List[MarketDataChunk]:
+        return self._chunks
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return sorted({chunk.trading_pair for chunk in self._chunks})
+
+    def chunk_events(self, chunk: MarketDataChunk) -> MarketDataEvents:
+        """
+        :return: the rows of the chunk, the columns are read only views of the memory mapped file
+        """
+        offset = chunk.offset + CHUNK_HEADER.size
+        columns = []
+        for column in MarketDataEvents.COLUMNS:
+            columns.append(np.frombuffer(self._data, dtype=COLUMN_DTYPES[column], count=chunk.rows, offset=offset))
+            offset += chunk.rows * 8
+        return MarketDataEvents(*columns)
+
+    def events(self, trading_pair: str) -> MarketDataEvents:
+        """
+        :return: all the rows of the trading pair, in the order they were recorded
+        """
+        return concatenate_events([self.chunk_events(chunk) for chunk in self._chunks
+                                   if chunk.trading_pair == trading_pair])
+
+    def _read_index(self) -> Optional[List[MarketDataChunk]]:
+        path = index_path(self._path)
+        if not path.exists():
+            return None
+        try:
+            index = json.loads(path.read_text())
+            chunks = [MarketDataChunk(**chunk) for chunk in index["chunks"]]
+        except (ValueError, KeyError, TypeError):
+            return None
+        # The index is written after its chunks, it can only miss the last chunks
+        if len(chunks) > 0 and chunks[-1].offset + chunk_size(chunks[-1].rows) > len(self._data):
+            return None
+        if chunks_end(chunks) < len(self._data):
+            chunks.extend(self._scan_chunks(chunks_end(chunks)))
+        return chunks
+
+    def _scan_chunks(self, offset: int = FILE_HEADER.size) -> List[MarketDataChunk]:
+        chunks = []
+        while offset + CHUNK_HEADER.size <= len(self._data):
+            magic, rows, first_timestamp, last_timestamp, trading_pair = CHUNK_HEADER.unpack_from(self._data, offset)
+            if magic != CHUNK_MAGIC or offset + chunk_size(rows) > len(self._data):
+                # A partially written last chunk
+                break
+            chunks.append(MarketDataChunk(trading_pair.rstrip(b"\x00").decode("utf8"),
+                                          offset,
+                                          rows,
+                                          first_timestamp,
+                                          last_timestamp))
+            offset += chunk_size(rows)
+        return chunks
+
+
+def chunk_size(rows: int) -> int:
+    return CHUNK_HEADER.size + rows * 8 * len(MarketDataEvents.COLUMNS)
+
+
+def chunks_end(chunks: List[MarketDataChunk]) -> int:
+    if len(chunks) == 0:
+        return FILE_HEADER.size
+    return chunks[-1].offset + chunk_size(chunks[-1].rows)
+
+
+def concatenate_events(events: Sequence[MarketDataEvents]) -> MarketDataEvents:
+    if len(events) == 1:
+        return events[0]
+    if len(events) == 0:
+        return MarketDataEvents.from_rows([])
+    return MarketDataEvents(*(np.concatenate([getattr(e, column) for e in events])
+                              for column in MarketDataEvents.COLUMNS))
+
+
+def load_market_data(paths: Sequence[Union[str, Path]]) -> Dict[str, MarketDataEvents]:
+    """
+    Reads the market data of files recorded one after the other (e.g. the rotated files of one recording)
+    :return: the rows of each trading pair, ready to be replayed
+    """
+    files = [MarketDataFile(path) for path in sorted(Path(path) for path in paths)]
+    trading_pairs = sorted({trading_pair for file in files for trading_pair in file.trading_pairs})
+    return {
+        trading_pair: concatenate_events([file.events(trading_pair) for file in files
+                                          if trading_pair in file.trading_pairs])
+        for trading_pair in trading_pairs
+    }
+
+
+class MarketDataRecorder:
+    """
+    Records what the order book trackers apply (snapshots, diffs and trades) into append only market data files, to
+    be replayed by MarketDataReplay. The tracker side only appends the messages to a queue, a writer thread reads
+    their entries (message.bids and message.asks, as the tracker applies them), converts them to columns and writes
+    them in chunks every flush_interval, so recording does not delay the book updates. The files are rotated by size
+    and by age, the chunk index of a file is written when it is closed.
+    The timestamps are the local times the messages were applied, the time line a live strategy sees.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 directory: Union[str, Path],
+                 max_file_size: int = 256 * 1024 * 1024,
+                 rotation_interval: float = 3600.0,
+                 flush_interval: float = 1.0):
+        """
+        :param directory: the directory the files are written to
+        :param max_file_size: the size (in bytes) after which a new file is started
+        :param rotation_interval: the age (in seconds) after which a new file is started
+        :param flush_interval: the interval (in seconds) between two writes of the queued messages
+        """
+        self._directory: Path = Path(directory)
+        self._max_file_size: int = max_file_size
+        self._rotation_interval: float = rotation_interval
+        self._flush_interval: float = flush_interval
+        self._records: Deque[Tuple[Any, ...]] = deque()
+        self._flush_lock: threading.Lock = threading.Lock()
+        self._stop_event: threading.Event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._file: Optional[BinaryIO] = None
+        self._file_path: Optional[Path] = None
+        self._file_size: int = 0
+        self._file_started_at: float = 0
+        self._chunks: List[MarketDataChunk] = []
+        self._files: List[Path] = []
+        self._rows_written: int = 0
+
+    @property
+    def files(self) -> List[Path]:
+        return list(self._files)
+
+    @property
+    def rows_written(self) -> int:
+        return self._rows_written
+
+    @property
+    def pending_records(self) -> int:
+        return len(self._records)
+
+    def start(self):
+        if self._writer_thread is not None:
+            return
+        self._stop_event.clear()
+        self._writer_thread = threading.Thread(target=self._run, name="MarketDataRecorder", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self):
+        """
+        Writes the queued messages and closes the current file
+        """
+        if self._writer_thread is not None:
+            self._stop_event.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+        self.flush()
+        with self._flush_lock:
+            self._close_file()
+
+    # The following record methods are called by the order book trackers, they only queue the messages
+    def record_diff(self, trading_pair: str, message: OrderBookMessage):
+        self._records.append((DIFF_MESSAGE, trading_pair, time.time(), message))
+
+    def record_snapshot(self, trading_pair: str, message: OrderBookMessage, past_diffs: List[OrderBookMessage]):
+        """
+        Records a snapshot followed by the past diffs OrderBook.restore_from_snapshot_and_diffs replays on it
+        """
+        timestamp = time.time()
+        self._records.append((SNAPSHOT_MESSAGE, trading_pair, timestamp, message))
+        for diff in past_diffs[bisect.bisect_right(past_diffs, message):]:
+            self._records.append((DIFF_MESSAGE, trading_pair, timestamp, diff))
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook):
+        """
+        Records the current state of an order book as a snapshot (e.g. an order book initialized from the exchange)
+        """
+        bids = [(row.price, row.amount) for row in order_book.bid_entries()]
+        asks = [(row.price, row.amount) for row in order_book.ask_entries()]
+        self._records.append((SNAPSHOT_ORDER_BOOK_RECORD, trading_pair, time.time(), order_book.snapshot_uid,
+                              bids, asks))
+
+    def record_trade(self, trading_pair: str, trade_event: OrderBookTradeEvent):
+        self._records.append((TRADE_MESSAGE, trading_pair, time.time(), trade_event.type is TradeType.BUY,
+                              trade_event.price, trade_event.amount))
+
+    def record_events(self, trading_pair: str, events: MarketDataEvents):
+        """
+        Records market data that is already in columns (e.g. converted from another source), with its own timestamps
+        """
+        self._records.append((EVENTS_RECORD, trading_pair, events))
+
+    def flush(self):
+        """
+        Writes the queued messages, one chunk per trading pair
+        """
+        with self._flush_lock:
+            columns_by_pair: Dict[str, Tuple[List, ...]] = defaultdict(lambda: ([], [], [], [], []))
+            records = self._records
+            while len(records) > 0:
+                record = records.popleft()
+                try:
+                    self._append_rows(columns_by_pair[record[1]], record)
+                except Exception:
+                    self.logger().error(f"Error recording the market data message {record}.", exc_info=True)
+            if len(columns_by_pair) == 0:
+                return
+            try:
+                self._write_chunks(columns_by_pair)
+            except OSError:
+                self.logger().error("Error writing the market data.", exc_info=True)
+
+    def _run(self):
+        while not self._stop_event.wait(self._flush_interval):
+            self.flush()
+
+    @staticmethod
+    def _append_rows(columns: Tuple[List, ...], record: Tuple[Any, ...]):
+        timestamps, update_ids, event_types, prices, amounts = columns
+        kind, _, timestamp = record[:3]
+        if kind == EVENTS_RECORD:
+            for values, column in zip(columns, MarketDataEvents.COLUMNS):
+                values.extend(getattr(record[2], column).tolist())
+            return
+        if kind == TRADE_MESSAGE:
+            _, _, _, is_buy, price, amount = record
+            timestamps.append(timestamp)
+            update_ids.append(0)
+            event_types.append(MarketDataEventType.TRADE_BUY if is_buy else MarketDataEventType.TRADE_SELL)
+            prices.append(float(price))
+            amounts.append(float(amount))
+            return
+        if kind == SNAPSHOT_ORDER_BOOK_RECORD:
+            _, _, _, update_id, bids, asks = record
+        else:
+            message = record[3]
+            update_id, bids, asks = message.update_id, message.bids, message.asks
+        bid_type, ask_type = ((MarketDataEventType.DIFF_BID, MarketDataEventType.DIFF_ASK)
+                              if kind == DIFF_MESSAGE
+                              else (MarketDataEventType.SNAPSHOT_BID, MarketDataEventType.SNAPSHOT_ASK))
+        for event_type, entries in ((bid_type, bids), (ask_type, asks)):
+            for price, amount, *_ in entries:
+                timestamps.append(timestamp)
+                update_ids.append(update_id)
+                event_types.append(event_type)
+                prices.append(float(price))
+                amounts.append(float(amount))
+
+    def _write_chunks(self, columns_by_pair: Dict[str, Tuple[List, ...]]):
+        now = time.time()
+        if self._file is not None and (self._file_size >= self._max_file_size
+                                       or now - self._file_started_at >= self._rotation_interval):
+            self._close_file()
+        if self._file is None:
+            self._open_file(now)
+        for trading_pair, columns in columns_by_pair.items():
+            rows = len(columns[0])
+            self._file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, rows, columns[0][0], columns[0][-1],
+                                               trading_pair.encode("utf8")))
+            for column, values in zip(MarketDataEvents.COLUMNS, columns):
+                self._file.write(np.asarray(values, dtype=COLUMN_DTYPES[column]).tobytes())
+            self._chunks.append(MarketDataChunk(trading_pair, self._file_size, rows, columns[0][0], columns[0][-1]))
+            self._file_size += chunk_size(rows)
+            self._rows_written += rows
+        self._file.flush()
+
+    def _open_file(self, timestamp: float):
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._directory / f"market_data_{int(timestamp * 1e3)}{FILE_SUFFIX}"
+        while path.exists():
+            path = path.with_name(f"{path.stem}_{len(self._files)}{FILE_SUFFIX}")
+        self._file = open(path, "wb")
+        self._file.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION))
+        self._file_path = path
+        self._file_size = FILE_HEADER.size
+        self._file_started_at = timestamp
+        self._chunks = []
+        self._files.append(path)
+
+    def _close_file(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._write_index()
+        self._file = None
+
+    def _write_index(self):
+        path = index_path(self._file_path)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"version": FILE_VERSION,
+                                         "chunks": [chunk._asdict() for chunk in self._chunks]}))
+        temp_path.replace(path)
@@ -0,0 +1,268 @@
+import heapq
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+class MarketDataEventType(IntEnum):
+    """
+    The type of a recorded market data row. Odd types are the bid (or taker buy) side, (type + 1) // 2 is the kind of
+    message the row belongs to: 1 snapshot, 2 diff, 3 trade.
+    """
+    SNAPSHOT_BID = 1
+    SNAPSHOT_ASK = 2
+    DIFF_BID = 3
+    DIFF_ASK = 4
+    TRADE_BUY = 5
+    TRADE_SELL = 6
+
+
+SNAPSHOT_MESSAGE = 1
+DIFF_MESSAGE = 2
+TRADE_MESSAGE = 3
+
+
+class MarketDataEvents:
+    """
+    The recorded market data of one trading pair, as columns of equal length sorted by timestamp: timestamp
+    (float64), update_id (int64), event_type (int64, a MarketDataEventType), price (float64) and amount (float64).
+    The rows of a snapshot or a diff share their timestamp and update id, a trade is one row.
+    """
+
+    COLUMNS = ("timestamp", "update_id", "event_type", "price", "amount")
+
+    def __init__(self,
+                 timestamp: np.ndarray,
+                 update_id: np.ndarray,
+                 event_type: np.ndarray,
+                 price: np.ndarray,
+                 amount: np.ndarray):
+        self.timestamp: np.ndarray = np.asarray(timestamp, dtype=np.float64)
+        self.update_id: np.ndarray = np.asarray(update_id, dtype=np.int64)
+        self.event_type: np.ndarray = np.asarray(event_type, dtype=np.int64)
+        self.price: np.ndarray = np.asarray(price, dtype=np.float64)
+        self.amount: np.ndarray = np.asarray(amount, dtype=np.float64)
+        if not (len(self.timestamp) == len(self.update_id) == len(self.event_type) == len(self.price)
+                == len(self.amount)):
+            raise ValueError("The market data columns must have the same length.")
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[float, int, int, float, float]]) -> "MarketDataEvents":
+        """
+        :param rows: (timestamp, update_id, event_type, price, amount) tuples, in timestamp order
+        """
+        rows = list(rows)
+        if len(rows) == 0:
+            return cls(*([] for _ in cls.COLUMNS))
+        return cls(*zip(*rows))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "MarketDataEvents":
+        with np.load(path) as data:
+            return cls(*(data[column] for column in cls.COLUMNS))
+
+    def save(self, path: Union[str, Path]):
+        np.savez(path, **{column: getattr(self, column) for column in self.COLUMNS})
+
+
+class PairReplay:
+    """
+    The replay state of one trading pair: its order book, its events grouped into messages and the next message.
+    """
+
+    def __init__(self, trading_pair: str, order_book: OrderBook, events: MarketDataEvents):
+        self.trading_pair: str = trading_pair
+        self.order_book: OrderBook = order_book
+        self.events: MarketDataEvents = events
+        self.has_snapshot: bool = False
+        self.next_message: int = 0
+
+        kinds = (events.event_type + 1) // 2
+        new_message = np.ones(len(events), dtype=bool)
+        new_message[1:] = ((events.timestamp[1:] != events.timestamp[:-1])
+                           | (events.update_id[1:] != events.update_id[:-1])
+                           | (kinds[1:] != kinds[:-1])
+                           | (kinds[1:] == TRADE_MESSAGE))
+        message_starts = np.flatnonzero(new_message)
+        # Python lists, indexing them in the replay loop is cheaper than indexing numpy arrays
+        self.message_starts: List[int] = message_starts.tolist()
+        self.message_ends: List[int] = self.message_starts[1:] + [len(events)]
+        self.message_timestamps: List[float] = events.timestamp[message_starts].tolist()
+        self.message_kinds: List[int] = kinds[message_starts].tolist()
+        self.is_bid: np.ndarray = events.event_type % 2
+
+    @property
+    def messages_count(self) -> int:
+        return len(self.message_starts)
+
+    @property
+    def next_timestamp(self) -> Optional[float]:
+        if self.next_message >= self.messages_count:
+            return None
+        return self.message_timestamps[self.next_message]
+
+    def apply_next_message(self) -> int:
+        """
+        Applies the next message to the order book.
+        :return: the number of events applied
+        """
+        events = self.events
+        message = self.next_message
+        start = self.message_starts[message]
+        end = self.message_ends[message]
+        kind = self.message_kinds[message]
+        self.next_message += 1
+        if kind == TRADE_MESSAGE:
+            self.order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=self.trading_pair,
+                timestamp=float(events.timestamp[start]),
+                type=TradeType.BUY if self.is_bid[start] else TradeType.SELL,
+                price=float(events.price[start]),
+                amount=float(events.amount[start]),
+            ))
+        else:
+            is_snapshot = kind == SNAPSHOT_MESSAGE
+            self.order_book.apply_columns(events.price[start:end],
+                                          events.amount[start:end],
+                                          self.is_bid[start:end],
+                                          int(events.update_id[start]),
+                                          is_snapshot)
+            self.has_snapshot = self.has_snapshot or is_snapshot
+        return end - start
+
+
+class MarketDataReplay:
+    """
+    Replays recorded market data into order books, in timestamp order across the trading pairs. The owner advances
+    it to each clock timestamp before the order books are read, so the books are in lockstep with the (back testing)
+    clock. Snapshots and diffs are applied from the column slices, trades go through OrderBook.apply_trade so the
+    order book trade listeners (e.g. the paper trade limit order matching) see them.
+    """
+
+    def __init__(self, order_books: Dict[str, OrderBook], market_data: Dict[str, MarketDataEvents]):
+        self._pairs: List[PairReplay] = [
+            PairReplay(trading_pair, order_books[trading_pair], events)
+            for trading_pair, events in market_data.items()
+        ]
+        self._next_messages: List[Tuple[float, int]] = []
+        for index, pair in enumerate(self._pairs):
+            if pair.next_timestamp is not None:
+                self._next_messages.append((pair.next_timestamp, index))
+        heapq.heapify(self._next_messages)
+        self._events_processed: int = 0
+        self._current_timestamp: float = float("nan")
+
+    @property
+    def ready(self) -> bool:
+        """
+        True once every order book has received a snapshot
+        """
+        return all(pair.has_snapshot for pair in self._pairs)
+
+    @property
+    def done(self) -> bool:
+        return len(self._next_messages) == 0
+
+    @property
+    def events_processed(self) -> int:
+        return self._events_processed
+
+    @property
+    def current_timestamp(self) -> float:
+        return self._current_timestamp
+
+    @property
+    def start_timestamp(self) -> Optional[float]:
+        timestamps = [pair.events.timestamp[0] for pair in self._pairs if len(pair.events) > 0]
+        return float(min(timestamps)) if len(timestamps) > 0 else None
+
+    @property
+    def end_timestamp(self) -> Optional[float]:
+        timestamps = [pair.events.timestamp[-1] for pair in self._pairs if len(pair.events) > 0]
+        return float(max(timestamps)) if len(timestamps) > 0 else None
+
+    def advance(self, timestamp: float) -> int:
+        """
+        Applies every message recorded at or before the timestamp.
+        :return: the number of events applied
+        """
+        events_applied = 0
+        next_messages = self._next_messages
+        pairs = self._pairs
+        while len(next_messages) > 0 and next_messages[0][0] <= timestamp:
+            index = next_messages[0][1]
+            pair = pairs[index]
+            events_applied += pair.apply_next_message()
+            next_timestamp = pair.next_timestamp
+            if next_timestamp is None:
+                heapq.heappop(next_messages)
+            else:
+                heapq.heapreplace(next_messages, (next_timestamp, index))
+        self._events_processed += events_applied
+        self._current_timestamp = timestamp
+        return events_applied
+
+
+class BacktestOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    The order books of a back test are created empty and filled by the market data replay, there is nothing to fetch
+    """
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_book_create_function()
+
+    async def listen_for_subscriptions(self):
+        pass
+
+
+class BacktestOrderBookTracker(OrderBookTracker):
+    """
+    An order book tracker fed by a MarketDataReplay instead of exchange streams. The order books are created by
+    create_order_books (with the data source order book create function, so the owner can set it first) and moved
+    forward by advance.
+    """
+
+    def __init__(self, market_data: Dict[str, MarketDataEvents]):
+        trading_pairs = list(market_data.keys())
+        super().__init__(data_source=BacktestOrderBookTrackerDataSource(trading_pairs), trading_pairs=trading_pairs)
+        self._market_data: Dict[str, MarketDataEvents] = market_data
+        self._replay: Optional[MarketDataReplay] = None
+
+    @property
+    def replay(self) -> Optional[MarketDataReplay]:
+        return self._replay
+
+    @property
+    def ready(self) -> bool:
+        return self._replay is not None and self._replay.ready
+
+    def create_order_books(self):
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = self._data_source.order_book_create_function()
+        self._replay = MarketDataReplay(self._order_books, self._market_data)
+
+    def advance(self, timestamp: float) -> int:
+        events_applied = self._replay.advance(timestamp)
+        if self._replay.ready:
+            self._order_books_initialized.set()
+        return events_applied
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
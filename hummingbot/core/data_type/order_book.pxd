@@ -3,6 +3,7 @@
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
+from hummingbot.core.data_type.CrossBookMatcher cimport CrossBookMatch
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.pubsub cimport PubSub
 from .order_book_query_result cimport OrderBookQueryResult
@@ -31,9 +32,15 @@ cdef class OrderBook(PubSub):
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef double c_get_level_amount(self, bint is_bid, double price)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef CrossBookMatch c_match_cross_book(self,
+                                           OrderBook ask_book,
+                                           double bid_price_rate,
+                                           double ask_price_rate,
+                                           double min_profitability)
@@ -1,8 +1,9 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/CrossBookMatcher.cpp']
 import bisect
 import logging
 import time
+from decimal import Decimal
 from typing import (
     Dict,
     Iterator,
@@ -24,6 +25,7 @@ from cython.operator cimport(
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.CrossBookMatcher cimport CrossBookStep, findBestProfitableSteps, matchCrossBook
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
@@ -35,6 +37,7 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+s_decimal_0 = Decimal(0)
 
 
 cdef class OrderBook(PubSub):
@@ -263,6 +266,31 @@ cdef class OrderBook(PubSub):
             last_update_id = max(last_update_id, <int64_t>row[2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
+    def apply_columns(self,
+                      const double[:] prices,
+                      const double[:] amounts,
+                      const int64_t[:] is_bid,
+                      int64_t update_id,
+                      bint is_snapshot=False):
+        """
+        Applies a diff (or a snapshot) given as columns, the rows with a non zero is_bid are bids. Replays recorded
+        market data without building an OrderBookRow or a numpy row per entry.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            Py_ssize_t i
+
+        for i in range(prices.shape[0]):
+            if is_bid[i] != 0:
+                cpp_bids.push_back(OrderBookEntry(prices[i], amounts[i], update_id))
+            else:
+                cpp_asks.push_back(OrderBookEntry(prices[i], amounts[i], update_id))
+        if is_snapshot:
+            self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+        else:
+            self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
             set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
@@ -319,6 +347,20 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef double c_get_level_amount(self, bint is_bid, double price):
+        """
+        :return: the amount resting at exactly the price on the bid (or ask) side, 0 if there is no such level
+        """
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+        if it == deref(book).end():
+            return 0
+        return deref(it).getAmount()
+
+    def get_level_amount(self, is_bid: bool, price: float) -> float:
+        return self.c_get_level_amount(is_bid, price)
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
             double cumulative_volume = 0
@@ -458,6 +500,80 @@ cdef class OrderBook(PubSub):
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef CrossBookMatch c_match_cross_book(self,
+                                           OrderBook ask_book,
+                                           double bid_price_rate,
+                                           double ask_price_rate,
+                                           double min_profitability):
+        return matchCrossBook(self._bid_book, ask_book._ask_book, bid_price_rate, ask_price_rate, min_profitability)
+
+    def match_cross_book(self,
+                         ask_book: OrderBook,
+                         bid_price_rate: float = 1.0,
+                         ask_price_rate: float = 1.0,
+                         min_profitability: float = 0.0) -> List[Tuple[float, float, float]]:
+        """
+        Matches the bids of this order book against the asks of another one, best prices first, as long as the bid
+        (times bid_price_rate) is above the ask (times ask_price_rate). The walk runs natively over both books.
+        :param ask_book: the order book to buy from
+        :param bid_price_rate: the rate converting the bid prices to the common quote asset
+        :param ask_price_rate: the rate converting the ask prices to the common quote asset
+        :param min_profitability: when negative, the walk also stops below that bid / ask ratio (for debugging)
+        :return: the matched (bid price, ask price, amount) steps, the prices as in the order books
+        """
+        cdef:
+            CrossBookMatch match = self.c_match_cross_book(ask_book,
+                                                           bid_price_rate,
+                                                           ask_price_rate,
+                                                           min_profitability)
+            CrossBookStep step
+        return [(step.bidPrice, step.askPrice, step.amount) for step in match.steps]
+
+    def find_best_profitable_amount(self,
+                                    ask_book: OrderBook,
+                                    min_profitability: Decimal,
+                                    bid_fee_percent: Decimal = s_decimal_0,
+                                    ask_fee_percent: Decimal = s_decimal_0,
+                                    bid_price_rate: Decimal = Decimal(1),
+                                    ask_price_rate: Decimal = Decimal(1),
+                                    max_amount: Optional[Decimal] = None) -> Tuple[Decimal, Decimal]:
+        """
+        Finds the largest amount to sell into the bids of this order book and buy from the asks of another one with a
+        profitability (bid value net of fees over ask value with fees) above 1 + min_profitability. The search runs
+        in double precision, its result is re-checked in Decimal and moved back a step while the check fails.
+        :return: the amount and its profitability, both 0 when no amount is profitable
+        """
+        cdef:
+            CrossBookMatch match = self.c_match_cross_book(ask_book,
+                                                           float(bid_price_rate),
+                                                           float(ask_price_rate),
+                                                           float(min_profitability))
+            double best_amount = 0
+            double best_profitability = 0
+            size_t best_steps
+        best_steps = findBestProfitableSteps(match.steps,
+                                             float(bid_price_rate),
+                                             float(ask_price_rate),
+                                             float(bid_fee_percent),
+                                             float(ask_fee_percent),
+                                             float(min_profitability),
+                                             float(max_amount) if max_amount is not None else float("inf"),
+                                             best_amount,
+                                             best_profitability)
+        steps = [(Decimal(match.steps[i].bidPrice), Decimal(match.steps[i].askPrice), Decimal(match.steps[i].amount))
+                 for i in range(best_steps)]
+        while best_steps > 0:
+            amount, profitability = _exact_profitability(steps[:best_steps],
+                                                         Decimal(bid_fee_percent),
+                                                         Decimal(ask_fee_percent),
+                                                         Decimal(bid_price_rate),
+                                                         Decimal(ask_price_rate),
+                                                         max_amount)
+            if profitability > 1 + min_profitability:
+                return amount, profitability
+            best_steps -= 1
+        return s_decimal_0, s_decimal_0
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -490,3 +606,21 @@ cdef class OrderBook(PubSub):
         self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
             self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+
+def _exact_profitability(steps: List[Tuple[Decimal, Decimal, Decimal]],
+                         bid_fee_percent: Decimal,
+                         ask_fee_percent: Decimal,
+                         bid_price_rate: Decimal,
+                         ask_price_rate: Decimal,
+                         max_amount: Optional[Decimal]) -> Tuple[Decimal, Decimal]:
+    total_amount = s_decimal_0
+    total_bid_value = s_decimal_0
+    total_ask_value = s_decimal_0
+    for bid_price, ask_price, amount in steps:
+        if max_amount is not None:
+            amount = min(amount, max_amount - total_amount)
+        total_amount += amount
+        total_bid_value += bid_price * bid_price_rate * amount
+        total_ask_value += ask_price * ask_price_rate * amount
+    return total_amount, (total_bid_value * (1 - bid_fee_percent)) / (total_ask_value * (1 + ask_fee_percent))
@@ -3,7 +3,7 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -15,10 +15,14 @@ from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
+if TYPE_CHECKING:
+    from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+
 
 class OrderBookTrackerDataSourceType(Enum):
     REMOTE_API = 2
     EXCHANGE_API = 3
+    LOCAL_HUB = 4
 
 
 class OrderBookTracker:
@@ -55,6 +59,7 @@ class OrderBookTracker:
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
+        self._market_data_recorder: Optional["MarketDataRecorder"] = None
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -68,6 +73,19 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def market_data_recorder(self) -> Optional["MarketDataRecorder"]:
+        return self._market_data_recorder
+
+    def set_market_data_recorder(self, recorder: Optional["MarketDataRecorder"]):
+        """
+        Records the snapshots, diffs and trades applied to the order books from now on, None to stop recording
+        """
+        self._market_data_recorder = recorder
+        if recorder is not None:
+            for trading_pair, order_book in self._order_books.items():
+                recorder.record_order_book(trading_pair, order_book)
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -175,6 +193,8 @@ class OrderBookTracker:
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+            if self._market_data_recorder is not None:
+                self._market_data_recorder.record_order_book(trading_pair, self._order_books[trading_pair])
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -271,6 +291,8 @@ class OrderBookTracker:
                 if message.type is OrderBookMessageType.DIFF:
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
                     past_diffs_window.append(message)
+                    if self._market_data_recorder is not None:
+                        self._market_data_recorder.record_diff(trading_pair, message)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -282,6 +304,8 @@ class OrderBookTracker:
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if self._market_data_recorder is not None:
+                        self._market_data_recorder.record_snapshot(trading_pair, message, past_diffs)
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
                 raise
@@ -308,14 +332,17 @@ class OrderBookTracker:
                     continue
 
                 order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
+                trade_event = OrderBookTradeEvent(
                     trading_pair=trade_message.trading_pair,
                     timestamp=trade_message.timestamp,
                     price=float(trade_message.content["price"]),
                     amount=float(trade_message.content["amount"]),
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
+                )
+                order_book.apply_trade(trade_event)
+                if self._market_data_recorder is not None:
+                    self._market_data_recorder.record_trade(trading_pair, trade_event)
 
                 messages_accepted += 1
 
@@ -13,6 +13,12 @@ from hummingbot.logger import HummingbotLogger
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # The number of streams the exchange allows on a websocket connection. When set, the trading pairs are spread
+    # over as many connections (shards) as needed, see _subscribe_channels_for_trading_pairs
+    MAX_STREAMS_PER_CONNECTION: Optional[int] = None
+    STREAMS_PER_TRADING_PAIR = 2
+    # The delay between the reconnections (and the snapshot requests following them) of consecutive shards
+    SHARD_RECONNECT_STAGGER_SECONDS = 1.0
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -24,6 +30,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        # The output of listen_for_order_book_snapshots, where the shards put the snapshots requested on reconnection
+        self._snapshot_output: Optional[asyncio.Queue] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -71,7 +79,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
         exchange. Each message is stored in its own queue.
+        When the trading pairs don't fit in a single connection, each shard of trading pairs is listened to through
+        its own connection.
         """
+        shards = self._trading_pair_shards()
+        if len(shards) > 1:
+            await asyncio.gather(*[self._listen_for_shard_subscriptions(shard_index, trading_pairs)
+                                   for shard_index, trading_pairs in enumerate(shards)])
+            return
         ws: Optional[WSAssistant] = None
         while True:
             try:
@@ -90,6 +105,69 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
             finally:
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
+    async def _listen_for_shard_subscriptions(self, shard_index: int, trading_pairs: List[str]):
+        """
+        Listens to the trade events and order diffs of a shard of trading pairs through its own websocket connection.
+        After a reconnection the order book snapshots of the shard trading pairs are requested again, since the diffs
+        sent while disconnected are lost. Each shard waits shard_index * SHARD_RECONNECT_STAGGER_SECONDS before
+        reconnecting, so that the shards dropped together don't reconnect and request their snapshots at once.
+
+        :param shard_index: the index of the shard
+        :param trading_pairs: the trading pairs of the shard
+        """
+        ws: Optional[WSAssistant] = None
+        snapshots_task: Optional[asyncio.Task] = None
+        reconnecting = False
+        while True:
+            try:
+                if reconnecting:
+                    await self._sleep(shard_index * self.SHARD_RECONNECT_STAGGER_SECONDS)
+                ws = await self._connected_websocket_assistant()
+                await self._subscribe_channels_for_trading_pairs(ws, trading_pairs)
+                if reconnecting:
+                    snapshots_task = asyncio.ensure_future(self._request_shard_order_book_snapshots(trading_pairs))
+                await self._process_websocket_messages(websocket_assistant=ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(
+                    f"The websocket connection of shard {shard_index} was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    f"Unexpected error occurred when listening to order book streams of shard {shard_index}. "
+                    f"Retrying in 5 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                if snapshots_task is not None:
+                    snapshots_task.cancel()
+                    snapshots_task = None
+                reconnecting = True
+                await self._on_order_stream_interruption(websocket_assistant=ws)
+                ws = None
+
+    def _trading_pair_shards(self) -> List[List[str]]:
+        """
+        :return: the trading pairs of each websocket connection, a single shard when the exchange has no limit of
+            streams per connection
+        """
+        if self.MAX_STREAMS_PER_CONNECTION is None or len(self._trading_pairs) == 0:
+            return [self._trading_pairs]
+        pairs_per_shard = max(self.MAX_STREAMS_PER_CONNECTION // self.STREAMS_PER_TRADING_PAIR, 1)
+        return [self._trading_pairs[start:start + pairs_per_shard]
+                for start in range(0, len(self._trading_pairs), pairs_per_shard)]
+
+    async def _request_shard_order_book_snapshots(self, trading_pairs: List[str]):
+        for trading_pair in trading_pairs:
+            try:
+                snapshot = await self._order_book_snapshot(trading_pair=trading_pair)
+                if self._snapshot_output is not None:
+                    self._snapshot_output.put_nowait(snapshot)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(f"Unexpected error fetching order book snapshot for {trading_pair}.")
+
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
         Reads the order diffs events queue. For each event creates a diff message instance and adds it to the
@@ -119,6 +197,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         :param ev_loop: the event loop the method will run in
         :param output: a queue to add the created snapshot messages
         """
+        self._snapshot_output = output
         message_queue = self._message_queue[self._snapshot_messages_queue_key]
         while True:
             try:
@@ -207,6 +286,19 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def _subscribe_channels_for_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
+        """
+        Subscribes to the trade events and diff orders events of some trading pairs through the provided websocket
+        connection. Data sources setting MAX_STREAMS_PER_CONNECTION implement it to be listened to in shards.
+
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pairs: the trading pairs to subscribe to
+        """
+        if trading_pairs == self._trading_pairs:
+            await self._subscribe_channels(ws)
+        else:
+            raise NotImplementedError
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         """
         Identifies the channel for a particular event message. Used to find the correct queue to add the message in
@@ -3,29 +3,51 @@ from collections import deque
 
 from async_timeout import timeout
 from typing import (
+    Iterator,
     List,
     Optional,
 )
 
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.event.fill_event_log import FillEventLog
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self, event_source: Optional[str] = None, fill_spill_directory: Optional[str] = None):
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
+        # But we keep all order fill events, because they are required for PnL calculation. They are kept in compact
+        # columns, the older ones spilled to disk
         self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
+        self._order_filled_logged_events = FillEventLog(spill_directory=fill_spill_directory)
         self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
+        """
+        A copy of the logged events, with all the order fills. Prefer iter_events() or fill_log to read the fills.
+        """
         return list(self._generic_logged_events) + list(self._order_filled_logged_events)
 
+    @property
+    def fill_log(self) -> FillEventLog:
+        return self._order_filled_logged_events
+
+    def iter_events(self, event_type: Optional[type] = None) -> Iterator[any]:
+        """
+        Iterates over the logged events (of event_type when set) in the order of event_log, without copying the
+        order fills.
+        """
+        if event_type is None or event_type is not OrderFilledEvent:
+            for event in tuple(self._generic_logged_events):
+                if event_type is None or type(event) is event_type:
+                    yield event
+        if event_type is None or event_type is OrderFilledEvent:
+            yield from self._order_filled_logged_events.iter_events()
+
     @property
     def event_source(self) -> str:
         return self._event_source
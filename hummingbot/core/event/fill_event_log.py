@@ -0,0 +1,404 @@
+import os
+import shutil
+import tempfile
+import weakref
+from decimal import Decimal
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.events import OrderFilledEvent
+
+COLUMN_DTYPES = {
+    "timestamp": np.float64,
+    # The decimals are kept exactly, as an integer mantissa and a power of ten exponent
+    "price_mantissa": np.int64,
+    "price_exponent": np.int8,
+    "amount_mantissa": np.int64,
+    "amount_exponent": np.int8,
+    "fee_amount_mantissa": np.int64,
+    "fee_amount_exponent": np.int8,
+    # The interned trading pair, trade type, order type, leverage, position and fee type of the fill
+    "category": np.int32,
+    # The end offsets of the order id and of the exchange trade id in the strings of the chunk
+    "order_id_end": np.int32,
+    "exchange_trade_id_end": np.int32,
+    "exchange_trade_id_kind": np.int8,
+    "order_id_hash": np.int64,
+}
+CHUNK_SIZE = 4096
+MAX_MEMORY_CHUNKS = 32
+MAX_MANTISSA_DIGITS = 18
+
+TRADE_ID_STR = 0
+TRADE_ID_INT = 1
+TRADE_ID_NONE = 2
+
+FEE_CLASSES = (AddedToCostTradeFee, DeductedFromReturnsTradeFee)
+
+
+def _remove_spill_files(paths: List[str], directory: Optional[str]):
+    if directory is not None:
+        shutil.rmtree(directory, ignore_errors=True)
+        return
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class _FillChunk:
+    """
+    The fills of a chunk. The active chunk is filled in place, a sealed chunk keeps its columns trimmed to the fills
+    it holds, or only the path of its spill file once it is spilled to disk.
+    """
+
+    def __init__(self, chunk_size: int):
+        self.columns: Optional[Dict[str, np.ndarray]] = {name: np.empty(chunk_size, dtype=dtype)
+                                                         for name, dtype in COLUMN_DTYPES.items()}
+        self.strings = bytearray()
+        self.size = 0
+        self.min_timestamp = float("inf")
+        self.max_timestamp = float("-inf")
+        # The base and quote amounts of the fills kept in the columns, by trading pair and trade type
+        self.traded_amounts: Dict[Tuple[str, Any], List[Decimal]] = {}
+        # The fills that can't be kept in the columns, by row
+        self.overflow: Dict[int, OrderFilledEvent] = {}
+        # The rows of the fills by order id while the chunk is active, replaced by the sorted order id hashes when
+        # the chunk is sealed
+        self.order_rows: Optional[Dict[str, List[int]]] = {}
+        self.sorted_hashes: Optional[np.ndarray] = None
+        self.sorted_rows: Optional[np.ndarray] = None
+        self.path: Optional[str] = None
+
+    def seal(self):
+        self.columns = {name: values[:self.size].copy() for name, values in self.columns.items()}
+        self.columns["strings"] = np.frombuffer(bytes(self.strings), dtype=np.uint8)
+        self.strings = bytearray()
+        rows = np.argsort(self.columns["order_id_hash"], kind="stable").astype(np.int32)
+        self.sorted_hashes = self.columns["order_id_hash"][rows]
+        self.sorted_rows = rows
+        self.order_rows = None
+
+    def spill(self, path: str):
+        np.savez(path, **self.columns)
+        self.path = path
+        self.columns = None
+
+    def load(self) -> Dict[str, np.ndarray]:
+        if self.columns is not None:
+            return self.columns
+        with np.load(self.path) as data:
+            return {name: data[name] for name in data.files}
+
+    def rows_of_order(self, order_id: str) -> List[int]:
+        if self.order_rows is not None:
+            return list(self.order_rows.get(order_id, []))
+        order_id_hash = hash(order_id)
+        start = np.searchsorted(self.sorted_hashes, order_id_hash, side="left")
+        end = np.searchsorted(self.sorted_hashes, order_id_hash, side="right")
+        return sorted(self.sorted_rows[start:end].tolist())
+
+
+class FillEventLog:
+    """
+    Keeps the order filled events of an event logger in typed NumPy columns instead of OrderFilledEvent objects.
+
+    The fills are appended to chunks of chunk_size rows. The prices and the amounts are kept exactly (integer
+    mantissa and exponent), the trading pair, the trade and order types, the leverage, the position and the fee type
+    are interned, and the order and exchange trade ids are packed in a byte string: a fill takes about 100 bytes
+    instead of about 850 bytes as an event. Once more than max_memory_chunks full chunks are kept, the oldest ones are
+    spilled to files in spill_directory (a temporary directory by default), removed when the log is cleared or
+    garbage collected. The events are only created back while they are iterated, a chunk at a time, and the fills of
+    an order are found through an index of the order ids of each chunk.
+    """
+
+    def __init__(self,
+                 chunk_size: int = CHUNK_SIZE,
+                 max_memory_chunks: int = MAX_MEMORY_CHUNKS,
+                 spill_directory: Optional[str] = None):
+        """
+        :param chunk_size: The number of fills of a chunk
+        :param max_memory_chunks: The number of full chunks kept in memory, the older ones are spilled to disk
+        :param spill_directory: The directory of the spill files, a temporary directory is created when None
+        """
+        self._chunk_size = chunk_size
+        self._max_memory_chunks = max_memory_chunks
+        self._spill_directory = spill_directory
+        self._owned_spill_directory: Optional[str] = None
+        self._spill_paths: List[str] = []
+        self._finalizer: Optional[weakref.finalize] = None
+        self._chunks: List[_FillChunk] = []
+        self._memory_chunks = 0
+        self._size = 0
+        self._category_keys: List[Tuple[Hashable, ...]] = []
+        self._category_indexes: Dict[Tuple[Hashable, ...], int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[OrderFilledEvent]:
+        return self.iter_events()
+
+    @property
+    def spilled_fills(self) -> int:
+        """
+        :return: The number of fills kept on disk
+        """
+        return sum(chunk.size for chunk in self._chunks if chunk.path is not None)
+
+    def append(self, event: OrderFilledEvent):
+        if len(self._chunks) == 0 or self._chunks[-1].size == self._chunk_size:
+            self._add_chunk()
+        chunk = self._chunks[-1]
+        row = chunk.size
+        if self._add_to_columns(chunk, row, event):
+            amounts = chunk.traded_amounts.get((event.trading_pair, event.trade_type))
+            if amounts is None:
+                chunk.traded_amounts[(event.trading_pair, event.trade_type)] = [event.amount, event.price * event.amount]
+            else:
+                amounts[0] += event.amount
+                amounts[1] += event.price * event.amount
+        else:
+            columns = chunk.columns
+            columns["category"][row] = -1
+            columns["order_id_end"][row] = len(chunk.strings)
+            columns["exchange_trade_id_end"][row] = len(chunk.strings)
+            columns["order_id_hash"][row] = hash(event.order_id) if isinstance(event.order_id, str) else 0
+            chunk.overflow[row] = event
+        if isinstance(event.order_id, str):
+            chunk.order_rows.setdefault(event.order_id, []).append(row)
+        if isinstance(event.timestamp, (int, float)):
+            chunk.min_timestamp = min(chunk.min_timestamp, event.timestamp)
+            chunk.max_timestamp = max(chunk.max_timestamp, event.timestamp)
+        chunk.size += 1
+        self._size += 1
+
+    def clear(self):
+        self._chunks = []
+        self._memory_chunks = 0
+        self._size = 0
+        self._remove_spill_files()
+
+    def iter_events(self,
+                    order_id: Optional[str] = None,
+                    start_timestamp: Optional[float] = None) -> Iterator[OrderFilledEvent]:
+        """
+        Iterates over the fills in the order they were logged, without copying the history. The spilled chunks are
+        read back one at a time, and only when they hold a fill matching the query.
+
+        :param order_id: Only the fills of this order when set
+        :param start_timestamp: Only the fills at or after this timestamp when set
+        """
+        for chunk in list(self._chunks):
+            if start_timestamp is not None and chunk.max_timestamp < start_timestamp and len(chunk.overflow) == 0:
+                continue
+            if order_id is not None:
+                rows = chunk.rows_of_order(order_id)
+                if len(rows) == 0:
+                    continue
+            else:
+                rows = None
+            for event in self._events(chunk, rows):
+                if order_id is not None and event.order_id != order_id:
+                    continue
+                if start_timestamp is not None and event.timestamp < start_timestamp:
+                    continue
+                yield event
+
+    def traded_amounts(self, after_timestamp: float = float("-inf")) -> Dict[Tuple[str, Any], Tuple[Decimal, Decimal]]:
+        """
+        Sums the base amounts and the quote amounts (price x amount) of the fills logged after a timestamp, by trading
+        pair and trade type. The sums of each chunk are kept as the fills are appended, only the rows of the chunks
+        holding fills on both sides of the timestamp are read.
+
+        :param after_timestamp: Only the fills strictly after this timestamp
+        :return: The (base amount, quote amount) sums by (trading pair, trade type)
+        """
+        totals: Dict[Tuple[str, Any], List[Decimal]] = {}
+
+        def add(key: Tuple[str, Any], amount: Decimal, quote_amount: Decimal):
+            key_totals = totals.get(key)
+            if key_totals is None:
+                totals[key] = [amount, quote_amount]
+            else:
+                key_totals[0] += amount
+                key_totals[1] += quote_amount
+
+        for chunk in list(self._chunks):
+            for event in chunk.overflow.values():
+                if event.timestamp > after_timestamp:
+                    add((event.trading_pair, event.trade_type), event.amount, event.price * event.amount)
+            if chunk.min_timestamp > after_timestamp:
+                for key, (amount, quote_amount) in chunk.traded_amounts.items():
+                    add(key, amount, quote_amount)
+            elif chunk.max_timestamp > after_timestamp:
+                columns = chunk.load()
+                for row in np.flatnonzero(columns["timestamp"][:chunk.size] > after_timestamp).tolist():
+                    if row in chunk.overflow:
+                        continue
+                    price = self._decode_decimal(int(columns["price_mantissa"][row]),
+                                                 int(columns["price_exponent"][row]))
+                    amount = self._decode_decimal(int(columns["amount_mantissa"][row]),
+                                                  int(columns["amount_exponent"][row]))
+                    trading_pair, trade_type = self._category_keys[columns["category"][row]][:2]
+                    add((trading_pair, trade_type), amount, price * amount)
+        return {key: (amount, quote_amount) for key, (amount, quote_amount) in totals.items()}
+
+    def _add_chunk(self):
+        if len(self._chunks) > 0:
+            self._chunks[-1].seal()
+        self._chunks.append(_FillChunk(self._chunk_size))
+        self._memory_chunks += 1
+        # The active chunk is not counted
+        while self._memory_chunks - 1 > self._max_memory_chunks:
+            self._spill_oldest()
+
+    def _spill_oldest(self):
+        chunk = next(chunk for chunk in self._chunks if chunk.path is None)
+        if self._finalizer is None:
+            if self._spill_directory is None:
+                self._owned_spill_directory = tempfile.mkdtemp(prefix="hummingbot_fills_")
+            else:
+                os.makedirs(self._spill_directory, exist_ok=True)
+            self._finalizer = weakref.finalize(self, _remove_spill_files, self._spill_paths,
+                                               self._owned_spill_directory)
+        directory = self._owned_spill_directory or self._spill_directory
+        file_descriptor, path = tempfile.mkstemp(suffix=".npz", prefix="fills_", dir=directory)
+        os.close(file_descriptor)
+        chunk.spill(path)
+        self._spill_paths.append(path)
+        self._memory_chunks -= 1
+
+    def _remove_spill_files(self):
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._owned_spill_directory = None
+        self._spill_paths = []
+
+    def _add_to_columns(self, chunk: _FillChunk, row: int, event: OrderFilledEvent) -> bool:
+        if not isinstance(event.timestamp, (int, float)) or not isinstance(event.order_id, str):
+            return False
+        price = self._encode_decimal(event.price)
+        amount = self._encode_decimal(event.amount)
+        fee = self._encode_fee(event.trade_fee)
+        trade_id = event.exchange_trade_id
+        if isinstance(trade_id, str):
+            trade_id_kind = TRADE_ID_STR
+        elif trade_id is None:
+            trade_id_kind, trade_id = TRADE_ID_NONE, ""
+        elif type(trade_id) is int:
+            trade_id_kind, trade_id = TRADE_ID_INT, str(trade_id)
+        else:
+            return False
+        if price is None or amount is None or fee is None:
+            return False
+        fee_key, fee_amount = fee
+        try:
+            category = self._intern_category((event.trading_pair, event.trade_type, event.order_type, event.leverage,
+                                              event.position, fee_key))
+        except TypeError:
+            # Unhashable values
+            return False
+        columns = chunk.columns
+        columns["timestamp"][row] = event.timestamp
+        columns["price_mantissa"][row], columns["price_exponent"][row] = price
+        columns["amount_mantissa"][row], columns["amount_exponent"][row] = amount
+        columns["fee_amount_mantissa"][row], columns["fee_amount_exponent"][row] = fee_amount
+        columns["category"][row] = category
+        chunk.strings += event.order_id.encode("utf-8")
+        columns["order_id_end"][row] = len(chunk.strings)
+        chunk.strings += trade_id.encode("utf-8")
+        columns["exchange_trade_id_end"][row] = len(chunk.strings)
+        columns["exchange_trade_id_kind"][row] = trade_id_kind
+        columns["order_id_hash"][row] = hash(event.order_id)
+        return True
+
+    def _events(self, chunk: _FillChunk, rows: Optional[List[int]] = None) -> Iterator[OrderFilledEvent]:
+        # Only the columns of the rows read are converted to Python values
+        size = chunk.size
+        columns = chunk.load()
+        strings = bytes(chunk.strings) if "strings" not in columns else columns["strings"].tobytes()
+        trade_id_ends = columns["exchange_trade_id_end"][:size]
+        order_id_starts = np.concatenate(([0], trade_id_ends[:-1]))
+        selection = slice(0, size) if rows is None else np.asarray(rows, dtype=np.int64)
+
+        def values(name: str) -> List[Any]:
+            return columns[name][:size][selection].tolist()
+
+        row_numbers = range(size) if rows is None else rows
+        for (row, timestamp, price_mantissa, price_exponent, amount_mantissa, amount_exponent, fee_amount_mantissa,
+             fee_amount_exponent, category, order_id_start, order_id_end, trade_id_end, trade_id_kind) in zip(
+                row_numbers, values("timestamp"), values("price_mantissa"), values("price_exponent"),
+                values("amount_mantissa"), values("amount_exponent"), values("fee_amount_mantissa"),
+                values("fee_amount_exponent"), values("category"), order_id_starts[selection].tolist(),
+                values("order_id_end"), trade_id_ends[selection].tolist(), values("exchange_trade_id_kind")):
+            overflow_event = chunk.overflow.get(row)
+            if overflow_event is not None:
+                yield overflow_event
+                continue
+            trading_pair, trade_type, order_type, leverage, position, fee_key = self._category_keys[category]
+            trade_id = strings[order_id_end:trade_id_end].decode("utf-8")
+            if trade_id_kind == TRADE_ID_INT:
+                trade_id = int(trade_id)
+            elif trade_id_kind == TRADE_ID_NONE:
+                trade_id = None
+            yield OrderFilledEvent(
+                timestamp=timestamp,
+                order_id=strings[order_id_start:order_id_end].decode("utf-8"),
+                trading_pair=trading_pair,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=self._decode_decimal(price_mantissa, price_exponent),
+                amount=self._decode_decimal(amount_mantissa, amount_exponent),
+                trade_fee=self._decode_fee(fee_key, fee_amount_mantissa, fee_amount_exponent),
+                exchange_trade_id=trade_id,
+                leverage=leverage,
+                position=position)
+
+    def _intern_category(self, key: Tuple[Hashable, ...]) -> int:
+        index = self._category_indexes.get(key)
+        if index is None:
+            index = len(self._category_keys)
+            self._category_keys.append(key)
+            self._category_indexes[key] = index
+        return index
+
+    @staticmethod
+    def _encode_decimal(value: Any) -> Optional[Tuple[int, int]]:
+        if type(value) is not Decimal or not value.is_finite():
+            return None
+        sign, digits, exponent = value.as_tuple()
+        if len(digits) > MAX_MANTISSA_DIGITS or not -128 <= exponent <= 127 or (sign and value.is_zero()):
+            return None
+        mantissa = int(value.scaleb(-exponent))
+        return mantissa, exponent
+
+    @staticmethod
+    def _decode_decimal(mantissa: int, exponent: int) -> Decimal:
+        return Decimal(mantissa).scaleb(exponent)
+
+    def _encode_fee(self, trade_fee: Any) -> Optional[Tuple[Tuple[Hashable, ...], Tuple[int, int]]]:
+        # The fee key holds what the fills share (the fee type, percent and tokens), the amount of the flat fee is
+        # kept in the columns. The percent is in the key as a string too, so that 0.1 and 0.10 are kept apart.
+        if type(trade_fee) not in FEE_CLASSES or len(trade_fee.flat_fees) > 1:
+            return None
+        percent = trade_fee.percent
+        if type(percent) is not Decimal:
+            return None
+        if len(trade_fee.flat_fees) == 0:
+            return (type(trade_fee), percent, str(percent), trade_fee.percent_token, False, None), (0, 0)
+        flat_fee = trade_fee.flat_fees[0]
+        fee_amount = self._encode_decimal(flat_fee.amount)
+        if type(flat_fee) is not TokenAmount or fee_amount is None:
+            return None
+        return (type(trade_fee), percent, str(percent), trade_fee.percent_token, True, flat_fee.token), fee_amount
+
+    def _decode_fee(self, fee_key: Tuple[Hashable, ...], fee_amount_mantissa: int, fee_amount_exponent: int):
+        fee_class, percent, _, percent_token, has_flat_fee, token = fee_key
+        flat_fees = ([TokenAmount(token, self._decode_decimal(fee_amount_mantissa, fee_amount_exponent))]
+                     if has_flat_fee else [])
+        return fee_class(percent=percent, percent_token=percent_token, flat_fees=flat_fees)
@@ -1,15 +1,21 @@
+import asyncio
 import logging
 import re
 import ssl
+import time
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
+import cachetools
 
 from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import PositionSide
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_request_cache import GatewayRequestCache
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.tick_profiler import TickProfiler
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -37,6 +43,16 @@ class GatewayError(Enum):
     UnknownError = 1099
 
 
+# The price endpoints polled by the strategies and connectors, their responses are cached and concurrent identical
+# requests coalesced (see GatewayRequestCache)
+QUOTE_ENDPOINTS = ("amm/price", "amm/perp/market-prices", "clob/tickers")
+TRANSACTION_POLL_BATCH_SIZE = 100
+TRANSACTION_POLL_CONCURRENCY = 5
+# The time (in seconds) the batch poll endpoint is not used after gateway answered it does not have it
+TRANSACTION_BATCH_POLL_RETRY_INTERVAL = 600.0
+CONFIRMED_TRANSACTIONS_CACHE_SIZE = 10000
+
+
 class GatewayHttpClient:
     """
     An HTTP client for making requests to the gateway API.
@@ -63,6 +79,11 @@ class GatewayHttpClient:
         if GatewayHttpClient.__instance is None:
             self._base_url = f"https://{api_host}:{api_port}"
         self._client_config_map = client_config_map
+        quote_cache_ttl = float(client_config_map.gateway.gateway_quote_cache_ttl)
+        self._request_cache = GatewayRequestCache({path_url: quote_cache_ttl for path_url in QUOTE_ENDPOINTS})
+        # The time the batch poll endpoint of each network path is tried again, after gateway answered it is missing
+        self._batch_poll_retry_timestamps: Dict[str, float] = {}
+        self._confirmed_transactions: cachetools.LRUCache = cachetools.LRUCache(CONFIRMED_TRANSACTIONS_CACHE_SIZE)
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -102,6 +123,16 @@ class GatewayHttpClient:
     def base_url(self, url: str):
         self._base_url = url
 
+    @property
+    def request_cache(self) -> GatewayRequestCache:
+        return self._request_cache
+
+    def set_cache_ttl(self, path_url: str, ttl: float):
+        """
+        Caches the responses of an endpoint for ttl seconds, concurrent identical requests share one HTTP call
+        """
+        self._request_cache.set_ttl(path_url, ttl)
+
     def log_error_codes(self, resp: Dict[str, Any]):
         """
         If the API returns an error code, interpret the code, log a useful
@@ -169,10 +200,37 @@ class GatewayHttpClient:
         :param use_body: used to determine if the request should sent the parameters in the body or as query string
         :returns A response in json format.
         """
+        if not self._request_cache.is_cached_endpoint(path_url):
+            response, _ = await self._send_request(method, path_url, params, fail_silently, use_body)
+            return response
+        response = await self._request_cache.request(
+            method,
+            path_url,
+            {"params": params, "fail_silently": fail_silently, "use_body": use_body},
+            lambda: self._send_request(method, path_url, params, fail_silently, use_body),
+        )
+        profiler = TickProfiler.get_instance()
+        if profiler.enabled:
+            profiler.set_counters("GatewayHttpClient", self._request_cache.stats())
+        return response
+
+    async def _send_request(
+            self,
+            method: str,
+            path_url: str,
+            params: Dict[str, Any],
+            fail_silently: bool,
+            use_body: bool,
+    ) -> Tuple[Optional[Union[Dict[str, Any], List[Dict[str, Any]]]], bool]:
+        """
+        Sends the request, returns its response and whether it succeeded (the errors of the requests failing silently
+        are returned as their response).
+        """
         url = f"{self.base_url}/{path_url}"
         client = self._http_client(self._client_config_map)
 
         parsed_response = {}
+        succeeded = False
         try:
             if method == "get":
                 if len(params) > 0:
@@ -194,6 +252,7 @@ class GatewayHttpClient:
                 self.logger().network(f"The network call to {url} has timed out.")
             else:
                 parsed_response = await response.json()
+                succeeded = response.status == 200
                 if response.status != 200 and \
                    not fail_silently and \
                    not self.is_timeout_error(parsed_response):
@@ -216,7 +275,7 @@ class GatewayHttpClient:
                     )
                 raise e
 
-        return parsed_response
+        return parsed_response, succeeded
 
     async def ping_gateway(self) -> bool:
         try:
@@ -407,6 +466,101 @@ class GatewayHttpClient:
         network_path = "near" if chain == "near" else "network"
         return await self.api_request("post", f"{network_path}/poll", request, fail_silently=fail_silently)
 
+    @staticmethod
+    def is_transaction_confirmed(transaction_status: Dict[str, Any]) -> bool:
+        """
+        A transaction included in a block (successful or reverted) never changes status again
+        """
+        return transaction_status.get("txStatus") == 1 and transaction_status.get("txReceipt") is not None
+
+    async def get_transaction_statuses(
+            self,
+            chain: str,
+            network: str,
+            transaction_hashes: List[str],
+            connector: Optional[str] = None,
+            address: Optional[str] = None,
+            fail_silently: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Polls the status of several transactions. Confirmed transactions are answered from a local cache and never
+        polled again. The others are polled TRANSACTION_POLL_BATCH_SIZE at a time through the batch endpoint, and the
+        ones it didn't answer with single poll requests (TRANSACTION_POLL_CONCURRENCY at a time). A gateway without the
+        batch endpoint is only sent single poll requests for TRANSACTION_BATCH_POLL_RETRY_INTERVAL seconds.
+        :return: the status of each transaction (in the order of transaction_hashes), or the exception raised while
+        polling it
+        """
+        statuses: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        pending: List[str] = []
+        for tx_hash in dict.fromkeys(transaction_hashes):
+            confirmed_status = self._confirmed_transactions.get((chain, network, tx_hash))
+            if confirmed_status is not None:
+                statuses[tx_hash] = confirmed_status
+            else:
+                pending.append(tx_hash)
+
+        network_path = "near" if chain == "near" else "network"
+        if len(pending) > 0 and self._batch_poll_retry_timestamps.get(network_path, 0) <= self._time():
+            statuses.update(await self._poll_transaction_batches(chain, network, pending, connector, address))
+            pending = [tx_hash for tx_hash in pending if tx_hash not in statuses]
+
+        if len(pending) > 0:
+            semaphore = asyncio.Semaphore(TRANSACTION_POLL_CONCURRENCY)
+
+            async def poll(tx_hash: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.get_transaction_status(
+                        chain, network, tx_hash, connector=connector, address=address, fail_silently=fail_silently
+                    )
+
+            results = await safe_gather(*[poll(tx_hash) for tx_hash in pending], return_exceptions=True)
+            statuses.update(zip(pending, results))
+
+        for tx_hash, status in statuses.items():
+            if isinstance(status, dict) and self.is_transaction_confirmed(status):
+                self._confirmed_transactions[(chain, network, tx_hash)] = status
+        return [statuses[tx_hash] for tx_hash in transaction_hashes]
+
+    async def _poll_transaction_batches(
+            self,
+            chain: str,
+            network: str,
+            transaction_hashes: List[str],
+            connector: Optional[str],
+            address: Optional[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        network_path = "near" if chain == "near" else "network"
+        statuses: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(transaction_hashes), TRANSACTION_POLL_BATCH_SIZE):
+            request = {
+                "chain": chain,
+                "network": network,
+                "txHashes": transaction_hashes[start:start + TRANSACTION_POLL_BATCH_SIZE],
+            }
+            if connector:
+                request["connector"] = connector
+            if address:
+                request["address"] = address
+            try:
+                response = await self.api_request("post", f"{network_path}/poll-batch", request)
+            except aiohttp.ClientResponseError as e:
+                # A missing route is answered with an HTML 404 (the route errors are JSON), only use single poll
+                # requests for a while
+                if e.status == 404:
+                    self._batch_poll_retry_timestamps[network_path] = \
+                        self._time() + TRANSACTION_BATCH_POLL_RETRY_INTERVAL
+                break
+            except Exception:
+                # Left to the single poll requests of this call
+                break
+            transactions = response.get("transactions", []) if isinstance(response, dict) else []
+            statuses.update({status["txHash"]: status for status in transactions if "txHash" in status})
+        return statuses
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
     async def get_evm_nonce(
             self,
             chain: str,
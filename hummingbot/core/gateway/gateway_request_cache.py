@@ -0,0 +1,108 @@
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+RequestKey = Tuple[str, str, str]
+
+
+class CachedResponse(NamedTuple):
+    response: Any
+    expires_at: float
+
+
+class EndpointCacheStats:
+    __slots__ = ("hits", "misses", "coalesced")
+
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced}
+
+
+class GatewayRequestCache:
+    """
+    A response cache for the read only gateway endpoints, with a TTL per endpoint. Identical requests (same method,
+    endpoint and parameters) within the TTL of a response get that response, and identical requests made while one is
+    in flight wait for it instead of sending their own (single flight).
+    Only the successful non empty responses are cached: the error responses of the requests failing silently are
+    returned to the waiting callers but not cached, and errors are propagated to every waiting caller.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 1000):
+        self._ttls: Dict[str, float] = dict(ttls or {})
+        self._max_entries: int = max_entries
+        self._responses: Dict[RequestKey, CachedResponse] = {}
+        self._in_flight: Dict[RequestKey, asyncio.Future] = {}
+        self._stats: Dict[str, EndpointCacheStats] = {}
+
+    def ttl(self, path_url: str) -> float:
+        return self._ttls.get(path_url, 0.0)
+
+    def set_ttl(self, path_url: str, ttl: float):
+        """
+        :param path_url: the endpoint, e.g. amm/price
+        :param ttl: the number of seconds a response is reused, 0 to only coalesce concurrent requests
+        """
+        self._ttls[path_url] = ttl
+
+    def is_cached_endpoint(self, path_url: str) -> bool:
+        return path_url in self._ttls
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {path_url: stats.to_dict() for path_url, stats in self._stats.items()}
+
+    def clear(self):
+        self._responses.clear()
+
+    async def request(self,
+                      method: str,
+                      path_url: str,
+                      params: Dict[str, Any],
+                      send_request: Callable[[], Awaitable[Tuple[Any, bool]]]) -> Any:
+        """
+        Returns the cached response of an identical request, or sends the request.
+        :param send_request: sends the request and returns its response and whether the request succeeded
+        """
+        key = (method, path_url, json.dumps(params, sort_keys=True, default=str))
+        stats = self._stats.get(path_url)
+        if stats is None:
+            stats = self._stats[path_url] = EndpointCacheStats()
+
+        cached = self._responses.get(key)
+        if cached is not None and cached.expires_at > time.time():
+            stats.hits += 1
+            return cached.response
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            stats.coalesced += 1
+        else:
+            stats.misses += 1
+            in_flight = self._in_flight[key] = asyncio.ensure_future(send_request())
+            in_flight.add_done_callback(lambda future: self._request_done(key, future))
+        # A caller giving up (cancelled) does not cancel the request the other callers are waiting for
+        response, _ = await asyncio.shield(in_flight)
+        return response
+
+    def _request_done(self, key: RequestKey, future: asyncio.Future):
+        del self._in_flight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        response, succeeded = future.result()
+        ttl = self.ttl(key[1])
+        if succeeded and response and ttl > 0:
+            if len(self._responses) >= self._max_entries:
+                self._remove_expired_responses()
+            self._responses[key] = CachedResponse(response, time.time() + ttl)
+
+    def _remove_expired_responses(self):
+        now = time.time()
+        expired = [key for key, cached in self._responses.items() if cached.expires_at <= now]
+        for key in expired:
+            del self._responses[key]
+        if len(self._responses) >= self._max_entries:
+            self._responses.clear()
@@ -15,13 +15,16 @@ from libcpp.vector cimport vector
 from enum import Enum
 import logging
 import random
+from time import perf_counter_ns
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.utils.tick_profiler import TickProfiler
 
 class_logger = None
+tick_profiler = TickProfiler.get_instance()
 
 
 cdef class PubSub:
@@ -151,6 +154,8 @@ cdef class PubSub:
             EventListenersCollection listeners
             object listener_weafref
             EventListener typed_listener
+            bint profiling = tick_profiler.enabled
+            int64_t start_ns
         if it == self._events.end():
             return
 
@@ -162,7 +167,14 @@ cdef class PubSub:
             typed_listener = <object>PyWeakref_GetObject(listener_weafref)
             try:
                 typed_listener.c_set_event_info(event_tag, self)
-                typed_listener.c_call(arg)
+                if profiling:
+                    start_ns = perf_counter_ns()
+                    typed_listener.c_call(arg)
+                    tick_profiler.record(self.__class__.__name__,
+                                         f"event:{typed_listener.__class__.__name__}",
+                                         perf_counter_ns() - start_ns)
+                else:
+                    typed_listener.c_call(arg)
             except Exception:
                 self.c_log_exception(event_tag, arg)
             finally:
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
 from typing import Dict, Optional
 
@@ -13,7 +14,7 @@ from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGecko
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateTable
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -25,12 +26,16 @@ RATE_ORACLE_SOURCES = {
     "gate_io": GateIoRateSource,
 }
 
+# How long the prices fetched for the async rate requests are shared when the price loop is not running
+LIVE_PRICES_TTL = 1.0
+
 
 class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    Each prices snapshot is turned into a RateTable, which resolves the rates of a given pair (directly, inversely or
+    through other tokens) once and then serves them from its cache.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -51,6 +56,10 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._rate_table: RateTable = RateTable(self._prices)
+        self._live_rate_table: Optional[RateTable] = None
+        self._live_rate_table_timestamp: float = 0
+        self._live_prices_lock = asyncio.Lock()
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -82,6 +91,7 @@ class RateOracle(NetworkBase):
     @source.setter
     def source(self, new_source: RateSourceBase):
         self._source = new_source
+        self._live_rate_table = None
 
     @property
     def quote_token(self) -> str:
@@ -92,6 +102,7 @@ class RateOracle(NetworkBase):
         if new_token != self._quote_token:
             self._quote_token = new_token
             self._prices = {}
+            self._live_rate_table = None
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -141,9 +152,9 @@ class RateOracle(NetworkBase):
         :param base_token: The token symbol that we want to price, e.g. BTC
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
         pair = combine_to_hb_trading_pair(base=base_token, quote=self._quote_token)
-        return find_rate(prices, pair)
+        rate_table = await self._latest_rate_table()
+        return rate_table.rate(pair)
 
     def get_pair_rate(self, pair: str) -> Decimal:
         """
@@ -153,7 +164,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._current_rate_table().rate(pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -178,13 +189,37 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
-        return find_rate(prices, pair)
+        rate_table = await self._latest_rate_table()
+        return rate_table.rate(pair)
+
+    def _current_rate_table(self) -> RateTable:
+        # The table is rebuilt when the prices were replaced without going through the price loop
+        if self._rate_table.prices is not self._prices or self._rate_table.reference_token != self._quote_token:
+            self._rate_table = RateTable(self._prices, self._quote_token)
+        return self._rate_table
+
+    async def _latest_rate_table(self) -> RateTable:
+        """
+        Returns the rate table of the prices kept up to date by the price loop. When the loop is not running, the
+        prices are fetched from the source and shared by the requests made in the next LIVE_PRICES_TTL seconds,
+        concurrent requests wait for the same fetch.
+        """
+        if self._prices:
+            return self._current_rate_table()
+        async with self._live_prices_lock:
+            if (self._live_rate_table is None
+                    or time.time() - self._live_rate_table_timestamp > LIVE_PRICES_TTL):
+                prices = await self._source.get_prices(quote_token=self._quote_token)
+                self._live_rate_table = RateTable(prices, self._quote_token)
+                self._live_rate_table_timestamp = time.time()
+            return self._live_rate_table
 
     async def _fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self._source.get_prices(quote_token=self._quote_token)
+                prices = await self._source.get_prices(quote_token=self._quote_token)
+                self._rate_table = RateTable(prices, self._quote_token)
+                self._prices = prices
                 if self._prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
@@ -1,5 +1,6 @@
+from collections import defaultdict
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
@@ -35,3 +36,93 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
         common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
         if common_denom_pair in prices:
             return proxy_price / prices[common_denom_pair]
+
+
+class RateTable:
+    """
+    Conversion rates between the tokens of a prices snapshot.
+
+    The prices are turned once into a conversion graph (a token to token rate for each price and its inverse, wrapped
+    tokens are merged with their native token), and
+    the rates of every token reachable from the reference token are resolved up front by a breadth first walk of the
+    graph. A rate is then a dictionary lookup, the pairs resolved on demand (two hops routes, or through the
+    reference token) are cached in the table as well. The table is immutable, a new one is built for each snapshot.
+    """
+
+    def __init__(self, prices: Dict[str, Decimal], reference_token: Optional[str] = None):
+        self._prices = prices
+        self._reference_token = reference_token
+        self._graph: Dict[str, Dict[str, Decimal]] = defaultdict(dict)
+        self._rates: Dict[str, Optional[Decimal]] = dict(prices)
+        self._reference_rates: Dict[str, Decimal] = {}
+        self._build_graph()
+        if reference_token is not None:
+            self._resolve_reference_rates(reference_token)
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        return self._prices
+
+    @property
+    def reference_token(self) -> Optional[str]:
+        return self._reference_token
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the conversion rate of a trading pair, in order of preference from its price, the inverse of the price
+        of the reverse pair, a two hops route or the rates of both tokens to the reference token.
+        :param pair: The trading pair
+        """
+        try:
+            return self._rates[pair]
+        except KeyError:
+            rate = self._resolve_rate(pair)
+            self._rates[pair] = rate
+            return rate
+
+    def _build_graph(self):
+        inverse_prices = []
+        for pair, price in self._prices.items():
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+            base = unwrap_token_symbol(base)
+            quote = unwrap_token_symbol(quote)
+            self._graph[base][quote] = price
+            if price:
+                inverse_prices.append((quote, base, Decimal("1") / price))
+        # A price known in both directions is used as is rather than through its inverse
+        for base, quote, price in inverse_prices:
+            self._graph[base].setdefault(quote, price)
+
+    def _resolve_reference_rates(self, reference_token: str):
+        reference_symbol = unwrap_token_symbol(reference_token)
+        self._reference_rates[reference_symbol] = Decimal("1")
+        frontier = [reference_symbol]
+        while frontier:
+            next_frontier = []
+            for token in frontier:
+                token_rate = self._reference_rates[token]
+                for neighbor in self._graph.get(token, {}):
+                    neighbor_rate = self._graph.get(neighbor, {}).get(token)
+                    if neighbor not in self._reference_rates and neighbor_rate is not None:
+                        self._reference_rates[neighbor] = neighbor_rate * token_rate
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        for token, rate in self._reference_rates.items():
+            self._rates.setdefault(combine_to_hb_trading_pair(base=token, quote=reference_token), rate)
+
+    def _resolve_rate(self, pair: str) -> Optional[Decimal]:
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1")
+        base_rates = self._graph.get(base, {})
+        if quote in base_rates:
+            return base_rates[quote]
+        for link_token, link_rate in base_rates.items():
+            link_rates = self._graph.get(link_token, {})
+            if quote in link_rates:
+                return link_rate * link_rates[quote]
+        if base in self._reference_rates and self._reference_rates.get(quote):
+            return self._reference_rates[base] / self._reference_rates[quote]
+        return None
@@ -0,0 +1,140 @@
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+
+class StatusTable(NamedTuple):
+    """
+    The columns and the rows of a table of a status report
+    """
+    columns: List[Any]
+    rows: List[List[Any]]
+
+
+def format_status_value(value: Any) -> str:
+    """
+    Formats a table cell as map_df_to_str does: the floats in positional notation without trailing zeros.
+    """
+    if isinstance(value, float):
+        return np.format_float_positional(value, trim="-")
+    return str(value)
+
+
+def map_table_to_str(table: StatusTable) -> StatusTable:
+    """
+    Formats the cells of a table as strings, as map_df_to_str does for a data frame.
+    """
+    return StatusTable(table.columns, [[format_status_value(value) for value in row] for row in table.rows])
+
+
+def render_status_table(table: StatusTable, header: bool = True, left_align_first_column: bool = False) -> List[str]:
+    """
+    Renders a table as DataFrame.to_string(index=False) does, without building a data frame: the columns are right
+    aligned and separated by a space, the columns of numbers are one character wider.
+
+    :param table: The table to render
+    :param header: Whether the first line has the column names
+    :param left_align_first_column: Whether the first column is aligned on the left (the row names)
+    :return: The table lines
+    """
+    columns_count = len(table.columns)
+    cells = [[format_status_value(value) for value in row] for row in table.rows]
+    widths = []
+    for i in range(columns_count):
+        width = max((len(row[i]) for row in cells), default=0)
+        if header:
+            width = max(width, len(str(table.columns[i])))
+        if len(table.rows) > 0 and all(isinstance(row[i], (int, float)) and not isinstance(row[i], bool)
+                                       for row in table.rows):
+            # The numbers have a leading space for their sign
+            width += 1
+        widths.append(width)
+    lines_cells = ([[str(column) for column in table.columns]] if header else []) + cells
+    lines = []
+    for line_cells in lines_cells:
+        line = [
+            cell.ljust(widths[i]) if i == 0 and left_align_first_column else cell.rjust(widths[i])
+            for i, cell in enumerate(line_cells)
+        ]
+        lines.append(" ".join(line))
+    return lines
+
+
+class StatusReport:
+    """
+    The status text of a strategy, made of sections the strategy updates every time it formats its status.
+
+    A section is either a table with a title or some lines of text. A table section is given the inputs its table is
+    built from (e.g. the prices, the balances or the active orders), and the function building it: the table is only
+    built and rendered when the section is new or its inputs changed since its previous update, the other sections
+    keep their text. The sections are rendered in the order they were updated since the previous render, the ones that
+    were not updated are left out, and render() returns the previous text when no section changed.
+    """
+
+    def __init__(self, indent: str = "    "):
+        self._indent = indent
+        # The inputs (or the lines) and the text of the sections, the text is None for a table built as None
+        self._sections: Dict[str, Tuple[Any, Optional[str]]] = {}
+        self._updated_sections: List[str] = []
+        self._changed_sections: Set[str] = set()
+        self._rendered_sections: List[str] = []
+        self._text: Optional[str] = None
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._text is None or self._updated_sections != self._rendered_sections or len(self._changed_sections) > 0
+
+    def update_table(self,
+                     name: str,
+                     title: str,
+                     build_table: Callable[[], Optional[StatusTable]],
+                     inputs: Any,
+                     header: bool = True,
+                     left_align_first_column: bool = False):
+        """
+        Updates a table section, rendered as an empty line, the title and the indented table.
+
+        :param name: The section name
+        :param title: The table title, e.g. Markets
+        :param build_table: Builds the table, the section is left out when it returns None
+        :param inputs: The values the table is built from, compared with ==. The table is built again only when they
+        change, None builds it on every update.
+        :param header: Whether the table header is rendered
+        :param left_align_first_column: Whether the first column is aligned on the left
+        """
+        self._updated_sections.append(name)
+        section = self._sections.get(name)
+        if inputs is not None and section is not None and section[0] == ("table", title, inputs):
+            return
+        table = build_table()
+        text = None if table is None else self._render_table(title, table, header, left_align_first_column)
+        self._sections[name] = (("table", title, inputs), text)
+        self._changed_sections.add(name)
+
+    def update_lines(self, name: str, lines: List[str]):
+        """
+        Updates a section of text lines, rendered as they are.
+        """
+        self._updated_sections.append(name)
+        section = self._sections.get(name)
+        if section is None or section[0] != ("lines", lines):
+            self._sections[name] = (("lines", lines), "\n".join(lines))
+            self._changed_sections.add(name)
+
+    def render(self) -> str:
+        if not self.is_dirty:
+            self._updated_sections = []
+            return self._text
+        section_texts = [self._sections[name][1] for name in self._updated_sections
+                         if self._sections[name][1] is not None]
+        for name in set(self._sections) - set(self._updated_sections):
+            del self._sections[name]
+        self._rendered_sections = self._updated_sections
+        self._updated_sections = []
+        self._changed_sections = set()
+        self._text = "\n".join(section_texts)
+        return self._text
+
+    def _render_table(self, title: str, table: StatusTable, header: bool, left_align_first_column: bool) -> str:
+        table_lines = render_status_table(table, header, left_align_first_column)
+        return "\n".join(["", f"  {title}:"] + [self._indent + line for line in table_lines])
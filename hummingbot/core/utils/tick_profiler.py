@@ -0,0 +1,169 @@
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from hummingbot.logger import HummingbotLogger
+
+HISTOGRAM_BUCKETS = 64
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with power of two nanosecond buckets: bucket b counts the durations of b significant bits,
+    i.e. in [2^(b-1), 2^b) ns. Recording a duration is a couple of integer operations, the percentiles are the upper
+    bounds of their buckets (within a factor of two of the exact value).
+    """
+
+    __slots__ = ("count", "total_ns", "max_ns", "_buckets")
+
+    def __init__(self):
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+        self._buckets: List[int] = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, elapsed_ns: int):
+        self._buckets[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count > 0 else 0.0
+
+    def percentile_ns(self, percentile: float) -> int:
+        """
+        :param percentile: the percentile, between 0 and 100
+        :return: the upper bound of the bucket holding the percentile (never above the maximum recorded duration)
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * percentile // 100))
+        seen = 0
+        for bucket, bucket_count in enumerate(self._buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min((1 << bucket) - 1, self.max_ns)
+        return self.max_ns
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_us": self.mean_ns / 1e3,
+            "p50_us": self.percentile_ns(50) / 1e3,
+            "p90_us": self.percentile_ns(90) / 1e3,
+            "p99_us": self.percentile_ns(99) / 1e3,
+            "max_us": self.max_ns / 1e3,
+            "total_ms": self.total_ns / 1e6,
+        }
+
+
+class TickProfiler:
+    """
+    Opt-in latency instrumentation of the clock tick. The clock times every TimeIterator.c_tick, PubSub times every
+    event listener call and strategies can time their own stages, each into a LatencyHistogram keyed by component and
+    stage. The instrumented code checks `enabled` before reading the time, so the hooks cost an attribute lookup
+    while the profiler is stopped.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instance: "TickProfiler" = None
+
+    @classmethod
+    def get_instance(cls) -> "TickProfiler":
+        if cls._shared_instance is None:
+            cls._shared_instance = TickProfiler()
+        return cls._shared_instance
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self.enabled: bool = False
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._counters: Dict[str, Dict[str, Any]] = {}
+        self._started_at: float = 0
+        self._export_path: Optional[Path] = None
+        self._export_interval: float = 60.0
+        self._last_export_timestamp: float = 0
+
+    @property
+    def export_path(self) -> Optional[Path]:
+        return self._export_path
+
+    def start(self, export_path: Optional[Path] = None, export_interval: float = 60.0):
+        """
+        Clears the previous measurements and enables the hooks.
+        :param export_path: the JSON file the metrics are periodically written to, None to keep them in memory only
+        :param export_interval: the minimum interval between two exports (in seconds)
+        """
+        self.reset()
+        self._export_path = export_path
+        self._export_interval = export_interval
+        self._last_export_timestamp = time.time()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+        if self._export_path is not None:
+            self.export()
+
+    def reset(self):
+        self._histograms.clear()
+        self._counters.clear()
+        self._started_at = time.time()
+
+    def record(self, component: str, stage: str, elapsed_ns: int):
+        key = (component, stage)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram()
+        histogram.record(elapsed_ns)
+
+    def set_counters(self, component: str, counters: Dict[str, Any]):
+        """
+        Stores the latest values of counters a component maintains itself, they are exported with the histograms
+        """
+        self._counters[component] = counters
+
+    def counters(self, component: str) -> Optional[Dict[str, Any]]:
+        return self._counters.get(component)
+
+    def histogram(self, component: str, stage: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get((component, stage))
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        :return: one row per component and stage, sorted by the total time spent, largest first
+        """
+        rows = [{"component": component, "stage": stage, **histogram.to_dict()}
+                for (component, stage), histogram in self._histograms.items()]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def export_if_due(self, timestamp: float):
+        if self._export_path is not None and timestamp - self._last_export_timestamp >= self._export_interval:
+            self._last_export_timestamp = timestamp
+            self.export()
+
+    def export(self):
+        metrics = {
+            "started_at": self._started_at,
+            "exported_at": time.time(),
+            "stages": self.snapshot(),
+            "counters": self._counters,
+        }
+        try:
+            self._export_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._export_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(metrics, indent=2))
+            temp_path.replace(self._export_path)
+        except OSError:
+            self.logger().error(f"Error exporting the tick profile to {self._export_path}.", exc_info=True)
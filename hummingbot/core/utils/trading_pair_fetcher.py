@@ -1,14 +1,37 @@
+import asyncio
+import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import os
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Dict, List, Optional
 
+from hummingbot import data_path
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
+
+TRADING_PAIRS_CACHE_PATH = Path(data_path()) / "trading_pairs_cache.json"
+# The cached trading pairs of an exchange are refreshed in the background when older than this (in seconds)
+TRADING_PAIRS_CACHE_TTL = 24 * 60 * 60
+# The time (in seconds) after a failed fetch before the trading pairs of the exchange are requested again
+TRADING_PAIRS_FETCH_RETRY_INTERVAL = 60
+# The exchanges queried for their trading pairs at the same time, their public endpoints are rate limited
+MAX_CONCURRENT_FETCHES = 4
 
 
 class TradingPairFetcher:
+    """
+    Provides the trading pairs of the exchanges for the autocompletion and the validation of the markets.
+
+    The trading pairs of an exchange are fetched when they are first requested (get_trading_pairs), or for every
+    exchange at start when fetch_pairs_from_all_exchanges is set in the client config. They are kept in an on disk
+    cache: the cached pairs are served right away and refreshed in the background once older than
+    TRADING_PAIRS_CACHE_TTL. At most MAX_CONCURRENT_FETCHES exchanges are queried at the same time, and an exchange
+    failing to answer is not queried again for TRADING_PAIRS_FETCH_RETRY_INTERVAL.
+    """
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
@@ -19,64 +42,157 @@ class TradingPairFetcher:
         return cls._tpf_logger
 
     @classmethod
-    def get_instance(cls, client_config_map: Optional["ClientConfigAdapter"] = None) -> "TradingPairFetcher":
+    def get_instance(cls,
+                     client_config_map: Optional["ClientConfigAdapter"] = None,
+                     fetch_trading_pairs: bool = True) -> "TradingPairFetcher":
         if cls._sf_shared_instance is None:
             client_config_map = client_config_map or cls._get_client_config_map()
-            cls._sf_shared_instance = TradingPairFetcher(client_config_map)
+            cls._sf_shared_instance = TradingPairFetcher(client_config_map, fetch_trading_pairs)
         return cls._sf_shared_instance
 
-    def __init__(self, client_config_map: ClientConfigAdapter):
+    def __init__(self, client_config_map: ClientConfigAdapter, fetch_trading_pairs: bool = True):
+        """
+        :param client_config_map: The client config
+        :param fetch_trading_pairs: When False (the bot runs without the autocompletion) only the cached trading
+        pairs are used, none are fetched from the exchanges
+        """
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
-        self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
+        self._fetch_trading_pairs = fetch_trading_pairs
+        self._fetch_timestamps: Dict[str, float] = {}
+        self._failed_fetch_timestamps: Dict[str, float] = {}
+        self._fetch_tasks: Dict[str, asyncio.Task] = {}
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self._load_cache()
+        self._fetch_task: Optional[asyncio.Task] = None
+        if fetch_trading_pairs and client_config_map.fetch_pairs_from_all_exchanges:
+            self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
+        else:
+            self.ready = True
+
+    def get_trading_pairs(self, connector_name: str) -> List[str]:
+        """
+        Returns the known trading pairs of a connector, and fetches them in the background if they are not known yet
+        or their cache expired.
+
+        :param connector_name: The connector name, e.g. binance or binance_paper_trade
+        :return: The trading pairs, empty until they are fetched
+        """
+        now = time.time()
+        if (now - self._fetch_timestamps.get(connector_name, 0) > TRADING_PAIRS_CACHE_TTL
+                and now - self._failed_fetch_timestamps.get(connector_name, 0) > TRADING_PAIRS_FETCH_RETRY_INTERVAL):
+            self.fetch_trading_pairs(connector_name)
+        return self.trading_pairs.get(connector_name, [])
+
+    def fetch_trading_pairs(self, connector_name: str) -> Optional[asyncio.Task]:
+        """
+        Starts fetching the trading pairs of a connector, unless they are being fetched already.
+
+        :param connector_name: The connector name
+        :return: The fetch task, None if the trading pairs of the connector can't be fetched
+        """
+        fetch_task = self._fetch_tasks.get(connector_name)
+        if fetch_task is None or fetch_task.done():
+            fetch_task = self._start_fetch(connector_name, self._all_connector_settings())
+        return fetch_task
+
+    def _start_fetch(self,
+                     connector_name: str,
+                     connector_settings: Dict[str, ConnectorSetting],
+                     save_cache: bool = True) -> Optional[asyncio.Task]:
+        conn_setting = connector_settings.get(connector_name)
+        if not self._fetch_trading_pairs or conn_setting is None:
+            return None
+        # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
+        # data source module for them.
+        try:
+            if conn_setting.base_name().endswith("paper_trade"):
+                fetch_task = self._fetch_pairs_from_connector_setting(
+                    connector_setting=connector_settings[conn_setting.parent_name],
+                    connector_name=conn_setting.name,
+                    save_cache=save_cache,
+                )
+            else:
+                fetch_task = self._fetch_pairs_from_connector_setting(connector_setting=conn_setting,
+                                                                      save_cache=save_cache)
+        except ModuleNotFoundError:
+            self._failed_fetch_timestamps[connector_name] = time.time()
+            return None
+        except Exception:
+            self._failed_fetch_timestamps[connector_name] = time.time()
+            self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
+                                    "Please check the logs")
+            return None
+        self._fetch_tasks[connector_name] = fetch_task
+        return fetch_task
 
     def _fetch_pairs_from_connector_setting(
             self,
             connector_setting: ConnectorSetting,
-            connector_name: Optional[str] = None):
+            connector_name: Optional[str] = None,
+            save_cache: bool = True) -> asyncio.Task:
         connector_name = connector_name or connector_setting.name
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
         if connector_setting.uses_gateway_generic_connector():
             connector_params = connector_setting.name.split("_")
             try:
-                safe_ensure_future(self.call_fetch_pairs(
-                    connector.all_trading_pairs(connector_params[1], connector_params[2]), connector_name))
+                fetch_fn = connector.all_trading_pairs(connector_params[1], connector_params[2])
             except TypeError:  # some gateway generic connector like gateway_EVM_Perpetual require an extra name parameter
-                safe_ensure_future(self.call_fetch_pairs(
-                    connector.all_trading_pairs(connector_params[1], connector_params[2], connector_params[0]), connector_name))
+                fetch_fn = connector.all_trading_pairs(connector_params[1], connector_params[2], connector_params[0])
         else:
-            safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+            fetch_fn = connector.all_trading_pairs()
+        return safe_ensure_future(self.call_fetch_pairs(fetch_fn, connector_name, save_cache))
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         connector_settings = self._all_connector_settings()
-        for conn_setting in connector_settings.values():
-            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
-            # data source module for them.
-            try:
-                if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-            except ModuleNotFoundError:
-                continue
-            except Exception:
-                self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
-                                        "Please check the logs")
-
+        fetch_tasks = [self._start_fetch(connector_name, connector_settings, save_cache=False)
+                       for connector_name in connector_settings]
         self.ready = True
 
-    async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+        await safe_gather(*[task for task in fetch_tasks if task is not None], return_exceptions=True)
+        self._save_cache()
+
+    async def call_fetch_pairs(self, fetch_fn: Awaitable[List[str]], exchange_name: str, save_cache: bool = False):
         try:
-            pairs = await fetch_fn
+            async with self._fetch_semaphore:
+                pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            self._fetch_timestamps[exchange_name] = time.time()
+            self._failed_fetch_timestamps.pop(exchange_name, None)
+            if save_cache:
+                self._save_cache()
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            # In case of error keep the cached pairs or assign an empty list, this is st. the bot won't stop working,
+            # the fetch timestamp is left as is so the pairs are fetched again when requested after the retry interval
+            self.trading_pairs.setdefault(exchange_name, [])
+            self._failed_fetch_timestamps[exchange_name] = time.time()
+
+    def _load_cache(self):
+        try:
+            with open(TRADING_PAIRS_CACHE_PATH) as fd:
+                cache: Dict[str, Dict[str, Any]] = json.load(fd)
+            for exchange_name, entry in cache.items():
+                self.trading_pairs[exchange_name] = entry["trading_pairs"]
+                self._fetch_timestamps[exchange_name] = entry["timestamp"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def _save_cache(self):
+        cache = {
+            exchange_name: {"timestamp": self._fetch_timestamps[exchange_name], "trading_pairs": trading_pairs}
+            for exchange_name, trading_pairs in self.trading_pairs.items()
+            if len(trading_pairs) > 0 and exchange_name in self._fetch_timestamps
+        }
+        temp_path = f"{TRADING_PAIRS_CACHE_PATH}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(TRADING_PAIRS_CACHE_PATH.parent, exist_ok=True)
+            with open(temp_path, "w") as fd:
+                json.dump(cache, fd)
+            os.replace(temp_path, TRADING_PAIRS_CACHE_PATH)
+        except OSError:
+            self.logger().warning("Could not save the trading pairs cache.", exc_info=True)
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
@@ -9,6 +9,7 @@ from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBa
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
+from hummingbot.core.web_assistant.ws_subscriptions import WSSubscriptionManager
 
 
 class WebAssistantsFactory:
@@ -57,9 +58,9 @@ class WebAssistantsFactory:
         )
         return assistant
 
-    async def get_ws_assistant(self) -> WSAssistant:
+    async def get_ws_assistant(self, subscription_manager: Optional[WSSubscriptionManager] = None) -> WSAssistant:
         connection = await self._connections_factory.get_ws_connection()
         assistant = WSAssistant(
-            connection, self._ws_pre_processors, self._ws_post_processors, self._auth
+            connection, self._ws_pre_processors, self._ws_post_processors, self._auth, subscription_manager
         )
         return assistant
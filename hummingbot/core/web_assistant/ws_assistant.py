@@ -2,6 +2,7 @@ from copy import deepcopy
 from typing import (
     AsyncGenerator,
     Dict,
+    Iterable,
     List,
     Optional,
 )
@@ -11,6 +12,7 @@ from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
+from hummingbot.core.web_assistant.ws_subscriptions import WSSubscriptionManager
 
 
 class WSAssistant:
@@ -19,6 +21,9 @@ class WSAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `WSPreProcessorBase` and `WSPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    When a `WSSubscriptionManager` is set, `subscribe_channels` subscribes to the channels in batched frames, and the
+    acknowledgements are tracked from the messages received.
     """
 
     def __init__(
@@ -27,16 +32,22 @@ class WSAssistant:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        subscription_manager: Optional[WSSubscriptionManager] = None,
     ):
         self._connection = connection
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
+        self._subscription_manager = subscription_manager
 
     @property
     def last_recv_time(self) -> float:
         return self._connection.last_recv_time
 
+    @property
+    def subscription_manager(self) -> Optional[WSSubscriptionManager]:
+        return self._subscription_manager
+
     async def connect(
         self,
         ws_url: str,
@@ -46,6 +57,9 @@ class WSAssistant:
         ws_headers: Optional[Dict] = {},
     ):
         await self._connection.connect(ws_url=ws_url, ws_headers=ws_headers, ping_timeout=ping_timeout, message_timeout=message_timeout)
+        if self._subscription_manager is not None:
+            # The subscriptions of a previous connection are lost
+            self._subscription_manager.reset()
 
     async def disconnect(self):
         await self._connection.disconnect()
@@ -54,6 +68,16 @@ class WSAssistant:
         """Will eventually be used to handle automatic re-connection."""
         await self.send(request)
 
+    async def subscribe_channels(self, channels: Optional[Iterable[str]] = None) -> int:
+        """Subscribes to the channels not subscribed yet through the subscription manager, in batched frames.
+
+        Called without channels after a reconnection, it subscribes again to the missing channels only.
+        :return: the number of frames sent
+        """
+        if self._subscription_manager is None:
+            raise RuntimeError("The WS assistant has no subscription manager.")
+        return await self._subscription_manager.subscribe(self, channels)
+
     async def send(self, request: WSRequest):
         request = deepcopy(request)
         request = await self._pre_process_request(request)
@@ -69,6 +93,7 @@ class WSAssistant:
             response = await self._connection.receive()
             if response is not None:
                 response = await self._post_process_response(response)
+                self._track_subscriptions(response)
                 yield response
 
     async def receive(self) -> Optional[WSResponse]:
@@ -76,6 +101,7 @@ class WSAssistant:
         response = await self._connection.receive()
         if response is not None:
             response = await self._post_process_response(response)
+            self._track_subscriptions(response)
         return response
 
     async def _pre_process_request(self, request: WSRequest) -> WSRequest:
@@ -92,3 +118,7 @@ class WSAssistant:
         for post_processor in self._ws_post_processors:
             response = await post_processor.post_process(response)
         return response
+
+    def _track_subscriptions(self, response: WSResponse):
+        if self._subscription_manager is not None:
+            self._subscription_manager.process_message(response.data)
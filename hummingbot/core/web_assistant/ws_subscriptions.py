@@ -0,0 +1,199 @@
+import abc
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSPlainTextRequest, WSRequest
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+
+class WSSubscriptionAck(NamedTuple):
+    request_id: int
+    success: bool
+
+
+class WSSubscriptionFormatBase(abc.ABC):
+    """An interface class describing how an exchange subscribes to channels through its WebSocket.
+
+    A class implementing it builds the payload of a frame subscribing to a batch of channels (up to
+    `max_channels_per_frame`), and recognizes the messages acknowledging those frames.
+    """
+
+    #: The number of channels the exchange accepts in a single subscription frame
+    max_channels_per_frame: int = 1
+
+    @abc.abstractmethod
+    def subscription_payload(self, channels: List[str], request_id: int) -> Any:
+        """The JSON payload (or the text) of the frame subscribing to the channels."""
+        ...
+
+    def is_auth_required(self, channels: List[str]) -> bool:
+        return False
+
+    def acknowledgement(self, data: Any) -> Optional[WSSubscriptionAck]:
+        """Returns the acknowledgement the message carries, None if the message is not one.
+
+        The formats of exchanges that don't acknowledge subscriptions keep the default, the channels are then
+        considered subscribed once their frame is sent.
+        """
+        return None
+
+    @property
+    def tracks_acknowledgements(self) -> bool:
+        return type(self).acknowledgement is not WSSubscriptionFormatBase.acknowledgement
+
+
+class _PendingFrame(NamedTuple):
+    channels: List[str]
+    sent_timestamp: float
+
+
+class WSSubscriptionManager:
+    """Keeps the channels a WebSocket connection is subscribed to, and subscribes to them in batches.
+
+    The channels are sent in the minimum number of frames the exchange allows (as described by the subscription
+    format), paced under the throttler limit when one is set. The frames not requiring authentication are serialized
+    once, when they are built. The acknowledgements of the frames are tracked from the messages received by the
+    assistant: a channel rejected or not acknowledged within `ack_timeout` seconds is missing again, and only the
+    missing channels are sent by the next `subscribe`. Connecting the assistant again resets the acknowledgements,
+    since the subscriptions of the previous connection are lost.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(
+        self,
+        subscription_format: WSSubscriptionFormatBase,
+        throttler: Optional[AsyncThrottlerBase] = None,
+        throttler_limit_id: Optional[str] = None,
+        ack_timeout: float = 10.0,
+        pre_serialize: bool = True,
+    ):
+        """
+        :param subscription_format: how the exchange batches and acknowledges the subscriptions
+        :param throttler: the throttler pacing the frames, the frames are not paced when None
+        :param throttler_limit_id: the limit of the throttler consumed by each frame
+        :param ack_timeout: the time (in seconds) a frame is waited for acknowledgement before its channels are
+            missing again
+        :param pre_serialize: sends the frames as text serialized once, instead of JSON payloads (disable it when a
+            pre-processor of the assistant rewrites the payloads)
+        """
+        self._format = subscription_format
+        self._throttler = throttler
+        self._throttler_limit_id = throttler_limit_id
+        self._ack_timeout = ack_timeout
+        self._pre_serialize = pre_serialize
+        # Ordered set of the channels to subscribe to
+        self._channels: Dict[str, None] = {}
+        self._acknowledged: Set[str] = set()
+        self._pending: Dict[int, _PendingFrame] = {}
+        self._next_request_id = 1
+
+    @property
+    def channels(self) -> List[str]:
+        return list(self._channels)
+
+    @property
+    def acknowledged_channels(self) -> Set[str]:
+        return set(self._acknowledged)
+
+    @property
+    def missing_channels(self) -> List[str]:
+        """The channels neither acknowledged nor waiting for their acknowledgement."""
+        pending = {channel for frame in self._pending.values() for channel in frame.channels}
+        return [channel for channel in self._channels if channel not in self._acknowledged and channel not in pending]
+
+    @property
+    def is_fully_subscribed(self) -> bool:
+        return len(self._acknowledged) == len(self._channels)
+
+    def add_channels(self, channels: Iterable[str]):
+        for channel in channels:
+            self._channels[channel] = None
+
+    def remove_channels(self, channels: Iterable[str]):
+        """Stops tracking the channels. The unsubscription frames are left to the caller."""
+        for channel in channels:
+            self._channels.pop(channel, None)
+            self._acknowledged.discard(channel)
+
+    def reset(self):
+        """Forgets the acknowledgements, all the channels are missing again (e.g. after a reconnection)."""
+        self._acknowledged.clear()
+        self._pending.clear()
+
+    async def subscribe(self, ws_assistant: "WSAssistant", channels: Optional[Iterable[str]] = None) -> int:
+        """Subscribes to the missing channels (after adding `channels` to the subscriptions).
+
+        :return: the number of frames sent
+        """
+        if channels is not None:
+            self.add_channels(channels)
+        self._expire_pending_frames()
+        missing_channels = self.missing_channels
+        batch_size = max(self._format.max_channels_per_frame, 1)
+        frames = 0
+        for start in range(0, len(missing_channels), batch_size):
+            batch = missing_channels[start:start + batch_size]
+            request_id = self._next_request_id
+            self._next_request_id += 1
+            request = self._build_request(batch, request_id)
+            if self._throttler is not None and self._throttler_limit_id is not None:
+                async with self._throttler.execute_task(limit_id=self._throttler_limit_id):
+                    await ws_assistant.send(request)
+            else:
+                await ws_assistant.send(request)
+            if self._format.tracks_acknowledgements:
+                self._pending[request_id] = _PendingFrame(batch, self._time())
+            else:
+                self._acknowledged.update(batch)
+            frames += 1
+        return frames
+
+    def process_message(self, data: Any) -> bool:
+        """Updates the subscriptions from a received message.
+
+        :return: True if the message acknowledged (or rejected) a subscription frame
+        """
+        ack = self._format.acknowledgement(data)
+        if ack is None:
+            return False
+        frame = self._pending.pop(ack.request_id, None)
+        if frame is not None:
+            if ack.success:
+                self._acknowledged.update(channel for channel in frame.channels if channel in self._channels)
+            else:
+                self.logger().warning(f"The subscription to {', '.join(frame.channels)} was rejected ({data}).")
+        return True
+
+    def _build_request(self, channels: List[str], request_id: int) -> WSRequest:
+        payload = self._format.subscription_payload(channels, request_id)
+        is_auth_required = self._format.is_auth_required(channels)
+        if isinstance(payload, str):
+            return WSPlainTextRequest(payload=payload, is_auth_required=is_auth_required)
+        if self._pre_serialize and not is_auth_required:
+            return WSPlainTextRequest(payload=json.dumps(payload))
+        return WSJSONRequest(payload=payload, is_auth_required=is_auth_required)
+
+    def _expire_pending_frames(self):
+        now = self._time()
+        for request_id, frame in list(self._pending.items()):
+            if now - frame.sent_timestamp > self._ack_timeout:
+                self.logger().warning(f"The subscription to {', '.join(frame.channels)} was not acknowledged "
+                                      f"after {self._ack_timeout} seconds.")
+                del self._pending[request_id]
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
@@ -5,11 +5,10 @@ import os
 import sys
 import time
 import traceback
+from datetime import datetime
 from logging import Logger as PythonLogger
 from typing import Optional, Type
 
-import pandas as pd
-
 from .application_warning import ApplicationWarning
 
 TESTING_TOOLS = ["nose", "unittest", "pytest"]
@@ -48,7 +47,7 @@ class HummingbotLogger(PythonLogger):
         if not HummingbotLogger.is_testing_mode():
             from hummingbot.client.hummingbot_application import HummingbotApplication
             hummingbot_app: HummingbotApplication = HummingbotApplication.main_application()
-            hummingbot_app.notify(f"({pd.Timestamp.fromtimestamp(int(time.time()))}) {msg}")
+            hummingbot_app.notify(f"({datetime.fromtimestamp(int(time.time()))}) {msg}")
 
     def network(self, log_msg: str, app_warning_msg: Optional[str] = None, *args, **kwargs):
         from hummingbot.client.hummingbot_application import HummingbotApplication
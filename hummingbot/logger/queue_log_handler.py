@@ -0,0 +1,226 @@
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+
+class QueueOverflowPolicy(Enum):
+    """
+    What the log dispatcher does when the records are logged faster than its handlers write them.
+
+    drop_oldest: the queue keeps the latest records, the oldest ones are dropped when it is full.
+    sample: once the queue is half full, only one out of sample_rate records below WARNING is kept, the oldest
+    records are dropped when it is full.
+    """
+    drop_oldest = "drop_oldest"
+    sample = "sample"
+
+
+class LogDispatcher:
+    """
+    Writes the log records to their handlers on a background thread.
+
+    The records are queued unformatted, the message, the time stamp and the stack trace are formatted by the handlers
+    on the dispatcher thread, logging on the event loop thread only creates the record. The queue is bounded, what is
+    dropped when it is full depends on the overflow policy, the number of dropped records is logged.
+    """
+
+    def __init__(self,
+                 max_size: int = 10000,
+                 overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.drop_oldest,
+                 sample_rate: int = 10):
+        self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        self._sample_rate = sample_rate
+        self._records: Deque[Tuple[logging.LogRecord, Sequence[logging.Handler]]] = deque(maxlen=max_size)
+        self._wakeup = threading.Event()
+        self._sampled_count = 0
+        self._dropped_count = 0
+        self._reported_dropped_count = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._records)
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._dispatch_loop, name="LogDispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the dispatcher thread once the queued records are written.
+        """
+        if not self._running:
+            return
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def put(self, record: logging.LogRecord, handlers: Sequence[logging.Handler]):
+        if not self._running:
+            self._handle(record, handlers)
+            return
+        queue_size = len(self._records)
+        if (self._overflow_policy is QueueOverflowPolicy.sample
+                and record.levelno < logging.WARNING
+                and queue_size * 2 >= self._max_size):
+            self._sampled_count += 1
+            if self._sampled_count % self._sample_rate != 0:
+                self._dropped_count += 1
+                return
+        if queue_size >= self._max_size:
+            self._dropped_count += 1
+        self._records.append((record, handlers))
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        Waits until the queued records are written.
+        """
+        while self._running and len(self._records) > 0:
+            self._wakeup.set()
+            time.sleep(0.001)
+
+    def _dispatch_loop(self):
+        while True:
+            self._wakeup.wait(timeout=1.0)
+            self._wakeup.clear()
+            self._drain()
+            self._report_dropped_records()
+            if not self._running:
+                # Records logged while the dispatcher stopped
+                self._drain()
+                break
+
+    def _drain(self):
+        while True:
+            try:
+                record, handlers = self._records.popleft()
+            except IndexError:
+                return
+            self._handle(record, handlers)
+
+    @staticmethod
+    def _handle(record: logging.LogRecord, handlers: Sequence[logging.Handler]):
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                try:
+                    handler.handle(record)
+                except Exception:
+                    # The dispatcher thread must outlive a failing handler
+                    handler.handleError(record)
+
+    def _report_dropped_records(self):
+        dropped_count = self._dropped_count - self._reported_dropped_count
+        if dropped_count == 0:
+            return
+        self._reported_dropped_count += dropped_count
+        logger = logging.getLogger(__name__)
+        record = logger.makeRecord(logger.name, logging.WARNING, __file__, 0,
+                                   f"The logging queue is full, {dropped_count} log records were dropped "
+                                   f"({self._overflow_policy.value} policy).",
+                                   (), None)
+        self._handle(record, _queued_handlers(logger))
+
+
+class QueueLogHandler(logging.Handler):
+    """
+    Hands the records of a logger to the log dispatcher, which writes them to the handlers the logger had.
+    """
+
+    def __init__(self, dispatcher: LogDispatcher, handlers: List[logging.Handler]):
+        super().__init__(level=min((handler.level for handler in handlers), default=logging.NOTSET))
+        self.dispatcher = dispatcher
+        self.handlers = handlers
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # Skips the handler lock, the dispatcher queue is thread safe
+        if self.filter(record):
+            self.dispatcher.put(record, self.handlers)
+            return True
+        return False
+
+    def emit(self, record: logging.LogRecord):
+        self.dispatcher.put(record, self.handlers)
+
+    def flush(self):
+        self.dispatcher.flush()
+
+    def close(self):
+        self.dispatcher.stop()
+        super().close()
+
+
+_dispatcher: Optional[LogDispatcher] = None
+
+
+def _unwrap_handlers(handlers: List[logging.Handler]) -> List[logging.Handler]:
+    unwrapped_handlers = []
+    for handler in handlers:
+        unwrapped_handlers.extend(handler.handlers if isinstance(handler, QueueLogHandler) else [handler])
+    return unwrapped_handlers
+
+
+def _queued_handlers(logger: logging.Logger) -> List[logging.Handler]:
+    # The handlers of the first logger up the hierarchy that has some, as Logger.callHandlers would use
+    while logger is not None:
+        if len(logger.handlers) > 0:
+            return _unwrap_handlers(logger.handlers)
+        logger = logger.parent if logger.propagate else None
+    return []
+
+
+def _configured_loggers() -> List[logging.Logger]:
+    return [logging.getLogger()] + [
+        logger for logger in logging.root.manager.loggerDict.values() if isinstance(logger, logging.Logger)
+    ]
+
+
+def install_queue_logging(max_size: int = 10000,
+                          overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.drop_oldest,
+                          sample_rate: int = 10) -> LogDispatcher:
+    """
+    Puts the handlers of the configured loggers behind a shared log dispatcher: the loggers then only queue their
+    records, the handlers write them on the dispatcher thread.
+    """
+    global _dispatcher
+    uninstall_queue_logging()
+    _dispatcher = LogDispatcher(max_size, overflow_policy, sample_rate)
+    queue_handlers: Dict[Tuple[int, ...], QueueLogHandler] = {}
+    for logger in _configured_loggers():
+        if len(logger.handlers) == 0:
+            continue
+        # The loggers sharing the same handlers share their queue handler
+        key = tuple(id(handler) for handler in logger.handlers)
+        if key not in queue_handlers:
+            queue_handlers[key] = QueueLogHandler(_dispatcher, list(logger.handlers))
+        logger.handlers = [queue_handlers[key]]
+    _dispatcher.start()
+    return _dispatcher
+
+
+def uninstall_queue_logging():
+    """
+    Writes the queued records and gives the loggers their handlers back.
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        return
+    _dispatcher.stop()
+    for logger in _configured_loggers():
+        logger.handlers = _unwrap_handlers(logger.handlers)
+    _dispatcher = None
@@ -28,6 +28,16 @@ class LogMessage(PubSubMessage):
     logger_name: str = ''
 
 
+class SnapshotMessage(PubSubMessage):
+    timestamp: float = 0.0
+    full: bool = True
+    data: dict = {}
+
+
+class MessageBatch(PubSubMessage):
+    messages: List[dict] = []
+
+
 class StartCommandMessage(RPCMessage):
     class Request(RPCMessage.Request):
         log_level: Optional[str] = None
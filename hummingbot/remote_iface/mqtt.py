@@ -4,9 +4,9 @@ import asyncio
 import logging
 import threading
 import time
+from collections import deque
 from dataclasses import asdict, is_dataclass
-from datetime import datetime
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from hummingbot import get_logging_conf
 from hummingbot.connector.connector_base import ConnectorBase
@@ -16,8 +16,10 @@ if TYPE_CHECKING:  # pragma: no cover
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
     from hummingbot.core.event.event_listener import EventListener  # noqa: F401
 
+from commlib.msg import PubSubMessage
 from commlib.node import Node, NodeState
-from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParameters
+from commlib.pubsub import BasePublisher
+from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParameters, MQTTQoS
 
 from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -34,7 +36,9 @@ from hummingbot.remote_iface.messages import (
     HistoryCommandMessage,
     ImportCommandMessage,
     LogMessage,
+    MessageBatch,
     NotifyMessage,
+    SnapshotMessage,
     StartCommandMessage,
     StatusCommandMessage,
     StopCommandMessage,
@@ -62,6 +66,182 @@ class TopicSpecs:
     MARKET_EVENTS: str = '/events'
     NOTIFICATIONS: str = '/notify'
     HEARTBEATS: str = '/hb'
+    MARKET_DATA: str = '/market_data'
+    BALANCES: str = '/balances'
+    ORDERS: str = '/orders'
+    STRATEGY: str = '/strategy'
+
+
+class MQTTPublishQueue:
+    """
+    Publishes the market events, logs and notifications on a sender thread.
+
+    The messages are queued with the function building them, they are built and published on the sender thread so
+    the event loop only queues them. The queue is bounded, the oldest or the newest messages are dropped when it is
+    full depending on the drop policy. With a batch size above 1, the queued messages of a topic are published
+    together as message batches of up to batch_size messages.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global mqtts_logger
+        if mqtts_logger is None:  # pragma: no cover
+            mqtts_logger = HummingbotLogger(__name__)
+        return mqtts_logger
+
+    def __init__(self,
+                 qos: int = 0,
+                 max_size: int = 10000,
+                 drop_policy: str = "drop_oldest",
+                 batch_size: int = 1):
+        self._qos = MQTTQoS(qos)
+        self._max_size = max_size
+        self._drop_oldest = drop_policy == "drop_oldest"
+        self._batch_size = batch_size
+        self._messages: Deque[Tuple[BasePublisher, Callable[..., PubSubMessage], tuple, Dict[str, Any]]] = \
+            deque(maxlen=max_size)
+        self._wakeup = threading.Event()
+        self._running = False
+        # Set while the sender thread builds and publishes the messages it took from the queue
+        self._sending = False
+        self._thread: Optional[threading.Thread] = None
+        self._max_queue_size = 0
+        self._published_count = 0
+        self._dropped_count = 0
+        self._failed_count = 0
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._messages)
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """
+        The queue depth (current and highest seen) and the counts of published, dropped and failed messages
+        """
+        return {
+            "queue_size": len(self._messages),
+            "max_queue_size": self._max_queue_size,
+            "published": self._published_count,
+            "dropped": self._dropped_count,
+            "failed": self._failed_count,
+        }
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._send_loop, name="MQTTPublishQueue", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the sender thread once the queued messages are published.
+        """
+        if not self._running:
+            return
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def put(self, publisher: BasePublisher, build_msg: Callable[..., PubSubMessage], *args, **kwargs):
+        """
+        Queues a message, it can be called from any thread.
+
+        :param publisher: The publisher of the message topic
+        :param build_msg: The function building the message, called with args and kwargs on the sender thread
+        """
+        if not self._running:
+            msg = self._build(build_msg, args, kwargs)
+            if msg is not None:
+                self._publish(publisher, msg)
+            return
+        if len(self._messages) >= self._max_size:
+            self._dropped_count += 1
+            if not self._drop_oldest:
+                return
+        self._messages.append((publisher, build_msg, args, kwargs))
+        self._max_queue_size = max(self._max_queue_size, len(self._messages))
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        Waits until the queued messages are published, including the ones the sender thread is publishing.
+        """
+        while self._running and (len(self._messages) > 0 or self._sending):
+            self._wakeup.set()
+            time.sleep(0.001)
+
+    def _send_loop(self):
+        while self._running:
+            self._wakeup.wait(timeout=1.0)
+            self._wakeup.clear()
+            self._sending = True
+            try:
+                self._send_queued_messages()
+            finally:
+                self._sending = False
+        # Messages queued while the queue stopped
+        self._send_queued_messages()
+
+    def _send_queued_messages(self):
+        if self._batch_size == 1:
+            while True:
+                try:
+                    publisher, build_msg, args, kwargs = self._messages.popleft()
+                except IndexError:
+                    return
+                msg = self._build(build_msg, args, kwargs)
+                if msg is not None:
+                    self._publish(publisher, msg)
+        # The messages of each topic, in the order they were queued
+        batches: Dict[BasePublisher, List[PubSubMessage]] = {}
+        while True:
+            try:
+                publisher, build_msg, args, kwargs = self._messages.popleft()
+            except IndexError:
+                break
+            msg = self._build(build_msg, args, kwargs)
+            if msg is None:
+                continue
+            batch = batches.setdefault(publisher, [])
+            batch.append(msg)
+            if len(batch) == self._batch_size:
+                self._publish_batch(publisher, batches.pop(publisher))
+        for publisher, batch in batches.items():
+            self._publish_batch(publisher, batch)
+
+    def _build(self,
+               build_msg: Callable[..., PubSubMessage],
+               args: tuple,
+               kwargs: Dict[str, Any]) -> Optional[PubSubMessage]:
+        # A message failing to build is counted and skipped, the sender thread keeps publishing the others
+        try:
+            return build_msg(*args, **kwargs)
+        except Exception:
+            self._failed_count += 1
+            self.logger().error(f"Failed to build the MQTT message with {getattr(build_msg, '__qualname__', build_msg)}.",
+                                exc_info=True)
+            return None
+
+    def _publish_batch(self, publisher: BasePublisher, batch: List[PubSubMessage]):
+        self._publish(publisher, MessageBatch(messages=[msg.dict() for msg in batch]), len(batch))
+
+    def _publish(self, publisher: BasePublisher, msg: PubSubMessage, messages_count: int = 1):
+        try:
+            # Publisher.publish always publishes with QoS 0
+            publisher._transport.publish(publisher.topic, msg.dict(), qos=self._qos)
+            self._published_count += messages_count
+        except Exception:
+            # Not logged, the log records may be published through this queue
+            self._failed_count += messages_count
 
 
 class MQTTCommands:
@@ -320,6 +500,25 @@ class MQTTCommands:
 
 
 class MQTTMarketEventForwarder:
+    FORWARDED_EVENTS: Tuple[events.MarketEvent, ...] = (
+        events.MarketEvent.BuyOrderCreated,
+        events.MarketEvent.BuyOrderCompleted,
+        events.MarketEvent.SellOrderCreated,
+        events.MarketEvent.SellOrderCompleted,
+        events.MarketEvent.OrderFilled,
+        events.MarketEvent.OrderFailure,
+        events.MarketEvent.OrderCancelled,
+        events.MarketEvent.OrderExpired,
+        events.MarketEvent.FundingPaymentCompleted,
+        events.MarketEvent.RangePositionLiquidityAdded,
+        events.MarketEvent.RangePositionLiquidityRemoved,
+        events.MarketEvent.RangePositionUpdate,
+        events.MarketEvent.RangePositionUpdateFailure,
+        events.MarketEvent.RangePositionFeeCollected,
+        events.MarketEvent.RangePositionClosed,
+    )
+    EVENT_TYPES: Dict[int, str] = {event.value: event.name for event in FORWARDED_EVENTS}
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global mqtts_logger
@@ -348,21 +547,7 @@ class MQTTMarketEventForwarder:
         self._mqtt_fowarder: SourceInfoEventForwarder = \
             SourceInfoEventForwarder(self._send_mqtt_event)
         self._market_event_pairs: List[Tuple[int, EventListener]] = [
-            (events.MarketEvent.BuyOrderCreated, self._mqtt_fowarder),
-            (events.MarketEvent.BuyOrderCompleted, self._mqtt_fowarder),
-            (events.MarketEvent.SellOrderCreated, self._mqtt_fowarder),
-            (events.MarketEvent.SellOrderCompleted, self._mqtt_fowarder),
-            (events.MarketEvent.OrderFilled, self._mqtt_fowarder),
-            (events.MarketEvent.OrderFailure, self._mqtt_fowarder),
-            (events.MarketEvent.OrderCancelled, self._mqtt_fowarder),
-            (events.MarketEvent.OrderExpired, self._mqtt_fowarder),
-            (events.MarketEvent.FundingPaymentCompleted, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionLiquidityAdded, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionLiquidityRemoved, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionUpdate, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionUpdateFailure, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionFeeCollected, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionClosed, self._mqtt_fowarder),
+            (event, self._mqtt_fowarder) for event in self.FORWARDED_EVENTS
         ]
 
         self.event_fw_pub = self._mqtt_node.create_publisher(
@@ -371,37 +556,15 @@ class MQTTMarketEventForwarder:
         self._start_event_listeners()
 
     def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(
-                self._send_mqtt_event,
-                event_tag,
-                pubsub,
-                event
-            )
-            return
-
-        try:
-            event_types = {
-                events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
-                events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
-                events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
-                events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
-                events.MarketEvent.OrderFilled.value: "OrderFilled",
-                events.MarketEvent.OrderCancelled.value: "OrderCancelled",
-                events.MarketEvent.OrderExpired.value: "OrderExpired",
-                events.MarketEvent.OrderFailure.value: "OrderFailure",
-                events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
-                events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
-                events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
-                events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
-                events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
-                events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
-                events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
-            }
-            event_type = event_types[event_tag]
-        except KeyError:
-            event_type = "Unknown"
-
+        # The event is converted on the publish queue sender thread
+        self._mqtt_node.publish_queue.put(self.event_fw_pub,
+                                          self._build_event_message,
+                                          self.EVENT_TYPES.get(event_tag, "Unknown"),
+                                          event,
+                                          time.time())
+
+    @staticmethod
+    def _build_event_message(event_type: str, event, event_time: float) -> EventMessage:
         if is_dataclass(event):
             event_data = asdict(event)
         elif isinstance(event, tuple) and hasattr(event, '_fields'):
@@ -412,17 +575,12 @@ class MQTTMarketEventForwarder:
             except (TypeError, ValueError):
                 event_data = {}
 
-        try:
-            timestamp = event_data.pop('timestamp')
-        except KeyError:
-            timestamp = datetime.now().timestamp()
-
-        self.event_fw_pub.publish(
-            EventMessage(
-                timestamp=int(timestamp),
-                type=event_type,
-                data=event_data
-            )
+        timestamp = event_data.pop('timestamp', event_time)
+
+        return EventMessage(
+            timestamp=int(timestamp),
+            type=event_type,
+            data=event_data
         )
 
     def _start_event_listeners(self):
@@ -439,6 +597,188 @@ class MQTTMarketEventForwarder:
                 market.remove_listener(event_pair[0], event_pair[1])
 
 
+class MQTTSnapshotPublisher:
+    """
+    Publishes snapshots of the top of book of the markets, of the balances, of the active orders and of the strategy
+    state, each to its own topic at its own interval.
+
+    The snapshots are built on the event loop from the state of the connectors, no status report is formatted. When
+    publishing the changes only (mqtt_snapshots_delta_only), the entries of a snapshot that did not change since the
+    previous one are left out and the removed ones are published as null, the full snapshots are published every
+    mqtt_snapshots_full_interval seconds.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global mqtts_logger
+        if mqtts_logger is None:  # pragma: no cover
+            mqtts_logger = HummingbotLogger(__name__)
+        return mqtts_logger
+
+    def __init__(self,
+                 hb_app: "HummingbotApplication",
+                 mqtt_node: Node):
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            raise EnvironmentError(
+                "MQTTSnapshotPublisher can only be initialized from the main thread."
+            )
+        self._hb_app = hb_app
+        self._mqtt_node = mqtt_node
+        self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
+        mqtt_bridge = self._hb_app.client_config_map.mqtt_bridge
+        self._delta_only = bool(mqtt_bridge.mqtt_snapshots_delta_only)
+        self._full_interval = float(mqtt_bridge.mqtt_snapshots_full_interval)
+
+        topic_prefix = TopicSpecs.PREFIX.format(
+            namespace=self._mqtt_node.namespace,
+            instance_id=self._hb_app.instance_id
+        )
+        snapshots: List[Tuple[str, float, Callable[[], Dict[str, Any]]]] = [
+            (TopicSpecs.MARKET_DATA, float(mqtt_bridge.mqtt_market_data_interval), self.market_data_snapshot),
+            (TopicSpecs.BALANCES, float(mqtt_bridge.mqtt_balances_interval), self.balances_snapshot),
+            (TopicSpecs.ORDERS, float(mqtt_bridge.mqtt_orders_interval), self.orders_snapshot),
+            (TopicSpecs.STRATEGY, float(mqtt_bridge.mqtt_strategy_interval), self.strategy_snapshot),
+        ]
+        # The enabled snapshots, by topic: interval, snapshot function and publisher
+        self._snapshots: Dict[str, Tuple[float, Callable[[], Dict[str, Any]], BasePublisher]] = {
+            topic: (interval, build_snapshot, self._mqtt_node.create_publisher(topic=f'{topic_prefix}{topic}',
+                                                                               msg_type=SnapshotMessage))
+            for topic, interval, build_snapshot in snapshots if interval > 0
+        }
+        self._published_snapshots: Dict[str, Dict[str, Any]] = {}
+        self._full_snapshot_timestamps: Dict[str, float] = {}
+        self._publish_tasks: List[asyncio.Task] = []
+
+    @property
+    def publishers(self) -> List[BasePublisher]:
+        return [publisher for _, _, publisher in self._snapshots.values()]
+
+    def start(self):
+        self.stop()
+        self._publish_tasks = [
+            safe_ensure_future(self._publish_loop(topic, interval), loop=self._ev_loop)
+            for topic, (interval, _, _) in self._snapshots.items()
+        ]
+
+    def stop(self):
+        for task in self._publish_tasks:
+            task.cancel()
+        self._publish_tasks = []
+
+    async def _publish_loop(self, topic: str, interval: float):
+        while True:
+            try:
+                self.publish_snapshot(topic)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error(f"Unexpected error publishing the {topic} snapshot.", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def publish_snapshot(self, topic: str, timestamp: Optional[float] = None):
+        """
+        Publishes the snapshot of a topic, or its changes since the previous one.
+
+        :param topic: The snapshot topic, e.g. TopicSpecs.BALANCES
+        :param timestamp: The snapshot time stamp, the current time by default
+        """
+        timestamp = timestamp or time.time()
+        _, build_snapshot, publisher = self._snapshots[topic]
+        snapshot = build_snapshot()
+        previous_snapshot = self._published_snapshots.get(topic)
+        full = (not self._delta_only
+                or previous_snapshot is None
+                or timestamp - self._full_snapshot_timestamps[topic] >= self._full_interval)
+        if full:
+            data = snapshot
+            self._full_snapshot_timestamps[topic] = timestamp
+        else:
+            data = {key: value for key, value in snapshot.items()
+                    if key not in previous_snapshot or previous_snapshot[key] != value}
+            data.update({key: None for key in previous_snapshot if key not in snapshot})
+            if len(data) == 0:
+                return
+        self._published_snapshots[topic] = snapshot
+        self._mqtt_node.publish_queue.put(publisher, SnapshotMessage, timestamp=timestamp, full=full, data=data)
+
+    def market_data_snapshot(self) -> Dict[str, Any]:
+        """
+        The top of book of the markets, by connector_name:trading_pair
+        """
+        snapshot = {}
+        for connector_name, trading_pairs in self._hb_app.market_trading_pairs_map.items():
+            market = self._hb_app.markets.get(connector_name)
+            if market is None:
+                continue
+            for trading_pair in trading_pairs:
+                try:
+                    order_book = market.get_order_book(trading_pair)
+                except Exception:
+                    # The order book is not tracked yet
+                    continue
+                best_bid = next(order_book.bid_entries(), None)
+                best_ask = next(order_book.ask_entries(), None)
+                snapshot[f"{connector_name}:{trading_pair}"] = {
+                    "bid": best_bid.price if best_bid is not None else None,
+                    "bid_size": best_bid.amount if best_bid is not None else None,
+                    "ask": best_ask.price if best_ask is not None else None,
+                    "ask_size": best_ask.amount if best_ask is not None else None,
+                    "last_trade_price": self._float_or_none(order_book.last_trade_price),
+                }
+        return snapshot
+
+    def balances_snapshot(self) -> Dict[str, Any]:
+        """
+        The total and available balances of the assets, by connector_name:asset
+        """
+        snapshot = {}
+        for connector_name, market in self._hb_app.markets.items():
+            for asset, total_balance in market.get_all_balances().items():
+                snapshot[f"{connector_name}:{asset}"] = {
+                    "total": float(total_balance),
+                    "available": float(market.get_available_balance(asset)),
+                }
+        return snapshot
+
+    def orders_snapshot(self) -> Dict[str, Any]:
+        """
+        The active limit orders, by client order id
+        """
+        snapshot = {}
+        for connector_name, market in self._hb_app.markets.items():
+            for order in market.limit_orders:
+                snapshot[order.client_order_id] = {
+                    "connector": connector_name,
+                    "trading_pair": order.trading_pair,
+                    "side": "BUY" if order.is_buy else "SELL",
+                    "price": float(order.price),
+                    "quantity": float(order.quantity),
+                    "filled_quantity": self._float_or_none(order.filled_quantity),
+                    "creation_timestamp": order.creation_timestamp,
+                }
+        return snapshot
+
+    def strategy_snapshot(self) -> Dict[str, Any]:
+        """
+        The strategy running and the state of its connectors
+        """
+        markets = self._hb_app.markets
+        return {
+            "strategy": self._hb_app.strategy_name,
+            "strategy_file": self._hb_app.strategy_file_name,
+            "running": self._hb_app.strategy is not None,
+            "start_time": self._hb_app.start_time,
+            "markets_ready": {connector_name: market.ready for connector_name, market in markets.items()},
+            "network_status": {connector_name: market.network_status.name for connector_name, market in markets.items()},
+            "active_orders": sum(len(market.limit_orders) for market in markets.values()),
+        }
+
+    @staticmethod
+    def _float_or_none(value: Optional[float]) -> Optional[float]:
+        # NaN is not valid JSON, the paper trade orders have no filled quantity
+        return None if value is None or value != value else float(value)
+
+
 class MQTTNotifier(NotifierBase):
     def __init__(self,
                  hb_app: "HummingbotApplication",
@@ -459,10 +799,7 @@ class MQTTNotifier(NotifierBase):
         )
 
     def add_msg_to_queue(self, msg: str):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(self.add_msg_to_queue, msg)
-            return
-        self.notify_pub.publish(NotifyMessage(msg=msg))
+        self._mqtt_node.publish_queue.put(self.notify_pub, NotifyMessage, msg=msg)
 
     def start(self) -> None:
         return None
@@ -488,10 +825,13 @@ class MQTTGateway(Node):
         self._stop_event_async = asyncio.Event()
         self._notifier: MQTTNotifier = None
         self._market_events: MQTTMarketEventForwarder = None
+        self._snapshots: MQTTSnapshotPublisher = None
         self._commands: MQTTCommands = None
         self._logh: MQTTLogHandler = None
         self._hb_app: "HummingbotApplication" = hb_app
         self._ev_loop = self._hb_app.ev_loop
+        self._publish_queue = self._create_publish_queue_from_conf()
+        self._reported_dropped_count = 0
         self._params = self._create_mqtt_params_from_conf()
         self.namespace = self._hb_app.client_config_map.mqtt_bridge.mqtt_namespace
         if self.namespace[-1] in ('/', '.'):
@@ -516,6 +856,10 @@ class MQTTGateway(Node):
     def health(self):
         return self._health
 
+    @property
+    def publish_queue(self) -> MQTTPublishQueue:
+        return self._publish_queue
+
     def _remove_log_handlers(self):
         loggers = [logging.getLogger(name) for name in logging.root.manager.loggerDict]
         log_conf = get_logging_conf()
@@ -583,11 +927,31 @@ class MQTTGateway(Node):
             self._market_events = MQTTMarketEventForwarder(self._hb_app, self)
             if self.state == NodeState.RUNNING:
                 self._market_events.event_fw_pub.run()
+        if self._hb_app.client_config_map.mqtt_bridge.mqtt_snapshots:
+            self._stop_snapshots()
+            self._snapshots = MQTTSnapshotPublisher(self._hb_app, self)
+            if self.state == NodeState.RUNNING:
+                for publisher in self._snapshots.publishers:
+                    publisher.run()
+            self._snapshots.start()
+
+    def _stop_snapshots(self):
+        if self._snapshots is not None:
+            self._snapshots.stop()
 
     def _remove_market_event_listeners(self):
         if self._market_events is not None:
             self._market_events._stop_event_listeners()
 
+    def _create_publish_queue_from_conf(self) -> MQTTPublishQueue:
+        mqtt_bridge = self._hb_app.client_config_map.mqtt_bridge
+        return MQTTPublishQueue(
+            qos=int(mqtt_bridge.mqtt_publish_qos),
+            max_size=int(mqtt_bridge.mqtt_publish_queue_size),
+            drop_policy=str(mqtt_bridge.mqtt_publish_drop_policy.value),
+            batch_size=int(mqtt_bridge.mqtt_publish_batch_size),
+        )
+
     def _create_mqtt_params_from_conf(self):
         host = self._hb_app.client_config_map.mqtt_bridge.mqtt_host
         port = self._hb_app.client_config_map.mqtt_bridge.mqtt_port
@@ -633,12 +997,21 @@ class MQTTGateway(Node):
             # Maybe we can include more checks here to determine the health!
             self._health = await self._ev_loop.run_in_executor(
                 None, self._check_connections)
+            self._report_dropped_messages()
             await asyncio.sleep(period)
 
+    def _report_dropped_messages(self):
+        dropped_count = self._publish_queue.dropped_count - self._reported_dropped_count
+        if dropped_count > 0:
+            self._reported_dropped_count += dropped_count
+            self.logger().warning(f"The MQTT publish queue is full, {dropped_count} messages were dropped "
+                                  f"({self._publish_queue.metrics}).")
+
     def _stop_health_monitorint_loop(self):
         self._stop_event_async.set()
 
     def start(self) -> None:
+        self._publish_queue.start()
         self._init_logger()
         self._init_notifier()
         self._init_commands()
@@ -646,10 +1019,13 @@ class MQTTGateway(Node):
         self.run()
 
     def stop(self):
+        # Publishes the queued messages before the publishers stop
+        self._publish_queue.stop()
         super().stop()
         self._remove_notifier()
         self._remove_log_handlers()
         self._remove_market_event_listeners()
+        self._stop_snapshots()
         self._stop_health_monitorint_loop()
 
     def __del__(self):
@@ -680,16 +1056,14 @@ class MQTTLogHandler(logging.Handler):
                                                         msg_type=LogMessage)
 
     def emit(self, record: logging.LogRecord):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(self.emit, record)
-            return
-        msg_str = self.format(record)
-        msg = LogMessage(
-            timestamp=time.time(),
-            msg=msg_str,
+        # The record is formatted on the publish queue sender thread
+        self._mqtt_node.publish_queue.put(self.log_pub, self._build_log_message, record)
+
+    def _build_log_message(self, record: logging.LogRecord) -> LogMessage:
+        return LogMessage(
+            timestamp=record.created,
+            msg=self.format(record),
             level_no=record.levelno,
             level_name=record.levelname,
             logger_name=record.name
-
         )
-        self.log_pub.publish(msg)
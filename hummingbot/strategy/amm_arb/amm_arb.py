@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
 from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Tuple, cast
@@ -24,7 +25,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.amm_arb.data_types import ArbProposalSide
 from hummingbot.strategy.amm_arb.utils import ArbProposal, create_arb_proposals
@@ -63,6 +64,7 @@ class AmmArbStrategy(StrategyPyBase):
     _rate_source: RateOracle
     _cancel_outdated_orders_task: Optional[asyncio.Task]
     _gateway_transaction_cancel_interval: int
+    _max_quote_age: float
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -81,6 +83,7 @@ class AmmArbStrategy(StrategyPyBase):
                     concurrent_orders_submission: bool = True,
                     status_report_interval: float = 900,
                     gateway_transaction_cancel_interval: int = 600,
+                    max_quote_age: float = 10.0,
                     ):
         """
         Assigns strategy parameters, this function must be called directly after init.
@@ -100,6 +103,8 @@ class AmmArbStrategy(StrategyPyBase):
         :param status_report_interval: Amount of seconds to wait to refresh the status report
         :param gateway_transaction_cancel_interval: Amount of seconds to wait before trying to cancel orders that are
         blockchain transactions that have not been included in a block (they are still in the mempool).
+        :param max_quote_age: Amount of seconds after which the prices of an arbitrage proposal are considered stale,
+        a stale proposal is dropped instead of executed.
         """
         self._market_info_1 = market_info_1
         self._market_info_2 = market_info_2
@@ -124,6 +129,7 @@ class AmmArbStrategy(StrategyPyBase):
 
         self._cancel_outdated_orders_task = None
         self._gateway_transaction_cancel_interval = gateway_transaction_cancel_interval
+        self._max_quote_age = max_quote_age
 
         self._order_id_side_map: Dict[str, ArbProposalSide] = {}
 
@@ -147,6 +153,10 @@ class AmmArbStrategy(StrategyPyBase):
     def order_amount(self, value: Decimal):
         self._order_amount = value
 
+    @property
+    def max_quote_age(self) -> float:
+        return self._max_quote_age
+
     @property
     def rate_source(self) -> RateOracle:
         return self._rate_source
@@ -308,6 +318,11 @@ class AmmArbStrategy(StrategyPyBase):
             if any(p.amount <= s_decimal_zero for p in (arb_proposal.first_side, arb_proposal.second_side)):
                 continue
 
+            if arb_proposal.is_stale(time.time(), self._max_quote_age):
+                self.logger().info(f"Dropping arbitrage opportunity, its prices are more than {self._max_quote_age} "
+                                   f"seconds old: {arb_proposal}")
+                continue
+
             if not self._concurrent_orders_submission:
                 arb_proposal = self.prioritize_evm_exchanges(arb_proposal)
 
@@ -416,10 +431,15 @@ class AmmArbStrategy(StrategyPyBase):
             return "  The strategy is not ready, please try again later."
         columns = ["Exchange", "Market", "Sell Price", "Buy Price", "Mid Price"]
         data = []
-        for market_info in [self._market_info_1, self._market_info_2]:
+        market_infos = [self._market_info_1, self._market_info_2]
+        quote_prices = await safe_gather(*[
+            market_info.market.get_quote_price(market_info.trading_pair, is_buy, self._order_amount)
+            for market_info in market_infos
+            for is_buy in (True, False)
+        ])
+        for index, market_info in enumerate(market_infos):
             market, trading_pair, base_asset, quote_asset = market_info
-            buy_price = await market.get_quote_price(trading_pair, True, self._order_amount)
-            sell_price = await market.get_quote_price(trading_pair, False, self._order_amount)
+            buy_price, sell_price = quote_prices[2 * index], quote_prices[2 * index + 1]
 
             # check for unavailable price data
             buy_price = PerformanceMetrics.smart_round(Decimal(str(buy_price)), 8) if buy_price is not None else '-'
@@ -142,4 +142,11 @@ amm_arb_config_map = {
         default=600,
         validator=lambda v: validate_int(v, min_value=1, inclusive=True),
         type_str="int"),
+    "max_quote_age": ConfigVar(
+        key="max_quote_age",
+        prompt="After how many seconds should the prices of an arbitrage opportunity be considered stale, and the "
+               "opportunity dropped instead of traded? (Enter time in seconds) >>> ",
+        default=Decimal("10"),
+        validator=lambda v: validate_decimal(v, min_value=0, inclusive=False),
+        type_str="decimal"),
 }
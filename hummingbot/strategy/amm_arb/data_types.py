@@ -28,6 +28,7 @@ class ArbProposalSide:
     order_price: Decimal
     amount: Decimal
     extra_flat_fees: List[TokenAmount]
+    quote_timestamp: float = 0.0
     completed_event: asyncio.Event = asyncio.Event()
     failed_event: asyncio.Event = asyncio.Event()
 
@@ -72,6 +73,16 @@ class ArbProposal:
     def has_failed_orders(self) -> bool:
         return any([self.first_side.is_failed, self.second_side.is_failed])
 
+    @property
+    def quote_timestamp(self) -> float:
+        """
+        The time the oldest of the two side prices was quoted
+        """
+        return min(self.first_side.quote_timestamp, self.second_side.quote_timestamp)
+
+    def is_stale(self, timestamp: float, max_quote_age: float) -> bool:
+        return timestamp - self.quote_timestamp > max_quote_age
+
     def profit_pct(
             self,
             rate_source: Optional[RateOracle] = None,
@@ -159,10 +170,12 @@ class ArbProposal:
         return ArbProposal(
             ArbProposalSide(self.first_side.market_info, self.first_side.is_buy,
                             self.first_side.quote_price, self.first_side.order_price,
-                            self.first_side.amount, self.first_side.extra_flat_fees),
+                            self.first_side.amount, self.first_side.extra_flat_fees,
+                            self.first_side.quote_timestamp),
             ArbProposalSide(self.second_side.market_info, self.second_side.is_buy,
                             self.second_side.quote_price, self.second_side.order_price,
-                            self.second_side.amount, self.second_side.extra_flat_fees)
+                            self.second_side.amount, self.second_side.extra_flat_fees,
+                            self.second_side.quote_timestamp)
         )
 
     async def wait(self):
@@ -22,6 +22,7 @@ def start(self):
     concurrent_orders_submission = amm_arb_config_map.get("concurrent_orders_submission").value
     debug_price_shim = amm_arb_config_map.get("debug_price_shim").value
     gateway_transaction_cancel_interval = amm_arb_config_map.get("gateway_transaction_cancel_interval").value
+    max_quote_age = float(amm_arb_config_map.get("max_quote_age").value)
 
     self._initialize_markets([(connector_1, [market_1]), (connector_2, [market_2])])
     base_1, quote_1 = market_1.split("-")
@@ -63,4 +64,5 @@ def start(self):
                               market_2_slippage_buffer=market_2_slippage_buffer,
                               concurrent_orders_submission=concurrent_orders_submission,
                               gateway_transaction_cancel_interval=gateway_transaction_cancel_interval,
+                              max_quote_age=max_quote_age,
                               )
@@ -1,6 +1,8 @@
+import time
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from .data_types import (
     ArbProposal,
@@ -11,6 +13,28 @@ from .data_types import (
 s_decimal_nan = Decimal("NaN")
 
 
+async def fetch_side_prices(
+        market_info: MarketTradingPairTuple,
+        is_buy: bool,
+        order_amount: Decimal,
+) -> Tuple[Optional[Decimal], Optional[Decimal], float]:
+    """
+    Fetches the quote and order prices of one market side concurrently, or only the quote price when the connector's
+    order price is the quote price.
+    :return the quote price, the order price and the time the prices were received
+    """
+    market = market_info.market
+    if market.order_price_is_quote_price:
+        quote_price = await market.get_quote_price(market_info.trading_pair, is_buy, order_amount)
+        order_price = quote_price
+    else:
+        quote_price, order_price = await safe_gather(
+            market.get_quote_price(market_info.trading_pair, is_buy, order_amount),
+            market.get_order_price(market_info.trading_pair, is_buy, order_amount),
+        )
+    return quote_price, order_price, time.time()
+
+
 async def create_arb_proposals(
         market_info_1: MarketTradingPairTuple,
         market_info_2: MarketTradingPairTuple,
@@ -19,7 +43,8 @@ async def create_arb_proposals(
         order_amount: Decimal,
 ) -> List[ArbProposal]:
     """
-    Creates base arbitrage proposals for given markets without any filtering.
+    Creates base arbitrage proposals for given markets without any filtering. The prices of both sides of both
+    markets are all fetched concurrently, so creating the proposals takes about one price request.
     :param market_info_1: The first market
     :param market_info_2: The second market
     :param order_amount: The required order amount.
@@ -28,21 +53,16 @@ async def create_arb_proposals(
     :return A list of at most 2 proposal - (market_1 buy, market_2 sell) and (market_1 sell, market_2 buy)
     """
     order_amount = Decimal(str(order_amount))
+    m_1_buy, m_1_sell, m_2_buy, m_2_sell = await safe_gather(
+        fetch_side_prices(market_info_1, True, order_amount),
+        fetch_side_prices(market_info_1, False, order_amount),
+        fetch_side_prices(market_info_2, True, order_amount),
+        fetch_side_prices(market_info_2, False, order_amount),
+    )
     results = []
-    for index in range(0, 2):
-        is_buy: bool = not bool(index)  # bool(0) is False, so start with buy first
-        m_1_q_price: Optional[Decimal] = await market_info_1.market.get_quote_price(
-            market_info_1.trading_pair, is_buy, order_amount
-        )
-        m_1_o_price: Optional[Decimal] = await market_info_1.market.get_order_price(
-            market_info_1.trading_pair, is_buy, order_amount
-        )
-        m_2_q_price: Optional[Decimal] = await market_info_2.market.get_quote_price(
-            market_info_2.trading_pair, not is_buy, order_amount
-        )
-        m_2_o_price: Optional[Decimal] = await market_info_2.market.get_order_price(
-            market_info_2.trading_pair, not is_buy, order_amount
-        )
+    for is_buy, m_1_prices, m_2_prices in ((True, m_1_buy, m_2_sell), (False, m_1_sell, m_2_buy)):
+        m_1_q_price, m_1_o_price, m_1_timestamp = m_1_prices
+        m_2_q_price, m_2_o_price, m_2_timestamp = m_2_prices
         if any(p is None for p in (m_1_o_price, m_1_q_price, m_2_o_price, m_2_q_price)):
             continue
         first_side = ArbProposalSide(
@@ -52,6 +72,7 @@ async def create_arb_proposals(
             order_price=m_1_o_price,
             amount=order_amount,
             extra_flat_fees=market_1_extra_flat_fees,
+            quote_timestamp=m_1_timestamp,
         )
         second_side = ArbProposalSide(
             market_info=market_info_2,
@@ -59,7 +80,8 @@ async def create_arb_proposals(
             quote_price=m_2_q_price,
             order_price=m_2_o_price,
             amount=order_amount,
-            extra_flat_fees=market_2_extra_flat_fees
+            extra_flat_fees=market_2_extra_flat_fees,
+            quote_timestamp=m_2_timestamp,
         )
 
         results.append(ArbProposal(first_side, second_side))
@@ -9,6 +9,7 @@ from typing import (
 
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.core.data_type.CrossBookMatcher cimport CrossBookMatch
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
@@ -625,6 +626,10 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
     Iterates through sell and buy order books and returns a list of matched profitable sell and buy order
     pairs with sizes.
 
+    The raw order books are first matched natively in double precision (OrderBook.c_match_cross_book), so the usual
+    case of books that do not cross returns without building any Decimal entry. Otherwise the quantized Decimal
+    entries of the markets are walked to get the exact steps.
+
     If no profitable trades can be done between the buy and sell order books, then returns an empty list.
 
     :param min_profitability: Minimum profit ratio
@@ -644,8 +649,16 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
         object current_ask_price_adjusted
         str sell_market_quote_asset = sell_market_trading_pair_tuple.quote_asset
         str buy_market_quote_asset = buy_market_trading_pair_tuple.quote_asset
+        OrderBook bid_order_book = sell_market_trading_pair_tuple.order_book
+        OrderBook ask_order_book = buy_market_trading_pair_tuple.order_book
+        CrossBookMatch match = bid_order_book.c_match_cross_book(ask_order_book,
+                                                                 float(sell_market_conversion_rate),
+                                                                 float(buy_market_conversion_rate),
+                                                                 float(min_profitability))
 
     profitable_orders = []
+    if match.steps.size() == 0:
+        return profitable_orders
     bid_it = sell_market_trading_pair_tuple.order_book_bid_entries()
     ask_it = buy_market_trading_pair_tuple.order_book_ask_entries()
 
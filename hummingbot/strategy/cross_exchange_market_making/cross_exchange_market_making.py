@@ -1,10 +1,11 @@
 import logging
+import time
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple, cast
+from typing import Dict, List, Optional, Tuple, cast
 
 import pandas as pd
 from bidict import bidict
@@ -26,6 +27,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.status_report import StatusReport, StatusTable
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
     CrossExchangeMarketMakingConfigMap,
     PassiveOrderRefreshMode,
@@ -109,6 +111,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
+        self._status_report = StatusReport()
         self._market_pair_tracker = OrderIDMarketPairTracker()
 
         # Holds ongoing hedging orders mapped to their respective maker fill trades
@@ -270,7 +273,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 if gas_pair is not None and gas_pair.split("-")[0] != gas_pair.split("-")[1]:
                     self.logger().info(f"{gas_pair} ({gas_rate_source}) conversion rate: {PerformanceMetrics.smart_round(gas_rate)}")
 
-    def oracle_status_df(self):
+    def oracle_status_table(self) -> StatusTable:
         columns = ["Source", "Pair", "Rate"]
         data = []
         for market_pair in self._market_pairs.values():
@@ -289,12 +292,41 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     data.extend([
                         [gas_rate_source, gas_pair, PerformanceMetrics.smart_round(gas_rate)],
                     ])
-        return pd.DataFrame(data=data, columns=columns)
+        return StatusTable(columns, data)
+
+    def _markets_status_table(self, market_pair: MakerTakerMarketPair) -> Optional[StatusTable]:
+        if not self.is_gateway_market(market_pair.taker):
+            return self.market_status_table([market_pair.maker, market_pair.taker])
+        markets_table = self.market_status_table([market_pair.maker])
+        # Market status for gateway
+        bid_price = "" if self._last_taker_buy_price is None else self._last_taker_buy_price
+        ask_price = "" if self._last_taker_sell_price is None else self._last_taker_sell_price
+        if self._last_taker_buy_price is not None and self._last_taker_sell_price is not None:
+            mid_price = (self._last_taker_buy_price + self._last_taker_sell_price) / 2
+        else:
+            mid_price = ""
+        if markets_table is not None:
+            markets_table.rows.append([
+                market_pair.taker.market.display_name,
+                market_pair.taker.trading_pair,
+                bid_price,
+                ask_price,
+                mid_price
+            ])
+        return markets_table
+
+    def _oracle_status_table(self) -> Optional[StatusTable]:
+        oracle_table = self.oracle_status_table()
+        return oracle_table if len(oracle_table.rows) > 0 else None
+
+    def oracle_status_df(self):
+        table = self.oracle_status_table()
+        return pd.DataFrame(data=table.rows, columns=table.columns)
 
     def format_status(self) -> str:
-        lines = []
         warning_lines = []
         tracked_maker_orders = {}
+        status_report = self._status_report
 
         # Go through the currently open limit orders, and group them by market pair.
         for market, limit_order, order_id in self.active_maker_limit_orders:
@@ -305,59 +337,56 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             else:
                 tracked_maker_orders[market_pair][typed_limit_order.client_order_id] = typed_limit_order
 
-        for market_pair in self._market_pairs.values():
+        for i, market_pair in enumerate(self._market_pairs.values()):
             warning_lines.extend(self.network_warning([market_pair.maker, market_pair.taker]))
+            market_infos = [market_pair.maker, market_pair.taker]
+            # The values the tables are built from, a table is only built again when they change
+            book_market_infos = market_infos if not self.is_gateway_market(market_pair.taker) else [market_pair.maker]
+            markets_inputs = (
+                tuple((market_info.market.get_price(market_info.trading_pair, False),
+                       market_info.market.get_price(market_info.trading_pair, True))
+                      for market_info in book_market_infos),
+                self._last_taker_buy_price,
+                self._last_taker_sell_price,
+            )
+            status_report.update_table(f"{i}:markets", "Markets",
+                                       lambda market_pair=market_pair: self._markets_status_table(market_pair),
+                                       markets_inputs)
 
-            if not self.is_gateway_market(market_pair.taker):
-                markets_df = self.market_status_data_frame([market_pair.maker, market_pair.taker])
-            else:
-                markets_df = self.market_status_data_frame([market_pair.maker])
-                # Market status for gateway
-                bid_price = "" if self._last_taker_buy_price is None else self._last_taker_buy_price
-                ask_price = "" if self._last_taker_sell_price is None else self._last_taker_sell_price
-                if self._last_taker_buy_price is not None and self._last_taker_sell_price is not None:
-                    mid_price = (self._last_taker_buy_price + self._last_taker_sell_price) / 2
-                else:
-                    mid_price = ""
-                taker_data = {
-                    "Exchange": market_pair.taker.market.display_name,
-                    "Market": market_pair.taker.trading_pair,
-                    "Best Bid Price": bid_price,
-                    "Best Ask Price": ask_price,
-                    "Mid Price": mid_price
-                }
-                if markets_df is not None:
-                    markets_df = markets_df.append(taker_data, ignore_index=True)
-            lines.extend(["", "  Markets:"] +
-                         ["    " + line for line in str(markets_df).split("\n")])
-
-            oracle_df = self.oracle_status_df()
-            if not oracle_df.empty:
-                lines.extend(["", "  Rate conversion:"] +
-                             ["    " + line for line in str(oracle_df).split("\n")])
-
-            assets_df = self.wallet_balance_data_frame([market_pair.maker, market_pair.taker])
-            lines.extend(["", "  Assets:"] +
-                         ["    " + line for line in str(assets_df).split("\n")])
+            oracle_inputs = tuple(self.get_conversion_rates(pair) for pair in self._market_pairs.values())
+            status_report.update_table(f"{i}:oracle", "Rate conversion", self._oracle_status_table, oracle_inputs)
+
+            assets_inputs = tuple((market_info.market.get_balance(asset), market_info.market.get_available_balance(asset))
+                                  for market_info in market_infos
+                                  for asset in (market_info.base_asset, market_info.quote_asset))
+            status_report.update_table(f"{i}:assets", "Assets",
+                                       lambda market_infos=market_infos: self.wallet_balance_table(market_infos),
+                                       assets_inputs)
 
             # See if there're any open orders.
             if market_pair in tracked_maker_orders and len(tracked_maker_orders[market_pair]) > 0:
                 limit_orders = list(tracked_maker_orders[market_pair].values())
                 bid, ask = self.get_top_bid_ask(market_pair)
                 mid_price = (bid + ask) / 2
-                df = LimitOrder.to_pandas(limit_orders, mid_price)
-                df_lines = str(df).split("\n")
-                lines.extend(["", "  Active maker market orders:"] +
-                             ["    " + line for line in df_lines])
+                # The order ages are computed at the current time, the orders table is built at most once a second
+                orders_inputs = (tuple((o.client_order_id, o.is_buy, o.price, o.quantity, o.creation_timestamp)
+                                       for o in limit_orders),
+                                 mid_price,
+                                 int(time.time()))
+                status_report.update_table(
+                    f"{i}:orders", "Active maker market orders",
+                    lambda limit_orders=limit_orders, mid_price=mid_price: LimitOrder.to_status_table(
+                        limit_orders, mid_price),
+                    orders_inputs)
             else:
-                lines.extend(["", "  No active maker market orders."])
+                status_report.update_lines(f"{i}:orders", ["", "  No active maker market orders."])
 
             warning_lines.extend(self.balance_warning([market_pair.maker, market_pair.taker]))
 
         if len(warning_lines) > 0:
-            lines.extend(["", "  *** WARNINGS ***"] + warning_lines)
+            status_report.update_lines("warnings", ["", "  *** WARNINGS ***"] + warning_lines)
 
-        return "\n".join(lines)
+        return status_report.render()
 
     def start(self, clock: Clock, timestamp: float):
         super().start(clock, timestamp)
@@ -126,6 +126,7 @@ cdef class OrderTracker(TimeIterator):
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self.c_check_and_cleanup_shadow_records()
+        self.c_expire_in_flight_cancels()
 
     cdef dict c_get_limit_orders(self):
         return self._tracked_limit_orders
@@ -156,18 +157,11 @@ cdef class OrderTracker(TimeIterator):
         :param order_id: the order id to be canceled
         :return: True if there's no existing in flight cancel for the order id, False otherwise.
         """
-        cdef:
-            list keys_to_delete = []
-
         if order_id in self._in_flight_pending_created:  # Checks if a Buy/SellOrderCreatedEvent has been received
             return False
 
         # Maintain the cancel expiry time invariant.
-        for k, cancel_timestamp in self._in_flight_cancels.items():
-            if cancel_timestamp < self._current_timestamp - self.CANCEL_EXPIRY_DURATION:
-                keys_to_delete.append(k)
-        for k in keys_to_delete:
-            del self._in_flight_cancels[k]
+        self.c_expire_in_flight_cancels()
 
         if order_id in self.in_flight_cancels:
             return False
@@ -179,6 +173,17 @@ cdef class OrderTracker(TimeIterator):
     def check_and_track_cancel(self, order_id: str) -> bool:
         return self.c_check_and_track_cancel(order_id)
 
+    cdef c_expire_in_flight_cancels(self):
+        cdef:
+            double expiry_timestamp = self._current_timestamp - self.CANCEL_EXPIRY_DURATION
+
+        # The cancels are tracked in time order, the expired ones are at the front
+        while len(self._in_flight_cancels) > 0:
+            order_id, cancel_timestamp = next(iter(self._in_flight_cancels.items()))
+            if cancel_timestamp >= expiry_timestamp:
+                break
+            del self._in_flight_cancels[order_id]
+
     cdef object c_get_market_pair_from_order_id(self, str order_id):
         return self._order_id_to_market_pair.get(order_id)
 
@@ -1,10 +1,9 @@
 import logging
 from decimal import Decimal
 from itertools import chain
-from math import ceil, floor
+from math import ceil, floor, isnan
 from typing import Dict, List
 
-import numpy as np
 import pandas as pd
 
 from hummingbot.connector.derivative.position import Position
@@ -19,7 +18,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import map_df_to_str
+from hummingbot.core.utils.status_report import StatusReport, StatusTable, map_table_to_str
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
@@ -28,7 +27,7 @@ from hummingbot.strategy.perpetual_market_making.perpetual_market_making_order_t
     PerpetualMarketMakingOrderTracker,
 )
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
-from hummingbot.strategy.utils import order_age
+from hummingbot.strategy.utils import format_order_age, order_age
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
@@ -118,6 +117,7 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
         self._logging_options = logging_options
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
+        self._status_report = StatusReport()
         self._last_own_trade_price = Decimal('nan')
         self._ts_peak_bid_price = Decimal('0')
         self._ts_peak_ask_price = Decimal('0')
@@ -321,7 +321,7 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
     def asset_price_delegate(self, value):
         self._asset_price_delegate = value
 
-    def perpetual_mm_assets_df(self) -> pd.DataFrame:
+    def perpetual_mm_assets_table(self) -> StatusTable:
         market, trading_pair, base_asset, quote_asset = self._market_info
         quote_balance = float(market.get_balance(quote_asset))
         available_quote_balance = float(market.get_available_balance(quote_asset))
@@ -330,10 +330,12 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
             ["Total Balance", round(quote_balance, 4)],
             ["Available Balance", round(available_quote_balance, 4)]
         ]
-        df = pd.DataFrame(data=data)
-        return df
+        return StatusTable([0, 1], data)
 
-    def active_orders_df(self) -> pd.DataFrame:
+    def perpetual_mm_assets_df(self) -> pd.DataFrame:
+        return pd.DataFrame(data=self.perpetual_mm_assets_table().rows)
+
+    def active_orders_table(self) -> StatusTable:
         price = self.get_price()
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy])
@@ -351,7 +353,7 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
                 level = no_sells - lvl_sell
                 lvl_sell += 1
             spread = 0 if price == 0 else abs(order.price - price) / price
-            age = pd.Timestamp(order_age(order, self.current_timestamp), unit='s').strftime('%H:%M:%S')
+            age = format_order_age(order_age(order, self.current_timestamp))
 
             amount_orig = "" if level is None else self._order_amount + ((level - 1) * self._order_level_amount)
             data.append([
@@ -364,9 +366,13 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
                 age
             ])
 
-        return pd.DataFrame(data=data, columns=columns)
+        return StatusTable(columns, data)
 
-    def active_positions_df(self) -> pd.DataFrame:
+    def active_orders_df(self) -> pd.DataFrame:
+        table = self.active_orders_table()
+        return pd.DataFrame(data=table.rows, columns=table.columns)
+
+    def active_positions_table(self) -> StatusTable:
         columns = ["Symbol", "Type", "Entry Price", "Amount", "Leverage", "Unrealized PnL"]
         data = []
         market, trading_pair = self._market_info.market, self._market_info.trading_pair
@@ -382,9 +388,13 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
                 unrealized_profit
             ])
 
-        return pd.DataFrame(data=data, columns=columns)
+        return StatusTable(columns, data)
 
-    def market_status_data_frame(self) -> pd.DataFrame:
+    def active_positions_df(self) -> pd.DataFrame:
+        table = self.active_positions_table()
+        return pd.DataFrame(data=table.rows, columns=table.columns)
+
+    def market_status_table(self) -> StatusTable:
         markets_data = []
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"Ref Price ({self._price_type.name})"]
         if self._price_type is PriceType.LastOwnTrade and self._last_own_trade_price.is_nan():
@@ -405,44 +415,69 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
                 trading_pair,
                 float(bid_price),
                 float(ask_price),
-                float(ref_price)
+                "" if isnan(float(ref_price)) else float(ref_price)
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return StatusTable(markets_columns, markets_data)
+
+    def market_status_data_frame(self) -> pd.DataFrame:
+        table = self.market_status_table()
+        return pd.DataFrame(data=table.rows, columns=table.columns)
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
             return "Market connectors are not ready."
-        lines = []
         warning_lines = []
+        status_report = self._status_report
 
-        markets_df = self.market_status_data_frame()
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
-
-        assets_df = map_df_to_str(self.perpetual_mm_assets_df())
-
-        first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+        market, trading_pair, base_asset, quote_asset = self._market_info
+        price = self.get_price()
+        # The values the tables are built from, a table is only built again when they change
+        market_books = [(market, trading_pair)]
+        if type(self._asset_price_delegate) is OrderBookAssetPriceDelegate:
+            market_books.append((self._asset_price_delegate.market, self._asset_price_delegate.trading_pair))
+        markets_inputs = (
+            tuple((book_market.get_price(book_pair, False), book_market.get_price(book_pair, True))
+                  for book_market, book_pair in market_books),
+            price,
+            self._price_type,
+            self._last_own_trade_price.is_nan(),
+            (None if self._asset_price_delegate is None or self._price_type is PriceType.LastOwnTrade
+             else self._asset_price_delegate.get_price_by_type(self._price_type)),
+        )
+        status_report.update_table("markets", "Markets", self.market_status_table, markets_inputs)
+        assets_inputs = (market.get_balance(quote_asset), market.get_available_balance(quote_asset))
+        status_report.update_table("assets", "Assets", lambda: map_table_to_str(self.perpetual_mm_assets_table()),
+                                   assets_inputs, header=False, left_align_first_column=True)
 
         # See if there're any open orders.
-        if len(self.active_orders) > 0:
-            df = self.active_orders_df()
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        active_orders = self.active_orders
+        if len(active_orders) > 0:
+            # The order ages change with the timestamp, the orders table is built at most once per tick
+            orders_inputs = (tuple((o.client_order_id, o.is_buy, o.price, o.quantity, o.creation_timestamp)
+                                   for o in active_orders),
+                             price, self.current_timestamp, self._order_amount, self._order_level_amount)
+            status_report.update_table("orders", "Orders", self.active_orders_table, orders_inputs)
         else:
-            lines.extend(["", "  No active maker orders."])
+            status_report.update_lines("orders", ["", "  No active maker orders."])
 
         # See if there're any active positions.
-        if len(self.active_positions) > 0:
-            df = self.active_positions_df()
-            lines.extend(["", "  Positions:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        active_positions = self.active_positions
+        if len(active_positions) > 0:
+            positions_inputs = (
+                tuple((position.trading_pair, position.position_side, position.entry_price, position.amount,
+                       position.leverage)
+                      for position in active_positions.values()),
+                market.get_price(trading_pair, True),
+                market.get_price(trading_pair, False),
+            )
+            status_report.update_table("positions", "Positions", self.active_positions_table, positions_inputs)
         else:
-            lines.extend(["", "  No active positions."])
+            status_report.update_lines("positions", ["", "  No active positions."])
 
         if len(warning_lines) > 0:
-            lines.extend(["", "*** WARNINGS ***"] + warning_lines)
+            status_report.update_lines("warnings", ["", "*** WARNINGS ***"] + warning_lines)
 
-        return "\n".join(lines)
+        return status_report.render()
 
     def tick(self, timestamp: float):
         if not self._position_mode_ready:
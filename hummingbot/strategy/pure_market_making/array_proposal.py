@@ -0,0 +1,249 @@
+from bisect import bisect_right
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from itertools import accumulate
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .data_types import PriceSize, Proposal
+from .fixed_point import TickLotScale, quantize_exact
+
+s_decimal_zero = Decimal(0)
+s_decimal_one = Decimal(1)
+
+
+class ArrayProposal:
+    """
+    A proposal stored as NumPy columns: prices in ticks, sizes in lots and the order side. Buys come first, in level
+    order, followed by the sells in level order. The modifiers changing the prices or the sizes remove the levels left
+    below the minimum order size or the minimum notional of the scale, as the order amount quantization of the
+    connector would.
+    The proposal modifiers of PureMarketMakingStrategy work on the columns directly, the Decimal PriceSize objects of
+    the buys and sells properties are only built when the orders are placed (or compared with the active orders).
+    The prices set by reprice_side are also kept unrounded, as the Decimal pipeline keeps them, so that scale_prices
+    rounds them to ticks once after applying its factors.
+    """
+
+    def __init__(self, scale: TickLotScale, prices: np.ndarray, sizes: np.ndarray, is_buy: np.ndarray):
+        self.scale: TickLotScale = scale
+        self.prices: np.ndarray = prices
+        self.sizes: np.ndarray = sizes
+        self.is_buy: np.ndarray = is_buy
+        # The Decimal prices before their rounding to ticks, None for the prices on a tick
+        self.unrounded_prices: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_sides(cls,
+                   scale: TickLotScale,
+                   buy_prices: np.ndarray,
+                   buy_sizes: np.ndarray,
+                   sell_prices: np.ndarray,
+                   sell_sizes: np.ndarray) -> "ArrayProposal":
+        return cls(scale,
+                   np.concatenate((buy_prices, sell_prices)).astype(np.int64),
+                   np.concatenate((buy_sizes, sell_sizes)).astype(np.int64),
+                   np.concatenate((np.ones(len(buy_prices), dtype=bool), np.zeros(len(sell_prices), dtype=bool))))
+
+    def __repr__(self):
+        return repr(self.to_proposal())
+
+    @property
+    def buys(self) -> List[PriceSize]:
+        return self._price_sizes(self.is_buy)
+
+    @property
+    def sells(self) -> List[PriceSize]:
+        return self._price_sizes(~self.is_buy)
+
+    def to_proposal(self) -> Proposal:
+        return Proposal(self.buys, self.sells)
+
+    def side_index(self, is_buy: bool) -> np.ndarray:
+        return np.flatnonzero(self.is_buy if is_buy else ~self.is_buy)
+
+    def clear_side(self, is_buy: bool):
+        self._keep(~self.is_buy if is_buy else self.is_buy)
+
+    def drop_first_levels(self, is_buy: bool, count: int):
+        keep = np.ones(len(self.prices), dtype=bool)
+        keep[self.side_index(is_buy)[:count]] = False
+        self._keep(keep)
+
+    def scale_sizes(self, is_buy: bool, ratio: Decimal):
+        """
+        Multiplies the sizes of one side by ratio, rounded down to lots (inventory skew).
+        """
+        index = self.side_index(is_buy)
+        lots = self.sizes[index]
+        scale = self.scale
+        self.sizes[index] = quantize_exact(lots * float(ratio),
+                                           lambda i: scale.size_to_lots(scale.lots_to_size(lots[i]) * ratio))
+        self._keep_tradable()
+
+    def level_prices(self, is_buy: bool) -> List[Decimal]:
+        """
+        Returns the prices of one side in level order, unrounded when they were set by reprice_side.
+        """
+        index = self.side_index(is_buy)
+        prices = [self.scale.ticks_to_price(ticks) for ticks in self.prices[index].tolist()]
+        if self.unrounded_prices is not None:
+            prices = [price if unrounded is None else unrounded
+                      for price, unrounded in zip(prices, self.unrounded_prices[index].tolist())]
+        return prices
+
+    def scale_prices(self, is_buy: bool, factors: Sequence[Decimal]):
+        """
+        Multiplies the price of each level of one side by its factor, rounded down to ticks (transaction costs).
+        The unrounded prices are multiplied, so the prices are only rounded once, after the factors are applied.
+        """
+        index = self.side_index(is_buy)
+        scale = self.scale
+        if self.unrounded_prices is None:
+            ticks = self.prices[index]
+            float_factors = np.array([float(factor) for factor in factors[:len(index)]])
+            self.prices[index] = quantize_exact(
+                ticks * float_factors, lambda i: scale.price_to_ticks(scale.ticks_to_price(ticks[i]) * factors[i]))
+        else:
+            prices = self.level_prices(is_buy)
+            self.prices[index] = [scale.price_to_ticks(price * factor) for price, factor in zip(prices, factors)]
+            self.unrounded_prices[index] = None
+        self._keep_tradable()
+
+    def reprice_side(self, is_buy: bool, first_price: Decimal, level_offsets: Sequence[Decimal]):
+        """
+        Sorts one side from the best price outwards and re-prices its levels from first_price, level i is priced at
+        first_price * (1 -/+ level_offsets[i]) / (1 -/+ level_offsets[0]) (order optimization).
+        Unlike the Decimal pipeline the new prices are rounded down to ticks here rather than by the connector when the
+        order is created, so the proposal holds the prices that are actually placed. The unrounded prices are kept for
+        scale_prices.
+        """
+        index = self.side_index(is_buy)
+        if len(index) == 0:
+            return
+        ticks = self.prices[index]
+        order = np.argsort(-ticks if is_buy else ticks, kind="stable")
+        self.sizes[index] = self.sizes[index][order]
+
+        sign = -1 if is_buy else 1
+        prices = [first_price * (s_decimal_one + sign * level_offsets[i]) / (s_decimal_one + sign * level_offsets[0])
+                  for i in range(len(index))]
+        self.prices[index] = [self.scale.price_to_ticks(price) for price in prices]
+        if self.unrounded_prices is None:
+            self.unrounded_prices = np.full(len(self.prices), None, dtype=object)
+        self.unrounded_prices[index] = prices
+        self._keep_tradable()
+
+    def filter_takers(self, top_bid: Decimal, top_ask: Decimal):
+        """
+        Removes the buys priced at or above top_ask and the sells priced at or below top_bid, a NaN top price keeps
+        its side unchanged.
+        """
+        keep = np.ones(len(self.prices), dtype=bool)
+        price_increment = self.scale.price_increment
+        if not top_ask.is_nan():
+            max_buy_ticks = int((top_ask / price_increment).to_integral_value(rounding=ROUND_CEILING))
+            keep &= ~self.is_buy | (self.prices < max_buy_ticks)
+        if not top_bid.is_nan():
+            min_sell_ticks = int((top_bid / price_increment).to_integral_value(rounding=ROUND_FLOOR))
+            keep &= self.is_buy | (self.prices > min_sell_ticks)
+        self._keep(keep)
+
+    def apply_budget(self, base_balance: Decimal, quote_balance: Decimal, buy_fee_percent: Decimal):
+        """
+        Allocates the balances to the levels in order: the first level that does not fit gets the remaining balance
+        and the levels after it get nothing. Levels left with no size, or below the minimums, are removed.
+        :param base_balance: the base asset available for the sells
+        :param quote_balance: the quote asset available for the buys
+        :param buy_fee_percent: the fee percentage added to the cost of every buy
+        """
+        scale = self.scale
+        fee_multiplier = s_decimal_one + buy_fee_percent
+
+        buy_index = self.side_index(True)
+        ticks = self.prices[buy_index].tolist()
+        lots = self.sizes[buy_index].tolist()
+        cumulative_cost = list(accumulate(t * l for t, l in zip(ticks, lots)))
+        unit_cost = scale.price_increment * scale.size_increment * fee_multiplier
+        exhausted = bisect_right(cumulative_cost, quote_balance / unit_cost)
+        if exhausted < len(buy_index):
+            spent = cumulative_cost[exhausted - 1] * unit_cost if exhausted > 0 else s_decimal_zero
+            remaining = quote_balance - spent
+            self.sizes[buy_index[exhausted]] = scale.size_to_lots(
+                remaining / (scale.ticks_to_price(ticks[exhausted]) * fee_multiplier))
+            self.sizes[buy_index[exhausted + 1:]] = 0
+
+        sell_index = self.side_index(False)
+        cumulative_lots = list(accumulate(self.sizes[sell_index].tolist()))
+        exhausted = bisect_right(cumulative_lots, base_balance / scale.size_increment)
+        if exhausted < len(sell_index):
+            used = cumulative_lots[exhausted - 1] if exhausted > 0 else 0
+            self.sizes[sell_index[exhausted]] = scale.size_to_lots(base_balance - scale.lots_to_size(used))
+            self.sizes[sell_index[exhausted + 1:]] = 0
+
+        self._keep_tradable()
+
+    def _keep_tradable(self):
+        self._keep(self.scale.tradable(self.prices, self.sizes))
+
+    def _keep(self, keep: np.ndarray):
+        self.prices = self.prices[keep]
+        self.sizes = self.sizes[keep]
+        self.is_buy = self.is_buy[keep]
+        if self.unrounded_prices is not None:
+            self.unrounded_prices = self.unrounded_prices[keep]
+
+    def _price_sizes(self, mask: np.ndarray) -> List[PriceSize]:
+        price_increment = self.scale.price_increment
+        size_increment = self.scale.size_increment
+        return [PriceSize(ticks * price_increment, lots * size_increment)
+                for ticks, lots in zip(self.prices[mask].tolist(), self.sizes[mask].tolist())]
+
+
+def _level_sizes(scale: TickLotScale, order_amount: Decimal, order_level_amount: Decimal, levels: int) -> np.ndarray:
+    base_lots, base_remainder = divmod(order_amount, scale.size_increment)
+    step_lots, step_remainder = divmod(order_level_amount, scale.size_increment)
+    if base_remainder == 0 and step_remainder == 0:
+        # Amounts are whole lots (the usual configuration), the level sizes are exact integers
+        return int(base_lots) + int(step_lots) * np.arange(levels, dtype=np.int64)
+    level_index = np.arange(levels, dtype=np.float64)
+    sizes = float(order_amount) + float(order_level_amount) * level_index
+    return scale.quantize_sizes(sizes, lambda i: order_amount + (order_level_amount * i))
+
+
+def build_level_proposal(scale: TickLotScale,
+                         buy_reference_price: Optional[Decimal],
+                         sell_reference_price: Optional[Decimal],
+                         bid_spread: Decimal,
+                         ask_spread: Decimal,
+                         order_level_spread: Decimal,
+                         order_amount: Decimal,
+                         order_level_amount: Decimal,
+                         buy_levels: int,
+                         sell_levels: int) -> ArrayProposal:
+    """
+    Computes all the order levels at once in ticks and lots. The result matches the per level Decimal computation of
+    PureMarketMakingStrategy.c_create_base_proposal: levels with no size, or below the minimum order size or the
+    minimum notional of the scale, are dropped, and a side with a NaN or None reference price gets no orders.
+    """
+    empty = np.empty(0, dtype=np.int64)
+    buy_prices = buy_sizes = sell_prices = sell_sizes = empty
+
+    if buy_reference_price is not None and not buy_reference_price.is_nan() and buy_levels > 0:
+        level_index = np.arange(buy_levels, dtype=np.float64)
+        prices = float(buy_reference_price) * (1.0 - float(bid_spread) - level_index * float(order_level_spread))
+        buy_prices = scale.quantize_prices(
+            prices, lambda i: buy_reference_price * (Decimal("1") - bid_spread - (i * order_level_spread)))
+        buy_sizes = _level_sizes(scale, order_amount, order_level_amount, buy_levels)
+        keep = scale.tradable(buy_prices, buy_sizes)
+        buy_prices, buy_sizes = buy_prices[keep], buy_sizes[keep]
+
+    if sell_reference_price is not None and not sell_reference_price.is_nan() and sell_levels > 0:
+        level_index = np.arange(sell_levels, dtype=np.float64)
+        prices = float(sell_reference_price) * (1.0 + float(ask_spread) + level_index * float(order_level_spread))
+        sell_prices = scale.quantize_prices(
+            prices, lambda i: sell_reference_price * (Decimal("1") + ask_spread + (i * order_level_spread)))
+        sell_sizes = _level_sizes(scale, order_amount, order_level_amount, sell_levels)
+        keep = scale.tradable(sell_prices, sell_sizes)
+        sell_prices, sell_sizes = sell_prices[keep], sell_sizes[keep]
+
+    return ArrayProposal.from_sides(scale, buy_prices, buy_sizes, sell_prices, sell_sizes)
@@ -0,0 +1,139 @@
+from decimal import ROUND_CEILING, Decimal
+from typing import Callable
+
+import numpy as np
+
+from hummingbot.connector.trading_rule import TradingRule
+
+# Float results closer than this (relative) to a tick/lot boundary are re-evaluated with Decimal so that
+# the fixed point path rounds exactly like the Decimal quantization it replaces.
+BOUNDARY_TOLERANCE = 1e-9
+
+
+def quantize_exact(approx: np.ndarray, exact: Callable[[int], int]) -> np.ndarray:
+    """
+    Rounds an array of float values toward zero (like Decimal's // operator) into int64, re-computing with the exact
+    function the entries that are too close to an integer boundary for double precision to be trusted.
+    :param approx: the values computed in double precision
+    :param exact: a function returning the exact quantized value for an index
+    :return: the quantized values as an int64 array
+    """
+    result = np.trunc(approx).astype(np.int64)
+    nearest = np.rint(approx)
+    ambiguous = np.flatnonzero(np.abs(approx - nearest) <= BOUNDARY_TOLERANCE * np.maximum(1.0, np.abs(approx)))
+    for index in ambiguous:
+        result[index] = exact(int(index))
+    return result
+
+
+class TickLotScale:
+    """
+    Fixed point representation of the prices and sizes of a trading pair, prices are integer numbers of ticks
+    (the minimum price increment) and sizes are integer numbers of lots (the minimum base amount increment).
+    The minimum order size and minimum notional of the trading rule are kept with it, the orders below them are not
+    tradable.
+    """
+
+    def __init__(self,
+                 price_increment: Decimal,
+                 size_increment: Decimal,
+                 min_order_size: Decimal = Decimal(0),
+                 min_notional_size: Decimal = Decimal(0)):
+        if price_increment <= 0 or size_increment <= 0:
+            raise ValueError("Price and size increments must be positive.")
+        self._price_increment = price_increment
+        self._size_increment = size_increment
+        self._min_order_size = min_order_size
+        self._min_notional_size = min_notional_size
+        self._price_increment_float = float(price_increment)
+        self._size_increment_float = float(size_increment)
+        # The minimums in lots and in ticks x lots, rounded up
+        self._min_lots = max(1, int((min_order_size / size_increment).to_integral_value(rounding=ROUND_CEILING)))
+        self._min_notional_units = max(0, int((min_notional_size / (price_increment * size_increment))
+                                              .to_integral_value(rounding=ROUND_CEILING)))
+
+    @classmethod
+    def from_trading_rule(cls, trading_rule: TradingRule) -> "TickLotScale":
+        return cls(Decimal(trading_rule.min_price_increment),
+                   Decimal(trading_rule.min_base_amount_increment),
+                   Decimal(trading_rule.min_order_size),
+                   Decimal(trading_rule.min_notional_size))
+
+    def __eq__(self, other):
+        return (isinstance(other, TickLotScale)
+                and self._price_increment == other.price_increment
+                and self._size_increment == other.size_increment
+                and self._min_order_size == other.min_order_size
+                and self._min_notional_size == other.min_notional_size)
+
+    def __repr__(self):
+        return (f"TickLotScale(price_increment={self._price_increment}, size_increment={self._size_increment}, "
+                f"min_order_size={self._min_order_size}, min_notional_size={self._min_notional_size})")
+
+    @property
+    def price_increment(self) -> Decimal:
+        return self._price_increment
+
+    @property
+    def size_increment(self) -> Decimal:
+        return self._size_increment
+
+    @property
+    def min_order_size(self) -> Decimal:
+        return self._min_order_size
+
+    @property
+    def min_notional_size(self) -> Decimal:
+        return self._min_notional_size
+
+    def price_to_ticks(self, price: Decimal) -> int:
+        return int(price // self._price_increment)
+
+    def size_to_lots(self, size: Decimal) -> int:
+        return int(size // self._size_increment)
+
+    def ticks_to_price(self, ticks: int) -> Decimal:
+        return int(ticks) * self._price_increment
+
+    def lots_to_size(self, lots: int) -> Decimal:
+        return int(lots) * self._size_increment
+
+    def ticks_to_float(self, ticks: np.ndarray) -> np.ndarray:
+        return ticks * self._price_increment_float
+
+    def lots_to_float(self, lots: np.ndarray) -> np.ndarray:
+        return lots * self._size_increment_float
+
+    def quantize_prices(self, prices: np.ndarray, exact: Callable[[int], Decimal]) -> np.ndarray:
+        """
+        Converts float prices to ticks, rounding like ConnectorBase.c_quantize_order_price.
+        :param prices: the prices in double precision
+        :param exact: a function returning the exact Decimal price for an index, used on tick boundaries
+        """
+        return quantize_exact(prices / self._price_increment_float, lambda i: self.price_to_ticks(exact(i)))
+
+    def quantize_sizes(self, sizes: np.ndarray, exact: Callable[[int], Decimal]) -> np.ndarray:
+        """
+        Converts float sizes to lots, rounding like ConnectorBase.c_quantize_order_amount.
+        :param sizes: the sizes in double precision
+        :param exact: a function returning the exact Decimal size for an index, used on lot boundaries
+        """
+        return quantize_exact(sizes / self._size_increment_float, lambda i: self.size_to_lots(exact(i)))
+
+    def tradable(self, ticks: np.ndarray, lots: np.ndarray) -> np.ndarray:
+        """
+        Returns the mask of the orders with a size of at least the minimum order size (and one lot) and a notional
+        (price x size) of at least the minimum notional.
+        :param ticks: the order prices in ticks
+        :param lots: the order sizes in lots
+        """
+        keep = lots >= self._min_lots
+        if self._min_notional_units > 0:
+            # The notional in ticks x lots can exceed the int64 range, it is compared in double precision and the
+            # orders too close to the minimum are re-checked with Python integers
+            units = self._min_notional_units
+            notional = ticks.astype(np.float64) * lots
+            keep &= notional >= units
+            for index in np.flatnonzero(np.abs(notional - units) <= BOUNDARY_TOLERANCE * units):
+                keep[index] = lots[index] >= self._min_lots and int(ticks[index]) * int(lots[index]) >= units
+        return keep
@@ -0,0 +1,95 @@
+from decimal import Decimal
+from typing import List, NamedTuple, Sequence, Tuple
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+
+from .data_types import PriceSize, Proposal
+
+
+class OrderDiff(NamedTuple):
+    kept: List[LimitOrder]
+    to_cancel: List[LimitOrder]
+    to_amend: List[Tuple[LimitOrder, PriceSize]]
+    to_create: Proposal
+
+    @property
+    def is_empty(self) -> bool:
+        return (len(self.to_cancel) == 0 and len(self.to_amend) == 0
+                and len(self.to_create.buys) == 0 and len(self.to_create.sells) == 0)
+
+
+def _is_within_tolerance(current_price: Decimal, proposal_price: Decimal, tolerance_pct: Decimal) -> bool:
+    return abs(proposal_price - current_price) / current_price <= tolerance_pct
+
+
+def _match_side(active_orders: Sequence[LimitOrder],
+                levels: Sequence[PriceSize],
+                tolerance_pct: Decimal) -> Tuple[List[LimitOrder], List[LimitOrder], List[PriceSize]]:
+    """
+    Pairs the active orders of one side with the proposal levels of that side. Both lists are walked in ascending
+    price order, an order and a level match when their prices are within the tolerance.
+    :return: the matched orders, the unmatched orders and the unmatched levels (in their proposal order)
+    """
+    orders = sorted(active_orders, key=lambda o: o.price)
+    level_order = sorted(range(len(levels)), key=lambda i: levels[i].price)
+    kept = []
+    unmatched_orders = []
+    matched_levels = set()
+    order_idx = level_idx = 0
+    if tolerance_pct >= 0:
+        while order_idx < len(orders) and level_idx < len(level_order):
+            order = orders[order_idx]
+            level = level_order[level_idx]
+            current_price = Decimal(str(order.price))
+            if _is_within_tolerance(current_price, levels[level].price, tolerance_pct):
+                kept.append(order)
+                matched_levels.add(level)
+                order_idx += 1
+                level_idx += 1
+            elif current_price < levels[level].price:
+                unmatched_orders.append(order)
+                order_idx += 1
+            else:
+                level_idx += 1
+    unmatched_orders.extend(orders[order_idx:])
+    unmatched_levels = [level for i, level in enumerate(levels) if i not in matched_levels]
+    return kept, unmatched_orders, unmatched_levels
+
+
+def _pair_amends(unmatched_orders: List[LimitOrder],
+                 unmatched_levels: List[PriceSize],
+                 is_buy: bool) -> Tuple[List[LimitOrder], List[Tuple[LimitOrder, PriceSize]], List[PriceSize]]:
+    # Best priced orders are moved to the best priced levels
+    orders = sorted(unmatched_orders, key=lambda o: o.price, reverse=is_buy)
+    levels = sorted(unmatched_levels, key=lambda level: level.price, reverse=is_buy)
+    pairs = min(len(orders), len(levels))
+    return orders[pairs:], list(zip(orders[:pairs], levels[:pairs])), levels[pairs:]
+
+
+def reconcile_orders(active_orders: Sequence[LimitOrder],
+                     proposal: Proposal,
+                     tolerance_pct: Decimal,
+                     amend_supported: bool = False) -> OrderDiff:
+    """
+    Diffs the active orders against a new proposal level by level, so a refresh only touches the levels that changed.
+    An active order is kept when a proposal level on its side is priced within tolerance_pct of it (a negative
+    tolerance keeps nothing). The remaining orders are cancelled and the remaining levels created; when the connector
+    supports amends the unmatched orders are instead amended to the unmatched levels of their side, best price first.
+    """
+    kept = []
+    to_cancel = []
+    to_amend = []
+    to_create = Proposal([], [])
+    for is_buy, levels in ((True, proposal.buys), (False, proposal.sells)):
+        side_orders = [o for o in active_orders if o.is_buy == is_buy]
+        side_kept, unmatched_orders, unmatched_levels = _match_side(side_orders, levels, tolerance_pct)
+        if amend_supported:
+            unmatched_orders, side_amends, unmatched_levels = _pair_amends(unmatched_orders, unmatched_levels, is_buy)
+            to_amend.extend(side_amends)
+        kept.extend(side_kept)
+        to_cancel.extend(unmatched_orders)
+        if is_buy:
+            to_create.buys = unmatched_levels
+        else:
+            to_create.sells = unmatched_levels
+    return OrderDiff(kept, to_cancel, to_amend, to_create)
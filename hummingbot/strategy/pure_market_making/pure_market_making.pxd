@@ -53,17 +53,22 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         int _filled_sells_balance
         double _last_timestamp
         double _status_report_interval
+        object _status_report
         int64_t _logging_options
         object _last_own_trade_price
         bint _should_wait_order_cancel_confirmation
+        bint _order_reconciliation_enabled
 
         object _moving_price_band
 
     cdef object c_get_mid_price(self)
+    cdef int64_t c_profile_stage(self, str stage, int64_t stage_start_ns)
     cdef object c_create_base_proposal(self)
+    cdef object c_get_tick_lot_scale(self, object buy_reference_price, object sell_reference_price)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
     cdef c_apply_price_band(self, object proposal)
+    cdef c_clear_proposal_side(self, object proposal, bint is_buy)
     cdef c_apply_ping_pong(self, object proposal)
     cdef c_apply_order_price_modifiers(self, object proposal)
     cdef c_apply_order_size_modifiers(self, object proposal)
@@ -72,12 +77,17 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef c_filter_out_takers(self, object proposal)
     cdef c_apply_order_optimization(self, object proposal)
+    cdef c_apply_array_order_optimization(self, object proposal, object own_buy_size, object own_sell_size)
     cdef c_apply_add_transaction_costs(self, object proposal)
+    cdef c_apply_array_add_transaction_costs(self, object proposal)
     cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices)
     cdef c_cancel_active_orders(self, object proposal)
     cdef c_cancel_orders_below_min_spread(self)
     cdef c_cancel_active_orders_on_max_age_limit(self)
     cdef bint c_to_create_orders(self, object proposal)
+    cdef bint c_reconciles_orders(self)
+    cdef object c_diff_active_orders(self, object proposal, bint amend_supported)
+    cdef c_reconcile_active_orders(self, object proposal)
     cdef c_execute_orders_proposal(self, object proposal)
     cdef set_timers(self)
     cdef c_apply_moving_price_band(self, object proposal)
@@ -1,9 +1,9 @@
 import logging
 from decimal import Decimal
-from math import ceil, floor
+from math import ceil, floor, isnan
+from time import perf_counter_ns
 from typing import Dict, List, Optional
 
-import numpy as np
 import pandas as pd
 
 from hummingbot.connector.exchange_base import ExchangeBase
@@ -13,15 +13,19 @@ from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import map_df_to_str
+from hummingbot.core.utils.status_report import StatusReport, StatusTable, map_table_to_str
+from hummingbot.core.utils.tick_profiler import TickProfiler
 from hummingbot.strategy.asset_price_delegate cimport AssetPriceDelegate
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 from hummingbot.strategy.hanging_orders_tracker import CreatedPairOfOrders, HangingOrdersTracker
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
 from hummingbot.strategy.strategy_base import StrategyBase
-from hummingbot.strategy.utils import order_age
+from hummingbot.strategy.utils import format_order_age, order_age
+from .array_proposal import ArrayProposal, build_level_proposal
 from .data_types import PriceSize, Proposal
+from .fixed_point import TickLotScale
+from .order_reconciler import reconcile_orders
 from .inventory_cost_price_delegate import InventoryCostPriceDelegate
 from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_asset_ratio
 from .inventory_skew_calculator import calculate_total_order_size
@@ -33,6 +37,7 @@ NaN = float("nan")
 s_decimal_zero = Decimal(0)
 s_decimal_neg_one = Decimal(-1)
 pmm_logger = None
+tick_profiler = TickProfiler.get_instance()
 
 
 cdef class PureMarketMakingStrategy(StrategyBase):
@@ -85,7 +90,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     bid_order_level_spreads: List[Decimal] = None,
                     ask_order_level_spreads: List[Decimal] = None,
                     should_wait_order_cancel_confirmation: bool = True,
-                    moving_price_band: Optional[MovingPriceBand] = None
+                    moving_price_band: Optional[MovingPriceBand] = None,
+                    order_reconciliation_enabled: bool = False
                     ):
         if order_override is None:
             order_override = {}
@@ -141,9 +147,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._logging_options = logging_options
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
+        self._status_report = StatusReport()
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._order_reconciliation_enabled = order_reconciliation_enabled
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -185,6 +193,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def order_refresh_tolerance_pct(self, value: Decimal):
         self._order_refresh_tolerance_pct = value
 
+    @property
+    def order_reconciliation_enabled(self) -> bool:
+        return self._order_reconciliation_enabled
+
+    @order_reconciliation_enabled.setter
+    def order_reconciliation_enabled(self, value: bool):
+        self._order_reconciliation_enabled = value
+
     @property
     def order_amount(self) -> Decimal:
         return self._order_amount
@@ -492,7 +508,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def inventory_cost_price_delegate(self, value):
         self._inventory_cost_price_delegate = value
 
-    def inventory_skew_stats_data_frame(self) -> Optional[pd.DataFrame]:
+    def inventory_skew_stats_table(self) -> StatusTable:
         cdef:
             ExchangeBase market = self._market_info.market
 
@@ -538,7 +554,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             float(target_base_ratio),
             float(base_asset_range)
         )
-        inventory_skew_df = pd.DataFrame(data=[
+        return StatusTable([0, 1, 2], [
             [f"Target Value ({self.quote_asset})", f"{target_base_amount_in_quote:.4f}",
              f"{target_quote_amount:.4f}"],
             ["Current %", f"{base_asset_ratio:.1%}", f"{quote_asset_ratio:.1%}"],
@@ -547,9 +563,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
              f"{1 - high_water_mark_ratio:.1%} - {1 - low_water_mark_ratio:.1%}"],
             ["Order Adjust %", f"{bid_ask_ratios.bid_ratio:.1%}", f"{bid_ask_ratios.ask_ratio:.1%}"]
         ])
-        return inventory_skew_df
 
-    def pure_mm_assets_df(self, to_show_current_pct: bool) -> pd.DataFrame:
+    def inventory_skew_stats_data_frame(self) -> Optional[pd.DataFrame]:
+        return pd.DataFrame(data=self.inventory_skew_stats_table().rows)
+
+    def pure_mm_assets_table(self, to_show_current_pct: bool) -> StatusTable:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self._market_info.get_mid_price()
         base_balance = float(market.get_balance(base_asset))
@@ -568,10 +586,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         ]
         if to_show_current_pct:
             data.append(["Current %", f"{base_ratio:.1%}", f"{quote_ratio:.1%}"])
-        df = pd.DataFrame(data=data)
-        return df
+        return StatusTable([0, 1, 2], data)
 
-    def active_orders_df(self) -> pd.DataFrame:
+    def pure_mm_assets_df(self, to_show_current_pct: bool) -> pd.DataFrame:
+        return pd.DataFrame(data=self.pure_mm_assets_table(to_show_current_pct).rows)
+
+    def active_orders_table(self) -> StatusTable:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self.get_price()
         active_orders = self.active_orders
@@ -598,7 +618,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 amount_orig = self._order_amount + ((level_for_calculation - 1) * self._order_level_amount)
                 level = "hang"
             spread = 0 if price == 0 else abs(order.price - price)/price
-            age = pd.Timestamp(order_age(order, self._current_timestamp), unit='s').strftime('%H:%M:%S')
+            age = format_order_age(order_age(order, self._current_timestamp))
             data.append([
                 level,
                 "buy" if order.is_buy else "sell",
@@ -609,9 +629,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 age
             ])
 
-        return pd.DataFrame(data=data, columns=columns)
+        return StatusTable(columns, data)
 
-    def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+    def active_orders_df(self) -> pd.DataFrame:
+        table = self.active_orders_table()
+        return pd.DataFrame(data=table.rows, columns=table.columns)
+
+    def market_status_table(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> StatusTable:
         markets_data = []
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"Ref Price ({self._price_type.name})"]
         if self._price_type is PriceType.LastOwnTrade and self._last_own_trade_price.is_nan():
@@ -641,46 +665,80 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 trading_pair,
                 float(bid_price),
                 float(ask_price),
-                float(ref_price)
+                "" if isnan(float(ref_price)) else float(ref_price)
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return StatusTable(markets_columns, markets_data)
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
             return "Market connectors are not ready."
         cdef:
-            list lines = []
             list warning_lines = []
         warning_lines.extend(self._ping_pong_warning_lines)
         warning_lines.extend(self.network_warning([self._market_info]))
 
-        markets_df = map_df_to_str(self.market_status_data_frame([self._market_info]))
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
-
-        assets_df = map_df_to_str(self.pure_mm_assets_df(not self._inventory_skew_enabled))
-        # append inventory skew stats.
+        status_report = self._status_report
+        market, trading_pair, base_asset, quote_asset = self._market_info
+        price = self.get_price()
+        active_orders = self.active_orders
+        # The values the tables are built from, a table is only built again when they change
+        orders_inputs = tuple((o.client_order_id, o.is_buy, o.price, o.quantity, o.creation_timestamp)
+                              for o in active_orders)
+        market_books = [(market, trading_pair)]
+        if type(self._asset_price_delegate) is OrderBookAssetPriceDelegate:
+            market_books.append((self._asset_price_delegate.market, self._asset_price_delegate.trading_pair))
+        markets_inputs = (
+            tuple((book_market.get_price(book_pair, False), book_market.get_price(book_pair, True))
+                  for book_market, book_pair in market_books),
+            price,
+            self._price_type,
+            self._last_own_trade_price.is_nan(),
+            None if self._inventory_cost_price_delegate is None else self._inventory_cost_price_delegate.get_price(),
+            (None if self._asset_price_delegate is None or self._price_type is PriceType.LastOwnTrade
+             else self._asset_price_delegate.get_price_by_type(self._price_type)),
+        )
+        status_report.update_table("markets", "Markets",
+                                   lambda: map_table_to_str(self.market_status_table([self._market_info])),
+                                   markets_inputs)
+
+        assets_inputs = (
+            self._market_info.get_mid_price(),
+            market.get_balance(base_asset),
+            market.get_balance(quote_asset),
+            market.get_available_balance(base_asset),
+            market.get_available_balance(quote_asset),
+            self._inventory_skew_enabled,
+        )
         if self._inventory_skew_enabled:
-            inventory_skew_df = map_df_to_str(self.inventory_skew_stats_data_frame())
-            assets_df = assets_df.append(inventory_skew_df)
-
-        first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+            assets_inputs += (price, orders_inputs, self._inventory_target_base_pct, self._inventory_range_multiplier,
+                              self._order_amount, self._order_level_amount, self._order_levels)
+        status_report.update_table("assets", "Assets", self._assets_status_table, assets_inputs,
+                                   header=False, left_align_first_column=True)
 
         # See if there're any open orders.
-        if len(self.active_orders) > 0:
-            df = map_df_to_str(self.active_orders_df())
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        if len(active_orders) > 0:
+            hanging_order_ids = tuple(o.order_id for o in self._hanging_orders_tracker.strategy_current_hanging_orders)
+            # The order ages change with the timestamp, the orders table is built at most once per tick
+            orders_inputs = (orders_inputs, hanging_order_ids, price, self._current_timestamp, self._order_amount,
+                             self._order_level_amount)
+            status_report.update_table("orders", "Orders", lambda: map_table_to_str(self.active_orders_table()),
+                                       orders_inputs)
         else:
-            lines.extend(["", "  No active maker orders."])
+            status_report.update_lines("orders", ["", "  No active maker orders."])
 
         warning_lines.extend(self.balance_warning([self._market_info]))
 
         if len(warning_lines) > 0:
-            lines.extend(["", "*** WARNINGS ***"] + warning_lines)
+            status_report.update_lines("warnings", ["", "*** WARNINGS ***"] + warning_lines)
 
-        return "\n".join(lines)
+        return status_report.render()
+
+    def _assets_status_table(self) -> StatusTable:
+        assets_table = self.pure_mm_assets_table(not self._inventory_skew_enabled)
+        # append inventory skew stats.
+        if self._inventory_skew_enabled:
+            assets_table.rows.extend(self.inventory_skew_stats_table().rows)
+        return map_table_to_str(assets_table)
 
     # The following exposed Python functions are meant for unit tests
     # ---------------------------------------------------------------
@@ -720,6 +778,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             bint should_report_warnings = ((current_tick > last_tick) and
                                            (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
             cdef object proposal
+            bint profiling = tick_profiler.enabled
+            int64_t stage_start_ns = perf_counter_ns() if profiling else 0
         try:
             if not self._all_markets_ready:
                 self._all_markets_ready = all([market.ready for market in self._sb_markets])
@@ -740,28 +800,54 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             if self._create_timestamp <= self._current_timestamp:
                 # 1. Create base order proposals
                 proposal = self.c_create_base_proposal()
+                if profiling:
+                    stage_start_ns = self.c_profile_stage("create_base_proposal", stage_start_ns)
                 # 2. Apply functions that limit numbers of buys and sells proposal
                 self.c_apply_order_levels_modifiers(proposal)
+                if profiling:
+                    stage_start_ns = self.c_profile_stage("apply_order_levels_modifiers", stage_start_ns)
                 # 3. Apply functions that modify orders price
                 self.c_apply_order_price_modifiers(proposal)
+                if profiling:
+                    stage_start_ns = self.c_profile_stage("apply_order_price_modifiers", stage_start_ns)
                 # 4. Apply functions that modify orders size
                 self.c_apply_order_size_modifiers(proposal)
+                if profiling:
+                    stage_start_ns = self.c_profile_stage("apply_order_size_modifiers", stage_start_ns)
                 # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
                 self.c_apply_budget_constraint(proposal)
+                if profiling:
+                    stage_start_ns = self.c_profile_stage("apply_budget_constraint", stage_start_ns)
 
                 if not self._take_if_crossed:
                     self.c_filter_out_takers(proposal)
+                    if profiling:
+                        stage_start_ns = self.c_profile_stage("filter_out_takers", stage_start_ns)
 
             self._hanging_orders_tracker.process_tick()
+            if profiling:
+                stage_start_ns = self.c_profile_stage("hanging_orders", stage_start_ns)
 
             self.c_cancel_active_orders_on_max_age_limit()
             self.c_cancel_active_orders(proposal)
             self.c_cancel_orders_below_min_spread()
+            if profiling:
+                stage_start_ns = self.c_profile_stage("cancel_orders", stage_start_ns)
             if self.c_to_create_orders(proposal):
                 self.c_execute_orders_proposal(proposal)
+                if profiling:
+                    self.c_profile_stage("execute_orders_proposal", stage_start_ns)
         finally:
             self._last_timestamp = timestamp
 
+    cdef int64_t c_profile_stage(self, str stage, int64_t stage_start_ns):
+        """
+        Records the time spent in a tick stage since stage_start_ns, returns the start of the next stage
+        """
+        cdef int64_t now_ns = perf_counter_ns()
+        tick_profiler.record(self.__class__.__name__, stage, now_ns - stage_start_ns)
+        return now_ns
+
     cdef object c_create_base_proposal(self):
         cdef:
             ExchangeBase market = self._market_info.market
@@ -801,6 +887,18 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                         if size > 0 and price > 0:
                             sells.append(PriceSize(price, size))
         else:
+            scale = self.c_get_tick_lot_scale(buy_reference_price, sell_reference_price)
+            if scale is not None:
+                return build_level_proposal(scale,
+                                            buy_reference_price,
+                                            sell_reference_price,
+                                            self._bid_spread,
+                                            self._ask_spread,
+                                            self._order_level_spread,
+                                            self._order_amount,
+                                            self._order_level_amount,
+                                            self._buy_levels,
+                                            self._sell_levels)
             if not buy_reference_price.is_nan():
                 for level in range(0, self._buy_levels):
                     price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
@@ -820,6 +918,58 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         return Proposal(buys, sells)
 
+    cdef object c_get_tick_lot_scale(self, object buy_reference_price, object sell_reference_price):
+        """
+        Returns the fixed point scale to build all order levels at once as an ArrayProposal, or None when the market
+        price or size quantum is not the same across every level, or when the market applies order size minimums
+        the scale can't hold (the levels are then built one by one with Decimal math into a Proposal).
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            int max_levels = max(self._buy_levels, self._sell_levels) - 1
+            list prices = []
+            object price_quantum = None
+            object max_level_spread
+            object trading_rule
+
+        if max_levels < 0:
+            return None
+        max_level_spread = max_levels * self._order_level_spread
+        if not buy_reference_price.is_nan():
+            prices.append(buy_reference_price)
+            prices.append(buy_reference_price * (Decimal("1") - self._bid_spread - max_level_spread))
+        if not sell_reference_price.is_nan():
+            prices.append(sell_reference_price)
+            prices.append(sell_reference_price * (Decimal("1") + self._ask_spread + max_level_spread))
+        if len(prices) == 0:
+            return None
+        for price in prices:
+            if price <= 0:
+                return None
+            quantum = market.c_get_order_price_quantum(self.trading_pair, price)
+            if price_quantum is not None and quantum != price_quantum:
+                return None
+            price_quantum = quantum
+
+        size_quantum = market.c_get_order_size_quantum(self.trading_pair, self._order_amount)
+        max_size = self._order_amount + (self._order_level_amount * max_levels)
+        if size_quantum != market.c_get_order_size_quantum(self.trading_pair, max_size):
+            return None
+        if price_quantum <= 0 or size_quantum <= 0:
+            return None
+        trading_rule = getattr(market, "trading_rules", {}).get(self.trading_pair)
+        if trading_rule is not None:
+            return TickLotScale(price_quantum,
+                                size_quantum,
+                                trading_rule.min_order_size,
+                                trading_rule.min_notional_size)
+        # Without a trading rule the minimums of the connector are unknown, the levels are only built as integers when
+        # the order amount quantization of the connector just rounds down to lots
+        if market.c_quantize_order_amount(self.trading_pair, self._order_amount) != \
+                (self._order_amount // size_quantum) * size_quantum:
+            return None
+        return TickLotScale(price_quantum, size_quantum)
+
     cdef tuple c_get_adjusted_available_balance(self, list orders):
         """
         Calculates the available balance, plus the amount attributed to orders.
@@ -847,17 +997,25 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef c_apply_price_band(self, proposal):
         if self._price_ceiling > 0 and self.get_price() >= self._price_ceiling:
-            proposal.buys = []
+            self.c_clear_proposal_side(proposal, True)
         if self._price_floor > 0 and self.get_price() <= self._price_floor:
-            proposal.sells = []
+            self.c_clear_proposal_side(proposal, False)
 
     cdef c_apply_moving_price_band(self, proposal):
         price = self.get_price()
         self._moving_price_band.check_and_update_price_band(
             self.current_timestamp, price)
         if self._moving_price_band.check_price_ceiling_exceeded(price):
-            proposal.buys = []
+            self.c_clear_proposal_side(proposal, True)
         if self._moving_price_band.check_price_floor_exceeded(price):
+            self.c_clear_proposal_side(proposal, False)
+
+    cdef c_clear_proposal_side(self, object proposal, bint is_buy):
+        if isinstance(proposal, ArrayProposal):
+            proposal.clear_side(is_buy)
+        elif is_buy:
+            proposal.buys = []
+        else:
             proposal.sells = []
 
     cdef c_apply_ping_pong(self, object proposal):
@@ -865,12 +1023,18 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if self._filled_buys_balance == self._filled_sells_balance:
             self._filled_buys_balance = self._filled_sells_balance = 0
         if self._filled_buys_balance > 0:
-            proposal.buys = proposal.buys[self._filled_buys_balance:]
+            if isinstance(proposal, ArrayProposal):
+                proposal.drop_first_levels(True, self._filled_buys_balance)
+            else:
+                proposal.buys = proposal.buys[self._filled_buys_balance:]
             self._ping_pong_warning_lines.extend(
                 [f"  Ping-pong removed {self._filled_buys_balance} buy orders."]
             )
         if self._filled_sells_balance > 0:
-            proposal.sells = proposal.sells[self._filled_sells_balance:]
+            if isinstance(proposal, ArrayProposal):
+                proposal.drop_first_levels(False, self._filled_sells_balance)
+            else:
+                proposal.sells = proposal.sells[self._filled_sells_balance:]
             self._ping_pong_warning_lines.extend(
                 [f"  Ping-pong removed {self._filled_sells_balance} sell orders."]
             )
@@ -906,6 +1070,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bid_adj_ratio = Decimal(bid_ask_ratios.bid_ratio)
         ask_adj_ratio = Decimal(bid_ask_ratios.ask_ratio)
 
+        if isinstance(proposal, ArrayProposal):
+            proposal.scale_sizes(True, bid_adj_ratio)
+            proposal.scale_sizes(False, ask_adj_ratio)
+            return
+
         for buy in proposal.buys:
             size = buy.size * bid_adj_ratio
             size = market.c_quantize_order_amount(self.trading_pair, size)
@@ -935,6 +1104,19 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
 
+        if isinstance(proposal, ArrayProposal):
+            buy_fee_percent = s_decimal_zero
+            buy_index = proposal.side_index(True)
+            if len(buy_index) > 0:
+                # The fee percentage is taken from the first level, it does not depend on the order price or size
+                first_buy = buy_index[0]
+                buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
+                                           proposal.scale.lots_to_size(proposal.sizes[first_buy]),
+                                           proposal.scale.ticks_to_price(proposal.prices[first_buy]))
+                buy_fee_percent = buy_fee.percent
+            proposal.apply_budget(base_balance, quote_balance, buy_fee_percent)
+            return
+
         for buy in proposal.buys:
             buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
                                        buy.size, buy.price)
@@ -974,6 +1156,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list new_buys = []
             list new_sells = []
         top_ask = market.c_get_price(self.trading_pair, True)
+        if isinstance(proposal, ArrayProposal):
+            proposal.filter_takers(market.c_get_price(self.trading_pair, False), top_ask)
+            return
         if not top_ask.is_nan():
             proposal.buys = [buy for buy in proposal.buys if buy.price < top_ask]
         top_bid = market.c_get_price(self.trading_pair, False)
@@ -993,6 +1178,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             else:
                 own_sell_size = order.quantity
 
+        if isinstance(proposal, ArrayProposal):
+            self.c_apply_array_order_optimization(proposal, own_buy_size, own_sell_size)
+            return
+
         if len(proposal.buys) > 0:
             # Get the top bid price in the market using order_optimization_depth and your buy order volume
             top_bid_price = self._market_info.get_price_for_volume(
@@ -1039,9 +1228,46 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     continue
                 proposal.sells[i].price = market.c_quantize_order_price(self.trading_pair, higher_sell_price) * (1 + self.order_level_spread * i)
 
+    cdef c_apply_array_order_optimization(self, object proposal, object own_buy_size, object own_sell_size):
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object scale = proposal.scale
+            object buy_index = proposal.side_index(True)
+            object sell_index = proposal.side_index(False)
+            list level_offsets
+
+        if len(buy_index) > 0:
+            top_bid_price = self._market_info.get_price_for_volume(
+                False, self._bid_order_optimization_depth + own_buy_size).result_price
+            price_quantum = market.c_get_order_price_quantum(self.trading_pair, top_bid_price)
+            price_above_bid = (ceil(top_bid_price / price_quantum) + 1) * price_quantum
+            best_buy_price = scale.ticks_to_price(proposal.prices[buy_index].max())
+            lower_buy_price = market.c_quantize_order_price(self.trading_pair, min(best_buy_price, price_above_bid))
+            if self._split_order_levels_enabled:
+                level_offsets = [spread / Decimal("100") for spread in self._bid_order_level_spreads]
+            else:
+                level_offsets = [self.order_level_spread * i for i in range(len(buy_index))]
+            proposal.reprice_side(True, lower_buy_price, level_offsets)
+
+        if len(sell_index) > 0:
+            top_ask_price = self._market_info.get_price_for_volume(
+                True, self._ask_order_optimization_depth + own_sell_size).result_price
+            price_quantum = market.c_get_order_price_quantum(self.trading_pair, top_ask_price)
+            price_below_ask = (floor(top_ask_price / price_quantum) - 1) * price_quantum
+            best_sell_price = scale.ticks_to_price(proposal.prices[sell_index].min())
+            higher_sell_price = market.c_quantize_order_price(self.trading_pair, max(best_sell_price, price_below_ask))
+            if self._split_order_levels_enabled:
+                level_offsets = [spread / Decimal("100") for spread in self._ask_order_level_spreads]
+            else:
+                level_offsets = [self.order_level_spread * i for i in range(len(sell_index))]
+            proposal.reprice_side(False, higher_sell_price, level_offsets)
+
     cdef object c_apply_add_transaction_costs(self, object proposal):
         cdef:
             ExchangeBase market = self._market_info.market
+        if isinstance(proposal, ArrayProposal):
+            self.c_apply_array_add_transaction_costs(proposal)
+            return
         for buy in proposal.buys:
             fee = market.c_get_fee(self.base_asset, self.quote_asset,
                                    self._limit_order_type, TradeType.BUY, buy.size, buy.price)
@@ -1053,6 +1279,23 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             price = sell.price * (Decimal(1) + fee.percent)
             sell.price = market.c_quantize_order_price(self.trading_pair, price)
 
+    cdef c_apply_array_add_transaction_costs(self, object proposal):
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object scale = proposal.scale
+
+        # The fee of each level is computed on its unrounded price, the prices are rounded to ticks after the fees
+        for is_buy, trade_type in ((True, TradeType.BUY), (False, TradeType.SELL)):
+            index = proposal.side_index(is_buy)
+            if len(index) == 0:
+                continue
+            factors = []
+            for lots, price in zip(proposal.sizes[index].tolist(), proposal.level_prices(is_buy)):
+                fee = market.c_get_fee(self.base_asset, self.quote_asset, self._limit_order_type, trade_type,
+                                       scale.lots_to_size(lots), price)
+                factors.append((Decimal(1) - fee.percent) if is_buy else (Decimal(1) + fee.percent))
+            proposal.scale_prices(is_buy, factors)
+
     cdef c_did_fill_order(self, object order_filled_event):
         cdef:
             str order_id = order_filled_event.order_id
@@ -1198,6 +1441,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             bint to_defer_canceling = False
         if len(active_orders) == 0:
             return
+        if proposal is not None and self.c_reconciles_orders():
+            self.c_reconcile_active_orders(proposal)
+            return
         if proposal is not None and \
                 self._order_refresh_tolerance_pct >= 0:
 
@@ -1219,6 +1465,35 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         # else:
         #     self.set_timers()
 
+    cdef bint c_reconciles_orders(self):
+        # Hanging orders pair the buys and sells of each full refresh, they keep the cancel and replace cycle
+        return self._order_reconciliation_enabled and not self._hanging_orders_enabled
+
+    cdef object c_diff_active_orders(self, object proposal, bint amend_supported):
+        """
+        Diffs the active non hanging orders against the proposal, orders with a cancel in flight are left out
+        """
+        cdef:
+            object in_flight_cancels = self._sb_order_tracker.in_flight_cancels
+            list active_orders = [o for o in self.active_non_hanging_orders
+                                  if o.client_order_id not in in_flight_cancels]
+        if isinstance(proposal, ArrayProposal):
+            proposal = proposal.to_proposal()
+        return reconcile_orders(active_orders, proposal, self._order_refresh_tolerance_pct, amend_supported)
+
+    cdef c_reconcile_active_orders(self, object proposal):
+        """
+        Cancels (or amends, if the connector supports it) only the active orders that no proposal level matches within
+        the order refresh tolerance, the matching orders keep their place in the book.
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object diff = self.c_diff_active_orders(proposal, market.supports_order_amend)
+        for order in diff.to_cancel:
+            self.c_cancel_order(self._market_info, order.client_order_id)
+        for order, level in diff.to_amend:
+            self.c_amend_order(self._market_info, order, level.price, level.size)
+
     # Cancel Non-Hanging, Active Orders if Spreads are below minimum_spread
     cdef c_cancel_orders_below_min_spread(self):
         cdef:
@@ -1235,6 +1510,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 self.c_cancel_order(self._market_info, order.client_order_id)
 
     cdef bint c_to_create_orders(self, object proposal):
+        if self.c_reconciles_orders():
+            # Orders are created for the levels left uncovered once every unmatched order has been cancelled
+            return (self._create_timestamp < self._current_timestamp
+                    and (not self._should_wait_order_cancel_confirmation or
+                         len(self._sb_order_tracker.in_flight_cancels) == 0)
+                    and proposal is not None
+                    and len(self.c_diff_active_orders(proposal, False).to_cancel) == 0)
         non_hanging_orders_non_cancelled = [o for o in self.active_non_hanging_orders if not
                                             self._hanging_orders_tracker.is_potential_hanging_order(o)]
         return (self._create_timestamp < self._current_timestamp
@@ -1248,6 +1530,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             double expiration_seconds = NaN
             str bid_order_id, ask_order_id
             bint orders_created = False
+        if self.c_reconciles_orders():
+            proposal = self.c_diff_active_orders(proposal, False).to_create
+        elif isinstance(proposal, ArrayProposal):
+            proposal = proposal.to_proposal()
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
 
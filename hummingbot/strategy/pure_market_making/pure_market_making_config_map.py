@@ -393,6 +393,14 @@ pure_market_making_config_map = {
                   type_str="bool",
                   default=True,
                   validator=validate_bool),
+    "order_reconciliation_enabled":
+        ConfigVar(key="order_reconciliation_enabled",
+                  prompt="Do you want to refresh only the order levels that moved out of the refresh tolerance, "
+                         "keeping the orders that still match (Yes/No) >>> ",
+                  required_if=lambda: False,
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
     "split_order_levels_enabled":
         ConfigVar(key="split_order_levels_enabled",
                   prompt="Do you want bid and ask orders to be placed at multiple defined spread and amount? "
@@ -99,6 +99,7 @@ def start(self):
         take_if_crossed = c_map.get("take_if_crossed").value
 
         should_wait_order_cancel_confirmation = c_map.get("should_wait_order_cancel_confirmation")
+        order_reconciliation_enabled = c_map.get("order_reconciliation_enabled").value
 
         strategy_logging_options = PureMarketMakingStrategy.OPTION_LOG_ALL
         self.strategy = PureMarketMakingStrategy()
@@ -138,7 +139,8 @@ def start(self):
             bid_order_level_spreads=bid_order_level_spreads,
             ask_order_level_spreads=ask_order_level_spreads,
             should_wait_order_cancel_confirmation=should_wait_order_cancel_confirmation,
-            moving_price_band=moving_price_band
+            moving_price_band=moving_price_band,
+            order_reconciliation_enabled=order_reconciliation_enabled
         )
     except Exception as e:
         self.notify(str(e))
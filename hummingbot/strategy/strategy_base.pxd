@@ -10,7 +10,7 @@ cdef class StrategyBase(TimeIterator):
         set _sb_markets
         EventListener _sb_create_buy_order_listener
         EventListener _sb_create_sell_order_listener
-        EventListener _sb_fill_order_listener
+        dict _sb_fill_order_listeners
         EventListener _sb_fail_order_listener
         EventListener _sb_cancel_order_listener
         EventListener _sb_expire_order_listener
@@ -27,6 +27,8 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_range_position_closed_listener
         bint _sb_delegate_lock
         public OrderTracker _sb_order_tracker
+        object _sb_fill_store
+        set _sb_fill_store_markets
 
     cdef c_add_markets(self, list markets)
     cdef c_remove_markets(self, list markets)
@@ -59,6 +61,7 @@ cdef class StrategyBase(TimeIterator):
     cdef str c_sell_with_specific_market(self, object market_trading_pair_tuple, object amount, object order_type = *,
                                          object price = *, double expiration_seconds = *, position_action = *, )
     cdef c_cancel_order(self, object market_pair, str order_id)
+    cdef str c_amend_order(self, object market_trading_pair_tuple, object order, object price, object amount)
 
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity)
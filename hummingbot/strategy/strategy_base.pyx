@@ -2,17 +2,20 @@ from decimal import Decimal
 import logging
 import pandas as pd
 from typing import (
-    List)
+    List,
+    Optional)
 
 from hummingbot.core.clock cimport Clock
-from hummingbot.core.event.events import MarketEvent, AccountEvent
+from hummingbot.core.event.events import MarketEvent, AccountEvent, OrderFilledEvent
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.status_report import StatusTable
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.connector.connector_base cimport ConnectorBase
+from hummingbot.core.data_type.fill_store import FillStore
 from hummingbot.core.data_type.trade import Trade
-from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.common import OrderType, PositionAction
 from hummingbot.strategy.order_tracker import OrderTracker
 from hummingbot.connector.derivative_base import DerivativeBase
@@ -57,7 +60,16 @@ cdef class PositionModeChangeFailureListener(BaseStrategyEventListener):
         self._owner.c_did_change_position_mode_fail(arg)
 
 cdef class OrderFilledListener(BaseStrategyEventListener):
+    cdef:
+        ConnectorBase _market
+
+    def __init__(self, StrategyBase owner, ConnectorBase market):
+        super().__init__(owner)
+        self._market = market
+
     cdef c_call(self, object arg):
+        # The fill is recorded first, the strategy sees it in its trades
+        self._owner._sb_fill_store.add_order_filled_event(self._market.display_name, arg)
         self._owner.c_did_fill_order(arg)
 
 
@@ -143,7 +155,7 @@ cdef class StrategyBase(TimeIterator):
         self._sb_markets = set()
         self._sb_create_buy_order_listener = BuyOrderCreatedListener(self)
         self._sb_create_sell_order_listener = SellOrderCreatedListener(self)
-        self._sb_fill_order_listener = OrderFilledListener(self)
+        self._sb_fill_order_listeners = {}
         self._sb_fail_order_listener = OrderFailedListener(self)
         self._sb_cancel_order_listener = OrderCancelledListener(self)
         self._sb_expire_order_listener = OrderExpiredListener(self)
@@ -162,6 +174,9 @@ cdef class StrategyBase(TimeIterator):
         self._sb_delegate_lock = False
 
         self._sb_order_tracker = OrderTracker()
+        self._sb_fill_store = FillStore()
+        # The markets whose past fills were added to the fill store
+        self._sb_fill_store_markets = set()
 
     def init_params(self, *args, **kwargs):
         """
@@ -179,6 +194,10 @@ cdef class StrategyBase(TimeIterator):
     def order_tracker(self) -> OrderTracker:
         return self._sb_order_tracker
 
+    @property
+    def fill_store(self) -> FillStore:
+        return self._sb_fill_store
+
     def format_status(self):
         raise NotImplementedError
 
@@ -190,26 +209,13 @@ cdef class StrategyBase(TimeIterator):
     def trades(self) -> List[Trade]:
         """
         Returns a list of all completed trades from the market.
-        The trades are taken from the market event logs.
+        The trades are created from the fills kept in the fill store, use the fill store summaries to aggregate
+        them without creating the trades. The store is given the fills the markets logged before they were added
+        to the strategy, the fills of a market while it is removed from the strategy are not recorded.
         """
-        def event_to_trade(order_filled_event: OrderFilledEvent, market_name: str):
-            return Trade(order_filled_event.trading_pair,
-                         order_filled_event.trade_type,
-                         order_filled_event.price,
-                         order_filled_event.amount,
-                         order_filled_event.order_type,
-                         market_name,
-                         order_filled_event.timestamp,
-                         order_filled_event.trade_fee)
-        past_trades = []
-        for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
-            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
-
-        return sorted(past_trades, key=lambda x: x.timestamp)
+        return self._sb_fill_store.trades()
 
-    def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+    def market_status_table(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Optional[StatusTable]:
         cdef:
             ConnectorBase market
             str trading_pair
@@ -232,12 +238,17 @@ cdef class StrategyBase(TimeIterator):
                     float(ask_price),
                     float(mid_price)
                 ])
-            return pd.DataFrame(data=markets_data, columns=markets_columns)
+            return StatusTable(markets_columns, markets_data)
 
         except Exception:
             self.logger().error("Error formatting market stats.", exc_info=True)
 
-    def wallet_balance_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+    def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+        table = self.market_status_table(market_trading_pair_tuples)
+        if table is not None:
+            return pd.DataFrame(data=table.rows, columns=table.columns)
+
+    def wallet_balance_table(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Optional[StatusTable]:
         cdef:
             ConnectorBase market
             str base_asset
@@ -260,11 +271,16 @@ cdef class StrategyBase(TimeIterator):
                     [market.display_name, quote_asset, quote_balance, available_quote_balance]
                 ])
 
-            return pd.DataFrame(data=assets_data, columns=assets_columns)
+            return StatusTable(assets_columns, assets_data)
 
         except Exception:
             self.logger().error("Error formatting wallet balance stats.", exc_info=True)
 
+    def wallet_balance_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+        table = self.wallet_balance_table(market_trading_pair_tuples)
+        if table is not None:
+            return pd.DataFrame(data=table.rows, columns=table.columns)
+
     def balance_warning(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> List[str]:
         cdef:
             double base_balance
@@ -318,7 +334,15 @@ cdef class StrategyBase(TimeIterator):
             typed_market = market
             typed_market.c_add_listener(self.BUY_ORDER_CREATED_EVENT_TAG, self._sb_create_buy_order_listener)
             typed_market.c_add_listener(self.SELL_ORDER_CREATED_EVENT_TAG, self._sb_create_sell_order_listener)
-            typed_market.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._sb_fill_order_listener)
+            if typed_market not in self._sb_fill_order_listeners:
+                self._sb_fill_order_listeners[typed_market] = OrderFilledListener(self, typed_market)
+            if typed_market not in self._sb_fill_store_markets:
+                # The fills logged by the market before the strategy listened to it are part of its trades
+                for event in typed_market.event_logs:
+                    if isinstance(event, OrderFilledEvent):
+                        self._sb_fill_store.add_order_filled_event(typed_market.display_name, event)
+                self._sb_fill_store_markets.add(typed_market)
+            typed_market.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._sb_fill_order_listeners[typed_market])
             typed_market.c_add_listener(self.ORDER_FAILURE_EVENT_TAG, self._sb_fail_order_listener)
             typed_market.c_add_listener(self.ORDER_CANCELED_EVENT_TAG, self._sb_cancel_order_listener)
             typed_market.c_add_listener(self.ORDER_EXPIRED_EVENT_TAG, self._sb_expire_order_listener)
@@ -348,7 +372,8 @@ cdef class StrategyBase(TimeIterator):
                 continue
             typed_market.c_remove_listener(self.BUY_ORDER_CREATED_EVENT_TAG, self._sb_create_buy_order_listener)
             typed_market.c_remove_listener(self.SELL_ORDER_CREATED_EVENT_TAG, self._sb_create_sell_order_listener)
-            typed_market.c_remove_listener(self.ORDER_FILLED_EVENT_TAG, self._sb_fill_order_listener)
+            typed_market.c_remove_listener(self.ORDER_FILLED_EVENT_TAG,
+                                           self._sb_fill_order_listeners.pop(typed_market))
             typed_market.c_remove_listener(self.ORDER_FAILURE_EVENT_TAG, self._sb_fail_order_listener)
             typed_market.c_remove_listener(self.ORDER_CANCELED_EVENT_TAG, self._sb_cancel_order_listener)
             typed_market.c_remove_listener(self.ORDER_EXPIRED_EVENT_TAG, self._sb_expire_order_listener)
@@ -597,6 +622,36 @@ cdef class StrategyBase(TimeIterator):
 
     def cancel_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str):
         self.c_cancel_order(market_trading_pair_tuple, order_id)
+
+    cdef str c_amend_order(self, object market_trading_pair_tuple, object order, object price, object amount):
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        if not (isinstance(amount, Decimal) and isinstance(price, Decimal)):
+            raise TypeError("price and amount must be Decimal objects.")
+
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+            str order_id
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for amend order is not in the whitelisted markets set.")
+
+        self.log_with_clock(
+            logging.INFO,
+            f"({market_trading_pair_tuple.trading_pair}) Amending the limit order {order.client_order_id} "
+            f"to {amount} @ {price}."
+        )
+        order_id = market.amend_order(market_trading_pair_tuple.trading_pair, order.client_order_id, price, amount)
+
+        # The amended order replaces the original one in the order tracker
+        self.c_stop_tracking_limit_order(market_trading_pair_tuple, order.client_order_id)
+        self.c_start_tracking_limit_order(market_trading_pair_tuple, order_id, order.is_buy, price, amount)
+        return order_id
+
+    def amend_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order: LimitOrder, price: Decimal,
+                    amount: Decimal) -> str:
+        return self.c_amend_order(market_trading_pair_tuple, order, price, amount)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
@@ -16,5 +16,13 @@ def order_age(order: LimitOrder, current_time: Optional[float] = None) -> int:
     return int(now - (order.creation_timestamp / 1e6))
 
 
+def format_order_age(age: float) -> str:
+    """
+    Formats the age of an order as HH:MM:SS, as pd.Timestamp(age, unit='s').strftime('%H:%M:%S') would.
+    :param age: the order age in seconds
+    """
+    return time.strftime("%H:%M:%S", time.gmtime(age))
+
+
 def _time() -> float:
     return time.time()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+"""
+Times the ArbitrageStrategy cross book walk on two 50 level per side order books: the generator walk over the
+quantized Decimal entries of the markets against OrderBook.match_cross_book, which walks the C++ order book sets
+directly in double precision, and OrderBook.find_best_profitable_amount (double precision search with a Decimal
+re-check). Both when the books do not cross (the usual case) and when they cross over a few levels.
+
+Usage: python test/debug/benchmark_arbitrage_cross_book_matcher.py
+"""
+
+import timeit
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+CYCLES = 2000
+
+trading_pair = "ETH-USDT"
+min_profitability = Decimal("0.003")
+fee_percent = Decimal("0.001")
+conversion_rate = Decimal("1")
+
+buy_market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+sell_market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+buy_market.set_balanced_order_book(trading_pair, 100.0, 95.0, 105.0, 0.1, 1)
+sell_market.set_balanced_order_book(trading_pair, 100.0, 95.0, 105.0, 0.1, 1)
+buy_order_book = buy_market.get_order_book(trading_pair)
+sell_order_book = sell_market.get_order_book(trading_pair)
+
+
+def decimal_walk():
+    """
+    The walk of c_find_profitable_arbitrage_orders before the native matcher
+    """
+    profitable_orders = []
+    bid_it = sell_market.order_book_bid_entries(trading_pair)
+    ask_it = buy_market.order_book_ask_entries(trading_pair)
+    bid_leftover_amount = ask_leftover_amount = Decimal(0)
+    current_bid = current_ask = None
+    try:
+        while True:
+            if bid_leftover_amount == 0:
+                current_bid = next(bid_it)
+                bid_leftover_amount = current_bid.amount
+            if ask_leftover_amount == 0:
+                current_ask = next(ask_it)
+                ask_leftover_amount = current_ask.amount
+            current_bid_price_adjusted = current_bid.price * conversion_rate
+            current_ask_price_adjusted = current_ask.price * conversion_rate
+            if current_bid_price_adjusted < current_ask_price_adjusted:
+                break
+            step_amount = min(bid_leftover_amount, ask_leftover_amount)
+            if step_amount == 0:
+                continue
+            profitable_orders.append((current_bid.price, current_ask.price, step_amount))
+            bid_leftover_amount -= step_amount
+            ask_leftover_amount -= step_amount
+    except StopIteration:
+        pass
+    return profitable_orders
+
+
+def native_walk():
+    return sell_order_book.match_cross_book(buy_order_book, float(conversion_rate), float(conversion_rate))
+
+
+def native_best_amount():
+    return sell_order_book.find_best_profitable_amount(buy_order_book, min_profitability, fee_percent, fee_percent)
+
+
+def run(label: str):
+    expected = [(float(bid), float(ask), float(amount)) for bid, ask, amount in decimal_walk()]
+    assert expected == native_walk()
+
+    decimal_time = timeit.timeit(decimal_walk, number=CYCLES) / CYCLES
+    native_time = timeit.timeit(native_walk, number=CYCLES) / CYCLES
+    best_amount_time = timeit.timeit(native_best_amount, number=CYCLES) / CYCLES
+    print(f"{label}: {len(expected)} matched steps, best profitable amount {native_best_amount()[0]}")
+    print(f"  Decimal generator walk:      {decimal_time * 1e6:10.1f} us/cycle")
+    print(f"  match_cross_book:            {native_time * 1e6:10.1f} us/cycle ({decimal_time / native_time:.1f}x)")
+    print(f"  find_best_profitable_amount: {best_amount_time * 1e6:10.1f} us/cycle")
+
+
+def main():
+    run("Books not crossing")
+    # Moves the sell market bids up so they cross the buy market asks over a few levels
+    sell_order_book.apply_diffs([OrderBookRow(100.6 - i * 0.1, 2, 2) for i in range(8)], [], 2)
+    sell_order_book.apply_diffs([], [OrderBookRow(100.65 + i * 0.1, 1, 3) for i in range(8)], 3)
+    run("Books crossing")
+
+
+if __name__ == "__main__":
+    main()
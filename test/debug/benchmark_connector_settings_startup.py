@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""
+Times the client start up to the connector settings and to the application import (what hummingbot.py and the
+headless hummingbot_quickstart.py load before the prompt or the strategy start), in fresh processes, when the
+connector settings are scanned from the connector utils modules and when they are read from the connector manifest.
+
+Usage: python test/debug/benchmark_connector_settings_startup.py
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from typing import Dict, List
+
+from hummingbot import root_path
+
+RUNS = 5
+
+STARTUP_SCRIPT = """
+import json
+import sys
+import time
+
+started = time.perf_counter()
+from hummingbot.client import settings
+settings.CONNECTOR_MANIFEST_PATH = settings.Path(sys.argv[1])
+settings_imported = time.perf_counter()
+settings.AllConnectorSettings.get_connector_settings()
+connector_settings = time.perf_counter()
+import hummingbot.client.hummingbot_application  # noqa: F401
+application = time.perf_counter()
+print(json.dumps({
+    "settings": connector_settings - settings_imported,
+    "application": application - started,
+    "connector_modules": len([name for name in sys.modules if name.startswith("hummingbot.connector.")]),
+}))
+"""
+
+
+def start_up(manifest_path: Path) -> Dict[str, float]:
+    output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT, str(manifest_path)],
+                            cwd=root_path(), check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def report(label: str, results: List[Dict[str, float]]):
+    settings = median(result["settings"] for result in results)
+    application = median(result["application"] for result in results)
+    print(f"{label:>8}: connector settings {settings * 1e3:8.1f} ms, application import {application:6.2f} s, "
+          f"connector modules imported {results[0]['connector_modules']}")
+
+
+def main():
+    scanned, manifest = [], []
+    with tempfile.TemporaryDirectory() as directory:
+        for run in range(RUNS):
+            manifest_path = Path(directory) / f"connector_manifest_{run}.json"
+            scanned.append(start_up(manifest_path))
+            manifest.append(start_up(manifest_path))
+    report("scanned", scanned)
+    report("manifest", manifest)
+
+
+if __name__ == "__main__":
+    main()
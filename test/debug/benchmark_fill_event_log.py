@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+"""
+Measures the memory used by the fills of a long market making run in the event logger of a connector, when they are
+kept as OrderFilledEvent objects (as the event logger kept them in a deque) and in a FillEventLog (all in memory, and
+spilling the older chunks to disk), the time it takes to find the fills of an order, and to sum the traded amounts as
+ConnectorBase.order_filled_balances does.
+
+Usage: python test/debug/benchmark_fill_event_log.py
+"""
+
+import time
+import tracemalloc
+from collections import deque
+from decimal import Decimal
+from typing import Callable, Tuple
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.event.fill_event_log import FillEventLog
+
+FILLS = 200000
+
+
+def fill_event(i: int) -> OrderFilledEvent:
+    return OrderFilledEvent(
+        timestamp=1650000000 + i,
+        order_id=f"HBOTBPXCT{i // 2:08d}",
+        trading_pair="BTC-USDT",
+        trade_type=TradeType.BUY if i % 4 < 2 else TradeType.SELL,
+        order_type=OrderType.LIMIT,
+        price=Decimal("40000") + Decimal(i % 1000) / 10,
+        amount=Decimal("0.001") * (1 + i % 7),
+        trade_fee=DeductedFromReturnsTradeFee(flat_fees=[TokenAmount("USDT", Decimal("0.04") + Decimal(i % 13) / 100)]),
+        exchange_trade_id=str(800000000 + i),
+    )
+
+
+def measure(build: Callable[[], object]) -> Tuple[object, int]:
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def events_deque() -> deque:
+    return deque(fill_event(i) for i in range(FILLS))
+
+
+def fill_event_log(max_memory_chunks: int) -> Callable[[], FillEventLog]:
+    def build() -> FillEventLog:
+        fill_log = FillEventLog(max_memory_chunks=max_memory_chunks)
+        for i in range(FILLS):
+            fill_log.append(fill_event(i))
+        return fill_log
+    return build
+
+
+def timed(function: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+def traded_amounts_of_events(events: deque, after_timestamp: float):
+    totals = {}
+    for event in events:
+        if event.timestamp > after_timestamp:
+            amount, quote_amount = totals.get((event.trading_pair, event.trade_type), (0, 0))
+            totals[(event.trading_pair, event.trade_type)] = (amount + event.amount,
+                                                              quote_amount + event.price * event.amount)
+    return totals
+
+
+def main():
+    events, events_size = measure(events_deque)
+    memory_log, memory_log_size = measure(fill_event_log(FILLS))
+    spilling_log, spilling_log_size = measure(fill_event_log(4))
+    print(f"{FILLS} fills: events {events_size / 2 ** 20:7.1f} MiB, fill log {memory_log_size / 2 ** 20:7.1f} MiB, "
+          f"spilling fill log {spilling_log_size / 2 ** 20:7.1f} MiB ({spilling_log.spilled_fills} fills on disk)")
+
+    order_id = fill_event(FILLS // 3).order_id
+    print(f"fills of an order: events {timed(lambda: [e for e in events if e.order_id == order_id]) * 1e3:8.2f} ms, "
+          f"fill log {timed(lambda: list(memory_log.iter_events(order_id=order_id))) * 1e3:8.2f} ms, "
+          f"spilling fill log {timed(lambda: list(spilling_log.iter_events(order_id=order_id))) * 1e3:8.2f} ms")
+    print(f"event_log copy: events {timed(lambda: list(events)) * 1e3:8.1f} ms, "
+          f"iterating the fill log {timed(lambda: sum(1 for _ in memory_log)) * 1e3:8.1f} ms")
+    for after_timestamp in (0, fill_event(FILLS - 100).timestamp):
+        print(f"traded amounts after {after_timestamp}: "
+              f"events {timed(lambda: traded_amounts_of_events(events, after_timestamp)) * 1e3:8.2f} ms, "
+              f"spilling fill log {timed(lambda: spilling_log.traded_amounts(after_timestamp)) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+"""
+Measures the memory used by the fills of a long market making run when they are kept as OrderFilledEvent objects (as
+the event logs of the connectors keep them) and in the columns of a FillStore, and the time it takes to get the volume
+and the average price by side, from the Trade objects and from the fill store summary.
+
+Usage: python test/debug/benchmark_fill_store.py
+"""
+
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Callable, List, Tuple
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.fill_store import FillStore
+from hummingbot.core.data_type.trade import Trade
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.events import OrderFilledEvent
+
+FILLS = 200000
+
+
+def fill_event(i: int) -> OrderFilledEvent:
+    return OrderFilledEvent(
+        timestamp=1650000000 + i,
+        order_id=f"HBOTBPXCT{i:08d}",
+        trading_pair="BTC-USDT",
+        trade_type=TradeType.BUY if i % 2 == 0 else TradeType.SELL,
+        order_type=OrderType.LIMIT,
+        price=Decimal("40000") + Decimal(i % 1000) / 10,
+        amount=Decimal("0.001") * (1 + i % 7),
+        trade_fee=DeductedFromReturnsTradeFee(flat_fees=[TokenAmount("USDT", Decimal("0.04") + Decimal(i % 13) / 100)]),
+    )
+
+
+def measure(build: Callable[[], object]) -> Tuple[object, int]:
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def events_list() -> List[OrderFilledEvent]:
+    return [fill_event(i) for i in range(FILLS)]
+
+
+def fill_store() -> FillStore:
+    store = FillStore(max_fills=FILLS)
+    for i in range(FILLS):
+        store.add_order_filled_event("binance", fill_event(i))
+    return store
+
+
+def summary_from_trades(events: List[OrderFilledEvent]):
+    trades = [Trade(e.trading_pair, e.trade_type, e.price, e.amount, e.order_type, "binance", e.timestamp,
+                    e.trade_fee) for e in events]
+    summary = {}
+    for side in (TradeType.BUY, TradeType.SELL):
+        side_trades = [trade for trade in trades if trade.side == side]
+        volume = sum(trade.amount for trade in side_trades)
+        summary[side] = (volume, sum(trade.amount * trade.price for trade in side_trades) / volume)
+    return summary
+
+
+def main():
+    events, events_size = measure(events_list)
+    store, store_size = measure(fill_store)
+    print(f"{FILLS} fills: events {events_size / 2 ** 20:7.1f} MiB, fill store {store_size / 2 ** 20:7.1f} MiB")
+
+    started = time.perf_counter()
+    summary_from_trades(events)
+    trades_duration = time.perf_counter() - started
+    started = time.perf_counter()
+    store.summary()
+    store_duration = time.perf_counter() - started
+    print(f"volume and average price by side: trades {trades_duration * 1e3:8.1f} ms, "
+          f"fill store {store_duration * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+"""
+Times a pure market making parameter sweep over one hour of synthetic market data (a diff per second and a trade
+every few seconds) with an increasing number of worker processes. The market data is written to a recorder file and
+memory mapped, as a recorded session would be.
+
+Usage: python test/debug/benchmark_parameter_sweep.py
+"""
+
+import multiprocessing
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+
+from hummingbot.client.parameter_sweep import ParameterSweep
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder, load_market_data
+from hummingbot.core.data_type.market_data_replay import MarketDataEvents, MarketDataEventType as EventType
+from hummingbot.strategy.pure_market_making.pure_market_making_config_map import pure_market_making_config_map
+
+TRADING_PAIR = "ETH-USDT"
+DURATION = 3600
+LEVELS = 20
+PARAMETER_GRID = {
+    "bid_spread": [Decimal("0.05"), Decimal("0.1"), Decimal("0.2"), Decimal("0.5")],
+    "ask_spread": [Decimal("0.05"), Decimal("0.1"), Decimal("0.2"), Decimal("0.5")],
+    "order_levels": [1, 2],
+}
+
+
+def synthetic_market_data(directory: Path) -> Path:
+    random = np.random.default_rng(42)
+    mid_prices = 1000 + np.cumsum(random.normal(0, 0.3, DURATION))
+    start = time.time()
+    rows = []
+    for level in range(LEVELS):
+        rows.append((start, 1, EventType.SNAPSHOT_BID, mid_prices[0] - 0.5 - level * 0.1, 5.0))
+        rows.append((start, 1, EventType.SNAPSHOT_ASK, mid_prices[0] + 0.5 + level * 0.1, 5.0))
+    for second in range(1, DURATION):
+        mid_price = round(mid_prices[second], 1)
+        for level in range(LEVELS):
+            rows.append((start + second, second + 1, EventType.DIFF_BID, mid_price - 0.5 - level * 0.1, 5.0))
+            rows.append((start + second, second + 1, EventType.DIFF_ASK, mid_price + 0.5 + level * 0.1, 5.0))
+        if second % 3 == 0:
+            trade_type = EventType.TRADE_BUY if random.random() < 0.5 else EventType.TRADE_SELL
+            trade_price = mid_price + (1.5 if trade_type == EventType.TRADE_BUY else -1.5)
+            rows.append((start + second, 0, trade_type, trade_price, float(random.uniform(0.1, 2))))
+
+    recorder = MarketDataRecorder(directory)
+    recorder.record_events(TRADING_PAIR, MarketDataEvents.from_rows(rows))
+    recorder.stop()
+    return recorder.files[0]
+
+
+def main():
+    for key, config_var in pure_market_making_config_map.items():
+        config_var.value = config_var.default
+    pure_market_making_config_map.get("exchange").value = "binance"
+    pure_market_making_config_map.get("market").value = TRADING_PAIR
+    pure_market_making_config_map.get("order_amount").value = Decimal("0.5")
+    pure_market_making_config_map.get("order_refresh_time").value = 10.
+    pure_market_making_config_map.get("take_if_crossed").value = False
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = synthetic_market_data(Path(directory))
+        market_data = load_market_data([path])
+        print(f"{len(market_data[TRADING_PAIR])} market data events, {path.stat().st_size / 1e6:.1f} MB")
+        sweep = ParameterSweep("pure_market_making",
+                               pure_market_making_config_map,
+                               PARAMETER_GRID,
+                               market_data,
+                               {"ETH": Decimal(10), "USDT": Decimal(10000)})
+        runs = len(sweep.combinations)
+        baseline = None
+        processes = 1
+        while processes <= multiprocessing.cpu_count():
+            started = time.perf_counter()
+            results = sweep.run(processes)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(f"{processes:3d} processes: {runs} runs in {elapsed:7.2f} s, {runs / elapsed:6.2f} runs/s, "
+                  f"speedup {baseline / elapsed:5.2f}x, failed runs {results['error'].notna().sum()}")
+            processes *= 2
+        print(results.sort_values("return_pct", ascending=False)[
+            list(PARAMETER_GRID.keys()) + ["num_trades", "total_pnl", "return_pct"]].head().to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+"""
+Times the PureMarketMakingStrategy proposal modifiers on a 25 level per side ladder: the PriceSize loops of the
+Decimal pipeline (inventory skew, transaction costs, budget constraint, taker filter) against the ArrayProposal
+column operations, both quantizing through a MockPaperExchange.
+
+Usage: python test/debug/benchmark_pmm_array_proposal_pipeline.py
+"""
+
+import timeit
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.strategy.pure_market_making.array_proposal import build_level_proposal
+from hummingbot.strategy.pure_market_making.data_types import Proposal
+from hummingbot.strategy.pure_market_making.fixed_point import TickLotScale
+
+LEVELS = 25
+CYCLES = 1000
+
+trading_pair = "BTC-USDT"
+reference_price = Decimal("27123.455")
+spread = Decimal("0.001")
+order_level_spread = Decimal("0.0002")
+order_amount = Decimal("0.05")
+order_level_amount = Decimal("0.01")
+bid_ratio = Decimal(0.8)
+ask_ratio = Decimal(1.2)
+fee_percent = Decimal("0.001")
+base_balance = Decimal("5")
+quote_balance = Decimal("50000")
+top_bid = Decimal("27100")
+top_ask = Decimal("27150")
+
+market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+market.set_quantization_param(QuantizationParams(trading_pair, 7, 2, 6, 3))
+scale = TickLotScale(market.get_order_price_quantum(trading_pair, reference_price),
+                     market.get_order_size_quantum(trading_pair, order_amount))
+
+
+def base_proposal() -> Proposal:
+    return build_level_proposal(scale, reference_price, reference_price, spread, spread, order_level_spread,
+                                order_amount, order_level_amount, LEVELS, LEVELS).to_proposal()
+
+
+def decimal_pipeline():
+    proposal = base_proposal()
+    for buy in proposal.buys:
+        buy.price = market.quantize_order_price(trading_pair, buy.price * (Decimal(1) - fee_percent))
+    for sell in proposal.sells:
+        sell.price = market.quantize_order_price(trading_pair, sell.price * (Decimal(1) + fee_percent))
+    for buy in proposal.buys:
+        buy.size = market.quantize_order_amount(trading_pair, buy.size * bid_ratio)
+    for sell in proposal.sells:
+        sell.size = market.quantize_order_amount(trading_pair, sell.size * ask_ratio)
+    remaining_quote = quote_balance
+    for buy in proposal.buys:
+        quote_size = buy.size * buy.price * (Decimal(1) + fee_percent)
+        if remaining_quote < quote_size:
+            buy.size = market.quantize_order_amount(
+                trading_pair, remaining_quote / (buy.price * (Decimal("1") + fee_percent)))
+            remaining_quote = Decimal(0)
+        elif remaining_quote == Decimal(0):
+            buy.size = Decimal(0)
+        else:
+            remaining_quote -= quote_size
+    proposal.buys = [o for o in proposal.buys if o.size > 0]
+    remaining_base = base_balance
+    for sell in proposal.sells:
+        if remaining_base < sell.size:
+            sell.size = market.quantize_order_amount(trading_pair, remaining_base)
+            remaining_base = Decimal(0)
+        elif remaining_base == Decimal(0):
+            sell.size = Decimal(0)
+        else:
+            remaining_base -= sell.size
+    proposal.sells = [o for o in proposal.sells if o.size > 0]
+    proposal.buys = [buy for buy in proposal.buys if buy.price < top_ask]
+    proposal.sells = [sell for sell in proposal.sells if sell.price > top_bid]
+    return proposal
+
+
+def array_pipeline():
+    proposal = build_level_proposal(scale, reference_price, reference_price, spread, spread, order_level_spread,
+                                    order_amount, order_level_amount, LEVELS, LEVELS)
+    proposal.scale_prices(True, [Decimal(1) - fee_percent] * LEVELS)
+    proposal.scale_prices(False, [Decimal(1) + fee_percent] * LEVELS)
+    proposal.scale_sizes(True, bid_ratio)
+    proposal.scale_sizes(False, ask_ratio)
+    proposal.apply_budget(base_balance, quote_balance, fee_percent)
+    proposal.filter_takers(top_bid, top_ask)
+    return proposal.to_proposal()
+
+
+def main():
+    expected = decimal_pipeline()
+    actual = array_pipeline()
+    assert [(o.price, o.size) for o in expected.buys] == [(o.price, o.size) for o in actual.buys]
+    assert [(o.price, o.size) for o in expected.sells] == [(o.price, o.size) for o in actual.sells]
+
+    base_time = timeit.timeit(base_proposal, number=CYCLES) / CYCLES
+    decimal_time = timeit.timeit(decimal_pipeline, number=CYCLES) / CYCLES - base_time
+    array_time = timeit.timeit(array_pipeline, number=CYCLES) / CYCLES
+    print(f"{LEVELS} levels per side, {CYCLES} cycles")
+    print(f"  PriceSize loops (modifiers only):          {decimal_time * 1e6:10.1f} us/cycle")
+    print(f"  ArrayProposal (with build and to_proposal): {array_time * 1e6:10.1f} us/cycle "
+          f"({decimal_time / array_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+"""
+Compares a 50 level proposal cycle built with per level Decimal math and connector quantization (as in
+PureMarketMakingStrategy.c_create_base_proposal before the fixed point path) against the fixed point builder.
+
+Usage: python test/debug/benchmark_pmm_fixed_point_proposal.py
+"""
+
+import timeit
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.strategy.pure_market_making.array_proposal import build_level_proposal
+from hummingbot.strategy.pure_market_making.data_types import PriceSize, Proposal
+from hummingbot.strategy.pure_market_making.fixed_point import TickLotScale
+
+LEVELS = 50
+CYCLES = 2000
+
+trading_pair = "BTC-USDT"
+reference_price = Decimal("27123.455")
+bid_spread = ask_spread = Decimal("0.001")
+order_level_spread = Decimal("0.0002")
+order_amount = Decimal("0.05")
+order_level_amount = Decimal("0.01")
+
+market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+market.set_quantization_param(QuantizationParams(trading_pair, 7, 2, 6, 3))
+
+
+def decimal_cycle() -> Proposal:
+    buys = []
+    sells = []
+    for level in range(0, LEVELS):
+        price = reference_price * (Decimal("1") - bid_spread - (level * order_level_spread))
+        price = market.quantize_order_price(trading_pair, price)
+        size = market.quantize_order_amount(trading_pair, order_amount + (order_level_amount * level))
+        if size > 0:
+            buys.append(PriceSize(price, size))
+    for level in range(0, LEVELS):
+        price = reference_price * (Decimal("1") + ask_spread + (level * order_level_spread))
+        price = market.quantize_order_price(trading_pair, price)
+        size = market.quantize_order_amount(trading_pair, order_amount + (order_level_amount * level))
+        if size > 0:
+            sells.append(PriceSize(price, size))
+    return Proposal(buys, sells)
+
+
+def fixed_point_cycle() -> Proposal:
+    # The strategy checks the quanta at the reference price and at the outer levels
+    lowest_price = reference_price * (Decimal("1") - bid_spread - ((LEVELS - 1) * order_level_spread))
+    highest_price = reference_price * (Decimal("1") + ask_spread + ((LEVELS - 1) * order_level_spread))
+    price_quanta = {market.get_order_price_quantum(trading_pair, price)
+                    for price in (reference_price, lowest_price, highest_price)}
+    largest_size = order_amount + (order_level_amount * (LEVELS - 1))
+    size_quanta = {market.get_order_size_quantum(trading_pair, size) for size in (order_amount, largest_size)}
+    assert len(price_quanta) == 1 and len(size_quanta) == 1
+    scale = TickLotScale(price_quanta.pop(), size_quanta.pop())
+    return build_level_proposal(scale, reference_price, reference_price, bid_spread, ask_spread, order_level_spread,
+                                order_amount, order_level_amount, LEVELS, LEVELS).to_proposal()
+
+
+def main():
+    expected = decimal_cycle()
+    actual = fixed_point_cycle()
+    assert [(o.price, o.size) for o in expected.buys] == [(o.price, o.size) for o in actual.buys]
+    assert [(o.price, o.size) for o in expected.sells] == [(o.price, o.size) for o in actual.sells]
+
+    decimal_time = timeit.timeit(decimal_cycle, number=CYCLES) / CYCLES
+    fixed_point_time = timeit.timeit(fixed_point_cycle, number=CYCLES) / CYCLES
+    print(f"{LEVELS} levels per side, {CYCLES} cycles")
+    print(f"  Decimal:     {decimal_time * 1e6:10.1f} us/cycle")
+    print(f"  Fixed point: {fixed_point_time * 1e6:10.1f} us/cycle ({decimal_time / fixed_point_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
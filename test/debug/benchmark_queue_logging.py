@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+"""
+Times the log calls of the event loop thread when the handlers write the records right away and when they write them
+on the log dispatcher thread (the queue section of the logging config), with a file handler and a stream handler
+formatting the records as the hummingbot logging config does.
+
+Usage: python test/debug/benchmark_queue_logging.py
+"""
+
+import logging
+import os
+import tempfile
+import time
+from statistics import median
+from typing import List
+
+from hummingbot.logger.queue_log_handler import QueueOverflowPolicy, install_queue_logging, uninstall_queue_logging
+
+RECORDS = 20000
+RUNS = 5
+FORMAT = "%(asctime)s - %(process)d - %(name)s - %(levelname)s - %(message)s"
+
+
+def configure_logger(directory: str, run: int) -> logging.Logger:
+    formatter = logging.Formatter(FORMAT)
+    file_handler = logging.FileHandler(os.path.join(directory, f"benchmark_{run}.log"))
+    stream_handler = logging.StreamHandler(open(os.devnull, "w"))
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    logger = logging.getLogger(f"benchmark.queue_logging.{run}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers = [file_handler, stream_handler]
+    return logger
+
+
+def close_logger(logger: logging.Logger):
+    for handler in logger.handlers:
+        handler.close()
+        if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
+            handler.stream.close()
+    logger.handlers = []
+
+
+def log_records(logger: logging.Logger) -> float:
+    started = time.perf_counter()
+    for i in range(RECORDS):
+        logger.info("Created LIMIT BUY order OID%d for %s %s at %s.", i, "1.5", "BTC-USDT", "25000.01")
+    return (time.perf_counter() - started) / RECORDS
+
+
+def run(label: str, queue_policy: QueueOverflowPolicy = None, max_size: int = 100000):
+    durations: List[float] = []
+    written: List[float] = []
+    dropped: List[int] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(RUNS):
+            logger = configure_logger(directory, i)
+            dispatcher = None
+            if queue_policy is not None:
+                dispatcher = install_queue_logging(max_size=max_size, overflow_policy=queue_policy)
+            started = time.perf_counter()
+            durations.append(log_records(logger))
+            if dispatcher is not None:
+                uninstall_queue_logging()
+                dropped.append(dispatcher.dropped_count)
+            written.append(time.perf_counter() - started)
+            close_logger(logger)
+    print(f"{label:>28}: {median(durations) * 1e6:6.2f} us per log call on the caller thread, "
+          f"{median(written) * 1e3:7.1f} ms until written, "
+          f"{median(dropped) if dropped else 0:6.0f} records dropped")
+
+
+def main():
+    run("synchronous handlers")
+    run("queue")
+    run("queue, 1000 records, oldest", QueueOverflowPolicy.drop_oldest, 1000)
+    run("queue, 1000 records, sample", QueueOverflowPolicy.sample, 1000)
+
+
+if __name__ == "__main__":
+    main()
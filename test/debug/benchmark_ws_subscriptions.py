@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+"""
+Compares subscribing to the trade and depth channels of 200 trading pairs with one WSJSONRequest per channel sent
+through WSAssistant.send, and in batched pre-serialized frames through a WSSubscriptionManager. The connection
+serializes the frames as aiohttp does, without sending them.
+
+Usage: python test/debug/benchmark_ws_subscriptions.py
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, List, Mapping
+
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_subscriptions import WSSubscriptionFormatBase, WSSubscriptionManager
+
+PAIRS = 200
+ROUNDS = 50
+
+
+class CountingConnection(WSConnection):
+    def __init__(self):
+        super().__init__(aiohttp_client_session=None)
+        self._connected = True
+        self.frames = 0
+
+    async def _send_json(self, payload: Mapping[str, Any]):
+        json.dumps(payload)
+        self.frames += 1
+
+    async def _send_plain_text(self, payload: str):
+        self.frames += 1
+
+
+class SubscriptionFormat(WSSubscriptionFormatBase):
+    max_channels_per_frame = 200
+
+    def subscription_payload(self, channels: List[str], request_id: int) -> Any:
+        return {"method": "SUBSCRIBE", "params": channels, "id": request_id}
+
+
+def channels() -> List[str]:
+    return [f"pair{i}usdt@{stream}" for i in range(PAIRS) for stream in ("trade", "depth@100ms")]
+
+
+async def per_channel_requests() -> int:
+    connection = CountingConnection()
+    ws_assistant = WSAssistant(connection)
+    for request_id, channel in enumerate(channels()):
+        await ws_assistant.send(WSJSONRequest(payload={"method": "SUBSCRIBE", "params": [channel], "id": request_id}))
+    return connection.frames
+
+
+async def batched_frames() -> int:
+    connection = CountingConnection()
+    ws_assistant = WSAssistant(connection, subscription_manager=WSSubscriptionManager(SubscriptionFormat()))
+    await ws_assistant.subscribe_channels(channels())
+    return connection.frames
+
+
+def timed(coroutine_function) -> float:
+    loop = asyncio.new_event_loop()
+    frames = loop.run_until_complete(coroutine_function())
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        loop.run_until_complete(coroutine_function())
+    duration = (time.perf_counter() - started) / ROUNDS
+    loop.close()
+    print(f"{coroutine_function.__name__:22s} {frames:4d} frames {duration * 1e3:8.2f} ms")
+    return duration
+
+
+def main():
+    timed(per_channel_requests)
+    timed(batched_frames)
+
+
+if __name__ == "__main__":
+    main()
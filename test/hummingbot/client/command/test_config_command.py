@@ -85,6 +85,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | gateway                  |                      |\n"
                            "    | ∟ gateway_api_host       | localhost            |\n"
                            "    | ∟ gateway_api_port       | 15888                |\n"
+                           "    | ∟ gateway_quote_cache_ttl | 1.0                  |\n"
                            "    | rate_oracle_source       | binance              |\n"
                            "    | global_token             |                      |\n"
                            "    | ∟ global_token_name      | USD                  |\n"
@@ -95,6 +96,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ other_commands_timeout | 30                   |\n"
                            "    | tables_format            | psql                 |\n"
                            "    | tick_size                | 1.0                  |\n"
+                           "    | tick_overrun_policy      | skip                 |\n"
                            "    +--------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
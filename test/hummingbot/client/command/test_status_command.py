@@ -1,5 +1,7 @@
 import asyncio
+import tempfile
 import unittest
+from pathlib import Path
 from test.mock.mock_cli import CLIMockingAssistant
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
@@ -7,6 +9,9 @@ from unittest.mock import MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode, TickOverrunPolicy
+from hummingbot.core.utils.tick_profiler import TickProfiler
 
 
 class StatusCommandTest(unittest.TestCase):
@@ -74,3 +79,69 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_status_profile_starts_reports_and_stops_the_profiler(self):
+        profiler = TickProfiler.get_instance()
+        with tempfile.TemporaryDirectory() as directory:
+            self.client_config_map.log_file_path = Path(directory)
+
+            self.app.status(profile="show")
+            self.assertTrue(profiler.enabled)
+            self.assertEqual(Path(directory) / "tick_profile.json", profiler.export_path)
+            self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+                msg=f"Tick profiler started, the timings are written to {profiler.export_path} every 60 seconds.\n"
+                    f"Run `status --profile` again to see them, and `status --profile stop` to stop profiling."))
+
+            profiler.record("PureMarketMakingStrategy", "create_base_proposal", 12_000)
+            self.app.status(profile="show")
+            report = self.app.format_tick_profile(profiler)
+            self.assertIn("create_base_proposal", report)
+            self.assertTrue(self.cli_mock_assistant.check_log_called_with(msg=report))
+
+            self.app.status(profile="stop")
+
+            self.assertFalse(profiler.enabled)
+            self.assertTrue(self.cli_mock_assistant.check_log_called_with(msg="Tick profiler stopped."))
+            self.assertTrue((Path(directory) / "tick_profile.json").exists())
+
+    def test_format_clock_status_reports_overruns(self):
+        self.assertEqual("", self.app.format_clock_status())
+
+        self.app.clock = Clock(ClockMode.REALTIME, tick_size=1.0, overrun_policy=TickOverrunPolicy.COALESCE)
+        self.assertEqual("", self.app.format_clock_status())
+
+        self.app.clock.overrun_stats.record_tick(lag=0.002, duration=0.5, missed_ticks=0)
+        self.app.clock.overrun_stats.record_tick(lag=0.004, duration=2.25, missed_ticks=2)
+        self.assertEqual("\n\n  Clock (coalesce on overrun): 1 of 2 ticks overran, 2 ticks missed, 0 strategy ticks "
+                         "deferred, max lag 0.004s, max tick duration 2.250s",
+                         self.app.format_clock_status())
+
+    def test_live_status_redraws_changed_status_and_restores_the_output(self):
+        # The status is logged to the output field, not to the mocked log
+        self.cli_mock_assistant.stop()
+        output_field = self.app.app.output_field
+        self.app.app.log("Previous output")
+        previous_text = output_field.buffer.text
+        statuses = ["Status 1", "Status 1", "Status 2", "Status 2"]
+        displayed_texts = []
+
+        async def strategy_status(live: bool = False):
+            displayed_texts.append(output_field.buffer.text)
+            if len(statuses) == 1:
+                self.app.app.live_updates = False
+            return statuses.pop(0)
+
+        self.app.strategy = MagicMock()
+        with patch.object(self.app, "strategy_status", side_effect=strategy_status), \
+                patch.object(self.app.app, "log", wraps=self.app.app.log) as log_mock:
+            self.async_run_with_timeout(self.app.status_check_all(live=True), timeout=2)
+
+        status_logs = [call.args[0] for call in log_mock.call_args_list if call.kwargs.get("save_log") is False]
+        self.assertEqual(2, len(status_logs))
+        self.assertTrue(status_logs[0].startswith("Status 1"))
+        self.assertTrue(status_logs[1].startswith("Status 2"))
+        self.assertEqual(previous_text, displayed_texts[0])
+        self.assertTrue(displayed_texts[2].startswith("Status 1"))
+        self.assertTrue(displayed_texts[3].startswith("Status 2"))
+        self.assertEqual(previous_text + "\nStopped live status display update.", output_field.buffer.text)
+        self.cli_mock_assistant.start()
@@ -0,0 +1,153 @@
+import unittest
+from decimal import Decimal
+from test.hummingbot.strategy import assign_config_default
+
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.parameter_sweep import METRICS_COLUMNS, ParameterSweep
+from hummingbot.core.data_type.market_data_replay import MarketDataEvents, MarketDataEventType as EventType
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
+    AvellanedaMarketMakingConfigMap,
+    InfiniteModel,
+    MultiOrderLevelModel,
+)
+from hummingbot.strategy.pure_market_making.pure_market_making_config_map import pure_market_making_config_map
+
+
+class ParameterSweepTest(unittest.TestCase):
+    start_timestamp: float = 1640000000.0
+    trading_pair: str = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        start = cls.start_timestamp
+        rows = [
+            (start, 1, EventType.SNAPSHOT_BID, 99.9, 10.0),
+            (start, 1, EventType.SNAPSHOT_ASK, 100.1, 10.0),
+        ]
+        # Trades 1% away from the mid price on both sides, they fill the orders placed closer than that
+        for i in range(1, 10):
+            rows.append((start + i * 20, 0, EventType.TRADE_SELL, 99.0, 1.0))
+            rows.append((start + i * 20 + 10, 0, EventType.TRADE_BUY, 101.0, 1.0))
+        cls.market_data = {cls.trading_pair: MarketDataEvents.from_rows(rows)}
+        cls.initial_balances = {"COINALPHA": Decimal(100), "HBOT": Decimal(10000)}
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.config_map = pure_market_making_config_map
+        assign_config_default(self.config_map)
+        self.config_map.get("exchange").value = "binance"
+        self.config_map.get("market").value = self.trading_pair
+        self.config_map.get("order_amount").value = Decimal("1")
+        self.config_map.get("bid_spread").value = Decimal("1")
+        self.config_map.get("ask_spread").value = Decimal("1")
+        self.config_map.get("order_refresh_time").value = 60.
+        self.config_map.get("take_if_crossed").value = False
+
+    def test_combinations_and_shards(self):
+        sweep = ParameterSweep("pure_market_making",
+                               self.config_map,
+                               {"bid_spread": [Decimal("0.5"), Decimal("2")], "order_levels": [1, 2, 3]},
+                               self.market_data,
+                               self.initial_balances)
+
+        self.assertEqual(6, len(sweep.combinations))
+        self.assertEqual({"bid_spread": Decimal("0.5"), "order_levels": 1}, sweep.combinations[0])
+        self.assertEqual({"bid_spread": Decimal("2"), "order_levels": 3}, sweep.combinations[-1])
+        shards = sweep.shards(processes=2)
+        self.assertEqual(list(range(6)), [run_id for shard in shards for run_id, _ in shard])
+        self.assertTrue(all(len(shard) == 1 for shard in shards))
+
+    def test_pure_market_making_sweep(self):
+        sweep = ParameterSweep("pure_market_making",
+                               self.config_map,
+                               {"bid_spread": [Decimal("0.5"), Decimal("2")], "ask_spread": [Decimal("0.5"), 2]},
+                               self.market_data,
+                               self.initial_balances)
+
+        results = sweep.run(processes=2)
+
+        self.assertEqual([0, 1, 2, 3], results.index.tolist())
+        self.assertEqual(["bid_spread", "ask_spread"] + METRICS_COLUMNS + ["error", "duration"],
+                         results.columns.tolist())
+        self.assertTrue(results["error"].isna().all())
+        # Only the orders 0.5% away from the mid price are filled by the recorded trades
+        self.assertEqual([6.0, 3.0, 3.0, 0.0], results["num_trades"].tolist())
+        self.assertEqual([3.0, 3.0, 0.0, 0.0], results["num_buys"].tolist())
+        self.assertEqual([3.0, 0.0, 3.0, 0.0], results["num_sells"].tolist())
+        self.assertGreater(results.loc[0, "total_pnl"], 0)
+        # The sweep runs in the workers, the config map of the parent process is untouched
+        self.assertEqual(Decimal("1"), self.config_map.get("bid_spread").value)
+
+    def test_single_run_restores_the_config_map_and_the_rate_source(self):
+        sweep = ParameterSweep("pure_market_making",
+                               self.config_map,
+                               {"bid_spread": [Decimal("0.5")]},
+                               self.market_data,
+                               self.initial_balances)
+        rate_source = RateOracle.get_instance().source
+
+        row = sweep.run_single({"bid_spread": Decimal("0.5")})
+
+        self.assertIsNone(row["error"])
+        self.assertEqual(3.0, row["num_buys"])
+        self.assertEqual(Decimal("1"), self.config_map.get("bid_spread").value)
+        self.assertIs(rate_source, RateOracle.get_instance().source)
+
+    def test_invalid_parameters_are_reported(self):
+        sweep = ParameterSweep("pure_market_making",
+                               self.config_map,
+                               {"bid_spread": [Decimal("-1")]},
+                               self.market_data,
+                               self.initial_balances)
+
+        main_application = HummingbotApplication._main_app
+        row = sweep.run_single({"bid_spread": Decimal("-1")})
+
+        self.assertEqual("Invalid value -1 for bid_spread", row["error"][:len("Invalid value -1 for bid_spread")])
+        self.assertIs(main_application, HummingbotApplication._main_app)
+        self.assertEqual(Decimal("1"), self.config_map.get("bid_spread").value)
+
+    def test_missing_market_data_is_reported(self):
+        self.config_map.get("market").value = "ETH-USDT"
+        sweep = ParameterSweep("pure_market_making", self.config_map, {}, self.market_data, self.initial_balances)
+
+        row = sweep.run_single({})
+
+        self.assertIn("could not be created", row["error"])
+        self.assertIn("No recorded market data for ETH-USDT.", row["error"])
+
+    def test_avellaneda_market_making_parameters_are_set_on_a_config_copy(self):
+        config_map = ClientConfigAdapter(AvellanedaMarketMakingConfigMap(
+            exchange="binance",
+            market=self.trading_pair,
+            execution_timeframe_mode=InfiniteModel(),
+            order_amount=1,
+            order_refresh_time=60,
+            order_levels_mode=MultiOrderLevelModel(order_levels=2, level_distances=1),
+            risk_factor=1,
+            order_amount_shape_factor=0,
+        ))
+        sweep = ParameterSweep("avellaneda_market_making",
+                               config_map,
+                               {"risk_factor": [0.5], "order_levels_mode.order_levels": [3]},
+                               self.market_data,
+                               self.initial_balances)
+
+        application_config_maps = []
+        original_config_map_with = sweep._config_map_with
+
+        def config_map_with(parameters):
+            application_config_maps.append(original_config_map_with(parameters))
+            return application_config_maps[-1]
+
+        sweep._config_map_with = config_map_with
+        row = sweep.run_single(sweep.combinations[0])
+
+        self.assertIsNone(row["error"])
+        self.assertEqual(Decimal("0.5"), application_config_maps[0].risk_factor)
+        self.assertEqual(3, application_config_maps[0].order_levels_mode.order_levels)
+        self.assertEqual(Decimal("1"), config_map.risk_factor)
+        self.assertEqual(2, config_map.order_levels_mode.order_levels)
@@ -1,8 +1,19 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import (
+    AllConnectorSettings,
+    ConnectorConfigKeysReference,
+    ConnectorSetting,
+    ConnectorType,
+    ManifestConnectorSetting,
+)
+from hummingbot.connector.exchange.binance import binance_utils
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -36,3 +47,75 @@ class SettingsTest(unittest.TestCase):
         self.assertEqual(api_key, connector.api_key)
         self.assertNotIsInstance(connector.secret_key, SecretStr)
         self.assertEqual(api_secret, connector.secret_key)
+
+
+class ConnectorManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = Path(self.temp_dir.name) / "connector_manifest.json"
+        manifest_path_patch = patch("hummingbot.client.settings.CONNECTOR_MANIFEST_PATH", self.manifest_path)
+        manifest_path_patch.start()
+        self.addCleanup(manifest_path_patch.stop)
+        gateway_connections_patch = patch("hummingbot.client.settings.GatewayConnectionSetting.load", return_value=[])
+        gateway_connections_patch.start()
+        self.addCleanup(gateway_connections_patch.stop)
+        self.all_connector_settings = AllConnectorSettings.all_connector_settings
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.all_connector_settings = self.all_connector_settings
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_connector_settings_are_read_from_the_manifest(self):
+        scanned_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertTrue(self.manifest_path.exists())
+        self.assertIsInstance(scanned_settings["binance"], ConnectorSetting)
+        self.assertNotIsInstance(scanned_settings["binance"], ManifestConnectorSetting)
+
+        with patch("hummingbot.client.settings.importlib.import_module") as import_module_mock:
+            manifest_settings = AllConnectorSettings.create_connector_settings()
+            AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+            paper_trade_settings = manifest_settings["binance_paper_trade"]
+            import_module_mock.assert_not_called()
+
+        self.assertEqual(set(scanned_settings), set(manifest_settings) - {"binance_paper_trade"})
+        for name, scanned_setting in scanned_settings.items():
+            manifest_setting = manifest_settings[name]
+            self.assertIsInstance(manifest_setting, ManifestConnectorSetting)
+            for field in ConnectorSetting._fields:
+                if field != "config_keys":
+                    self.assertEqual(getattr(scanned_setting, field), getattr(manifest_setting, field))
+        self.assertEqual(ConnectorConfigKeysReference(binance_utils.__name__, "KEYS"),
+                         manifest_settings["binance"]._asdict()["config_keys"])
+        self.assertIs(binance_utils.KEYS, manifest_settings["binance"].config_keys)
+        self.assertIs(binance_utils.OTHER_DOMAINS_KEYS["binance_us"], manifest_settings["binance_us"].config_keys)
+        self.assertIs(binance_utils.KEYS, paper_trade_settings.config_keys)
+        self.assertEqual("binance", paper_trade_settings.parent_name)
+
+    def test_connector_settings_update_replaces_the_manifest_setting(self):
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.create_connector_settings()
+        config_keys = BinanceConfigMap(binance_api_key="someKey", binance_api_secret="someSecret")
+
+        AllConnectorSettings.update_connector_config_keys(config_keys)
+
+        self.assertIs(config_keys, AllConnectorSettings.get_connector_config_keys("binance"))
+
+    def test_outdated_manifest_is_rebuilt(self):
+        AllConnectorSettings.create_connector_settings()
+        manifest = json.loads(self.manifest_path.read_text())
+        manifest["fingerprint"] = "outdated"
+        manifest["connectors"] = manifest["connectors"][:1]
+        self.manifest_path.write_text(json.dumps(manifest))
+
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertNotIsInstance(settings["binance"], ManifestConnectorSetting)
+        self.assertEqual(len(settings), len(json.loads(self.manifest_path.read_text())["connectors"]))
+
+        with patch("hummingbot.client.settings.AllConnectorSettings._connectors_fingerprint", return_value="changed"):
+            settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertNotIsInstance(settings["binance"], ManifestConnectorSetting)
@@ -175,46 +175,58 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
     def test_listen_for_subscriptions_subscribes_to_trades_and_order_diffs(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
 
-        result_subscribe_trades = {
+        result_subscribe = {
             "result": None,
             "id": 1
         }
-        result_subscribe_diffs = {
-            "result": None,
-            "id": 2
-        }
 
         self.mocking_assistant.add_websocket_aiohttp_message(
             websocket_mock=ws_connect_mock.return_value,
-            message=json.dumps(result_subscribe_trades))
-        self.mocking_assistant.add_websocket_aiohttp_message(
-            websocket_mock=ws_connect_mock.return_value,
-            message=json.dumps(result_subscribe_diffs))
+            message=json.dumps(result_subscribe))
 
         self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
 
         self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
 
-        sent_subscription_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+        sent_subscription_messages = self.mocking_assistant.text_messages_sent_through_websocket(
             websocket_mock=ws_connect_mock.return_value)
 
-        self.assertEqual(2, len(sent_subscription_messages))
-        expected_trade_subscription = {
+        self.assertEqual(1, len(sent_subscription_messages))
+        expected_subscription = {
             "method": "SUBSCRIBE",
-            "params": [f"{self.ex_trading_pair.lower()}@trade"],
+            "params": [f"{self.ex_trading_pair.lower()}@trade", f"{self.ex_trading_pair.lower()}@depth@100ms"],
             "id": 1}
-        self.assertEqual(expected_trade_subscription, sent_subscription_messages[0])
-        expected_diff_subscription = {
-            "method": "SUBSCRIBE",
-            "params": [f"{self.ex_trading_pair.lower()}@depth@100ms"],
-            "id": 2}
-        self.assertEqual(expected_diff_subscription, sent_subscription_messages[1])
+        self.assertEqual(expected_subscription, json.loads(sent_subscription_messages[0]))
 
         self.assertTrue(self._is_logged(
             "INFO",
             "Subscribed to public order book and trade channels..."
         ))
 
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_tracks_the_subscription_acknowledgement(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        ws_assistants = []
+        original_connected_websocket_assistant = self.data_source._connected_websocket_assistant
+
+        async def connected_websocket_assistant():
+            ws_assistants.append(await original_connected_websocket_assistant())
+            return ws_assistants[-1]
+
+        self.data_source._connected_websocket_assistant = connected_websocket_assistant
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"code": 2, "msg": "Invalid request", "id": 1}))
+
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        subscription_manager = ws_assistants[0].subscription_manager
+        self.assertFalse(subscription_manager.is_fully_subscribed)
+        self.assertEqual([f"{self.ex_trading_pair.lower()}@trade", f"{self.ex_trading_pair.lower()}@depth@100ms"],
+                         subscription_manager.missing_channels)
+
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     @patch("aiohttp.ClientSession.ws_connect")
     def test_listen_for_subscriptions_raises_cancel_exception(self, mock_ws, _: AsyncMock):
@@ -241,7 +253,7 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
 
     def test_subscribe_channels_raises_cancel_exception(self):
         mock_ws = MagicMock()
-        mock_ws.send.side_effect = asyncio.CancelledError
+        mock_ws.subscribe_channels = AsyncMock(side_effect=asyncio.CancelledError)
 
         with self.assertRaises(asyncio.CancelledError):
             self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels(mock_ws))
@@ -249,7 +261,7 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
 
     def test_subscribe_channels_raises_exception_and_logs_error(self):
         mock_ws = MagicMock()
-        mock_ws.send.side_effect = Exception("Test Error")
+        mock_ws.subscribe_channels = AsyncMock(side_effect=Exception("Test Error"))
 
         with self.assertRaises(Exception):
             self.listening_task = self.ev_loop.create_task(self.data_source._subscribe_channels(mock_ws))
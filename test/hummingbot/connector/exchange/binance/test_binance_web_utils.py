@@ -2,6 +2,7 @@ import unittest
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.exchange.binance import binance_web_utils as web_utils
+from hummingbot.core.web_assistant.ws_subscriptions import WSSubscriptionAck
 
 
 class BinanceUtilTestCases(unittest.TestCase):
@@ -17,3 +18,19 @@ class BinanceUtilTestCases(unittest.TestCase):
         domain = "com"
         expected_url = CONSTANTS.REST_URL.format(domain) + CONSTANTS.PRIVATE_API_VERSION + path_url
         self.assertEqual(expected_url, web_utils.private_rest_url(path_url, domain))
+
+    def test_ws_subscription_format_batches_the_streams_in_one_frame(self):
+        subscription_format = web_utils.BinanceWSSubscriptionFormat()
+
+        self.assertEqual(CONSTANTS.WS_MAX_STREAMS_PER_CONNECTION, subscription_format.max_channels_per_frame)
+        self.assertEqual({"method": "SUBSCRIBE", "params": ["btcusdt@trade", "btcusdt@depth@100ms"], "id": 3},
+                         subscription_format.subscription_payload(["btcusdt@trade", "btcusdt@depth@100ms"], 3))
+
+    def test_ws_subscription_format_acknowledgements(self):
+        subscription_format = web_utils.BinanceWSSubscriptionFormat()
+
+        self.assertEqual(WSSubscriptionAck(request_id=1, success=True),
+                         subscription_format.acknowledgement({"result": None, "id": 1}))
+        self.assertEqual(WSSubscriptionAck(request_id=2, success=False),
+                         subscription_format.acknowledgement({"code": 2, "msg": "Invalid request", "id": 2}))
+        self.assertIsNone(subscription_format.acknowledgement({"e": "trade", "s": "BTCUSDT"}))
@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.backtest_exchange import BacktestExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.market_data_replay import MarketDataEvents, MarketDataEventType as EventType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+
+
+class BacktestExchangeTest(unittest.TestCase):
+    start_timestamp: float = 1640000000.0
+    trading_pair: str = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        start = self.start_timestamp
+        market_data = MarketDataEvents.from_rows([
+            (start, 1, EventType.SNAPSHOT_BID, 99.0, 10.0),
+            (start, 1, EventType.SNAPSHOT_ASK, 101.0, 10.0),
+            (start + 5, 2, EventType.DIFF_BID, 99.5, 1.0),
+            (start + 10, 2, EventType.TRADE_SELL, 98.5, 2.0),
+        ])
+        self.exchange = BacktestExchange(ClientConfigAdapter(ClientConfigMap()), "binance",
+                                         {self.trading_pair: market_data})
+        self.exchange.set_balance("COINALPHA", Decimal(10))
+        self.exchange.set_balance("HBOT", Decimal(1000))
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 60)
+        self.clock.add_iterator(self.exchange)
+        self.fill_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+
+    def test_order_books_replay_with_the_clock(self):
+        self.assertFalse(self.exchange.ready)
+        self.clock.backtest_til(self.start_timestamp)
+
+        self.assertTrue(self.exchange.ready)
+        self.assertEqual([self.trading_pair], self.exchange.trading_pairs)
+        self.assertEqual("binance_Backtest", self.exchange.display_name)
+        self.assertEqual(Decimal("99"), self.exchange.get_price(self.trading_pair, False))
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.assertEqual(Decimal("99.5"), self.exchange.get_price(self.trading_pair, False))
+        self.assertEqual(3, self.exchange.market_data_replay.events_processed)
+
+    def test_recorded_trade_fills_resting_limit_order(self):
+        self.clock.backtest_til(self.start_timestamp)
+        self.exchange.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal("99"))
+        self.assertEqual(1, len(self.exchange.limit_orders))
+
+        self.clock.backtest_til(self.start_timestamp + 9)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        fill = self.fill_logger.event_log[0]
+        self.assertEqual(TradeType.BUY, fill.trade_type)
+        self.assertEqual(Decimal("99"), fill.price)
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        # The default binance fee of 0.1%, paid in the base asset
+        self.assertEqual(Decimal("10.999"), self.exchange.get_balance("COINALPHA"))
+
+    def test_market_order_executes_against_replayed_book(self):
+        self.clock.backtest_til(self.start_timestamp)
+        self.exchange.sell(self.trading_pair, Decimal(1), OrderType.MARKET)
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("99.5"), self.fill_logger.event_log[0].price)
@@ -0,0 +1,193 @@
+import asyncio
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
+from hummingbot.connector.exchange.paper_trade.backtest_exchange import BacktestExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.market_data_replay import MarketDataEvents, MarketDataEventType as EventType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+
+
+class PaperTradeQueuePositionTest(unittest.TestCase):
+    start_timestamp: float = 1640000000.0
+    trading_pair: str = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.fill_logger = EventLogger()
+        self.buy_completed_logger = EventLogger()
+        self.sell_completed_logger = EventLogger()
+        self.cancel_logger = EventLogger()
+
+    def start_exchange(self, rows, queue_position_fills: bool = True):
+        start = self.start_timestamp
+        market_data = MarketDataEvents.from_rows([
+            (start, 1, EventType.SNAPSHOT_BID, 99.0, 10.0),
+            (start, 1, EventType.SNAPSHOT_BID, 98.0, 5.0),
+            (start, 1, EventType.SNAPSHOT_ASK, 101.0, 10.0),
+        ] + [(start + row[0],) + tuple(row[1:]) for row in rows])
+        self.exchange = BacktestExchange(ClientConfigAdapter(ClientConfigMap()),
+                                         "binance",
+                                         {self.trading_pair: market_data},
+                                         queue_position_fills=queue_position_fills)
+        self.exchange.set_balance("COINALPHA", Decimal(10))
+        self.exchange.set_balance("HBOT", Decimal(1000))
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.exchange.add_listener(MarketEvent.BuyOrderCompleted, self.buy_completed_logger)
+        self.exchange.add_listener(MarketEvent.SellOrderCompleted, self.sell_completed_logger)
+        self.exchange.add_listener(MarketEvent.OrderCancelled, self.cancel_logger)
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 60)
+        self.clock.add_iterator(self.exchange)
+        self.clock.backtest_til(start)
+
+    def backtest_til(self, seconds: float):
+        self.clock.backtest_til(self.start_timestamp + seconds)
+
+    def test_order_joins_the_back_of_its_price_level(self):
+        self.start_exchange([])
+        order_id = self.exchange.buy(self.trading_pair, Decimal(2), OrderType.LIMIT, Decimal("99"))
+        new_level_order_id = self.exchange.buy(self.trading_pair, Decimal(2), OrderType.LIMIT, Decimal("98.5"))
+
+        self.assertTrue(self.exchange.queue_position_fills)
+        self.assertEqual(10, self.exchange.queue_positions[order_id].queue_ahead)
+        self.assertEqual(0, self.exchange.queue_positions[new_level_order_id].queue_ahead)
+
+        self.exchange.cancel(self.trading_pair, order_id)
+        self.assertNotIn(order_id, self.exchange.queue_positions)
+
+    def test_trades_consume_the_queue_ahead_then_partially_fill(self):
+        self.start_exchange([
+            (10, 0, EventType.TRADE_SELL, 99.0, 6.0),
+            # Two trades in the same tick are matched in one pass
+            (20, 0, EventType.TRADE_SELL, 99.0, 3.0),
+            (20.5, 0, EventType.TRADE_SELL, 99.0, 2.0),
+            (30, 0, EventType.TRADE_SELL, 98.5, 5.0),
+        ])
+        order_id = self.exchange.buy(self.trading_pair, Decimal(2), OrderType.LIMIT, Decimal("99"))
+
+        self.backtest_til(10)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual(4, self.exchange.queue_positions[order_id].queue_ahead)
+
+        self.backtest_til(21)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        fill = self.fill_logger.event_log[0]
+        self.assertEqual(order_id, fill.order_id)
+        self.assertEqual(TradeType.BUY, fill.trade_type)
+        self.assertEqual(Decimal("1"), fill.amount)
+        self.assertEqual(Decimal("99"), fill.price)
+        self.assertEqual(0, len(self.buy_completed_logger.event_log))
+        limit_order = self.exchange.limit_orders[0]
+        self.assertEqual(Decimal("1"), limit_order.filled_quantity)
+        self.assertEqual(Decimal("99"), self.exchange.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal("901"), self.exchange.get_balance("HBOT"))
+
+        # The trade at a lower price went through the order price level
+        self.backtest_til(30)
+        self.assertEqual(2, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("1"), self.fill_logger.event_log[1].amount)
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertNotIn(order_id, self.exchange.queue_positions)
+        completed = self.buy_completed_logger.event_log[0]
+        self.assertEqual(order_id, completed.order_id)
+        # The default binance fee of 0.1%, paid in the base asset
+        self.assertEqual(Decimal("1.998"), completed.base_asset_amount)
+        self.assertEqual(Decimal("198"), completed.quote_asset_amount)
+        self.assertEqual(Decimal("11.998"), self.exchange.get_balance("COINALPHA"))
+
+    def test_trade_through_the_price_fills_up_to_its_amount(self):
+        self.start_exchange([
+            (10, 0, EventType.TRADE_BUY, 102.0, 1.0),
+        ])
+        order_id = self.exchange.sell(self.trading_pair, Decimal(3), OrderType.LIMIT, Decimal("101"))
+
+        self.backtest_til(10)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("1"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(0, len(self.sell_completed_logger.event_log))
+        self.assertEqual(Decimal("1"), self.exchange.queue_positions[order_id].filled_amount)
+        self.assertEqual(2, self.exchange.queue_positions[order_id].remaining)
+
+    def test_orders_at_better_prices_fill_first(self):
+        self.start_exchange([
+            (10, 0, EventType.TRADE_SELL, 98.0, 3.0),
+        ])
+        worse_order_id = self.exchange.buy(self.trading_pair, Decimal(2), OrderType.LIMIT, Decimal("99"))
+        better_order_id = self.exchange.buy(self.trading_pair, Decimal(2), OrderType.LIMIT, Decimal("99.5"))
+
+        self.backtest_til(10)
+
+        fills = {fill.order_id: fill.amount for fill in self.fill_logger.event_log}
+        self.assertEqual({better_order_id: Decimal("2"), worse_order_id: Decimal("1")}, fills)
+        self.assertEqual([better_order_id], [event.order_id for event in self.buy_completed_logger.event_log])
+
+    def test_level_amount_decrease_moves_the_order_forward(self):
+        self.start_exchange([
+            (10, 2, EventType.DIFF_BID, 99.0, 3.0),
+            (20, 0, EventType.TRADE_SELL, 99.0, 4.0),
+        ])
+        order_id = self.exchange.buy(self.trading_pair, Decimal(2), OrderType.LIMIT, Decimal("99"))
+
+        self.backtest_til(10)
+        self.assertEqual(3, self.exchange.queue_positions[order_id].queue_ahead)
+
+        self.backtest_til(20)
+        self.assertEqual(Decimal("1"), self.fill_logger.event_log[0].amount)
+
+    def test_crossed_order_fills_its_remaining_amount(self):
+        self.start_exchange([
+            (10, 0, EventType.TRADE_BUY, 102.0, 1.0),
+            (20, 2, EventType.DIFF_BID, 101.5, 1.0),
+        ])
+        order_id = self.exchange.sell(self.trading_pair, Decimal(3), OrderType.LIMIT, Decimal("101"))
+
+        self.backtest_til(20)
+
+        self.assertEqual([Decimal("1"), Decimal("2")], [fill.amount for fill in self.fill_logger.event_log])
+        completed = self.sell_completed_logger.event_log[0]
+        self.assertEqual(order_id, completed.order_id)
+        self.assertEqual(Decimal("3"), completed.base_asset_amount)
+        self.assertEqual(Decimal("302.697"), completed.quote_asset_amount)
+
+    def test_insufficient_balance_cancels_the_order(self):
+        self.start_exchange([
+            (10, 0, EventType.TRADE_SELL, 98.0, 5.0),
+        ])
+        order_id = self.exchange.buy(self.trading_pair, Decimal(2), OrderType.LIMIT, Decimal("99"))
+        self.exchange.set_balance("HBOT", Decimal(100))
+
+        self.backtest_til(10)
+
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual(order_id, self.cancel_logger.event_log[0].order_id)
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertNotIn(order_id, self.exchange.queue_positions)
+
+    def test_trade_fills_whole_order_without_queue_positions(self):
+        self.start_exchange([
+            (10, 0, EventType.TRADE_SELL, 98.0, 1.0),
+        ], queue_position_fills=False)
+        self.exchange.buy(self.trading_pair, Decimal(2), OrderType.LIMIT, Decimal("99"))
+
+        self.backtest_til(10)
+
+        self.assertFalse(self.exchange.queue_position_fills)
+        self.assertEqual(0, len(self.exchange.queue_positions))
+        self.assertEqual(Decimal("2"), self.fill_logger.event_log[0].amount)
+
+    def test_paper_trade_market_uses_the_client_config(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.paper_trade.paper_trade_queue_position_fills = True
+
+        paper_exchange = create_paper_trade_market(exchange_name="binance",
+                                                   client_config_map=client_config_map,
+                                                   trading_pairs=[self.trading_pair])
+
+        self.assertTrue(paper_exchange.queue_position_fills)
@@ -11,6 +11,7 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent
 
 
 class InFightOrderTest(InFlightOrderBase):
@@ -570,3 +571,23 @@ class ConnectorBaseUnitTest(unittest.TestCase):
                                 + (current_sell_order.executed_amount_quote)
                                 - (extra_fill_event.amount * extra_fill_event.price))
         self.assertEqual(expected_hbot_amount, estimated_hbot_balance)
+
+    def test_order_filled_balances_from_the_connector_event_logger(self):
+        connector = ConnectorBase(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        for timestamp, trade_type, price, amount in [(1640000000, TradeType.BUY, Decimal(1000), Decimal(1)),
+                                                     (1640000002, TradeType.BUY, Decimal(1050), Decimal(2)),
+                                                     (1640000003, TradeType.SELL, Decimal(1100), Decimal("0.5"))]:
+            connector.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+                timestamp=timestamp,
+                order_id=f"OID{timestamp}",
+                trading_pair="COINALPHA-HBOT",
+                trade_type=trade_type,
+                order_type=OrderType.LIMIT,
+                price=price,
+                amount=amount,
+                trade_fee=AddedToCostTradeFee(),
+            ))
+
+        balances = connector.order_filled_balances(starting_timestamp=1640000001)
+
+        self.assertEqual({"COINALPHA": Decimal("1.5"), "HBOT": Decimal(-2100) + Decimal(550)}, balances)
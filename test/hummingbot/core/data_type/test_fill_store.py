@@ -0,0 +1,104 @@
+import math
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.fill_store import FillStore
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class FillStoreTest(unittest.TestCase):
+    def add_fill(self,
+                 store: FillStore,
+                 timestamp: float,
+                 trade_type: TradeType = TradeType.BUY,
+                 price: str = "100",
+                 amount: str = "1",
+                 market: str = "binance",
+                 trading_pair: str = "COINALPHA-HBOT",
+                 trade_fee=None):
+        store.add_order_filled_event(market, OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=f"OID{timestamp}",
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=trade_fee or AddedToCostTradeFee(percent=Decimal("0.001"))))
+
+    def test_trades_are_created_from_the_columns(self):
+        store = FillStore()
+        flat_fee = DeductedFromReturnsTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.0015")),
+                                                          TokenAmount("HBOT", Decimal("0.2"))])
+        self.add_fill(store, 2, TradeType.SELL, "101.5", "0.25", trade_fee=flat_fee)
+        self.add_fill(store, 1, TradeType.BUY, "99.1", "2", market="kucoin")
+
+        trades = store.trades()
+
+        self.assertEqual(2, len(trades))
+        self.assertEqual([1, 2], [trade.timestamp for trade in trades])
+        self.assertEqual(("COINALPHA-HBOT", TradeType.BUY, Decimal("99.1"), Decimal("2"), OrderType.LIMIT, "kucoin"),
+                         tuple(trades[0])[:6])
+        self.assertEqual(AddedToCostTradeFee(percent=Decimal("0.001")), trades[0].trade_fee)
+        self.assertEqual((Decimal("101.5"), Decimal("0.25")), (trades[1].price, trades[1].amount))
+        self.assertEqual(flat_fee, trades[1].trade_fee)
+        self.assertEqual(1, len(store.trades(market="kucoin")))
+
+    def test_summaries_by_market_and_side(self):
+        store = FillStore()
+        self.add_fill(store, 1, TradeType.BUY, "100", "1")
+        self.add_fill(store, 2, TradeType.BUY, "110", "3")
+        self.add_fill(store, 3, TradeType.SELL, "120", "2")
+        self.add_fill(store, 4, TradeType.SELL, "10", "5", trading_pair="HBOT-USDT")
+
+        summary = store.summary()
+
+        buys = summary[("binance", "COINALPHA-HBOT", TradeType.BUY)]
+        self.assertEqual((2, 4.0, 430.0), tuple(buys))
+        self.assertEqual(107.5, buys.average_price)
+        self.assertEqual((1, 2.0, 240.0), tuple(summary[("binance", "COINALPHA-HBOT", TradeType.SELL)]))
+        self.assertEqual((1, 5.0, 50.0), tuple(summary[("binance", "HBOT-USDT", TradeType.SELL)]))
+        self.assertEqual(3, len(summary))
+
+        self.assertEqual(6.0, store.volume(trading_pair="COINALPHA-HBOT"))
+        self.assertEqual(7.0, store.volume(trade_type=TradeType.SELL))
+        self.assertEqual(120.0, store.average_price("binance", "COINALPHA-HBOT", TradeType.SELL))
+        self.assertTrue(math.isnan(store.average_price(market="kucoin")))
+        self.assertEqual(2, len(store.summary(start_timestamp=3)))
+
+    def test_oldest_fills_are_dropped_past_max_fills(self):
+        store = FillStore(max_fills=3000)
+        for i in range(10000):
+            self.add_fill(store, i, amount=str(i))
+
+        self.assertEqual(3000, len(store))
+        self.assertEqual(7000, store.column("timestamp")[0])
+        self.assertEqual(9999, store.column("timestamp")[-1])
+        self.assertEqual(sum(range(7000, 10000)), store.volume())
+        self.assertEqual(3000, len(store.trades()))
+
+        store.set_retention(max_fills=10)
+
+        self.assertEqual(list(range(9990, 10000)), store.column("timestamp").tolist())
+
+    def test_fills_older_than_max_age_are_dropped(self):
+        store = FillStore(max_age=60)
+        for timestamp in (0, 30, 61, 100):
+            self.add_fill(store, timestamp)
+
+        self.assertEqual([61, 100], store.column("timestamp").tolist())
+
+        store.set_retention(max_fills=100, max_age=10)
+
+        self.assertEqual([100], store.column("timestamp").tolist())
+
+    def test_extra_flat_fees_of_dropped_fills_are_released(self):
+        store = FillStore(max_fills=2)
+        fee = DeductedFromReturnsTradeFee(flat_fees=[TokenAmount("BNB", Decimal("1")), TokenAmount("ETH", Decimal("2"))])
+        for timestamp in range(5):
+            self.add_fill(store, timestamp, trade_fee=fee)
+
+        self.assertEqual(2, len(store._extra_fee_amounts))
+        self.assertEqual([fee, fee], [trade.trade_fee for trade in store.trades()])
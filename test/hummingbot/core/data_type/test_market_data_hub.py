@@ -0,0 +1,211 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import Awaitable, List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.ndax.ndax_order_book_message import NdaxOrderBookEntry, NdaxOrderBookMessage
+from hummingbot.connector.test_support.mock_order_tracker import MockOrderBookTrackerDataSource
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_hub import (
+    DIFF_FRAME,
+    FRAME_HEADER,
+    SNAPSHOT_FRAME,
+    TRADE_FRAME,
+    MarketDataHub,
+    MarketDataHubOrderBookTrackerDataSource,
+    MarketDataHubPublisher,
+    decode_market_data,
+    encode_market_data,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker, OrderBookTrackerDataSourceType
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class HubOrderBookTracker(OrderBookTracker):
+    """
+    Tracks order books initialized with a snapshot, fed by the test through its message queues
+    """
+
+    def start(self):
+        for trading_pair in self._trading_pairs:
+            order_book = OrderBook()
+            order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1)], [OrderBookRow(101.0, 1.0, 1)], 1)
+            self._order_books[trading_pair] = order_book
+            self._tracking_message_queues[trading_pair] = asyncio.Queue()
+            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_books_initialized.set()
+        self._emit_trade_event_task = safe_ensure_future(self._emit_trade_event_loop())
+
+
+class MarketDataHubTest(unittest.TestCase):
+    trading_pair: str = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temp_dir.name, "hub.sock")
+        self.created_trackers: List[OrderBookTracker] = []
+        self.hub = MarketDataHub(socket_path=self.socket_path, tracker_factory=self.create_tracker)
+        self.bot_trackers: List[OrderBookTracker] = []
+
+    def tearDown(self) -> None:
+        for tracker in self.bot_trackers:
+            tracker.stop()
+        self.async_run_with_timeout(self.hub.stop())
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def create_tracker(self, exchange: str, trading_pairs: List[str]) -> OrderBookTracker:
+        if exchange != "binance":
+            raise ValueError(f"{exchange} is not a connector.")
+        tracker = HubOrderBookTracker(MockOrderBookTrackerDataSource(trading_pairs), trading_pairs)
+        self.created_trackers.append(tracker)
+        return tracker
+
+    def start_bot_tracker(self) -> OrderBookTracker:
+        data_source = MarketDataHubOrderBookTrackerDataSource([self.trading_pair], "binance", self.socket_path)
+        tracker = OrderBookTracker(data_source, [self.trading_pair])
+        tracker.start()
+        self.bot_trackers.append(tracker)
+        return tracker
+
+    async def wait_for(self, condition):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    def test_market_data_frames_round_trip(self):
+        frame = encode_market_data(DIFF_FRAME, self.trading_pair, 1.5, 7, [["99.5", "2", "extra"]], [])
+        length, frame_type = FRAME_HEADER.unpack_from(frame)
+        message = decode_market_data(frame_type, frame[FRAME_HEADER.size:])
+
+        self.assertEqual(len(frame) - FRAME_HEADER.size, length)
+        self.assertEqual(OrderBookMessageType.DIFF, message.type)
+        self.assertEqual(self.trading_pair, message.trading_pair)
+        self.assertEqual(7, message.update_id)
+        self.assertEqual(1.5, message.timestamp)
+        self.assertEqual([[99.5, 2.0]], message.content["bids"])
+        self.assertEqual([], message.content["asks"])
+
+        frame = encode_market_data(TRADE_FRAME, self.trading_pair, 2.0, 3, [], [(100.0, 0.5)])
+        message = decode_market_data(TRADE_FRAME, frame[FRAME_HEADER.size:])
+        self.assertEqual(OrderBookMessageType.TRADE, message.type)
+        self.assertEqual(float(TradeType.SELL.value), message.content["trade_type"])
+        self.assertEqual((100.0, 0.5), (message.content["price"], message.content["amount"]))
+
+        frame = encode_market_data(SNAPSHOT_FRAME, self.trading_pair, 2.0, 9, [(99.0, 1.0)], [(101.0, 1.0)], 100.0)
+        message = decode_market_data(SNAPSHOT_FRAME, frame[FRAME_HEADER.size:])
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, message.type)
+        self.assertEqual(100.0, message.content["last_trade_price"])
+
+    def test_publisher_encodes_the_message_order_book_rows(self):
+        frames = []
+        hub = MarketDataHub(socket_path=self.socket_path, tracker_factory=self.create_tracker)
+        hub.publish = lambda exchange, trading_pair, frame: frames.append(frame)
+        publisher = MarketDataHubPublisher(hub, "ndax")
+        # The entries of the ndax messages are in content["data"], the message converts them in its bids and asks
+        entries = [NdaxOrderBookEntry(2, 1, 1000, 0, "100", 1, "99.5", 1, "3", 0),
+                   NdaxOrderBookEntry(3, 1, 1000, 0, "100", 2, "101", 1, "1", 1)]
+
+        publisher.record_diff(self.trading_pair, NdaxOrderBookMessage(
+            OrderBookMessageType.DIFF, {"trading_pair": self.trading_pair, "data": entries}, timestamp=2.0))
+        publisher.record_snapshot(self.trading_pair, NdaxOrderBookMessage(
+            OrderBookMessageType.SNAPSHOT, {"trading_pair": self.trading_pair, "data": entries}, timestamp=2.0), [])
+
+        message = decode_market_data(DIFF_FRAME, frames[0][FRAME_HEADER.size:])
+        self.assertEqual(([[99.5, 3.0]], [[101.0, 1.0]]), (message.content["bids"], message.content["asks"]))
+        self.assertEqual(3, message.update_id)
+        message = decode_market_data(SNAPSHOT_FRAME, frames[1][FRAME_HEADER.size:])
+        self.assertEqual(([[99.5, 3.0]], [[101.0, 1.0]]), (message.content["bids"], message.content["asks"]))
+
+    def test_bots_share_the_hub_order_books(self):
+        self.async_run_with_timeout(self.hub.start())
+        first_bot = self.start_bot_tracker()
+        second_bot = self.start_bot_tracker()
+
+        self.async_run_with_timeout(self.wait_for(lambda: first_bot.ready and second_bot.ready))
+        self.assertEqual(1, len(self.created_trackers))
+        self.assertEqual(2, self.hub.subscribers_count)
+        for bot in (first_bot, second_bot):
+            self.assertEqual(99.0, bot.order_books[self.trading_pair].get_price(False))
+
+        hub_tracker = self.created_trackers[0]
+        hub_tracker._tracking_message_queues[self.trading_pair].put_nowait(OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": 2, "bids": [["99.5", "3"]], "asks": []},
+            timestamp=2.0))
+        hub_tracker._order_book_trade_stream.put_nowait(OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": self.trading_pair, "trade_type": float(TradeType.BUY.value), "trade_id": 1,
+             "price": "101", "amount": "0.5"},
+            timestamp=3.0))
+
+        for bot in (first_bot, second_bot):
+            order_book = bot.order_books[self.trading_pair]
+            self.async_run_with_timeout(self.wait_for(lambda: order_book.last_trade_price == 101.0))
+            self.assertEqual(99.5, order_book.get_price(False))
+            self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_bot_started_later_gets_the_current_order_book(self):
+        self.async_run_with_timeout(self.hub.start())
+        self.hub.track("binance", [self.trading_pair])
+        hub_tracker = self.created_trackers[0]
+        hub_tracker._tracking_message_queues[self.trading_pair].put_nowait(OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": 5, "bids": [], "asks": [["100.5", "2"]]},
+            timestamp=2.0))
+        hub_order_book = hub_tracker.order_books[self.trading_pair]
+        self.async_run_with_timeout(self.wait_for(lambda: hub_order_book.last_diff_uid == 5))
+
+        bot = self.start_bot_tracker()
+        self.async_run_with_timeout(self.wait_for(lambda: bot.ready))
+
+        self.assertEqual(1, len(self.created_trackers))
+        self.assertEqual(100.5, bot.order_books[self.trading_pair].get_price(True))
+        self.assertEqual(5, bot.order_books[self.trading_pair].snapshot_uid)
+
+    def test_subscription_to_an_unknown_exchange_is_reported(self):
+        self.async_run_with_timeout(self.hub.start())
+        data_source = MarketDataHubOrderBookTrackerDataSource([self.trading_pair], "unknown", self.socket_path)
+
+        with self.assertLogs(data_source.logger().name, level="ERROR") as logs:
+            task = safe_ensure_future(data_source.listen_for_subscriptions())
+            self.async_run_with_timeout(self.wait_for(lambda: len(logs.records) > 0))
+            task.cancel()
+
+        self.assertIn("unknown is not a connector.", logs.output[0])
+        self.assertEqual(0, self.hub.subscribers_count)
+
+    def test_exchange_connector_uses_the_hub_when_enabled(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.market_data_hub.market_data_hub_enabled = True
+        client_config_map.market_data_hub.market_data_hub_socket_path = self.socket_path
+
+        exchange = BinanceExchange(client_config_map=client_config_map,
+                                   binance_api_key="",
+                                   binance_api_secret="",
+                                   trading_pairs=[self.trading_pair],
+                                   trading_required=False)
+
+        self.assertEqual(OrderBookTrackerDataSourceType.LOCAL_HUB, exchange.order_book_tracker_data_source_type)
+        self.assertIsInstance(exchange.order_book_tracker.data_source, MarketDataHubOrderBookTrackerDataSource)
+
+        client_config_map.market_data_hub.market_data_hub_enabled = False
+        exchange = BinanceExchange(client_config_map=client_config_map,
+                                   binance_api_key="",
+                                   binance_api_secret="",
+                                   trading_pairs=[self.trading_pair],
+                                   trading_required=False)
+
+        self.assertEqual(OrderBookTrackerDataSourceType.EXCHANGE_API, exchange.order_book_tracker_data_source_type)
+        self.assertIs(exchange._orderbook_ds, exchange.order_book_tracker.data_source)
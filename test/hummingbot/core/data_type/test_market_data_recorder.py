@@ -0,0 +1,231 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Awaitable
+
+from hummingbot.connector.exchange.ndax.ndax_order_book_message import NdaxOrderBookEntry, NdaxOrderBookMessage
+from hummingbot.connector.test_support.mock_order_tracker import MockOrderBookTrackerDataSource
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_recorder import (
+    MarketDataFile,
+    MarketDataRecorder,
+    index_path,
+    load_market_data,
+)
+from hummingbot.core.data_type.market_data_replay import (
+    MarketDataEvents,
+    MarketDataEventType as EventType,
+    MarketDataReplay,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+def diff_message(update_id: int, bids, asks) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF,
+                            {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": bids, "asks": asks},
+                            timestamp=float(update_id))
+
+
+def snapshot_message(update_id: int, bids, asks) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                            {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": bids, "asks": asks},
+                            timestamp=float(update_id))
+
+
+def ndax_diff_message(update_id: int, price: str, quantity: str, side: int) -> NdaxOrderBookMessage:
+    # The entries are in content["data"], the message converts them in its bids and asks
+    entry = NdaxOrderBookEntry(update_id, 1, 1000, 0, "100", 1, price, 1, quantity, side)
+    return NdaxOrderBookMessage(OrderBookMessageType.DIFF,
+                                {"trading_pair": "COINALPHA-HBOT", "data": [entry]},
+                                timestamp=float(update_id))
+
+
+def book_entries(order_book: OrderBook):
+    return ([(row.price, row.amount) for row in order_book.bid_entries()],
+            [(row.price, row.amount) for row in order_book.ask_entries()])
+
+
+class MarketDataRecorderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        self.recorder = MarketDataRecorder(self.directory)
+
+    def tearDown(self) -> None:
+        self.recorder.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_recorded_messages_are_written_as_columns(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1)], [OrderBookRow(101.0, 2.0, 1)], 1)
+        self.recorder.record_order_book("COINALPHA-HBOT", order_book)
+        self.recorder.record_diff("COINALPHA-HBOT", diff_message(2, [["99.5", "3"]], [["101", "0"]]))
+        self.recorder.record_trade("COINALPHA-HBOT",
+                                   OrderBookTradeEvent("COINALPHA-HBOT", 3.0, TradeType.SELL, 99.5, 0.5))
+        self.recorder.record_diff("ETH-USDT", diff_message(7, [["1000", "1"]], []))
+        self.recorder.stop()
+
+        self.assertEqual(1, len(self.recorder.files))
+        self.assertEqual(6, self.recorder.rows_written)
+        data_file = MarketDataFile(self.recorder.files[0])
+        self.assertEqual(["COINALPHA-HBOT", "ETH-USDT"], data_file.trading_pairs)
+        events = data_file.events("COINALPHA-HBOT")
+        self.assertEqual([EventType.SNAPSHOT_BID, EventType.SNAPSHOT_ASK, EventType.DIFF_BID, EventType.DIFF_ASK,
+                          EventType.TRADE_SELL], events.event_type.tolist())
+        self.assertEqual([99.0, 101.0, 99.5, 101.0, 99.5], events.price.tolist())
+        self.assertEqual([1.0, 2.0, 3.0, 0.0, 0.5], events.amount.tolist())
+        self.assertEqual([1, 1, 2, 2, 0], events.update_id.tolist())
+        self.assertEqual(sorted(events.timestamp.tolist()), events.timestamp.tolist())
+        # The columns are views of the memory mapped file
+        self.assertFalse(events.price.flags.writeable)
+
+    def test_replay_reproduces_the_recorded_order_book(self):
+        past_diffs = [diff_message(3, [["98", "1"]], []), diff_message(5, [["97", "2"]], [])]
+        order_book = OrderBook()
+        self.recorder.record_snapshot("COINALPHA-HBOT", snapshot_message(4, [["99", "1"]], [["101", "1"]]),
+                                      past_diffs)
+        order_book.restore_from_snapshot_and_diffs(snapshot_message(4, [["99", "1"]], [["101", "1"]]), past_diffs)
+        message = diff_message(6, [["99", "0"], ["98.5", "4"]], [["100.5", "2"]])
+        self.recorder.record_diff("COINALPHA-HBOT", message)
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        self.recorder.stop()
+
+        replayed_book = OrderBook()
+        replay = MarketDataReplay({"COINALPHA-HBOT": replayed_book}, load_market_data(self.recorder.files))
+        replay.advance(float("inf"))
+
+        self.assertEqual(book_entries(order_book), book_entries(replayed_book))
+        self.assertEqual([(100.5, 2.0), (101.0, 1.0)], book_entries(replayed_book)[1])
+
+    def test_messages_are_recorded_from_their_order_book_rows(self):
+        self.recorder.record_diff("COINALPHA-HBOT", ndax_diff_message(2, "99.5", "3", side=0))
+        self.recorder.record_diff("COINALPHA-HBOT", ndax_diff_message(3, "101", "1", side=1))
+        self.recorder.stop()
+
+        events = load_market_data(self.recorder.files)["COINALPHA-HBOT"]
+        self.assertEqual([EventType.DIFF_BID, EventType.DIFF_ASK], events.event_type.tolist())
+        self.assertEqual([99.5, 101.0], events.price.tolist())
+        self.assertEqual([3.0, 1.0], events.amount.tolist())
+        self.assertEqual([2, 3], events.update_id.tolist())
+
+    def test_index_is_written_when_the_file_is_closed(self):
+        for update_id in range(1, 3):
+            self.recorder.record_diff("COINALPHA-HBOT", diff_message(update_id, [[str(update_id), "1"]], []))
+            self.recorder.flush()
+        path = self.recorder.files[0]
+        self.assertFalse(index_path(path).exists())
+        self.assertEqual([1.0, 2.0], MarketDataFile(path).events("COINALPHA-HBOT").price.tolist())
+
+        self.recorder.stop()
+
+        self.assertTrue(index_path(path).exists())
+        self.assertEqual(2, len(MarketDataFile(path).chunks))
+
+    def test_files_are_rotated_by_size(self):
+        recorder = MarketDataRecorder(self.directory, max_file_size=100)
+        for update_id in range(1, 4):
+            recorder.record_diff("COINALPHA-HBOT", diff_message(update_id, [[str(update_id), "1"]], []))
+            recorder.flush()
+        recorder.stop()
+
+        self.assertEqual(3, len(recorder.files))
+        market_data = load_market_data(recorder.files)
+        self.assertEqual([1.0, 2.0, 3.0], market_data["COINALPHA-HBOT"].price.tolist())
+
+    def test_chunks_are_found_without_index(self):
+        for update_id in range(1, 3):
+            self.recorder.record_diff("COINALPHA-HBOT", diff_message(update_id, [[str(update_id), "1"]], []))
+            self.recorder.flush()
+        self.recorder.stop()
+        path = self.recorder.files[0]
+        index_path(path).unlink()
+        # A partially written chunk at the end of the file is ignored
+        with open(path, "ab") as file:
+            file.write(b"HBCK" + b"\x00" * 20)
+
+        data_file = MarketDataFile(path)
+
+        self.assertEqual(2, len(data_file.chunks))
+        self.assertEqual([1.0, 2.0], data_file.events("COINALPHA-HBOT").price.tolist())
+
+    def test_events_are_recorded_with_their_timestamps(self):
+        events = MarketDataEvents.from_rows([
+            (1000.0, 1, EventType.SNAPSHOT_BID, 99.0, 1.0),
+            (1000.0, 1, EventType.SNAPSHOT_ASK, 101.0, 1.0),
+            (1001.5, 0, EventType.TRADE_BUY, 101.0, 0.5),
+        ])
+        self.recorder.record_events("COINALPHA-HBOT", events)
+        self.recorder.stop()
+
+        data_file = MarketDataFile(self.recorder.files[0])
+        recorded_events = data_file.events("COINALPHA-HBOT")
+        for column in MarketDataEvents.COLUMNS:
+            self.assertEqual(getattr(events, column).tolist(), getattr(recorded_events, column).tolist())
+        self.assertEqual((1000.0, 1001.5), (data_file.chunks[0].first_timestamp, data_file.chunks[0].last_timestamp))
+
+    def test_writer_thread_flushes_periodically(self):
+        recorder = MarketDataRecorder(self.directory, flush_interval=0.01)
+        recorder.start()
+        recorder.record_diff("COINALPHA-HBOT", diff_message(1, [["1", "1"]], []))
+        for _ in range(100):
+            if recorder.rows_written > 0:
+                break
+            asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.01))
+        recorder.stop()
+
+        self.assertEqual(1, recorder.rows_written)
+        self.assertEqual(0, recorder.pending_records)
+
+
+class OrderBookTrackerRecordingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recorder = MarketDataRecorder(self.temp_dir.name)
+        self.tracker = OrderBookTracker(MockOrderBookTrackerDataSource(["COINALPHA-HBOT"]), ["COINALPHA-HBOT"])
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1)], [OrderBookRow(101.0, 1.0, 1)], 1)
+        self.tracker._order_books["COINALPHA-HBOT"] = self.order_book
+        self.tracker._tracking_message_queues["COINALPHA-HBOT"] = asyncio.Queue()
+
+    def tearDown(self) -> None:
+        self.recorder.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_applied_messages_are_recorded(self):
+        self.tracker.set_market_data_recorder(self.recorder)
+        self.tracker._tracking_message_queues["COINALPHA-HBOT"].put_nowait(
+            diff_message(2, [["99.5", "2"]], []))
+        self.tracker._order_book_trade_stream.put_nowait(OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": "COINALPHA-HBOT", "trade_type": float(TradeType.BUY.value), "trade_id": 1,
+             "price": "101", "amount": "0.5"},
+            timestamp=3.0))
+        self.tracker._order_books_initialized.set()
+
+        async def track():
+            tasks = [asyncio.ensure_future(self.tracker._track_single_book("COINALPHA-HBOT")),
+                     asyncio.ensure_future(self.tracker._emit_trade_event_loop())]
+            await asyncio.sleep(0.05)
+            for task in tasks:
+                task.cancel()
+
+        self.async_run_with_timeout(track())
+        self.recorder.stop()
+
+        events = load_market_data(self.recorder.files)["COINALPHA-HBOT"]
+        self.assertEqual([EventType.SNAPSHOT_BID, EventType.SNAPSHOT_ASK, EventType.DIFF_BID, EventType.TRADE_BUY],
+                         events.event_type.tolist())
+        self.assertEqual([99.0, 101.0, 99.5, 101.0], events.price.tolist())
@@ -0,0 +1,103 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_replay import (
+    BacktestOrderBookTracker,
+    MarketDataEvents,
+    MarketDataEventType as EventType,
+    MarketDataReplay,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+
+
+def sample_events() -> MarketDataEvents:
+    return MarketDataEvents.from_rows([
+        (10.0, 1, EventType.SNAPSHOT_BID, 99.0, 1.0),
+        (10.0, 1, EventType.SNAPSHOT_BID, 98.0, 2.0),
+        (10.0, 1, EventType.SNAPSHOT_ASK, 101.0, 1.0),
+        (11.0, 2, EventType.DIFF_ASK, 101.0, 0.0),
+        (11.0, 2, EventType.DIFF_BID, 99.5, 3.0),
+        (11.0, 2, EventType.DIFF_ASK, 102.0, 4.0),
+        (12.0, 2, EventType.TRADE_BUY, 102.0, 0.5),
+        (12.0, 2, EventType.TRADE_SELL, 99.5, 0.25),
+        (13.0, 3, EventType.SNAPSHOT_BID, 90.0, 1.0),
+        (13.0, 3, EventType.SNAPSHOT_ASK, 91.0, 1.0),
+    ])
+
+
+class MarketDataReplayTest(unittest.TestCase):
+    def test_replay_in_lockstep(self):
+        order_book = OrderBook()
+        trade_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        replay = MarketDataReplay({"COINALPHA-HBOT": order_book}, {"COINALPHA-HBOT": sample_events()})
+
+        self.assertEqual(0, replay.advance(9.0))
+        self.assertFalse(replay.ready)
+        self.assertEqual(3, replay.advance(10.5))
+        self.assertTrue(replay.ready)
+        self.assertEqual([(99.0, 1.0), (98.0, 2.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(101.0, 1.0)], [(row.price, row.amount) for row in order_book.ask_entries()])
+
+        self.assertEqual(5, replay.advance(12.0))
+        self.assertEqual(99.5, order_book.get_price(False))
+        self.assertEqual(102.0, order_book.get_price(True))
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual([(TradeType.BUY, 102.0, 0.5), (TradeType.SELL, 99.5, 0.25)],
+                         [(trade.type, trade.price, trade.amount) for trade in trade_logger.event_log])
+        self.assertFalse(replay.done)
+
+        self.assertEqual(2, replay.advance(20.0))
+        self.assertEqual([(90.0, 1.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual(10, replay.events_processed)
+        self.assertTrue(replay.done)
+
+    def test_pairs_are_replayed_in_timestamp_order(self):
+        applied = []
+
+        class RecordingOrderBook(OrderBook):
+            def __init__(self, trading_pair: str):
+                super().__init__()
+                self.trading_pair = trading_pair
+
+            def apply_columns(self, *args):
+                applied.append(self.trading_pair)
+                super().apply_columns(*args)
+
+        market_data = {
+            "A-B": MarketDataEvents.from_rows([(1.0, 1, EventType.SNAPSHOT_BID, 1.0, 1.0),
+                                               (3.0, 2, EventType.DIFF_BID, 1.0, 2.0)]),
+            "C-D": MarketDataEvents.from_rows([(2.0, 1, EventType.SNAPSHOT_BID, 1.0, 1.0),
+                                               (4.0, 2, EventType.DIFF_BID, 1.0, 2.0)]),
+        }
+        replay = MarketDataReplay({pair: RecordingOrderBook(pair) for pair in market_data}, market_data)
+
+        replay.advance(10.0)
+
+        self.assertEqual(["A-B", "C-D", "A-B", "C-D"], applied)
+        self.assertEqual(1.0, replay.start_timestamp)
+        self.assertEqual(4.0, replay.end_timestamp)
+
+    def test_save_and_load(self):
+        events = sample_events()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "COINALPHA-HBOT.npz"
+            events.save(path)
+            loaded = MarketDataEvents.load(path)
+
+        self.assertEqual(len(events), len(loaded))
+        for column in MarketDataEvents.COLUMNS:
+            self.assertEqual(getattr(events, column).tolist(), getattr(loaded, column).tolist())
+
+    def test_backtest_order_book_tracker(self):
+        tracker = BacktestOrderBookTracker({"COINALPHA-HBOT": sample_events()})
+        tracker.create_order_books()
+
+        self.assertFalse(tracker.ready)
+        tracker.advance(10.0)
+        self.assertTrue(tracker.ready)
+        self.assertEqual(99.0, tracker.order_books["COINALPHA-HBOT"].get_price(False))
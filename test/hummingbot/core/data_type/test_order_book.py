@@ -2,6 +2,8 @@
 
 import logging
 import unittest
+from decimal import Decimal
+
 from hummingbot.core.data_type.order_book import OrderBook
 import numpy as np
 
@@ -50,6 +52,54 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    @staticmethod
+    def cross_books():
+        bid_book = OrderBook()
+        ask_book = OrderBook()
+        bid_book.apply_numpy_snapshot(np.array([[101, 1, 1], [100.5, 2, 1], [99, 5, 1]], dtype=np.float64),
+                                      np.array([[110, 1, 1]], dtype=np.float64))
+        ask_book.apply_numpy_snapshot(np.array([[90, 1, 1]], dtype=np.float64),
+                                      np.array([[100, 1.5, 1], [100.2, 0, 1], [100.4, 3, 1]], dtype=np.float64))
+        return bid_book, ask_book
+
+    def test_match_cross_book(self):
+        bid_book, ask_book = self.cross_books()
+
+        self.assertEqual([(101, 100, 1), (100.5, 100, 0.5), (100.5, 100.4, 1.5)], bid_book.match_cross_book(ask_book))
+        # A better rate on the ask side, the books no longer cross
+        self.assertEqual([], bid_book.match_cross_book(ask_book, ask_price_rate=1.02))
+        # A negative min profitability bounds the walk by the bid / ask ratio
+        self.assertEqual([(101, 100, 1)], bid_book.match_cross_book(ask_book, bid_price_rate=0.995,
+                                                                    min_profitability=-0.0049))
+        self.assertEqual([], ask_book.match_cross_book(bid_book))
+
+    def test_find_best_profitable_amount(self):
+        bid_book, ask_book = self.cross_books()
+
+        amount, profitability = bid_book.find_best_profitable_amount(ask_book, Decimal("0.003"),
+                                                                     Decimal("0.001"), Decimal("0.001"))
+        self.assertEqual(Decimal("1.5"), amount)
+        expected = (Decimal("151.25") * Decimal("0.999")) / (Decimal("150") * Decimal("1.001"))
+        self.assertEqual(expected, profitability)
+
+        amount, _ = bid_book.find_best_profitable_amount(ask_book, Decimal("0"), max_amount=Decimal("2"))
+        self.assertEqual(Decimal("2"), amount)
+        amount, profitability = bid_book.find_best_profitable_amount(ask_book, Decimal("0.01"))
+        self.assertEqual((Decimal(0), Decimal(0)), (amount, profitability))
+
+    def test_find_best_profitable_amount_decimal_recheck(self):
+        bid_book = OrderBook()
+        ask_book = OrderBook()
+        bid_book.apply_numpy_snapshot(np.array([[0.2, 1, 1], [0.1, 1, 1]], dtype=np.float64),
+                                      np.array([[1, 1, 1]], dtype=np.float64))
+        ask_book.apply_numpy_snapshot(np.array([[0.01, 1, 1]], dtype=np.float64),
+                                      np.array([[0.1, 2, 1]], dtype=np.float64))
+        # In double precision (0.2 + 0.1) / 0.2 is just above 1.5, while its exact value is 1.5 and not above the
+        # threshold, so the Decimal re-check steps back to the first level only
+        amount, profitability = bid_book.find_best_profitable_amount(ask_book, Decimal("0.5"))
+        self.assertEqual(Decimal(1), amount)
+        self.assertAlmostEqual(Decimal(2), profitability, places=20)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,106 @@
+import asyncio
+import unittest
+from typing import Any, Awaitable, Dict, List, Optional
+from unittest.mock import AsyncMock
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.web_assistant.connections.data_types import WSResponse
+
+
+class ShardWebsocketAssistant:
+    def __init__(self, messages: List[Dict[str, Any]]):
+        self.messages = messages
+        self.subscribed_trading_pairs: List[str] = []
+        self.disconnect = AsyncMock()
+
+    async def iter_messages(self):
+        for message in self.messages:
+            yield WSResponse(message)
+        # Lets the other shards and the snapshot requests run before the connection is closed
+        for _ in range(3):
+            await asyncio.sleep(0)
+        raise ConnectionError("closed")
+
+
+class ShardedDataSource(OrderBookTrackerDataSource):
+    MAX_STREAMS_PER_CONNECTION = 4
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.connections: List[ShardWebsocketAssistant] = []
+        self.sleeps: List[float] = []
+        self.snapshot_requests: List[str] = []
+        self.all_connected = asyncio.Event()
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def _connected_websocket_assistant(self):
+        if len(self.connections) >= 6:
+            self.all_connected.set()
+            await asyncio.Event().wait()
+        ws = ShardWebsocketAssistant([{"channel": self._trade_messages_queue_key, "index": len(self.connections)}])
+        self.connections.append(ws)
+        return ws
+
+    async def _subscribe_channels_for_trading_pairs(self, ws, trading_pairs: List[str]):
+        ws.subscribed_trading_pairs = trading_pairs
+
+    def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
+        return event_message["channel"]
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_requests.append(trading_pair)
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {"trading_pair": trading_pair}, timestamp=1)
+
+    async def _sleep(self, delay):
+        self.sleeps.append(delay)
+        await asyncio.sleep(0)
+
+
+class OrderBookTrackerDataSourceTests(unittest.TestCase):
+    ev_loop: asyncio.AbstractEventLoop
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_trading_pairs_are_spread_over_shards(self):
+        data_source = ShardedDataSource([f"PAIR{i}-USDT" for i in range(5)])
+
+        self.assertEqual([["PAIR0-USDT", "PAIR1-USDT"], ["PAIR2-USDT", "PAIR3-USDT"], ["PAIR4-USDT"]],
+                         data_source._trading_pair_shards())
+
+        ShardedDataSource.MAX_STREAMS_PER_CONNECTION = None
+        try:
+            self.assertEqual([data_source._trading_pairs], data_source._trading_pair_shards())
+        finally:
+            ShardedDataSource.MAX_STREAMS_PER_CONNECTION = 4
+
+    def test_each_shard_listens_and_reconnects_through_its_own_connection(self):
+        data_source = ShardedDataSource([f"PAIR{i}-USDT" for i in range(3)])
+        data_source._snapshot_output = asyncio.Queue()
+        listening_task = self.ev_loop.create_task(data_source.listen_for_subscriptions())
+        try:
+            self.async_run_with_timeout(data_source.all_connected.wait())
+            self.async_run_with_timeout(asyncio.sleep(0.01))
+        finally:
+            listening_task.cancel()
+
+        shard_pairs = sorted(tuple(ws.subscribed_trading_pairs) for ws in data_source.connections)
+        self.assertEqual([("PAIR0-USDT", "PAIR1-USDT")] * 3 + [("PAIR2-USDT",)] * 3, shard_pairs)
+        self.assertTrue(all(ws.disconnect.called for ws in data_source.connections))
+        # All the shards feed the same queues
+        self.assertEqual(6, data_source._message_queue[data_source._trade_messages_queue_key].qsize())
+        # The second shard waits a stagger interval before each reconnection
+        self.assertEqual([0, 0, 0, 1.0, 1.0, 1.0], sorted(data_source.sleeps))
+        # Only the trading pairs of the reconnected shard are requested snapshots again
+        self.assertEqual(["PAIR0-USDT"] * 2 + ["PAIR1-USDT"] * 2 + ["PAIR2-USDT"] * 2,
+                         sorted(data_source.snapshot_requests))
+        self.assertEqual(6, data_source._snapshot_output.qsize())
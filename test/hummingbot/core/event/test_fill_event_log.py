@@ -0,0 +1,145 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderFilledEvent
+from hummingbot.core.event.fill_event_log import FillEventLog
+
+
+class FillEventLogTest(unittest.TestCase):
+    def fill_event(self, i: int, **kwargs) -> OrderFilledEvent:
+        values = dict(
+            timestamp=1640000000.5 + i,
+            order_id=f"OID{i // 2}",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=TradeType.BUY if i % 2 == 0 else TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100.10") + i,
+            amount=Decimal("0.0001") * (i + 1),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.001"),
+                                          flat_fees=[TokenAmount("BNB", Decimal("0.000012") * i)]),
+            exchange_trade_id=f"T{i}",
+        )
+        values.update(kwargs)
+        return OrderFilledEvent(**values)
+
+    def test_events_are_created_back_from_the_columns(self):
+        fill_log = FillEventLog(chunk_size=4)
+        events = [self.fill_event(i) for i in range(10)]
+        events.append(self.fill_event(10, trade_fee=DeductedFromReturnsTradeFee(percent=Decimal("0.10")),
+                                      exchange_trade_id=12345, leverage=20, position=PositionAction.OPEN.value))
+        events.append(self.fill_event(11, exchange_trade_id=None, price=Decimal("1E+3"), amount=Decimal("0.000")))
+        for event in events:
+            fill_log.append(event)
+
+        logged_events = list(fill_log)
+
+        self.assertEqual(12, len(fill_log))
+        self.assertEqual(events, logged_events)
+        self.assertEqual("0.10", str(logged_events[10].trade_fee.percent))
+        self.assertEqual(("1E+3", "0.000"), (str(logged_events[11].price), str(logged_events[11].amount)))
+        self.assertEqual(0, len(fill_log._chunks[0].overflow))
+
+    def test_fills_that_do_not_fit_the_columns_are_kept_as_events(self):
+        fill_log = FillEventLog(chunk_size=4)
+        mock_fee = MagicMock()
+        events = [
+            self.fill_event(0),
+            self.fill_event(1, trade_fee=mock_fee),
+            self.fill_event(2, price=Decimal("3.1415926535897932384626433832")),
+            self.fill_event(3, trade_fee=DeductedFromReturnsTradeFee(flat_fees=[TokenAmount("BNB", Decimal("1")),
+                                                                                TokenAmount("ETH", Decimal("2"))])),
+            self.fill_event(4, amount=Decimal("NaN")),
+        ]
+        for event in events:
+            fill_log.append(event)
+
+        logged_events = list(fill_log)
+
+        self.assertIs(mock_fee, logged_events[1].trade_fee)
+        self.assertEqual(events[:4], logged_events[:4])
+        self.assertTrue(logged_events[4].amount.is_nan())
+
+    def test_fills_of_an_order(self):
+        fill_log = FillEventLog(chunk_size=3)
+        for i in range(20):
+            fill_log.append(self.fill_event(i))
+
+        fills = list(fill_log.iter_events(order_id="OID4"))
+
+        self.assertEqual([self.fill_event(8), self.fill_event(9)], fills)
+        self.assertEqual([], list(fill_log.iter_events(order_id="OID100")))
+        self.assertEqual([self.fill_event(19)], list(fill_log.iter_events(order_id="OID9", start_timestamp=1640000019)))
+        self.assertEqual(3, len(list(fill_log.iter_events(start_timestamp=1640000017))))
+
+    def test_traded_amounts_after_a_timestamp(self):
+        fill_log = FillEventLog(chunk_size=3, max_memory_chunks=1)
+        events = [self.fill_event(i) for i in range(10)]
+        events.append(self.fill_event(10, trade_fee=MagicMock()))
+        events.append(self.fill_event(11, trading_pair="ETH-HBOT"))
+        for event in events:
+            fill_log.append(event)
+
+        for after_timestamp in (float("-inf"), 1640000000.5, 1640000004.5, 1640000007, 1640000011.5):
+            expected = {}
+            for event in events:
+                if event.timestamp > after_timestamp:
+                    amount, quote_amount = expected.get((event.trading_pair, event.trade_type), (0, 0))
+                    expected[(event.trading_pair, event.trade_type)] = (amount + event.amount,
+                                                                        quote_amount + event.price * event.amount)
+            self.assertEqual(expected, fill_log.traded_amounts(after_timestamp))
+        self.assertGreater(fill_log.spilled_fills, 0)
+
+    def test_older_chunks_are_spilled_to_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fill_log = FillEventLog(chunk_size=10, max_memory_chunks=2, spill_directory=directory)
+            for i in range(55):
+                fill_log.append(self.fill_event(i))
+
+            self.assertEqual(30, fill_log.spilled_fills)
+            self.assertEqual(3, len(os.listdir(directory)))
+            self.assertEqual([self.fill_event(i) for i in range(55)], list(fill_log))
+            self.assertEqual([self.fill_event(6), self.fill_event(7)], list(fill_log.iter_events(order_id="OID3")))
+
+            fill_log.clear()
+
+            self.assertEqual(0, len(fill_log))
+            self.assertEqual([], os.listdir(directory))
+
+    def test_owned_spill_directory_is_removed(self):
+        fill_log = FillEventLog(chunk_size=2, max_memory_chunks=1)
+        for i in range(7):
+            fill_log.append(self.fill_event(i))
+        directory = fill_log._owned_spill_directory
+
+        self.assertTrue(os.path.isdir(directory))
+
+        del fill_log
+
+        self.assertFalse(os.path.exists(directory))
+
+
+class EventLoggerTest(unittest.TestCase):
+    def test_iter_events_by_type(self):
+        event_logger = EventLogger()
+        created_event = BuyOrderCreatedEvent(1, OrderType.LIMIT, "COINALPHA-HBOT", Decimal("1"), Decimal("100"), "OID1",
+                                             1)
+        fill_event = OrderFilledEvent(2, "OID1", "COINALPHA-HBOT", TradeType.BUY, OrderType.LIMIT, Decimal("100"),
+                                      Decimal("1"), AddedToCostTradeFee())
+        event_logger(fill_event)
+        event_logger(created_event)
+
+        self.assertEqual([created_event, fill_event], event_logger.event_log)
+        self.assertEqual([created_event, fill_event], list(event_logger.iter_events()))
+        self.assertEqual([fill_event], list(event_logger.iter_events(OrderFilledEvent)))
+        self.assertEqual([created_event], list(event_logger.iter_events(BuyOrderCreatedEvent)))
+        self.assertEqual([fill_event], list(event_logger.fill_log.iter_events(order_id="OID1")))
+
+        event_logger.clear()
+
+        self.assertEqual([], event_logger.event_log)
@@ -0,0 +1,129 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.core.gateway.gateway_request_cache import GatewayRequestCache
+
+
+class GatewayRequestCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.cache = GatewayRequestCache({"amm/price": 1.0})
+        self.requests = 0
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def send_request(self, response=None, succeeded: bool = True, delay: float = 0.01):
+        self.requests += 1
+        await asyncio.sleep(delay)
+        if isinstance(response, Exception):
+            raise response
+        return (response if response is not None else {"price": str(self.requests)}), succeeded
+
+    def request(self, params=None, **kwargs):
+        return self.cache.request("post", "amm/price", params or {"base": "WETH"}, lambda: self.send_request(**kwargs))
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        responses = self.async_run_with_timeout(asyncio.gather(*[self.request() for _ in range(5)]))
+
+        self.assertEqual(1, self.requests)
+        self.assertEqual([{"price": "1"}] * 5, responses)
+        self.assertEqual({"amm/price": {"hits": 0, "misses": 1, "coalesced": 4}}, self.cache.stats())
+
+    def test_response_is_reused_until_expired(self):
+        with patch("hummingbot.core.gateway.gateway_request_cache.time.time", return_value=1000.0):
+            self.assertEqual({"price": "1"}, self.async_run_with_timeout(self.request()))
+            self.assertEqual({"price": "1"}, self.async_run_with_timeout(self.request()))
+            self.assertEqual({"price": "2"}, self.async_run_with_timeout(self.request(params={"base": "DAI"})))
+        with patch("hummingbot.core.gateway.gateway_request_cache.time.time", return_value=1001.0):
+            self.assertEqual({"price": "3"}, self.async_run_with_timeout(self.request()))
+
+        self.assertEqual({"amm/price": {"hits": 1, "misses": 3, "coalesced": 0}}, self.cache.stats())
+
+    def test_zero_ttl_only_coalesces(self):
+        self.cache.set_ttl("amm/price", 0)
+
+        self.async_run_with_timeout(asyncio.gather(self.request(), self.request()))
+        self.async_run_with_timeout(self.request())
+
+        self.assertEqual(2, self.requests)
+
+    def test_errors_and_empty_responses_are_not_cached(self):
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(asyncio.gather(self.request(response=ValueError("gateway error")),
+                                                       self.request()))
+        self.assertEqual({}, self.async_run_with_timeout(self.request(response={})))
+        self.assertEqual({"price": "3"}, self.async_run_with_timeout(self.request()))
+
+        self.assertEqual(3, self.requests)
+
+    def test_failed_responses_are_returned_but_not_cached(self):
+        error_response = {"error": "Token not supported", "statusCode": 500}
+        responses = self.async_run_with_timeout(asyncio.gather(
+            self.request(response=error_response, succeeded=False), self.request()))
+
+        self.assertEqual([error_response, error_response], responses)
+        self.assertEqual({"price": "2"}, self.async_run_with_timeout(self.request()))
+        self.assertEqual({"price": "2"}, self.async_run_with_timeout(self.request()))
+        self.assertEqual(2, self.requests)
+
+    def test_cancelled_caller_does_not_cancel_shared_request(self):
+        async def cancel_first_caller():
+            first = asyncio.ensure_future(self.request(delay=0.05))
+            second = asyncio.ensure_future(self.request())
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        self.assertEqual({"price": "1"}, self.async_run_with_timeout(cancel_first_caller()))
+        self.assertEqual(1, self.requests)
+
+
+class GatewayHttpClientRequestCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.client = GatewayHttpClient(ClientConfigAdapter(ClientConfigMap()))
+
+    def test_quote_endpoints_are_coalesced(self):
+        calls = []
+
+        async def send_request(method, path_url, params, fail_silently, use_body):
+            calls.append(path_url)
+            await asyncio.sleep(0.01)
+            return {"price": "1"}, True
+
+        with patch.object(self.client, "_send_request", side_effect=send_request):
+            self.ev_loop.run_until_complete(asyncio.gather(
+                self.client.api_request("post", "amm/price", {"base": "WETH"}),
+                self.client.api_request("post", "amm/price", {"base": "WETH"}),
+                self.client.api_request("post", "amm/trade", {"base": "WETH"}),
+                self.client.api_request("post", "amm/trade", {"base": "WETH"}),
+            ))
+
+        self.assertEqual(["amm/price", "amm/trade", "amm/trade"], sorted(calls))
+        self.assertEqual(1.0, self.client.request_cache.ttl("amm/price"))
+        self.assertEqual({"hits": 0, "misses": 1, "coalesced": 1}, self.client.request_cache.stats()["amm/price"])
+
+    def test_silently_failed_quote_is_not_cached(self):
+        def http_response(status, payload):
+            return MagicMock(status=status, json=AsyncMock(return_value=payload))
+
+        self.client.base_url = "https://localhost:15888"
+        http_client = MagicMock()
+        http_client.post = AsyncMock(side_effect=[http_response(500, {"error": "Token not supported"}),
+                                                  http_response(200, {"price": "1"}),
+                                                  http_response(200, {"price": "2"})])
+
+        with patch.object(GatewayHttpClient, "_http_client", return_value=http_client):
+            responses = [self.ev_loop.run_until_complete(
+                self.client.api_request("post", "amm/price", {"base": "WETH"}, fail_silently=True)) for _ in range(3)]
+
+        self.assertEqual([{"error": "Token not supported"}, {"price": "1"}, {"price": "1"}], responses)
+        self.assertEqual(2, http_client.post.call_count)
@@ -0,0 +1,179 @@
+import asyncio
+import unittest
+from typing import Any, Awaitable, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.gateway import gateway_http_client
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+
+
+class MockGatewayPollAPI:
+    """
+    Stands in for the gateway poll endpoints: answers network/poll and, when batch_supported, network/poll-batch
+    from an in memory set of transactions. batch_error is raised by network/poll-batch when set.
+    """
+
+    def __init__(self, batch_supported: bool):
+        self.batch_supported = batch_supported
+        self.batch_error: Optional[Exception] = None
+        self.transactions: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[str] = []
+        self.polled_hashes: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def add_transaction(self, tx_hash: str, confirmed: bool):
+        self.transactions[tx_hash] = {
+            "txHash": tx_hash,
+            "txStatus": 1 if confirmed else 0,
+            "txReceipt": {"status": 1, "gasUsed": 21000} if confirmed else None,
+        }
+
+    def poll(self, tx_hash: str) -> Dict[str, Any]:
+        self.polled_hashes.append(tx_hash)
+        return self.transactions.get(tx_hash, {"txHash": tx_hash, "txStatus": -1, "txReceipt": None})
+
+    async def api_request(self,
+                          method: str,
+                          path_url: str,
+                          params: Dict[str, Any] = {},
+                          fail_silently: bool = False,
+                          use_body: bool = False) -> Optional[Dict[str, Any]]:
+        self.requests.append(path_url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if path_url == "network/poll-batch":
+            if not self.batch_supported:
+                # The HTML 404 of the missing endpoint
+                raise aiohttp.ContentTypeError(MagicMock(), (), status=404, message="Attempt to decode JSON")
+            if self.batch_error is not None:
+                raise self.batch_error
+            return {"transactions": [self.poll(tx_hash) for tx_hash in params["txHashes"]]}
+        if path_url == "network/poll":
+            return self.poll(params["txHash"])
+        raise ValueError(f"Unexpected request {path_url}")
+
+
+class GatewayTransactionStatusesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.client = GatewayHttpClient(ClientConfigAdapter(ClientConfigMap()))
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def get_statuses(self, api: MockGatewayPollAPI, tx_hashes: List[str]) -> List[Dict[str, Any]]:
+        with patch.object(self.client, "api_request", side_effect=api.api_request):
+            return self.async_run_with_timeout(self.client.get_transaction_statuses("ethereum", "goerli", tx_hashes))
+
+    def test_batch_poll_in_one_request(self):
+        api = MockGatewayPollAPI(batch_supported=True)
+        api.add_transaction("0x01", confirmed=True)
+        api.add_transaction("0x02", confirmed=False)
+
+        statuses = self.get_statuses(api, ["0x01", "0x02", "0x03"])
+
+        self.assertEqual(["network/poll-batch"], api.requests)
+        self.assertEqual(["0x01", "0x02", "0x03"], [status["txHash"] for status in statuses])
+        self.assertEqual([1, 0, -1], [status["txStatus"] for status in statuses])
+
+    def test_batch_poll_split_in_batches(self):
+        api = MockGatewayPollAPI(batch_supported=True)
+        tx_hashes = [f"0x{i:02x}" for i in range(5)]
+
+        with patch.object(gateway_http_client, "TRANSACTION_POLL_BATCH_SIZE", 2):
+            statuses = self.get_statuses(api, tx_hashes)
+
+        self.assertEqual(["network/poll-batch"] * 3, api.requests)
+        self.assertEqual(tx_hashes, [status["txHash"] for status in statuses])
+
+    def test_fall_back_to_bounded_single_polls(self):
+        api = MockGatewayPollAPI(batch_supported=False)
+        tx_hashes = [f"0x{i:02x}" for i in range(12)]
+
+        statuses = self.get_statuses(api, tx_hashes)
+
+        self.assertEqual(tx_hashes, [status["txHash"] for status in statuses])
+        self.assertEqual(["network/poll-batch"] + ["network/poll"] * 12, api.requests)
+        self.assertLessEqual(api.max_in_flight, gateway_http_client.TRANSACTION_POLL_CONCURRENCY)
+
+        # Gateway has no batch endpoint, it is tried again after the retry interval
+        now = self.client._time()
+        with patch.object(GatewayHttpClient, "_time", return_value=now + 1):
+            self.get_statuses(api, tx_hashes[:1])
+        self.assertEqual(["network/poll"] * 13, api.requests[1:])
+
+        api.batch_supported = True
+        retry_time = now + gateway_http_client.TRANSACTION_BATCH_POLL_RETRY_INTERVAL + 1
+        with patch.object(GatewayHttpClient, "_time", return_value=retry_time):
+            self.get_statuses(api, tx_hashes[:1])
+        self.assertEqual("network/poll-batch", api.requests[-1])
+
+    def test_failed_batch_poll_does_not_disable_the_batch_poll(self):
+        api = MockGatewayPollAPI(batch_supported=True)
+
+        # Gateway is unreachable for a moment
+        api.batch_error = ValueError("Error on POST network/poll-batch Error: rate limited")
+        statuses = self.get_statuses(api, ["0x01"])
+        self.assertEqual("0x01", statuses[0]["txHash"])
+        self.assertEqual(["network/poll-batch", "network/poll"], api.requests)
+
+        api.batch_error = None
+        self.get_statuses(api, ["0x01"])
+        self.assertEqual(["network/poll-batch", "network/poll", "network/poll-batch"], api.requests)
+
+    def test_transactions_left_out_of_the_batch_are_polled_alone(self):
+        api = MockGatewayPollAPI(batch_supported=True)
+        api.add_transaction("0x01", confirmed=True)
+        batch_poll = api.api_request
+
+        async def api_request(method, path_url, params={}, fail_silently=False, use_body=False):
+            response = await batch_poll(method, path_url, params, fail_silently, use_body)
+            if path_url == "network/poll-batch":
+                response["transactions"] = response["transactions"][:1]
+            return response
+
+        with patch.object(self.client, "api_request", side_effect=api_request):
+            statuses = self.async_run_with_timeout(
+                self.client.get_transaction_statuses("ethereum", "goerli", ["0x01", "0x02"])
+            )
+
+        self.assertEqual(["network/poll-batch", "network/poll"], api.requests)
+        self.assertEqual(["0x01", "0x02"], [status["txHash"] for status in statuses])
+
+    def test_confirmed_transactions_are_not_polled_again(self):
+        api = MockGatewayPollAPI(batch_supported=True)
+        api.add_transaction("0x01", confirmed=True)
+        api.add_transaction("0x02", confirmed=False)
+
+        self.get_statuses(api, ["0x01", "0x02"])
+        statuses = self.get_statuses(api, ["0x02", "0x01"])
+
+        self.assertEqual(["0x01", "0x02", "0x02"], api.polled_hashes)
+        self.assertEqual(["0x02", "0x01"], [status["txHash"] for status in statuses])
+        self.assertEqual(1, statuses[1]["txStatus"])
+
+    def test_single_poll_errors_are_returned(self):
+        api = MockGatewayPollAPI(batch_supported=False)
+
+        async def api_request(method, path_url, params={}, fail_silently=False, use_body=False):
+            if path_url == "network/poll" and params["txHash"] == "0x02":
+                raise ValueError("Gateway error")
+            return await api.api_request(method, path_url, params, fail_silently, use_body)
+
+        with patch.object(self.client, "api_request", side_effect=api_request):
+            statuses = self.async_run_with_timeout(
+                self.client.get_transaction_statuses("ethereum", "goerli", ["0x01", "0x02"])
+            )
+
+        self.assertEqual("0x01", statuses[0]["txHash"])
+        self.assertIsInstance(statuses[1], ValueError)
@@ -10,7 +10,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateTable, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -22,6 +22,7 @@ class DummyRateSource(RateSourceBase):
         return "dummy_rate_source"
 
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        self.requests_count = getattr(self, "requests_count", 0) + 1
         return deepcopy(self._price_dict)
 
 
@@ -82,6 +83,51 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_rate_table(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75"),
+                  "GBP-EUR": Decimal("1.2"), "WETH-AAVE": Decimal("30")}
+        rate_table = RateTable(prices, reference_token="EUR")
+
+        for pair in ("HBOT-USDT", "ZBOT-USDT", "USDT-HBOT", "HBOT-AAVE", "AAVE-HBOT", "HBOT-GBP"):
+            self.assertEqual(find_rate(prices, pair), rate_table.rate(pair))
+        self.assertEqual(Decimal("1"), rate_table.rate("ETH-WETH"))
+        # Routes of more than two hops go through the reference token
+        self.assertEqual(Decimal("90"), rate_table.rate("HBOT-EUR"))
+        self.assertEqual(Decimal("1350"), rate_table.rate("WETH-EUR"))
+        self.assertEqual(Decimal("15"), rate_table.rate("WETH-HBOT"))
+        self.assertIsNone(rate_table.rate("ZBOT-EUR"))
+
+    def test_rate_table_is_rebuilt_when_prices_change(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {self.trading_pair: Decimal("10")}
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate(self.trading_pair))
+        self.assertEqual(Decimal("0.1"), rate_oracle.get_pair_rate(f"{self.global_token}-{self.target_token}"))
+
+        rate_oracle._prices = {self.trading_pair: Decimal("20")}
+        self.assertEqual(Decimal("20"), rate_oracle.get_pair_rate(self.trading_pair))
+
+    def test_async_rates_share_the_prices_snapshot(self):
+        source = DummyRateSource(price_dict={self.trading_pair: Decimal("10")})
+        rate_oracle = RateOracle(source=source, quote_token=self.global_token)
+
+        rates = self.async_run_with_timeout(asyncio.gather(
+            rate_oracle.rate_async(self.trading_pair),
+            rate_oracle.get_rate(self.target_token),
+            rate_oracle.get_value(Decimal("2"), self.target_token),
+        ))
+
+        self.assertEqual([Decimal("10"), Decimal("10"), Decimal("20")], rates)
+        self.assertEqual(1, source.requests_count)
+
+        rate_oracle._live_rate_table_timestamp -= 2
+        self.async_run_with_timeout(rate_oracle.rate_async(self.trading_pair))
+        self.assertEqual(2, source.requests_count)
+
+        # The prices kept by the price loop are used without requesting the source
+        rate_oracle._prices = {self.trading_pair: Decimal("11")}
+        self.assertEqual(Decimal("11"), self.async_run_with_timeout(rate_oracle.rate_async(self.trading_pair)))
+        self.assertEqual(2, source.requests_count)
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
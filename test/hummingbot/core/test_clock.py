@@ -5,9 +5,29 @@ import time
 
 from hummingbot.core.clock import (
     Clock,
-    ClockMode
+    ClockMode,
+    TickOverrunStats
 )
+from hummingbot.core.clock_mode import TickOverrunPolicy
+from hummingbot.core.network_iterator import NetworkIterator
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.core.utils.tick_profiler import TickProfiler
+
+
+class SlowTimeIterator(PyTimeIterator):
+    def __init__(self, tick_duration: float, connector: NetworkIterator = None):
+        super().__init__()
+        self.tick_duration = tick_duration
+        self.connector = connector
+        self.tick_timestamps = []
+        self.connector_timestamps = []
+
+    def tick(self, timestamp: float):
+        self.tick_timestamps.append(timestamp)
+        if self.connector is not None:
+            self.connector_timestamps.append(self.connector.current_timestamp)
+        time.sleep(self.tick_duration)
 
 
 class ClockUnitTest(unittest.TestCase):
@@ -124,3 +144,106 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_backtest_til_profiles_iterator_ticks(self):
+        profiler = TickProfiler.get_instance()
+        self.clock_backtest.add_iterator(TimeIterator())
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
+        self.assertIsNone(profiler.histogram("TimeIterator", "tick"))
+
+        profiler.start()
+        try:
+            self.clock_backtest.backtest_til(self.backtest_start_timestamp + 3 * self.tick_size)
+        finally:
+            profiler.stop()
+        self.assertEqual(2, profiler.histogram("TimeIterator", "tick").count)
+
+    def test_tick_overrun_stats(self):
+        stats = TickOverrunStats()
+        stats.record_tick(lag=0.01, duration=0.2, missed_ticks=0)
+        stats.record_tick(lag=0.05, duration=2.5, missed_ticks=2)
+
+        self.assertEqual({
+            "ticks": 2,
+            "overruns": 1,
+            "missed_ticks": 2,
+            "deferred_ticks": 0,
+            "last_lag": 0.05,
+            "max_lag": 0.05,
+            "max_tick_duration": 2.5,
+        }, stats.to_dict())
+
+    def run_slow_clock(self, policy: TickOverrunPolicy, *iterators) -> Clock:
+        tick_size = 0.1
+        start = time.time()
+        clock = Clock(ClockMode.REALTIME, tick_size, start, overrun_policy=policy)
+        for iterator in iterators:
+            clock.add_iterator(iterator)
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(start + 1.0))
+        return clock
+
+    def test_run_til_skip_policy_waits_for_next_tick_after_overrun(self):
+        iterator = SlowTimeIterator(tick_duration=0.15)
+        clock = self.run_slow_clock(TickOverrunPolicy.SKIP, iterator)
+
+        stats = clock.overrun_stats
+        self.assertEqual(TickOverrunPolicy.SKIP, clock.overrun_policy)
+        self.assertGreater(stats.ticks, 1)
+        self.assertEqual(stats.ticks, stats.overruns)
+        self.assertGreaterEqual(stats.missed_ticks, stats.ticks)
+        self.assertGreaterEqual(stats.max_tick_duration, 0.15)
+        gaps = [b - a for a, b in zip(iterator.tick_timestamps, iterator.tick_timestamps[1:])]
+        self.assertTrue(all(gap > 0.15 for gap in gaps))
+
+    def test_run_til_coalesce_policy_runs_late_tick_immediately(self):
+        iterator = SlowTimeIterator(tick_duration=0.15)
+        clock = self.run_slow_clock(TickOverrunPolicy.COALESCE, iterator)
+
+        self.assertGreater(clock.overrun_stats.overruns, 0)
+        gaps = [b - a for a, b in zip(iterator.tick_timestamps, iterator.tick_timestamps[1:])]
+        # A late tick carries the timestamp of the boundary it missed, one tick after the previous one
+        self.assertTrue(any(gap < 0.15 for gap in gaps))
+
+    def test_run_til_late_ticks_let_other_coroutines_run(self):
+        iterator = SlowTimeIterator(tick_duration=0.15)
+        other_coroutine_runs = []
+
+        async def other_coroutine():
+            while True:
+                other_coroutine_runs.append(len(iterator.tick_timestamps))
+                await asyncio.sleep(0)
+
+        task = self.ev_loop.create_task(other_coroutine())
+        try:
+            self.run_slow_clock(TickOverrunPolicy.COALESCE, iterator)
+        finally:
+            task.cancel()
+
+        # Every late tick awaits before running, the coroutine runs between the ticks
+        self.assertGreater(len(iterator.tick_timestamps), 2)
+        self.assertTrue(set(range(1, len(iterator.tick_timestamps))) <= set(other_coroutine_runs))
+
+    def test_run_til_connectors_first_policy_defers_strategy_once(self):
+        connector = NetworkIterator()
+        strategy = SlowTimeIterator(tick_duration=0.15, connector=connector)
+        clock = self.run_slow_clock(TickOverrunPolicy.CONNECTORS_FIRST, strategy, connector)
+
+        stats = clock.overrun_stats
+        self.assertGreater(stats.deferred_ticks, 0)
+        # The connector is ticked before the strategy, and the strategy is never deferred twice in a row
+        self.assertEqual(strategy.tick_timestamps, strategy.connector_timestamps)
+        self.assertLessEqual(stats.ticks, len(strategy.tick_timestamps) * 2 + 1)
+        self.assertEqual(stats.ticks, len(strategy.tick_timestamps) + stats.deferred_ticks)
+
+    def test_run_til_exports_overrun_counters_to_profiler(self):
+        profiler = TickProfiler.get_instance()
+        profiler.start()
+        try:
+            self.run_slow_clock(TickOverrunPolicy.SKIP, SlowTimeIterator(tick_duration=0.15))
+        finally:
+            profiler.stop()
+
+        self.assertGreater(profiler.counters("Clock")["overruns"], 0)
+        self.assertGreater(profiler.histogram("Clock", "tick_lag").count, 0)
@@ -4,6 +4,7 @@ import weakref
 
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.utils.tick_profiler import TickProfiler
 
 from test.mock.mock_events import MockEventType, MockEvent
 
@@ -89,6 +90,20 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_trigger_event_profiles_listener_calls(self):
+        profiler = TickProfiler.get_instance()
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        profiler.start()
+        try:
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        finally:
+            profiler.stop()
+
+        self.assertEqual(2, len(self.listener_zero.event_log))
+        self.assertEqual(1, profiler.histogram("PubSub", "event:EventLogger").count)
+
 
 if __name__ == "__main__":
     unittest.main()
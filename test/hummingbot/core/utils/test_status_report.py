@@ -0,0 +1,101 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from hummingbot.core.utils.status_report import StatusReport, StatusTable, map_table_to_str, render_status_table
+
+
+class StatusReportTest(unittest.TestCase):
+    def test_table_rendered_as_data_frame_to_string(self):
+        table = StatusTable(
+            ["Exchange", "Market", "Best Bid", "Amount", "Level"],
+            [["binance", "COINALPHA-HBOT", 99.5, Decimal("100"), 1],
+             ["kucoin", "HBOT-USDT", 100.0, Decimal("0.50"), 12]])
+
+        lines = render_status_table(table)
+
+        self.assertEqual(["Exchange         Market  Best Bid Amount  Level",
+                          " binance COINALPHA-HBOT      99.5    100      1",
+                          "  kucoin      HBOT-USDT       100   0.50     12"], lines)
+
+    def test_table_of_strings_rendered_as_data_frame_to_string(self):
+        table = StatusTable(["Exchange", "Best Bid", "Spread"],
+                            [["binance", 99.5, "1.00%"], ["kucoin_paper_trade", 100.25, "10.00%"]])
+        df = pd.DataFrame(data=[[str(value) for value in row] for row in map_table_to_str(table).rows],
+                          columns=table.columns)
+
+        self.assertEqual(df.to_string(index=False).split("\n"), render_status_table(map_table_to_str(table)))
+
+    def test_table_without_header_with_first_column_aligned_on_the_left(self):
+        table = map_table_to_str(StatusTable([0, 1, 2], [["", "BTC", "USDT"],
+                                                         ["Total Balance", 1.5, 1000.0],
+                                                         ["Current %", "50.0%", "50.0%"]]))
+
+        lines = render_status_table(table, header=False, left_align_first_column=True)
+
+        self.assertEqual(["                BTC  USDT",
+                          "Total Balance   1.5  1000",
+                          "Current %     50.0% 50.0%"], lines)
+
+    def test_sections_rendered_in_update_order(self):
+        report = StatusReport()
+        report.update_table("markets", "Markets",
+                            lambda: StatusTable(["Market", "Price"], [["BTC-USDT", "100"]]), ("BTC-USDT", 100))
+        report.update_lines("orders", ["", "  No active maker orders."])
+
+        self.assertEqual("\n  Markets:"
+                         "\n      Market Price"
+                         "\n    BTC-USDT   100"
+                         "\n\n  No active maker orders.", report.render())
+
+        report.update_lines("orders", ["", "  No active maker orders."])
+        report.update_lines("warnings", ["", "*** WARNINGS ***"])
+
+        self.assertEqual("\n  No active maker orders.\n\n*** WARNINGS ***", report.render())
+
+    def test_tables_built_only_when_their_inputs_changed(self):
+        report = StatusReport()
+        build_markets = MagicMock(return_value=StatusTable(["Market", "Price"], [["BTC-USDT", "100"]]))
+        build_orders = MagicMock(return_value=StatusTable(["Type", "Price"], [["buy", "99"]]))
+
+        report.update_table("markets", "Markets", build_markets, ("BTC-USDT", 100))
+        report.update_table("orders", "Orders", build_orders, (("buy", 99),))
+        text = report.render()
+
+        report.update_table("markets", "Markets", build_markets, ("BTC-USDT", 100))
+        report.update_table("orders", "Orders", build_orders, (("buy", 99),))
+        self.assertFalse(report.is_dirty)
+        self.assertIs(text, report.render())
+        self.assertEqual(1, build_markets.call_count)
+        self.assertEqual(1, build_orders.call_count)
+
+        build_orders.return_value = StatusTable(["Type", "Price"], [["sell", "101"]])
+        report.update_table("markets", "Markets", build_markets, ("BTC-USDT", 100))
+        report.update_table("orders", "Orders", build_orders, (("sell", 101),))
+        self.assertTrue(report.is_dirty)
+        text = report.render()
+        self.assertEqual(1, build_markets.call_count)
+        self.assertEqual(2, build_orders.call_count)
+        self.assertIn("BTC-USDT", text)
+        self.assertIn("sell", text)
+        self.assertNotIn("buy", text)
+
+    def test_table_without_inputs_built_on_every_update(self):
+        report = StatusReport()
+        build_table = MagicMock(return_value=StatusTable(["Market"], [["BTC-USDT"]]))
+
+        report.update_table("markets", "Markets", build_table, None)
+        text = report.render()
+        report.update_table("markets", "Markets", build_table, None)
+
+        self.assertEqual(text, report.render())
+        self.assertEqual(2, build_table.call_count)
+
+    def test_section_left_out_when_its_table_is_none(self):
+        report = StatusReport()
+        report.update_table("oracle", "Rate conversion", lambda: None, ())
+        report.update_lines("orders", ["", "  No active maker orders."])
+
+        self.assertEqual("\n  No active maker orders.", report.render())
@@ -0,0 +1,95 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from hummingbot.core.utils.tick_profiler import LatencyHistogram, TickProfiler
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.mean_ns)
+        self.assertEqual(0, histogram.percentile_ns(99))
+
+    def test_record_and_percentiles(self):
+        histogram = LatencyHistogram()
+        for _ in range(98):
+            histogram.record(1_000)
+        histogram.record(1_000_000)
+        histogram.record(3_000_000)
+
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(3_000_000, histogram.max_ns)
+        self.assertEqual(98_000 + 4_000_000, histogram.total_ns)
+        # 1000 ns has 10 significant bits, the bucket upper bound is 1023 ns
+        self.assertEqual(1023, histogram.percentile_ns(50))
+        self.assertEqual(1023, histogram.percentile_ns(98))
+        self.assertEqual((1 << 20) - 1, histogram.percentile_ns(99))
+        self.assertEqual(3_000_000, histogram.percentile_ns(100))
+
+    def test_to_dict_in_microseconds(self):
+        histogram = LatencyHistogram()
+        histogram.record(2_000)
+        histogram.record(4_000)
+
+        values = histogram.to_dict()
+
+        self.assertEqual(2, values["count"])
+        self.assertEqual(3.0, values["mean_us"])
+        self.assertEqual(4.0, values["max_us"])
+        self.assertEqual(0.006, values["total_ms"])
+
+
+class TickProfilerTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.profiler = TickProfiler()
+
+    def test_shared_instance(self):
+        self.assertIs(TickProfiler.get_instance(), TickProfiler.get_instance())
+
+    def test_start_and_stop(self):
+        self.assertFalse(self.profiler.enabled)
+        self.profiler.record("Strategy", "tick", 100)
+
+        self.profiler.start()
+        self.assertTrue(self.profiler.enabled)
+        self.assertEqual([], self.profiler.snapshot())
+
+        self.profiler.stop()
+        self.assertFalse(self.profiler.enabled)
+
+    def test_snapshot_sorted_by_total_time(self):
+        self.profiler.start()
+        self.profiler.record("Exchange", "tick", 1_000)
+        self.profiler.record("Strategy", "tick", 5_000)
+        self.profiler.record("Strategy", "tick", 5_000)
+
+        rows = self.profiler.snapshot()
+
+        self.assertEqual([("Strategy", "tick"), ("Exchange", "tick")], [(r["component"], r["stage"]) for r in rows])
+        self.assertEqual(2, rows[0]["count"])
+        self.assertEqual(2, self.profiler.histogram("Strategy", "tick").count)
+        self.assertIsNone(self.profiler.histogram("Strategy", "unknown"))
+
+    def test_periodic_export(self):
+        with tempfile.TemporaryDirectory() as directory:
+            export_path = Path(directory) / "profile" / "tick_profile.json"
+            self.profiler.start(export_path=export_path, export_interval=60)
+            self.profiler.record("Strategy", "tick", 1_000)
+
+            self.profiler.export_if_due(self.profiler._last_export_timestamp + 10)
+            self.assertFalse(export_path.exists())
+
+            self.profiler.export_if_due(self.profiler._last_export_timestamp + 60)
+            metrics = json.loads(export_path.read_text())
+            self.assertEqual("Strategy", metrics["stages"][0]["component"])
+            self.assertEqual(1, metrics["stages"][0]["count"])
+
+            self.profiler.record("Strategy", "tick", 1_000)
+            self.profiler.stop()
+            metrics = json.loads(export_path.read_text())
+            self.assertEqual(2, metrics["stages"][0]["count"])
@@ -1,7 +1,10 @@
 import asyncio
 import json
+import tempfile
+import time
 import unittest
 from decimal import Decimal
+from pathlib import Path
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -13,6 +16,7 @@ from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.settings import ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.utils import trading_pair_fetcher as trading_pair_fetcher_module
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
@@ -31,6 +35,16 @@ class TestTradingPairFetcher(unittest.TestCase):
             else:
                 await asyncio.sleep(0)
 
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / "trading_pairs_cache.json"
+        cache_path_patch = patch.object(trading_pair_fetcher_module, "TRADING_PAIRS_CACHE_PATH", self.cache_path)
+        cache_path_patch.start()
+        self.addCleanup(cache_path_patch.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
     def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
         ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
         return ret
@@ -81,8 +95,8 @@ class TestTradingPairFetcher(unittest.TestCase):
             "mock_paper_trade": self.MockConnectorSetting(name="mock_paper_trade", parent_name="mock_exchange_1")
         }
 
-        client_config_map = ClientConfigAdapter(ClientConfigMap())
-        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(self.client_config_map)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
@@ -237,8 +251,8 @@ class TestTradingPairFetcher(unittest.TestCase):
             "wallet_address": "0x..."
         }
 
-        client_config_map = ClientConfigAdapter(ClientConfigMap())
-        fetcher = TradingPairFetcher(client_config_map)
+        self.client_config_map.fetch_pairs_from_all_exchanges = True
+        fetcher = TradingPairFetcher(self.client_config_map)
         asyncio.get_event_loop().run_until_complete(fetcher._fetch_task)
         trading_pairs = fetcher.trading_pairs
 
@@ -253,3 +267,104 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(1, len(perp_pairs))
         self.assertIn("ABC-USD", perp_pairs)
         self.assertNotIn("WETH-USDT", perp_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_trading_pairs_are_fetched_on_demand_and_cached(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange": self.MockConnectorSetting(name="mock_exchange", connector=connector),
+            "other_exchange": self.MockConnectorSetting(name="other_exchange", connector=AsyncMock()),
+        }
+
+        fetcher = TradingPairFetcher(self.client_config_map)
+
+        self.assertTrue(fetcher.ready)
+        self.assertEqual([], fetcher.get_trading_pairs("mock_exchange"))
+        self.async_run_with_timeout(fetcher.fetch_trading_pairs("mock_exchange"))
+        self.assertEqual(["MOCK-HBOT"], fetcher.get_trading_pairs("mock_exchange"))
+        self.assertEqual(1, connector.all_trading_pairs.call_count)
+        self.assertNotIn("other_exchange", fetcher.trading_pairs)
+        self.assertEqual(["MOCK-HBOT"], json.loads(self.cache_path.read_text())["mock_exchange"]["trading_pairs"])
+
+        # A new client uses the cached trading pairs
+        fetcher = TradingPairFetcher(self.client_config_map)
+        self.assertEqual(["MOCK-HBOT"], fetcher.get_trading_pairs("mock_exchange"))
+        self.assertIsNone(fetcher._fetch_tasks.get("mock_exchange"))
+
+        # The expired trading pairs are served while they are refreshed
+        fetcher._fetch_timestamps["mock_exchange"] = time.time() - trading_pair_fetcher_module.TRADING_PAIRS_CACHE_TTL - 1
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT", "MOCK-USDT"]
+        self.assertEqual(["MOCK-HBOT"], fetcher.get_trading_pairs("mock_exchange"))
+        self.async_run_with_timeout(fetcher._fetch_tasks["mock_exchange"])
+        self.assertEqual(["MOCK-HBOT", "MOCK-USDT"], fetcher.get_trading_pairs("mock_exchange"))
+        self.assertEqual(2, connector.all_trading_pairs.call_count)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_failed_fetch_is_retried_after_the_retry_interval(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = [IOError("Network error"), ["MOCK-HBOT"]]
+        mock_connector_settings.return_value = {
+            "mock_exchange": self.MockConnectorSetting(name="mock_exchange", connector=connector),
+        }
+
+        fetcher = TradingPairFetcher(self.client_config_map)
+
+        self.assertEqual([], fetcher.get_trading_pairs("mock_exchange"))
+        failed_fetch_task = fetcher._fetch_tasks["mock_exchange"]
+        self.async_run_with_timeout(failed_fetch_task)
+        self.assertNotIn("mock_exchange", fetcher._fetch_timestamps)
+
+        # The following requests (e.g. the autocompletion keystrokes) don't fetch again right away
+        self.assertEqual([], fetcher.get_trading_pairs("mock_exchange"))
+        self.assertIs(failed_fetch_task, fetcher._fetch_tasks["mock_exchange"])
+        self.assertEqual(1, connector.all_trading_pairs.call_count)
+
+        fetcher._failed_fetch_timestamps["mock_exchange"] -= trading_pair_fetcher_module.TRADING_PAIRS_FETCH_RETRY_INTERVAL
+        self.assertEqual([], fetcher.get_trading_pairs("mock_exchange"))
+        self.async_run_with_timeout(fetcher._fetch_tasks["mock_exchange"])
+        self.assertNotIn("mock_exchange", fetcher._failed_fetch_timestamps)
+        self.assertEqual(["MOCK-HBOT"], fetcher.get_trading_pairs("mock_exchange"))
+        self.assertEqual(2, connector.all_trading_pairs.call_count)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_trading_pairs_are_not_fetched_when_disabled(self, mock_connector_settings):
+        connector = AsyncMock()
+        mock_connector_settings.return_value = {
+            "mock_exchange": self.MockConnectorSetting(name="mock_exchange", connector=connector),
+        }
+        self.client_config_map.fetch_pairs_from_all_exchanges = True
+
+        fetcher = TradingPairFetcher(self.client_config_map, fetch_trading_pairs=False)
+
+        self.assertTrue(fetcher.ready)
+        self.assertEqual([], fetcher.get_trading_pairs("mock_exchange"))
+        self.assertIsNone(fetcher.fetch_trading_pairs("mock_exchange"))
+        connector.all_trading_pairs.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_concurrent_fetches_are_bounded(self, mock_connector_settings):
+        running = []
+        max_running = []
+
+        async def all_trading_pairs():
+            running.append(1)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return ["MOCK-HBOT"]
+
+        connector_settings = {}
+        for i in range(10):
+            connector = MagicMock()
+            connector.all_trading_pairs.side_effect = all_trading_pairs
+            connector_settings[f"exchange_{i}"] = self.MockConnectorSetting(name=f"exchange_{i}", connector=connector)
+        mock_connector_settings.return_value = connector_settings
+        self.client_config_map.fetch_pairs_from_all_exchanges = True
+
+        fetcher = TradingPairFetcher(self.client_config_map)
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        self.assertEqual(10, len(fetcher.trading_pairs))
+        self.assertEqual(trading_pair_fetcher_module.MAX_CONCURRENT_FETCHES, max(max_running))
+        self.assertEqual(10, len(json.loads(self.cache_path.read_text())))
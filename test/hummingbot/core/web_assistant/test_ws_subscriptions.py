@@ -0,0 +1,150 @@
+import asyncio
+import json
+import unittest
+from typing import Any, Awaitable, List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSPlainTextRequest, WSResponse
+from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_subscriptions import (
+    WSSubscriptionAck,
+    WSSubscriptionFormatBase,
+    WSSubscriptionManager,
+)
+
+
+class SubscriptionFormat(WSSubscriptionFormatBase):
+    max_channels_per_frame = 3
+
+    def subscription_payload(self, channels: List[str], request_id: int) -> Any:
+        return {"method": "SUBSCRIBE", "params": channels, "id": request_id}
+
+    def is_auth_required(self, channels: List[str]) -> bool:
+        return any(channel.startswith("user") for channel in channels)
+
+    def acknowledgement(self, data: Any) -> Optional[WSSubscriptionAck]:
+        if isinstance(data, dict) and "id" in data:
+            return WSSubscriptionAck(request_id=data["id"], success="error" not in data)
+        return None
+
+
+class UnacknowledgedSubscriptionFormat(SubscriptionFormat):
+    acknowledgement = WSSubscriptionFormatBase.acknowledgement
+
+
+class WSSubscriptionManagerTest(unittest.TestCase):
+    ev_loop: asyncio.AbstractEventLoop
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = WSSubscriptionManager(SubscriptionFormat(), ack_timeout=5)
+        self.ws_connection = WSConnection(MagicMock(spec=aiohttp.ClientSession))
+        self.ws_assistant = WSAssistant(self.ws_connection, subscription_manager=self.manager)
+        self.sent_requests = []
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def sent_channels(self) -> List[List[str]]:
+        return [json.loads(request.payload)["params"] for request in self.sent_requests]
+
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
+    def test_channels_are_batched_in_pre_serialized_frames(self, send_mock):
+        send_mock.side_effect = lambda request: self.sent_requests.append(request)
+        channels = [f"pair{i}@depth" for i in range(7)]
+
+        frames = self.async_run_with_timeout(self.ws_assistant.subscribe_channels(channels))
+
+        self.assertEqual(3, frames)
+        self.assertTrue(all(isinstance(request, WSPlainTextRequest) for request in self.sent_requests))
+        self.assertEqual([channels[0:3], channels[3:6], channels[6:]], self.sent_channels())
+        self.assertEqual([1, 2, 3], [json.loads(request.payload)["id"] for request in self.sent_requests])
+        self.assertEqual([], self.manager.missing_channels)
+        self.assertFalse(self.manager.is_fully_subscribed)
+
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
+    def test_auth_frames_are_sent_as_json_requests(self, send_mock):
+        send_mock.side_effect = lambda request: self.sent_requests.append(request)
+
+        self.async_run_with_timeout(self.ws_assistant.subscribe_channels(["user.orders"]))
+
+        self.assertIsInstance(self.sent_requests[0], WSJSONRequest)
+        self.assertTrue(self.sent_requests[0].is_auth_required)
+
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.receive")
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
+    def test_only_missing_channels_are_subscribed_again(self, send_mock, receive_mock):
+        send_mock.side_effect = lambda request: self.sent_requests.append(request)
+        channels = [f"pair{i}@trade" for i in range(5)]
+        self.async_run_with_timeout(self.ws_assistant.subscribe_channels(channels))
+
+        receive_mock.side_effect = [WSResponse({"id": 1, "result": None}),
+                                    WSResponse({"id": 2, "error": {"code": 2, "msg": "Invalid request"}})]
+        self.async_run_with_timeout(self.ws_assistant.receive())
+        self.async_run_with_timeout(self.ws_assistant.receive())
+
+        self.assertEqual(set(channels[:3]), self.manager.acknowledged_channels)
+        self.assertEqual(channels[3:], self.manager.missing_channels)
+
+        self.sent_requests.clear()
+        frames = self.async_run_with_timeout(self.ws_assistant.subscribe_channels(["pair5@trade"]))
+
+        self.assertEqual(1, frames)
+        self.assertEqual([["pair3@trade", "pair4@trade", "pair5@trade"]], self.sent_channels())
+
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.connect", new_callable=AsyncMock)
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
+    def test_reconnection_subscribes_to_all_the_channels_again(self, send_mock, _):
+        send_mock.side_effect = lambda request: self.sent_requests.append(request)
+        self.async_run_with_timeout(self.ws_assistant.subscribe_channels(["a", "b", "c", "d"]))
+        self.manager.process_message({"id": 1})
+        self.manager.process_message({"id": 2})
+        self.assertTrue(self.manager.is_fully_subscribed)
+
+        self.async_run_with_timeout(self.ws_assistant.connect("ws://some.url"))
+        self.sent_requests.clear()
+        self.async_run_with_timeout(self.ws_assistant.subscribe_channels())
+
+        self.assertEqual([["a", "b", "c"], ["d"]], self.sent_channels())
+
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
+    def test_unacknowledged_frames_expire(self, send_mock):
+        send_mock.side_effect = lambda request: self.sent_requests.append(request)
+        with patch.object(WSSubscriptionManager, "_time", return_value=1000):
+            self.async_run_with_timeout(self.ws_assistant.subscribe_channels(["a", "b"]))
+        self.sent_requests.clear()
+
+        with patch.object(WSSubscriptionManager, "_time", return_value=1006):
+            frames = self.async_run_with_timeout(self.ws_assistant.subscribe_channels())
+
+        self.assertEqual(1, frames)
+        self.assertEqual([["a", "b"]], self.sent_channels())
+
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
+    def test_frames_are_paced_by_the_throttler(self, send_mock):
+        send_mock.side_effect = lambda request: self.sent_requests.append(request)
+        throttler = MagicMock()
+        throttler.execute_task.return_value.__aenter__ = AsyncMock()
+        throttler.execute_task.return_value.__aexit__ = AsyncMock(return_value=False)
+        manager = WSSubscriptionManager(UnacknowledgedSubscriptionFormat(), throttler, "WSSubscribe")
+        ws_assistant = WSAssistant(self.ws_connection, subscription_manager=manager)
+
+        self.async_run_with_timeout(ws_assistant.subscribe_channels([str(i) for i in range(7)]))
+
+        self.assertEqual(3, throttler.execute_task.call_count)
+        throttler.execute_task.assert_called_with(limit_id="WSSubscribe")
+        # Without acknowledgements the channels are subscribed once sent
+        self.assertTrue(manager.is_fully_subscribed)
+
+    def test_subscribe_channels_requires_a_subscription_manager(self):
+        with self.assertRaises(RuntimeError):
+            self.async_run_with_timeout(WSAssistant(self.ws_connection).subscribe_channels(["a"]))
@@ -0,0 +1,148 @@
+import logging
+import threading
+import unittest
+from typing import List
+
+from hummingbot.logger.queue_log_handler import (
+    LogDispatcher,
+    QueueLogHandler,
+    QueueOverflowPolicy,
+    install_queue_logging,
+    uninstall_queue_logging,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.messages: List[str] = []
+        self.threads: List[str] = []
+        self.unblocked = threading.Event()
+        self.unblocked.set()
+
+    def emit(self, record: logging.LogRecord):
+        self.unblocked.wait()
+        self.messages.append(self.format(record))
+        self.threads.append(threading.current_thread().name)
+
+
+class QueueLogHandlerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.handler = RecordingHandler()
+        self.logger = logging.getLogger("test.queue_log_handler")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.logger.handlers = [self.handler]
+        self.dispatchers: List[LogDispatcher] = []
+
+    def tearDown(self) -> None:
+        self.handler.unblocked.set()
+        uninstall_queue_logging()
+        for dispatcher in self.dispatchers:
+            dispatcher.stop()
+        self.logger.handlers = []
+        super().tearDown()
+
+    def start_dispatcher(self, **kwargs) -> LogDispatcher:
+        dispatcher = LogDispatcher(**kwargs)
+        dispatcher.start()
+        self.dispatchers.append(dispatcher)
+        self.logger.handlers = [QueueLogHandler(dispatcher, [self.handler])]
+        return dispatcher
+
+    def test_records_are_formatted_and_written_on_the_dispatcher_thread(self):
+        dispatcher = self.start_dispatcher()
+        arguments = {"order_id": "OID1"}
+
+        self.logger.debug("Order %(order_id)s created.", arguments)
+        self.logger.info("Order %s filled.", "OID2")
+        dispatcher.flush()
+        dispatcher.stop()
+
+        self.assertEqual(["Order OID1 created.", "Order OID2 filled."], self.handler.messages)
+        self.assertEqual(["LogDispatcher", "LogDispatcher"], self.handler.threads)
+
+    def test_handler_levels_are_applied(self):
+        warning_handler = RecordingHandler(logging.WARNING)
+        dispatcher = LogDispatcher()
+        dispatcher.start()
+        self.dispatchers.append(dispatcher)
+        queue_handler = QueueLogHandler(dispatcher, [self.handler, warning_handler])
+        self.logger.handlers = [queue_handler]
+
+        self.logger.info("Info")
+        self.logger.warning("Warning")
+        dispatcher.stop()
+
+        self.assertEqual(logging.NOTSET, queue_handler.level)
+        self.assertEqual(["Info", "Warning"], self.handler.messages)
+        self.assertEqual(["Warning"], warning_handler.messages)
+
+    def test_oldest_records_are_dropped_when_the_queue_is_full(self):
+        dispatcher = self.start_dispatcher(max_size=5)
+        self.handler.unblocked.clear()
+        self.logger.info("Record 0")
+        while dispatcher.queue_size > 0:
+            pass
+
+        for i in range(1, 21):
+            self.logger.info(f"Record {i}")
+        self.assertEqual(5, dispatcher.queue_size)
+        self.assertEqual(15, dispatcher.dropped_count)
+
+        dropped_records_logs = RecordingHandler()
+        logging.getLogger("hummingbot.logger.queue_log_handler").addHandler(dropped_records_logs)
+        try:
+            self.handler.unblocked.set()
+            dispatcher.stop()
+        finally:
+            logging.getLogger("hummingbot.logger.queue_log_handler").removeHandler(dropped_records_logs)
+
+        self.assertEqual(["Record 0"] + [f"Record {i}" for i in range(16, 21)], self.handler.messages)
+        self.assertEqual(["The logging queue is full, 15 log records were dropped (drop_oldest policy)."],
+                         dropped_records_logs.messages)
+
+    def test_records_below_warning_are_sampled_when_the_queue_fills(self):
+        dispatcher = self.start_dispatcher(max_size=10, overflow_policy=QueueOverflowPolicy.sample, sample_rate=4)
+        self.handler.unblocked.clear()
+        self.logger.info("Record 0")
+        while dispatcher.queue_size > 0:
+            pass
+
+        for i in range(1, 25):
+            self.logger.debug(f"Record {i}")
+        self.logger.error("Error")
+
+        # Records 1 to 5 fill half of the queue, then one record out of 4 is queued
+        self.assertEqual(5 + 19 // 4 + 1, dispatcher.queue_size)
+        self.handler.unblocked.set()
+        dispatcher.stop()
+        self.assertEqual("Error", self.handler.messages[-1])
+        self.assertEqual(["Record 9", "Record 13", "Record 17", "Record 21"], self.handler.messages[6:10])
+
+    def test_install_and_uninstall_queue_logging(self):
+        other_logger = logging.getLogger("test.queue_log_handler.other")
+        other_logger.propagate = False
+        other_logger.handlers = [self.handler]
+        try:
+            dispatcher = install_queue_logging()
+
+            self.assertIsInstance(self.logger.handlers[0], QueueLogHandler)
+            self.assertIs(self.logger.handlers[0], other_logger.handlers[0])
+            self.assertEqual([self.handler], self.logger.handlers[0].handlers)
+
+            self.logger.info("Queued")
+            uninstall_queue_logging()
+
+            self.assertEqual(["Queued"], self.handler.messages)
+            self.assertEqual(["LogDispatcher"], self.handler.threads)
+            self.assertEqual([self.handler], self.logger.handlers)
+            self.assertEqual([self.handler], other_logger.handlers)
+
+            # Once stopped the records are written right away
+            dispatcher.put(self.logger.makeRecord(self.logger.name, logging.INFO, "", 0, "Direct", (), None),
+                           [self.handler])
+            self.assertEqual(threading.current_thread().name, self.handler.threads[-1])
+        finally:
+            other_logger.handlers = []
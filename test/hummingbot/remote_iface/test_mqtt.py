@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from decimal import Decimal
 from typing import Awaitable
 from unittest import TestCase
@@ -17,7 +18,8 @@ from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, Orde
 from hummingbot.core.mock_api.mock_mqtt_server import FakeMQTTBroker
 from hummingbot.model.order import Order
 from hummingbot.model.trade_fill import TradeFill
-from hummingbot.remote_iface.mqtt import MQTTGateway, MQTTMarketEventForwarder
+from hummingbot.remote_iface.messages import EventMessage, NotifyMessage
+from hummingbot.remote_iface.mqtt import MQTTGateway, MQTTMarketEventForwarder, MQTTPublishQueue, TopicSpecs
 
 
 class RemoteIfaceMQTTTests(TestCase):
@@ -93,6 +95,8 @@ class RemoteIfaceMQTTTests(TestCase):
         raise RuntimeError(self.fake_err_msg)
 
     def is_msg_received(self, *args, **kwargs):
+        # The notifications and events are published by the sender thread of the publish queue
+        self.gateway.publish_queue.flush()
         return self.fake_mqtt_broker.is_msg_received(*args, **kwargs)
 
     async def wait_for_rcv(self, topic, content=None, msg_key = 'msg'):
@@ -771,3 +775,181 @@ class RemoteIfaceMQTTTests(TestCase):
     #             return
     #     self.assertTrue(0)
     #     self.gateway.stop()
+
+    @staticmethod
+    def build_blocking_message(unblocked: threading.Event, started: threading.Event, msg: str) -> NotifyMessage:
+        started.set()
+        unblocked.wait()
+        return NotifyMessage(msg=msg)
+
+    def block_publish_queue(self, publish_queue: MQTTPublishQueue, publisher) -> threading.Event:
+        # The sender thread waits on the returned event while building the first message
+        unblocked, started = threading.Event(), threading.Event()
+        publish_queue.put(publisher, self.build_blocking_message, unblocked, started, "first")
+        started.wait(1)
+        return unblocked
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_publish_queue_batches_messages_per_topic(self,
+                                                           mock_mqtt):
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        events_publisher = self.gateway._market_events.event_fw_pub
+        notify_publisher = self.gateway._notifier.notify_pub
+        publish_queue = MQTTPublishQueue(qos=1, batch_size=2)
+        publish_queue.start()
+
+        unblocked = self.block_publish_queue(publish_queue, notify_publisher)
+        for event_type in ("BuyOrderCreated", "OrderFilled", "BuyOrderCompleted"):
+            publish_queue.put(events_publisher, EventMessage, type=event_type)
+        publish_queue.put(notify_publisher, NotifyMessage, msg="second")
+        self.assertEqual(4, publish_queue.queue_size)
+        unblocked.set()
+        publish_queue.stop()
+
+        events_batches = self.fake_mqtt_broker.received_msgs[f"hbot/{self.instance_id}/events"]
+        notify_batches = self.fake_mqtt_broker.received_msgs[f"hbot/{self.instance_id}/notify"]
+        self.assertEqual([["BuyOrderCreated", "OrderFilled"], ["BuyOrderCompleted"]],
+                         [[msg["type"] for msg in batch["messages"]] for batch in events_batches])
+        self.assertEqual([["first", "second"]], [[msg["msg"] for msg in batch["messages"]] for batch in notify_batches])
+        self.assertEqual({"queue_size": 0, "max_queue_size": 4, "published": 5, "dropped": 0, "failed": 0},
+                         publish_queue.metrics)
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_publish_queue_drop_policies(self,
+                                              mock_mqtt):
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        notify_publisher = self.gateway._notifier.notify_pub
+        notify_topic = f"hbot/{self.instance_id}/notify"
+
+        for drop_policy, expected_msgs in (("drop_oldest", ["first", "3", "4"]), ("drop_newest", ["first", "1", "2"])):
+            self.fake_mqtt_broker.received_msgs.clear()
+            publish_queue = MQTTPublishQueue(max_size=2, drop_policy=drop_policy)
+            publish_queue.start()
+
+            unblocked = self.block_publish_queue(publish_queue, notify_publisher)
+            for i in range(1, 5):
+                publish_queue.put(notify_publisher, NotifyMessage, msg=str(i))
+            unblocked.set()
+            publish_queue.stop()
+
+            self.assertEqual(expected_msgs, [msg["msg"] for msg in self.fake_mqtt_broker.received_msgs[notify_topic]])
+            self.assertEqual(2, publish_queue.dropped_count)
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_publish_queue_keeps_sending_after_a_message_fails_to_build(self,
+                                                                             mock_mqtt):
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        notify_publisher = self.gateway._notifier.notify_pub
+        notify_topic = f"hbot/{self.instance_id}/notify"
+
+        def failing_build(msg: str) -> NotifyMessage:
+            raise TypeError("not all arguments converted during string formatting")
+
+        for batch_size in (1, 2):
+            self.fake_mqtt_broker.received_msgs.clear()
+            publish_queue = MQTTPublishQueue(batch_size=batch_size)
+            publish_queue.start()
+
+            unblocked = self.block_publish_queue(publish_queue, notify_publisher)
+            publish_queue.put(notify_publisher, failing_build, "second")
+            publish_queue.put(notify_publisher, NotifyMessage, msg="third")
+            logger = MagicMock()
+            with patch("hummingbot.remote_iface.mqtt.mqtts_logger", logger):
+                unblocked.set()
+                publish_queue.flush()
+                self.assertTrue(publish_queue._thread.is_alive())
+                publish_queue.put(notify_publisher, NotifyMessage, msg="fourth")
+                publish_queue.stop()
+
+            msgs = self.fake_mqtt_broker.received_msgs[notify_topic]
+            if batch_size > 1:
+                msgs = [msg for batch in msgs for msg in batch["messages"]]
+            self.assertEqual(["first", "third", "fourth"], [msg["msg"] for msg in msgs])
+            self.assertEqual(1, publish_queue.metrics["failed"])
+            self.assertEqual(1, logger.error.call_count)
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_gateway_reports_dropped_messages(self,
+                                                   mock_mqtt):
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        self.gateway.publish_queue._dropped_count = 3
+
+        logger = MagicMock()
+        with patch("hummingbot.remote_iface.mqtt.mqtts_logger", logger):
+            self.gateway._report_dropped_messages()
+            self.gateway._report_dropped_messages()
+
+        self.assertEqual(1, logger.warning.call_count)
+        self.assertIn("The MQTT publish queue is full, 3 messages were dropped", logger.warning.call_args[0][0])
+
+    def start_mqtt_with_snapshots(self, mock_mqtt):
+        self.client_config_map.mqtt_bridge.mqtt_snapshots = True
+        self.addCleanup(setattr, self.client_config_map.mqtt_bridge, "mqtt_snapshots", False)
+        self.hbapp.market_trading_pairs_map = {"test_market_paper_trade": ["COINALPHA-HBOT"]}
+        self.addCleanup(setattr, self.hbapp, "market_trading_pairs_map", {})
+        self.test_market.set_balanced_order_book("COINALPHA-HBOT", 100, 50, 150, 1, 10)
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        # The snapshots are published by the test
+        self.gateway._snapshots.stop()
+
+    def published_snapshots(self, topic: str):
+        self.gateway.publish_queue.flush()
+        return self.fake_mqtt_broker.received_msgs.get(f"hbot/{self.instance_id}{topic}", [])
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_snapshots_publish_the_changes_only(self,
+                                                     mock_mqtt):
+        self.start_mqtt_with_snapshots(mock_mqtt)
+        snapshots = self.gateway._snapshots
+
+        snapshots.publish_snapshot(TopicSpecs.MARKET_DATA, 1000)
+        snapshots.publish_snapshot(TopicSpecs.MARKET_DATA, 1001)
+        self.test_market.set_balanced_order_book("COINALPHA-HBOT", 101, 50, 150, 1, 10)
+        snapshots.publish_snapshot(TopicSpecs.MARKET_DATA, 1002)
+        self.hbapp.market_trading_pairs_map = {}
+        snapshots.publish_snapshot(TopicSpecs.MARKET_DATA, 1003)
+        snapshots.publish_snapshot(TopicSpecs.MARKET_DATA, 1060)
+
+        published_snapshots = self.published_snapshots(TopicSpecs.MARKET_DATA)
+        self.assertEqual([1000, 1002, 1003, 1060], [snapshot["timestamp"] for snapshot in published_snapshots])
+        self.assertEqual([True, False, False, True], [snapshot["full"] for snapshot in published_snapshots])
+        self.assertEqual({"test_market_paper_trade:COINALPHA-HBOT": {"bid": 99.5,
+                                                                     "bid_size": 10.0,
+                                                                     "ask": 100.5,
+                                                                     "ask_size": 10.0,
+                                                                     "last_trade_price": None}},
+                         published_snapshots[0]["data"])
+        self.assertEqual(100.5, published_snapshots[1]["data"]["test_market_paper_trade:COINALPHA-HBOT"]["bid"])
+        self.assertEqual({"test_market_paper_trade:COINALPHA-HBOT": None}, published_snapshots[2]["data"])
+        self.assertEqual({}, published_snapshots[3]["data"])
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_snapshots_of_balances_orders_and_strategy(self,
+                                                            mock_mqtt):
+        self.start_mqtt_with_snapshots(mock_mqtt)
+        self.test_market.set_balance("HBOT", 10)
+        snapshots = self.gateway._snapshots
+
+        for topic in (TopicSpecs.BALANCES, TopicSpecs.ORDERS, TopicSpecs.STRATEGY):
+            snapshots.publish_snapshot(topic, 1000)
+
+        balances = self.published_snapshots(TopicSpecs.BALANCES)[0]["data"]
+        self.assertEqual({"total": 10.0, "available": 10.0}, balances["test_market_paper_trade:HBOT"])
+        self.assertEqual({}, self.published_snapshots(TopicSpecs.ORDERS)[0]["data"])
+        strategy = self.published_snapshots(TopicSpecs.STRATEGY)[0]["data"]
+        self.assertFalse(strategy["running"])
+        self.assertEqual({"test_market_paper_trade": True}, strategy["markets_ready"])
+        self.assertEqual(0, strategy["active_orders"])
+
+        # The paper trade orders have no filled quantity
+        order_id = self.test_market.buy("COINALPHA-HBOT", Decimal("2"), OrderType.LIMIT, Decimal("1"))
+        snapshots.publish_snapshot(TopicSpecs.ORDERS, 1001)
+
+        orders = self.published_snapshots(TopicSpecs.ORDERS)[1]["data"]
+        self.assertEqual({"connector": "test_market_paper_trade",
+                          "trading_pair": "COINALPHA-HBOT",
+                          "side": "BUY",
+                          "price": 1.0,
+                          "quantity": 2.0,
+                          "filled_quantity": None},
+                         {key: value for key, value in orders[order_id].items() if key != "creation_timestamp"})
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import time
 import unittest
 from decimal import Decimal
 from typing import List
@@ -323,6 +324,19 @@ class AmmArbUnitTest(unittest.TestCase):
         # Check if new order is submitted when arb opportunity still presents
         self.assertNotEqual(amm_1_order.client_order_id, new_amm_1_order.client_order_id)
 
+    @async_test(loop=ev_loop)
+    async def test_stale_arb_proposals_are_dropped(self):
+        first_side = ArbProposalSide(self.market_info_1, True, Decimal(101), Decimal(101), Decimal(1), [],
+                                     quote_timestamp=time.time() - 11)
+        second_side = ArbProposalSide(self.market_info_2, False, Decimal(104), Decimal(104), Decimal(1), [],
+                                      quote_timestamp=time.time())
+        self.clock.remove_iterator(self.strategy)
+
+        await self.strategy.execute_arb_proposals([ArbProposal(first_side, second_side)])
+
+        self.assertEqual(10.0, self.strategy.max_quote_age)
+        self.assertEqual(0, len(self.strategy.tracked_limit_orders))
+
     @async_test(loop=ev_loop)
     async def test_format_status(self):
         first_side = ArbProposalSide(
@@ -45,3 +45,4 @@ class AMMArbStartTest(unittest.TestCase):
         amm_arb_start.start(self)
         self.assertEqual(self.strategy._order_amount, Decimal(1))
         self.assertEqual(self.strategy._min_profitability, Decimal("10") / Decimal("100"))
+        self.assertEqual(10.0, self.strategy.max_quote_age)
@@ -204,3 +204,18 @@ class ArbProposalTests(TestCase):
         calculated_profit: Decimal = proposal.profit_pct(account_for_fee=True, rate_source=rate_source)
 
         self.assertEqual(expected_profit_pct, calculated_profit)
+
+    def test_quote_timestamp_and_staleness(self):
+        buy_market_info = MarketTradingPairTuple(self.buy_market, "BTC-USDT", "BTC", "USDT")
+        sell_market_info = MarketTradingPairTuple(self.sell_market, "BTC-USDT", "BTC", "USDT")
+        buy_side = ArbProposalSide(buy_market_info, True, Decimal(30000), Decimal(30000), Decimal(1), [],
+                                   quote_timestamp=1000.5)
+        sell_side = ArbProposalSide(sell_market_info, False, Decimal(32000), Decimal(32000), Decimal(1), [],
+                                    quote_timestamp=1000.0)
+
+        proposal = ArbProposal(buy_side, sell_side)
+
+        self.assertEqual(1000.0, proposal.quote_timestamp)
+        self.assertFalse(proposal.is_stale(1010.0, max_quote_age=10))
+        self.assertTrue(proposal.is_stale(1010.1, max_quote_age=10))
+        self.assertEqual(1000.0, proposal.copy().quote_timestamp)
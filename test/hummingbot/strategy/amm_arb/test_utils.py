@@ -1,4 +1,5 @@
 import asyncio
+import time
 import unittest
 from decimal import Decimal
 
@@ -35,6 +36,39 @@ class MockConnector2(ConnectorBase):
         return self.get_quote_price(trading_pair, is_buy, amount)
 
 
+class SlowGatewayConnector(ConnectorBase):
+    request_delay = 0.1
+
+    def __init__(self, client_config_map: ClientConfigAdapter):
+        super().__init__(client_config_map)
+        self.quote_price_requests = 0
+        self.order_price_requests = 0
+
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return True
+
+    async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        self.quote_price_requests += 1
+        await asyncio.sleep(self.request_delay)
+        return Decimal("101") if is_buy else Decimal("100")
+
+    async def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        self.order_price_requests += 1
+        return await self.get_quote_price(trading_pair, is_buy, amount)
+
+
+class SlowExchangeConnector(SlowGatewayConnector):
+    @property
+    def order_price_is_quote_price(self) -> bool:
+        return False
+
+    async def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        self.order_price_requests += 1
+        await asyncio.sleep(self.request_delay)
+        return Decimal("102") if is_buy else Decimal("99")
+
+
 class AmmArbUtilsUnitTest(unittest.TestCase):
 
     def test_create_arb_proposals(self):
@@ -61,3 +95,34 @@ class AmmArbUtilsUnitTest(unittest.TestCase):
         self.assertEqual(buy_1_sell_2_profit_pct, arb_proposals[0].profit_pct())
         buy_2_sell_1_profit_pct = (Decimal("104") - Decimal("103")) / Decimal("103")
         self.assertEqual(buy_2_sell_1_profit_pct, arb_proposals[1].profit_pct())
+
+    def test_create_arb_proposals_fetches_prices_concurrently(self):
+        asyncio.get_event_loop().run_until_complete(self._test_create_arb_proposals_fetches_prices_concurrently())
+
+    async def _test_create_arb_proposals_fetches_prices_concurrently(self):
+        gateway = SlowGatewayConnector(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange = SlowExchangeConnector(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market_info1 = MarketTradingPairTuple(gateway, trading_pair, base, quote)
+        market_info2 = MarketTradingPairTuple(exchange, trading_pair, base, quote)
+
+        start = time.time()
+        arb_proposals = await utils.create_arb_proposals(market_info1, market_info2, [], [], Decimal("1"))
+        elapsed = time.time() - start
+
+        # Six requests of 0.1 seconds each, all in flight at the same time
+        self.assertLess(elapsed, 2 * SlowGatewayConnector.request_delay)
+        # The gateway order price is its quote price, it is only requested once per side
+        self.assertEqual(2, gateway.quote_price_requests)
+        self.assertEqual(0, gateway.order_price_requests)
+        self.assertEqual(2, exchange.quote_price_requests)
+        self.assertEqual(2, exchange.order_price_requests)
+
+        self.assertEqual(2, len(arb_proposals))
+        buy_gateway = arb_proposals[0]
+        self.assertEqual(Decimal("101"), buy_gateway.first_side.order_price)
+        self.assertEqual(Decimal("100"), buy_gateway.second_side.quote_price)
+        self.assertEqual(Decimal("99"), buy_gateway.second_side.order_price)
+        for proposal in arb_proposals:
+            for side in (proposal.first_side, proposal.second_side):
+                self.assertGreaterEqual(side.quote_timestamp, start)
+                self.assertLessEqual(side.quote_timestamp, start + elapsed)
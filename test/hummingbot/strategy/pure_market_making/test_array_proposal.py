@@ -0,0 +1,257 @@
+import unittest
+from decimal import Decimal
+from typing import List, Tuple
+
+import numpy as np
+
+from hummingbot.strategy.pure_market_making.array_proposal import ArrayProposal, build_level_proposal
+from hummingbot.strategy.pure_market_making.fixed_point import TickLotScale
+
+
+def decimal_levels(reference_price: Decimal,
+                   spread: Decimal,
+                   level_spread: Decimal,
+                   amount: Decimal,
+                   level_amount: Decimal,
+                   levels: int,
+                   is_buy: bool,
+                   scale: TickLotScale) -> List[Tuple[Decimal, Decimal]]:
+    # Mirrors the Decimal loop in PureMarketMakingStrategy.c_create_base_proposal
+    result = []
+    for level in range(0, levels):
+        if is_buy:
+            price = reference_price * (Decimal("1") - spread - (level * level_spread))
+        else:
+            price = reference_price * (Decimal("1") + spread + (level * level_spread))
+        price = (price // scale.price_increment) * scale.price_increment
+        size = amount + (level_amount * level)
+        size = (size // scale.size_increment) * scale.size_increment
+        if size > 0:
+            result.append((price, size))
+    return result
+
+
+class ArrayProposalUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.scale = TickLotScale(Decimal("0.01"), Decimal("0.001"))
+        # Buys at 99.00, 98.00, 97.00 and sells at 101.00, 102.00, 103.00, one unit each
+        self.proposal = ArrayProposal.from_sides(self.scale,
+                                                 np.array([9900, 9800, 9700]),
+                                                 np.array([1000, 1000, 1000]),
+                                                 np.array([10100, 10200, 10300]),
+                                                 np.array([1000, 1000, 1000]))
+
+    @staticmethod
+    def price_sizes(orders) -> List[Tuple[Decimal, Decimal]]:
+        return [(order.price, order.size) for order in orders]
+
+    def test_build_level_proposal_matches_decimal_levels(self):
+        reference_price = Decimal("100.015")
+        proposal = build_level_proposal(self.scale,
+                                        reference_price,
+                                        reference_price,
+                                        bid_spread=Decimal("0.001"),
+                                        ask_spread=Decimal("0.002"),
+                                        order_level_spread=Decimal("0.0005"),
+                                        order_amount=Decimal("1.2345"),
+                                        order_level_amount=Decimal("0.1"),
+                                        buy_levels=50,
+                                        sell_levels=40)
+
+        expected_buys = decimal_levels(reference_price, Decimal("0.001"), Decimal("0.0005"),
+                                       Decimal("1.2345"), Decimal("0.1"), 50, True, self.scale)
+        expected_sells = decimal_levels(reference_price, Decimal("0.002"), Decimal("0.0005"),
+                                        Decimal("1.2345"), Decimal("0.1"), 40, False, self.scale)
+        self.assertEqual(expected_buys, self.price_sizes(proposal.buys))
+        self.assertEqual(expected_sells, self.price_sizes(proposal.sells))
+
+    def test_build_level_proposal_exact_on_tick_boundaries(self):
+        # 0.1 * 3 style values are not exact in double precision, every level lands exactly on a tick
+        scale = TickLotScale(Decimal("0.1"), Decimal("0.1"))
+        proposal = build_level_proposal(scale,
+                                        Decimal("10"),
+                                        Decimal("10"),
+                                        bid_spread=Decimal("0.01"),
+                                        ask_spread=Decimal("0.01"),
+                                        order_level_spread=Decimal("0.01"),
+                                        order_amount=Decimal("0.3"),
+                                        order_level_amount=Decimal("0.1"),
+                                        buy_levels=5,
+                                        sell_levels=5)
+
+        self.assertEqual([Decimal("9.9"), Decimal("9.8"), Decimal("9.7"), Decimal("9.6"), Decimal("9.5")],
+                         [buy.price for buy in proposal.buys])
+        self.assertEqual([Decimal("10.1"), Decimal("10.2"), Decimal("10.3"), Decimal("10.4"), Decimal("10.5")],
+                         [sell.price for sell in proposal.sells])
+        self.assertEqual([Decimal("0.3"), Decimal("0.4"), Decimal("0.5"), Decimal("0.6"), Decimal("0.7")],
+                         [buy.size for buy in proposal.buys])
+
+    def test_build_level_proposal_drops_empty_levels_and_nan_sides(self):
+        proposal = build_level_proposal(self.scale,
+                                        Decimal("NaN"),
+                                        Decimal("100"),
+                                        bid_spread=Decimal("0.01"),
+                                        ask_spread=Decimal("0.01"),
+                                        order_level_spread=Decimal("0.01"),
+                                        order_amount=Decimal("0.002"),
+                                        order_level_amount=Decimal("-0.001"),
+                                        buy_levels=3,
+                                        sell_levels=3)
+
+        self.assertEqual(0, len(proposal.buys))
+        self.assertEqual([(Decimal("101.00"), Decimal("0.002")), (Decimal("102.00"), Decimal("0.001"))],
+                         self.price_sizes(proposal.sells))
+
+    def test_build_level_proposal_drops_levels_below_the_minimums(self):
+        scale = TickLotScale(Decimal("0.01"), Decimal("0.001"), Decimal("1.5"), Decimal("200"))
+        proposal = build_level_proposal(scale,
+                                        Decimal("100"),
+                                        Decimal("100"),
+                                        bid_spread=Decimal("0.01"),
+                                        ask_spread=Decimal("0.01"),
+                                        order_level_spread=Decimal("0.01"),
+                                        order_amount=Decimal("1"),
+                                        order_level_amount=Decimal("1"),
+                                        buy_levels=3,
+                                        sell_levels=3)
+
+        # 1 is below the minimum size, 2 x 98.00 below the minimum notional
+        self.assertEqual([(Decimal("97.00"), Decimal("3.000"))], self.price_sizes(proposal.buys))
+        self.assertEqual([(Decimal("102.00"), Decimal("2.000")), (Decimal("103.00"), Decimal("3.000"))],
+                         self.price_sizes(proposal.sells))
+
+    def test_to_proposal(self):
+        proposal = self.proposal.to_proposal()
+
+        self.assertEqual([Decimal("99"), Decimal("98"), Decimal("97")], [buy.price for buy in proposal.buys])
+        self.assertEqual([Decimal("101"), Decimal("102"), Decimal("103")], [sell.price for sell in proposal.sells])
+        self.assertTrue(all(order.size == Decimal("1") for order in proposal.buys + proposal.sells))
+
+    def test_clear_side_and_drop_first_levels(self):
+        self.proposal.drop_first_levels(True, 2)
+        self.assertEqual([Decimal("97")], [buy.price for buy in self.proposal.buys])
+        self.assertEqual(3, len(self.proposal.sells))
+
+        self.proposal.clear_side(False)
+        self.assertEqual(1, len(self.proposal.buys))
+        self.assertEqual(0, len(self.proposal.sells))
+
+    def test_scale_sizes(self):
+        self.proposal.scale_sizes(True, Decimal("1.5"))
+        self.proposal.scale_sizes(False, Decimal("0.3333"))
+
+        self.assertEqual([Decimal("1.5")] * 3, [buy.size for buy in self.proposal.buys])
+        self.assertEqual([Decimal("0.333")] * 3, [sell.size for sell in self.proposal.sells])
+
+    def test_scale_prices(self):
+        self.proposal.scale_prices(True, [Decimal("0.999")] * 3)
+        self.proposal.scale_prices(False, [Decimal("1.001"), Decimal("1.001"), Decimal("1.002")])
+
+        self.assertEqual([Decimal("98.90"), Decimal("97.90"), Decimal("96.90")],
+                         [buy.price for buy in self.proposal.buys])
+        self.assertEqual([Decimal("101.10"), Decimal("102.10"), Decimal("103.20")],
+                         [sell.price for sell in self.proposal.sells])
+
+    def test_reprice_side(self):
+        self.proposal.reprice_side(True, Decimal("99.50"), [Decimal("0"), Decimal("0.01"), Decimal("0.02")])
+        self.proposal.reprice_side(False, Decimal("100.50"), [Decimal("0.01"), Decimal("0.02"), Decimal("0.03")])
+
+        self.assertEqual([Decimal("99.50"), Decimal("98.50"), Decimal("97.51")],
+                         [buy.price for buy in self.proposal.buys])
+        # 100.50 * 1.02 / 1.01 = 101.495...
+        self.assertEqual([Decimal("100.50"), Decimal("101.49"), Decimal("102.49")],
+                         [sell.price for sell in self.proposal.sells])
+
+    def test_scale_prices_rounds_the_repriced_levels_once(self):
+        self.proposal.reprice_side(True, Decimal("99.50"), [Decimal("0"), Decimal("0.0129"), Decimal("0.02")])
+        self.proposal.scale_prices(True, [Decimal("0.999"), Decimal("0.998"), Decimal("0.997")])
+
+        # 99.50 x 0.9871 = 98.21645 is kept unrounded, 98.21645 x 0.998 = 98.0200 (98.21 x 0.998 = 98.0135)
+        self.assertEqual([Decimal("99.40"), Decimal("98.02"), Decimal("97.21")],
+                         [buy.price for buy in self.proposal.buys])
+        self.assertEqual([None] * 6, self.proposal.unrounded_prices.tolist())
+
+    def test_reprice_side_sorts_levels_by_price(self):
+        proposal = ArrayProposal.from_sides(self.scale,
+                                            np.array([9700, 9900]),
+                                            np.array([3000, 1000]),
+                                            np.array([]),
+                                            np.array([]))
+        proposal.reprice_side(True, Decimal("99"), [Decimal("0"), Decimal("0.01")])
+
+        self.assertEqual([(Decimal("99.00"), Decimal("1")), (Decimal("98.01"), Decimal("3"))],
+                         self.price_sizes(proposal.buys))
+
+    def test_filter_takers(self):
+        self.proposal.filter_takers(top_bid=Decimal("101.005"), top_ask=Decimal("98"))
+
+        self.assertEqual([Decimal("97")], [buy.price for buy in self.proposal.buys])
+        self.assertEqual([Decimal("102"), Decimal("103")], [sell.price for sell in self.proposal.sells])
+
+    def test_filter_takers_ignores_nan_top_prices(self):
+        self.proposal.filter_takers(top_bid=Decimal("NaN"), top_ask=Decimal("NaN"))
+
+        self.assertEqual(3, len(self.proposal.buys))
+        self.assertEqual(3, len(self.proposal.sells))
+
+    def test_apply_budget(self):
+        # 99 + 98 quote fully funded, 50 left for the 97 level; 1.5 base covers one and a half sells
+        self.proposal.apply_budget(base_balance=Decimal("1.5"),
+                                   quote_balance=Decimal("247"),
+                                   buy_fee_percent=Decimal("0"))
+
+        self.assertEqual([(Decimal("99"), Decimal("1")), (Decimal("98"), Decimal("1")),
+                          (Decimal("97"), Decimal("0.515"))],
+                         self.price_sizes(self.proposal.buys))
+        self.assertEqual([(Decimal("101"), Decimal("1")), (Decimal("102"), Decimal("0.5"))],
+                         self.price_sizes(self.proposal.sells))
+
+    def test_modifiers_remove_the_levels_below_the_minimums(self):
+        scale = TickLotScale(Decimal("0.01"), Decimal("0.001"), Decimal("0.5"), Decimal("60"))
+
+        def proposal() -> ArrayProposal:
+            return ArrayProposal.from_sides(scale,
+                                            np.array([9900, 9800, 9700]),
+                                            np.array([1000, 1000, 1000]),
+                                            np.array([10100, 10200, 10300]),
+                                            np.array([1000, 1000, 1000]))
+
+        skewed = proposal()
+        skewed.scale_sizes(True, Decimal("0.615"))
+        skewed.scale_sizes(False, Decimal("0.4"))
+        # 0.615 x 99 and 0.615 x 98 meet the minimum notional, 0.615 x 97 does not, and 0.4 is below the min size
+        self.assertEqual([(Decimal("99"), Decimal("0.615")), (Decimal("98"), Decimal("0.615"))],
+                         self.price_sizes(skewed.buys))
+        self.assertEqual([], skewed.sells)
+
+        budgeted = proposal()
+        budgeted.apply_budget(base_balance=Decimal("1.5"), quote_balance=Decimal("247"), buy_fee_percent=Decimal("0"))
+        # The remaining 0.515 x 97 and 0.5 x 102 are below the minimum notional
+        self.assertEqual([(Decimal("99"), Decimal("1")), (Decimal("98"), Decimal("1"))],
+                         self.price_sizes(budgeted.buys))
+        self.assertEqual([(Decimal("101"), Decimal("1"))], self.price_sizes(budgeted.sells))
+
+        repriced = proposal()
+        repriced.scale_sizes(True, Decimal("0.607"))
+        self.assertEqual([(Decimal("99"), Decimal("0.607"))], self.price_sizes(repriced.buys))
+        # 0.607 x 98.01 is below the minimum notional once the price is lowered
+        repriced.scale_prices(True, [Decimal("0.99")])
+        self.assertEqual([], repriced.buys)
+
+    def test_apply_budget_with_fees_and_exact_balances(self):
+        # With a 1% fee the first level costs exactly 99.99, nothing is left for the next levels
+        self.proposal.apply_budget(base_balance=Decimal("2"),
+                                   quote_balance=Decimal("99.99"),
+                                   buy_fee_percent=Decimal("0.01"))
+
+        self.assertEqual([(Decimal("99"), Decimal("1"))], self.price_sizes(self.proposal.buys))
+        self.assertEqual([(Decimal("101"), Decimal("1")), (Decimal("102"), Decimal("1"))],
+                         self.price_sizes(self.proposal.sells))
+
+    def test_apply_budget_without_balance(self):
+        self.proposal.apply_budget(base_balance=Decimal("0"),
+                                   quote_balance=Decimal("0"),
+                                   buy_fee_percent=Decimal("0"))
+
+        self.assertEqual(0, len(self.proposal.buys))
+        self.assertEqual(0, len(self.proposal.sells))
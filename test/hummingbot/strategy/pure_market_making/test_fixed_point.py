@@ -0,0 +1,62 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.strategy.pure_market_making.fixed_point import TickLotScale, quantize_exact
+
+
+class FixedPointUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.scale = TickLotScale(Decimal("0.01"), Decimal("0.001"))
+
+    def test_scale_from_trading_rule(self):
+        rule = TradingRule("COINALPHA-HBOT",
+                           min_order_size=Decimal("0.5"),
+                           min_price_increment=Decimal("0.0001"),
+                           min_base_amount_increment=Decimal("0.1"),
+                           min_notional_size=Decimal("10"))
+        scale = TickLotScale.from_trading_rule(rule)
+
+        self.assertEqual(Decimal("0.0001"), scale.price_increment)
+        self.assertEqual(Decimal("0.1"), scale.size_increment)
+        self.assertEqual(Decimal("0.5"), scale.min_order_size)
+        self.assertEqual(Decimal("10"), scale.min_notional_size)
+        self.assertEqual(TickLotScale(Decimal("0.0001"), Decimal("0.1"), Decimal("0.5"), Decimal("10")), scale)
+        self.assertNotEqual(TickLotScale(Decimal("0.0001"), Decimal("0.1")), scale)
+
+    def test_tradable_orders_meet_the_minimums(self):
+        # Prices 10.00, 4.99 and 5.00, sizes 2.5, 2 and 2
+        ticks = np.array([1000, 499, 500, 1000])
+        lots = np.array([2500, 2000, 2000, 0])
+
+        self.assertEqual([True, True, True, False], self.scale.tradable(ticks, lots).tolist())
+        scale = TickLotScale(Decimal("0.01"), Decimal("0.001"), Decimal("2"), Decimal("10"))
+        self.assertEqual([True, False, True, False], scale.tradable(ticks, lots).tolist())
+        scale = TickLotScale(Decimal("0.01"), Decimal("0.001"), Decimal("2.001"))
+        self.assertEqual([True, False, False, False], scale.tradable(ticks, lots).tolist())
+
+    def test_scale_rejects_non_positive_increments(self):
+        with self.assertRaises(ValueError):
+            TickLotScale(Decimal("0"), Decimal("0.1"))
+        with self.assertRaises(ValueError):
+            TickLotScale(Decimal("0.1"), Decimal("-1"))
+
+    def test_ticks_and_lots_conversions(self):
+        self.assertEqual(10012, self.scale.price_to_ticks(Decimal("100.129")))
+        self.assertEqual(Decimal("100.12"), self.scale.ticks_to_price(10012))
+        self.assertEqual(1500, self.scale.size_to_lots(Decimal("1.5009")))
+        self.assertEqual(Decimal("1.5"), self.scale.lots_to_size(1500))
+
+    def test_quantize_exact_rechecks_boundaries(self):
+        rechecked = []
+
+        def exact(index: int) -> int:
+            rechecked.append(index)
+            return 41
+
+        result = quantize_exact(np.array([1.5, 42.0 - 1e-12, -2.5]), exact)
+
+        self.assertEqual([1, 41, -2], result.tolist())
+        self.assertEqual([1], rechecked)
@@ -0,0 +1,76 @@
+import unittest
+from decimal import Decimal
+from typing import List
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.strategy.pure_market_making.data_types import PriceSize, Proposal
+from hummingbot.strategy.pure_market_making.order_reconciler import reconcile_orders
+
+
+class OrderReconcilerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.buys = [self.limit_order(f"buy_{i}", True, price) for i, price in enumerate(["99", "98", "97"])]
+        self.sells = [self.limit_order(f"sell_{i}", False, price) for i, price in enumerate(["101", "102", "103"])]
+
+    @staticmethod
+    def limit_order(order_id: str, is_buy: bool, price: str) -> LimitOrder:
+        return LimitOrder(order_id, "HBOT-ETH", is_buy, "HBOT", "ETH", Decimal(price), Decimal("1"))
+
+    @staticmethod
+    def levels(*prices: str) -> List[PriceSize]:
+        return [PriceSize(Decimal(price), Decimal("1")) for price in prices]
+
+    @staticmethod
+    def order_ids(orders: List[LimitOrder]) -> List[str]:
+        return sorted(o.client_order_id for o in orders)
+
+    def test_unchanged_proposal_keeps_every_order(self):
+        proposal = Proposal(self.levels("99", "98", "97"), self.levels("101", "102", "103"))
+
+        diff = reconcile_orders(self.buys + self.sells, proposal, Decimal("0"))
+
+        self.assertEqual(6, len(diff.kept))
+        self.assertTrue(diff.is_empty)
+
+    def test_shifted_ladder_only_refreshes_outer_levels(self):
+        # The ladder moves one level up: three orders still match, one level on each side changes
+        proposal = Proposal(self.levels("100", "99.01", "98.02"), self.levels("102", "103", "104"))
+
+        diff = reconcile_orders(self.buys + self.sells, proposal, Decimal("0.001"))
+
+        self.assertEqual(["buy_0", "buy_1", "sell_1", "sell_2"], self.order_ids(diff.kept))
+        self.assertEqual(["buy_2", "sell_0"], self.order_ids(diff.to_cancel))
+        self.assertEqual([Decimal("100")], [level.price for level in diff.to_create.buys])
+        self.assertEqual([Decimal("104")], [level.price for level in diff.to_create.sells])
+        self.assertEqual([], diff.to_amend)
+
+    def test_negative_tolerance_refreshes_every_order(self):
+        proposal = Proposal(self.levels("99", "98", "97"), self.levels("101", "102", "103"))
+
+        diff = reconcile_orders(self.buys + self.sells, proposal, Decimal("-1"))
+
+        self.assertEqual([], diff.kept)
+        self.assertEqual(6, len(diff.to_cancel))
+        self.assertEqual(3, len(diff.to_create.buys))
+        self.assertEqual(3, len(diff.to_create.sells))
+
+    def test_unmatched_orders_are_amended_best_price_first(self):
+        proposal = Proposal(self.levels("99", "96.5", "96"), self.levels("101", "102", "103", "104"))
+
+        diff = reconcile_orders(self.buys + self.sells, proposal, Decimal("0"), amend_supported=True)
+
+        self.assertEqual(["buy_0", "sell_0", "sell_1", "sell_2"], self.order_ids(diff.kept))
+        self.assertEqual([], diff.to_cancel)
+        self.assertEqual([("buy_1", Decimal("96.5")), ("buy_2", Decimal("96"))],
+                         [(order.client_order_id, level.price) for order, level in diff.to_amend])
+        self.assertEqual([], diff.to_create.buys)
+        self.assertEqual([Decimal("104")], [level.price for level in diff.to_create.sells])
+
+    def test_surplus_orders_are_cancelled(self):
+        proposal = Proposal(self.levels("99"), [])
+
+        diff = reconcile_orders(self.buys + self.sells, proposal, Decimal("0"), amend_supported=True)
+
+        self.assertEqual(["buy_0"], self.order_ids(diff.kept))
+        self.assertEqual(["buy_1", "buy_2", "sell_0", "sell_1", "sell_2"], self.order_ids(diff.to_cancel))
+        self.assertEqual([], diff.to_amend)
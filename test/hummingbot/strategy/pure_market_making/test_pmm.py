@@ -2,6 +2,7 @@ import unittest
 from decimal import Decimal
 from test.mock.mock_asset_price_delegate import MockAssetPriceDelegate
 from typing import List, Optional
+from unittest.mock import patch
 
 import pandas as pd
 
@@ -10,16 +11,20 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.data_type.common import PriceType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent, OrderCancelledEvent
+from hummingbot.core.utils.tick_profiler import TickProfiler
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
+from hummingbot.strategy.pure_market_making.array_proposal import build_level_proposal
 from hummingbot.strategy.pure_market_making.inventory_cost_price_delegate import InventoryCostPriceDelegate
 from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
 
@@ -43,6 +48,11 @@ def simulate_order_book_widening(order_book: OrderBook, top_bid: float, top_ask:
     order_book.apply_diffs(bid_diffs, ask_diffs, update_id)
 
 
+class TradingRuleMockPaperExchange(MockPaperExchange):
+    # Exposes trading rules like the live connectors, the paper trade quantization has no minimums
+    pass
+
+
 class PMMUnitTest(unittest.TestCase):
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
     end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
@@ -224,6 +234,24 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual(1, len(strategy.active_buys))
         self.assertEqual(1, len(strategy.active_sells))
 
+    def test_tick_stages_are_profiled(self):
+        strategy = self.one_level_strategy
+        self.clock.add_iterator(strategy)
+        profiler = TickProfiler.get_instance()
+
+        profiler.start()
+        try:
+            self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        finally:
+            profiler.stop()
+
+        for stage in ("create_base_proposal", "apply_order_levels_modifiers", "apply_order_price_modifiers",
+                      "apply_order_size_modifiers", "apply_budget_constraint", "filter_out_takers",
+                      "hanging_orders", "cancel_orders", "execute_orders_proposal"):
+            self.assertEqual(1, profiler.histogram("PureMarketMakingStrategy", stage).count)
+        self.assertEqual(1, profiler.histogram("PureMarketMakingStrategy", "tick").count)
+        self.assertEqual(1, profiler.histogram("MockPaperExchange", "tick").count)
+
     def test_basic_one_level_price_type_own_last_trade(self):
         strategy = PureMarketMakingStrategy()
         strategy.init_params(
@@ -360,6 +388,40 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual(3, len(strategy.active_buys))
         self.assertEqual(3, len(strategy.active_sells))
 
+    def test_levels_below_the_trading_rule_minimums_are_not_placed(self):
+        market = TradingRuleMockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(self.trading_pair, mid_price=self.mid_price, min_price=1, max_price=200,
+                                       price_step_size=1, volume_step_size=10)
+        market.set_balance("HBOT", 500)
+        market.set_balance("ETH", 5000)
+        # The same price and size quantum for all the levels, they are built as integers
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 2, 6, 2))
+        market.trading_rules = {self.trading_pair: TradingRule(self.trading_pair,
+                                                               min_order_size=Decimal("2"),
+                                                               min_notional_size=Decimal("250"))}
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            order_refresh_tolerance_pct=-1,
+            order_levels=3,
+            order_level_spread=Decimal("0.01"),
+            order_level_amount=Decimal("1"),
+            minimum_spread=-1,
+        )
+        self.clock.add_iterator(market)
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        # The first levels are below the minimum size, the second levels (2 x 98 and 2 x 102) below the min notional
+        self.assertEqual([(Decimal("97"), Decimal("3"))],
+                         [(order.price, order.quantity) for order in strategy.active_buys])
+        self.assertEqual([(Decimal("103"), Decimal("3"))],
+                         [(order.price, order.quantity) for order in strategy.active_sells])
+
     def test_apply_budget_constraint_to_proposal(self):
         strategy = self.multi_levels_strategy
         self.clock.add_iterator(strategy)
@@ -648,6 +710,62 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual(strategy.active_sells[1].price / strategy.active_sells[0].price, Decimal("1.025"))
         self.assertEqual(strategy.active_sells[2].price / strategy.active_sells[0].price, Decimal("1.05"))
 
+    def test_array_proposal_prices_match_the_decimal_pipeline(self):
+        def placed_orders(order_override):
+            market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+            market.set_balanced_order_book(self.trading_pair, mid_price=self.mid_price, min_price=1, max_price=200,
+                                           price_step_size=1, volume_step_size=10)
+            # Widening the order book, top bid is now 97.5 and top ask 102.5
+            simulate_order_book_widening(market.order_books[self.trading_pair], 98, 102)
+            market.set_balance("HBOT", 500)
+            market.set_balance("ETH", 5000)
+            # The same price and size quantum on all the levels, they are built as integers unless they are overridden
+            market.set_quantization_param(QuantizationParams(self.trading_pair, 10, 2, 10, 3))
+            strategy = PureMarketMakingStrategy()
+            strategy.init_params(
+                MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+                bid_spread=Decimal("0.01"),
+                ask_spread=Decimal("0.01"),
+                order_amount=Decimal("1"),
+                order_refresh_time=5.0,
+                order_refresh_tolerance_pct=-1,
+                order_levels=3,
+                order_level_spread=Decimal("0.0129"),
+                order_level_amount=Decimal("1"),
+                order_optimization_enabled=True,
+                add_transaction_costs_to_orders=True,
+                minimum_spread=-1,
+                order_override=order_override,
+            )
+            clock = Clock(ClockMode.BACKTEST, self.clock_tick_size, self.start_timestamp, self.end_timestamp)
+            clock.add_iterator(market)
+            clock.add_iterator(strategy)
+            clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+            return ([(order.price, order.quantity) for order in strategy.active_buys],
+                    [(order.price, order.quantity) for order in strategy.active_sells])
+
+        def level_fee(*_, **kwargs):
+            # The fee percentage depends on the order size, it differs on each level
+            return AddedToCostTradeFee(percent=kwargs["amount"] / Decimal("1000"))
+
+        decimal_levels_override = {
+            f"{side}_{level}": [side, 1 + 1.29 * level, 1 + level] for side in ("buy", "sell") for level in range(3)
+        }
+        with patch("hummingbot.connector.exchange.paper_trade.paper_trade_exchange.build_trade_fee",
+                   side_effect=level_fee), \
+                patch("hummingbot.strategy.pure_market_making.pure_market_making.build_level_proposal",
+                      wraps=build_level_proposal) as build_level_proposal_mock:
+            array_buys, array_sells = placed_orders(None)
+            self.assertTrue(build_level_proposal_mock.called)
+            build_level_proposal_mock.reset_mock()
+            decimal_buys, decimal_sells = placed_orders(decimal_levels_override)
+            self.assertFalse(build_level_proposal_mock.called)
+
+        self.assertEqual(3, len(array_buys))
+        self.assertEqual(3, len(array_sells))
+        self.assertEqual(sorted(decimal_buys), sorted(array_buys))
+        self.assertEqual(sorted(decimal_sells), sorted(array_sells))
+
     def test_hanging_orders(self):
         strategy = self.one_level_strategy
         strategy.order_refresh_time = 4.0
@@ -908,6 +1026,32 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual("50.0%", status_df.iloc[4, 1])
         self.assertEqual("150.0%", status_df.iloc[4, 2])
 
+    def test_format_status(self):
+        strategy = self.one_level_strategy
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        expected_status = ("\n  Markets:"
+                           "\n               Exchange   Market Best Bid Best Ask Ref Price (MidPrice)"
+                           "\n    mock_paper_exchange HBOT-ETH     99.5    100.5                  100"
+                           "\n\n  Assets:"
+                           "\n                         HBOT  ETH"
+                           "\n    Total Balance         500 5000"
+                           "\n    Available Balance     499 4901"
+                           "\n    Current Value (ETH) 50000 5000"
+                           "\n    Current %           90.9% 9.1%"
+                           "\n\n  Orders:"
+                           "\n    Level Type Price Spread Amount (Orig) Amount (Adj)      Age"
+                           "\n        1 sell   101  1.00%             1            1 00:00:00"
+                           "\n        1  buy    99  1.00%             1            1 00:00:00")
+        status = strategy.format_status()
+        self.assertEqual(expected_status, status)
+        # The status text is kept while nothing changed
+        self.assertIs(status, strategy.format_status())
+
+        strategy.cancel_order(strategy.active_sells[0].client_order_id)
+        self.assertNotIn("sell", strategy.format_status())
+
     def test_inventory_cost_price_del(self):
         strategy = self.one_level_strategy
         strategy.inventory_cost_price_delegate = self.inventory_cost_price_del
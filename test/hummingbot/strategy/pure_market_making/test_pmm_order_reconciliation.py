@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+import logging
+import unittest
+from decimal import Decimal
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+logging.basicConfig(level=logging.ERROR)
+
+
+class AmendingMockPaperExchange(MockPaperExchange):
+    """
+    Amends an order by replacing it, the way exchanges without in place modification assign a new order id
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.amended_order_ids = []
+
+    @property
+    def supports_order_amend(self) -> bool:
+        return True
+
+    def amend_order(self, trading_pair: str, client_order_id: str, price: Decimal, amount: Decimal) -> str:
+        self.amended_order_ids.append(client_order_id)
+        order = next(o for o in self.limit_orders if o.client_order_id == client_order_id)
+        self.cancel(trading_pair, client_order_id)
+        if order.is_buy:
+            return self.buy(trading_pair, amount, OrderType.LIMIT, price)
+        return self.sell(trading_pair, amount, OrderType.LIMIT, price)
+
+
+class PMMOrderReconciliationUnitTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pair = "HBOT-ETH"
+    base_asset = trading_pair.split("-")[0]
+    quote_asset = trading_pair.split("-")[1]
+
+    def create_market(self, market_class=MockPaperExchange) -> MockPaperExchange:
+        market = market_class(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.set_mid_price(market, 100)
+        market.set_balance("HBOT", 500)
+        market.set_balance("ETH", 5000)
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        return market
+
+    def set_mid_price(self, market: MockPaperExchange, mid_price: float):
+        market.set_balanced_order_book(trading_pair=self.trading_pair,
+                                       mid_price=mid_price,
+                                       min_price=1,
+                                       max_price=200,
+                                       price_step_size=1,
+                                       volume_step_size=10)
+
+    def create_strategy(self, market: MockPaperExchange, **kwargs) -> PureMarketMakingStrategy:
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.end_timestamp)
+        self.clock.add_iterator(market)
+        self.cancel_order_logger: EventLogger = EventLogger()
+        market.add_listener(MarketEvent.OrderCancelled, self.cancel_order_logger)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_levels=5,
+            order_level_spread=Decimal("0.01"),
+            order_refresh_time=4,
+            order_refresh_tolerance_pct=Decimal("0.002"),
+            order_reconciliation_enabled=True,
+            **kwargs
+        )
+        self.clock.add_iterator(strategy)
+        return strategy
+
+    def test_only_moved_levels_are_replaced(self):
+        market = self.create_market()
+        strategy = self.create_strategy(market)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        old_buy_ids = {o.client_order_id for o in strategy.active_buys}
+        old_sell_ids = {o.client_order_id for o in strategy.active_sells}
+        self.assertEqual(5, len(old_buy_ids))
+        self.assertEqual(5, len(old_sell_ids))
+
+        # Moving the mid price by one level spread shifts the ladder, four levels per side still match
+        self.set_mid_price(market, 101)
+        self.clock.backtest_til(self.start_timestamp + 6)
+
+        self.assertEqual(2, len(self.cancel_order_logger.event_log))
+        self.assertEqual(5, len(strategy.active_buys))
+        self.assertEqual(5, len(strategy.active_sells))
+        self.assertEqual(4, len(old_buy_ids & {o.client_order_id for o in strategy.active_buys}))
+        self.assertEqual(4, len(old_sell_ids & {o.client_order_id for o in strategy.active_sells}))
+        self.assertEqual(Decimal("99.99"), max(o.price for o in strategy.active_buys))
+        self.assertEqual(Decimal("106.05"), max(o.price for o in strategy.active_sells))
+
+    def test_orders_are_kept_when_within_tolerance(self):
+        market = self.create_market()
+        strategy = self.create_strategy(market)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        old_ids = [o.client_order_id for o in strategy.active_orders]
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+
+        self.assertEqual(0, len(self.cancel_order_logger.event_log))
+        self.assertEqual(old_ids, [o.client_order_id for o in strategy.active_orders])
+
+    def test_unmatched_orders_are_amended_when_supported(self):
+        market = self.create_market(AmendingMockPaperExchange)
+        strategy = self.create_strategy(market)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        old_ids = {o.client_order_id for o in strategy.active_orders}
+
+        self.set_mid_price(market, 101)
+        self.clock.backtest_til(self.start_timestamp + 6)
+
+        self.assertEqual(2, len(market.amended_order_ids))
+        self.assertTrue(set(market.amended_order_ids) < old_ids)
+        self.assertEqual(10, len(strategy.active_orders))
+        self.assertEqual(8, len(old_ids & {o.client_order_id for o in strategy.active_orders}))
+        self.assertEqual(Decimal("99.99"), max(o.price for o in strategy.active_buys))
+        self.assertEqual(Decimal("96"), min(o.price for o in strategy.active_buys))
+        self.assertEqual(Decimal("106.05"), max(o.price for o in strategy.active_sells))
+
+    def test_hanging_orders_keep_full_refresh(self):
+        market = self.create_market()
+        strategy = self.create_strategy(market, hanging_orders_enabled=True)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        old_ids = {o.client_order_id for o in strategy.active_orders}
+
+        self.set_mid_price(market, 101)
+        self.clock.backtest_til(self.start_timestamp + 6)
+
+        self.assertEqual(10, len(strategy.active_orders))
+        self.assertEqual(set(), old_ids & {o.client_order_id for o in strategy.active_orders})
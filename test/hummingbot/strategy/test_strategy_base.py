@@ -124,6 +124,40 @@ class StrategyBaseUnitTests(unittest.TestCase):
         self.simulate_order_filled(self.market_info, limit_order)
 
         self.assertEqual(1, len(self.strategy.trades))
+        self.assertEqual(self.market.display_name, self.strategy.trades[0].market)
+        self.assertEqual(Decimal("50"), self.strategy.trades[0].amount)
+        self.assertEqual(50, self.strategy.fill_store.volume(self.market.display_name, trade_type=TradeType.SELL))
+
+        # The fills of a removed market are kept, the new ones are not recorded
+        self.strategy.remove_markets([self.market])
+        self.simulate_order_filled(self.market_info, limit_order)
+
+        self.assertEqual(1, len(self.strategy.trades))
+
+    def test_trades_include_the_fills_logged_before_the_market_was_added(self):
+        market = ExtendedMockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market_info = MarketTradingPairTuple(market, self.trading_pair, *self.trading_pair.split("-"))
+        limit_order = LimitOrder(client_order_id="test",
+                                 trading_pair=self.trading_pair,
+                                 is_buy=True,
+                                 base_currency=self.trading_pair.split("-")[0],
+                                 quote_currency=self.trading_pair.split("-")[1],
+                                 price=Decimal("100"),
+                                 quantity=Decimal("20"))
+        self.simulate_order_filled(market_info, limit_order)
+
+        strategy = MockStrategy()
+        strategy.add_markets([market])
+
+        self.assertEqual(1, len(strategy.trades))
+        self.assertEqual(Decimal("20"), strategy.trades[0].amount)
+
+        # The past fills are only added once
+        strategy.add_markets([market])
+        self.simulate_order_filled(market_info, limit_order)
+
+        self.assertEqual(2, len(strategy.trades))
+        self.assertEqual(40, strategy.fill_store.volume(market.display_name, trade_type=TradeType.BUY))
 
     def test_add_markets(self):
 